@@ -5,3 +5,7 @@ class PostConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'application.comment'
     verbose_name = '评论'
+
+    def ready(self):
+        # 注册缓存失效等信号处理
+        from application.comment import signals
@@ -0,0 +1,143 @@
+"""
+评论批量导入导出：按批 bulk_create，每批汇总涉及实体AI的评分和评论分布变化量后一次性更新
+"""
+import math
+from collections import Counter, defaultdict
+from itertools import islice
+
+from django.db import transaction
+
+from application.entityAI.cache import bump_entity_generation
+from application.entityAI.counters import SCORE_FIELDS, apply_comment_deltas
+from application.entityAI.models import EntityAI
+from application.user.models import User
+from utils.export_utils import iter_lines, iter_values
+
+from .models import Comment
+from .stats import apply_stat_deltas, comment_stat_deltas
+
+IMPORT_BATCH_SIZE = 1000
+EXPORT_FIELDS = ('id', 'entityAI_id', 'author_id', 'content', 'type', 'is_special', *SCORE_FIELDS, 'created_time')
+
+CONTENT_MAX_LENGTH = Comment._meta.get_field('content').max_length
+SCORE_MIN, SCORE_MAX = 0, 5
+COMMENT_TYPES = {value for value, _ in Comment.ChoicesF}
+
+
+def _parse_bool(value):
+    if isinstance(value, str):
+        return value.strip().lower() in ('1', 'true', 'yes')
+    return bool(value)
+
+
+def parse_comment(row):
+    """
+    把一行数据转换为未保存的 Comment，数据无效时抛出 ValueError。
+    created_time 由数据库写入时间决定，导入文件中的值会被忽略
+    """
+    if row is None:
+        raise ValueError('无法解析')
+    try:
+        entity_id = int(row['entityAI_id'])
+        author_id = int(row['author_id'])
+    except (KeyError, TypeError, ValueError):
+        raise ValueError('entityAI_id 和 author_id 必须是整数')
+
+    content = row.get('content') or ''
+    if not isinstance(content, str) or not content.strip():
+        raise ValueError('评论内容不能为空')
+    if len(content) > CONTENT_MAX_LENGTH:
+        raise ValueError(f'评论内容不能超过 {CONTENT_MAX_LENGTH} 字')
+
+    try:
+        comment_type = int(row.get('type') or 0)
+        scores = {field: float(row.get(field) or 0) for field in SCORE_FIELDS}
+    except (TypeError, ValueError):
+        raise ValueError('type 和评分必须是数字')
+    if comment_type not in COMMENT_TYPES:
+        raise ValueError('无效的评论类型')
+    # float() 接受 nan、inf，需要单独排除
+    if not all(math.isfinite(score) and SCORE_MIN <= score <= SCORE_MAX for score in scores.values()):
+        raise ValueError(f'评分必须在 {SCORE_MIN} ~ {SCORE_MAX} 之间')
+
+    return Comment(
+        entityAI_id=entity_id,
+        author_id=author_id,
+        content=content,
+        type=comment_type,
+        is_special=_parse_bool(row.get('is_special', False)),
+        **scores
+    )
+
+
+def _import_batch(batch, errors):
+    """
+    导入一批 (行号, 数据)，返回导入的评论数，无效的行记录到 errors
+    """
+    comments = []
+    for line_no, row in batch:
+        try:
+            comments.append((line_no, parse_comment(row)))
+        except ValueError as e:
+            errors.append((line_no, str(e)))
+
+    # 每批用两条查询确认引用的实体AI和用户存在
+    entity_ids = set(EntityAI.objects.filter(
+        id__in={comment.entityAI_id for _, comment in comments}
+    ).values_list('id', flat=True))
+    author_ids = set(User.objects.filter(
+        id__in={comment.author_id for _, comment in comments}
+    ).values_list('id', flat=True))
+
+    valid = []
+    for line_no, comment in comments:
+        if comment.entityAI_id not in entity_ids:
+            errors.append((line_no, f'实体AI {comment.entityAI_id} 不存在'))
+        elif comment.author_id not in author_ids:
+            errors.append((line_no, f'用户 {comment.author_id} 不存在'))
+        else:
+            valid.append(comment)
+    if not valid:
+        return 0
+
+    # 汇总本批评论对各实体评分和评论分布的影响
+    score_deltas = defaultdict(lambda: [0, [0.0] * len(SCORE_FIELDS)])
+    stat_deltas = Counter()
+    for comment in valid:
+        delta = score_deltas[comment.entityAI_id]
+        delta[0] += 1
+        delta[1] = [total + getattr(comment, field) for total, field in zip(delta[1], SCORE_FIELDS)]
+        stat_deltas.update(comment_stat_deltas(comment, 1))
+
+    with transaction.atomic():
+        Comment.objects.bulk_create(valid)
+        apply_comment_deltas(score_deltas)
+        apply_stat_deltas(stat_deltas)
+
+    # bulk_create 不会触发 post_save 信号，需要手动使缓存失效
+    bump_entity_generation()
+    return len(valid)
+
+
+def import_comments(rows, batch_size=IMPORT_BATCH_SIZE):
+    """
+    分批导入 (行号, 数据) 序列，返回 (导入的评论数, [(行号, 错误原因), ...])。
+    每批在一个事务中写入，某一批失败不影响之前已导入的批次
+    """
+    rows = iter(rows)
+    imported, errors = 0, []
+    while True:
+        batch = list(islice(rows, batch_size))
+        if not batch:
+            break
+        imported += _import_batch(batch, errors)
+    return imported, errors
+
+
+def export_lines(file_format, queryset=None):
+    """
+    逐行导出评论，按主键分块读取 values()，不创建模型实例也不一次性加载全部数据
+    """
+    if queryset is None:
+        queryset = Comment.objects.all()
+    return iter_lines(iter_values(queryset, EXPORT_FIELDS), EXPORT_FIELDS, file_format)
@@ -0,0 +1,34 @@
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+
+from utils.cache_utils import bump_generation
+
+# 通知的缓存代数名称，通知新增、修改、删除后增加
+NOTICE_GENERATION = 'notice'
+
+NOTICE_CACHE_KEY = 'notice:list'
+NOTICE_MODIFIED_KEY = 'notice:modified'  # 通知最后一次变化的时间戳（秒），用作 Last-Modified
+
+
+def bump_notice_generation():
+    """
+    通知变化后使缓存失效并记录修改时间，在事务提交后执行
+    """
+    def bump():
+        cache.set(NOTICE_MODIFIED_KEY, int(time.time()), timeout=None)
+        bump_generation(NOTICE_GENERATION)
+
+    transaction.on_commit(bump)
+
+
+def get_notice_modified():
+    """
+    通知最后一次变化的时间戳，丢失时以当前时间初始化
+    """
+    modified = cache.get(NOTICE_MODIFIED_KEY)
+    if modified is None:
+        cache.add(NOTICE_MODIFIED_KEY, int(time.time()), timeout=None)
+        modified = cache.get(NOTICE_MODIFIED_KEY)
+    return modified
@@ -0,0 +1,34 @@
+import sys
+
+from django.core.management.base import BaseCommand
+
+from application.comment.bulk import export_lines
+from application.comment.models import Comment
+from utils.export_utils import EXPORT_FORMATS, get_file_format
+
+
+class Command(BaseCommand):
+    help = '把评论逐行导出为 CSV 或 JSONL 文件，可作为 import_comments 的输入'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', nargs='?', default='-', help='导出文件，默认输出到标准输出')
+        parser.add_argument('--format', choices=EXPORT_FORMATS, help='文件格式，默认根据扩展名判断')
+        parser.add_argument('--entity', type=int, action='append', help='只导出指定实体AI的评论，可重复指定')
+
+    def handle(self, *args, **options):
+        path = options['path']
+        file_format = options['format'] or get_file_format(path)
+
+        queryset = Comment.objects.all()
+        if options['entity']:
+            queryset = queryset.filter(entityAI_id__in=options['entity'])
+
+        file = sys.stdout if path == '-' else open(path, 'w', encoding='utf-8', newline='')
+        try:
+            file.writelines(export_lines(file_format, queryset))
+        finally:
+            if file is not sys.stdout:
+                file.close()
+
+        if file is not sys.stdout:
+            self.stdout.write(self.style.SUCCESS(f'评论已导出到 {path}'))
@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from application.comment.bulk import IMPORT_BATCH_SIZE, import_comments
+from utils.export_utils import EXPORT_FORMATS, get_file_format, read_rows
+
+MAX_REPORTED_ERRORS = 20
+
+
+class Command(BaseCommand):
+    help = '从 CSV 或 JSONL 文件批量导入评论，每批导入后一次性更新涉及实体AI的评分和评论分布'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='导入文件，CSV 首行为表头，字段同 export_comments 的输出')
+        parser.add_argument('--format', choices=EXPORT_FORMATS, help='文件格式，默认根据扩展名判断')
+        parser.add_argument('--batch-size', type=int, default=IMPORT_BATCH_SIZE, help='每批导入的评论数')
+
+    def handle(self, *args, **options):
+        file_format = options['format'] or get_file_format(options['path'])
+        try:
+            file = open(options['path'], encoding='utf-8-sig', newline='')
+        except OSError as e:
+            raise CommandError(f'无法打开文件：{e}')
+
+        with file:
+            imported, errors = import_comments(read_rows(file, file_format), options['batch_size'])
+
+        for line_no, message in errors[:MAX_REPORTED_ERRORS]:
+            self.stderr.write(f'第 {line_no} 行：{message}')
+        if len(errors) > MAX_REPORTED_ERRORS:
+            self.stderr.write(f'…… 共 {len(errors)} 行无效')
+        self.stdout.write(self.style.SUCCESS(f'已导入 {imported} 条评论，跳过 {len(errors)} 行'))
@@ -30,6 +30,10 @@ class Comment(models.Model):
     class Meta:
         verbose_name = '评论'
         verbose_name_plural = verbose_name
+        indexes = [
+            # 按实体AI查看评论，按时间倒序
+            models.Index(fields=['entityAI', '-created_time'], name='comment_entity_created_idx'),
+        ]
 
     def __str__(self):
         return self.content
@@ -54,3 +58,23 @@ class Notice(models.Model):
     def __str__(self):
         return self.content
 
+
+
+class CommentStat(models.Model):
+    """
+    评论分布统计：每个实体AI在各维度各分段的评论数，评论增删改时增量维护
+    """
+    entityAI = models.ForeignKey('entityAI.EntityAI', on_delete=models.CASCADE, related_name='评论分布')
+    field = models.CharField(max_length=20, verbose_name='统计维度')  # score1~score4、type、is_special
+    bucket = models.IntegerField(verbose_name='分段')
+    count = models.IntegerField(default=0, verbose_name='评论数')
+
+    class Meta:
+        verbose_name = '评论分布'
+        verbose_name_plural = verbose_name
+        constraints = [
+            models.UniqueConstraint(fields=['entityAI', 'field', 'bucket'], name='comment_stat_unique'),
+        ]
+
+    def __str__(self):
+        return f'{self.entityAI_id} {self.field}={self.bucket}: {self.count}'
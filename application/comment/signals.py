@@ -0,0 +1,12 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from application.comment.models import Notice
+
+from .cache import bump_notice_generation
+
+
+@receiver([post_save, post_delete], sender=Notice)
+def invalidate_notice_cache(sender, **kwargs):
+    """通知新增、修改或删除后，通知列表缓存失效"""
+    bump_notice_generation()
@@ -0,0 +1,133 @@
+"""
+评论分布统计：comment_commentstat 表按 (实体AI, 维度, 分段) 记录评论数。
+
++ score1~score4：按 0.5 分一段，分段号为 score / 0.5，共 11 段（0 ~ 5 分）
++ type：分段号为评论类型
++ is_special：分段号为 0（普通）或 1（精品）
+"""
+from collections import Counter
+
+from django.db import connection, transaction
+from django.db.models import Count, F, IntegerField
+from django.db.models.functions import Cast, Floor, Greatest, Least
+
+from application.entityAI.counters import SCORE_FIELDS
+
+from .models import Comment, CommentStat
+
+SCORE_STEP = 0.5
+SCORE_BUCKETS = 11
+
+qn = connection.ops.quote_name
+
+STAT_TABLE = qn(CommentStat._meta.db_table)
+STAT_COLUMNS = [qn(CommentStat._meta.get_field(name).column) for name in ('entityAI', 'field', 'bucket', 'count')]
+
+
+def score_bucket(score):
+    return min(max(int(score // SCORE_STEP), 0), SCORE_BUCKETS - 1)
+
+
+def get_buckets(comment):
+    """
+    返回评论所在的各维度分段 [(维度, 分段), ...]
+    """
+    return [
+        *[(field, score_bucket(getattr(comment, field))) for field in SCORE_FIELDS],
+        ('type', comment.type),
+        ('is_special', int(comment.is_special)),
+    ]
+
+
+def _upsert_sql(row_count):
+    """
+    一条语句插入或累加多个分段的评论数
+    """
+    entity_column, field_column, bucket_column, count_column = STAT_COLUMNS
+    values = ', '.join(['(%s, %s, %s, %s)'] * row_count)
+    sql = f'INSERT INTO {STAT_TABLE} ({", ".join(STAT_COLUMNS)}) VALUES {values} '
+    if connection.vendor == 'mysql':
+        return sql + f'ON DUPLICATE KEY UPDATE {count_column} = {count_column} + VALUES({count_column})'
+    return sql + (
+        f'ON CONFLICT ({entity_column}, {field_column}, {bucket_column}) '
+        f'DO UPDATE SET {count_column} = {STAT_TABLE}.{count_column} + EXCLUDED.{count_column}'
+    )
+
+
+def apply_stat_deltas(deltas, chunk_size=500):
+    """
+    按 {(实体AI ID, 维度, 分段): 变化量} 增量更新评论分布，变化量为 0 的忽略，每条语句最多 chunk_size 个分段
+    """
+    rows = [(*key, delta) for key, delta in deltas.items() if delta]
+    with connection.cursor() as cursor:
+        for start in range(0, len(rows), chunk_size):
+            chunk = rows[start:start + chunk_size]
+            cursor.execute(_upsert_sql(len(chunk)), [value for row in chunk for value in row])
+
+
+def comment_stat_deltas(comment, delta):
+    """
+    单条评论对评论分布的影响，新增时 delta 为 1，删除时为 -1
+    """
+    return Counter({(comment.entityAI_id, field, bucket): delta for field, bucket in get_buckets(comment)})
+
+
+def rebuild_comment_stats(entity_ids=None):
+    """
+    根据 comment_comment 表重新统计评论分布，返回写入的分段数
+    """
+    comments = Comment.objects.all()
+    stats = CommentStat.objects.all()
+    if entity_ids is not None:
+        comments = comments.filter(entityAI_id__in=entity_ids)
+        stats = stats.filter(entityAI_id__in=entity_ids)
+
+    expressions = {
+        field: Least(Greatest(Cast(Floor(F(field) / SCORE_STEP), IntegerField()), 0), SCORE_BUCKETS - 1)
+        for field in SCORE_FIELDS
+    }
+    expressions['type'] = F('type')
+    expressions['is_special'] = Cast('is_special', IntegerField())
+
+    rows = [
+        CommentStat(entityAI_id=row['entityAI_id'], field=field, bucket=row['bucket'], count=row['count'])
+        for field, expression in expressions.items()
+        for row in comments.annotate(bucket=expression).values('entityAI_id', 'bucket').annotate(
+            count=Count('id')
+        ).order_by()
+    ]
+    with transaction.atomic():
+        stats.delete()
+        CommentStat.objects.bulk_create(rows, batch_size=1000)
+    return len(rows)
+
+
+def get_distribution(entity_id):
+    """
+    一次查询返回实体AI的评论分布，没有评论的分段计为 0
+    """
+    counts = {
+        (field, bucket): count
+        for field, bucket, count in CommentStat.objects.filter(entityAI_id=entity_id).values_list(
+            'field', 'bucket', 'count'
+        )
+    }
+    return {
+        'entityAI': entity_id,
+        'comment_count': sum(counts.get(('type', value), 0) for value, _ in Comment.ChoicesF),
+        'scores': {
+            field: [
+                {'score': bucket * SCORE_STEP, 'count': counts.get((field, bucket), 0)}
+                for bucket in range(SCORE_BUCKETS)
+            ]
+            for field in SCORE_FIELDS
+        },
+        'type': [
+            {'type': value, 'name': name, 'count': counts.get(('type', value), 0)}
+            for value, name in Comment.ChoicesF
+        ],
+        'is_special': [
+            {'is_special': bool(bucket), 'count': counts.get(('is_special', bucket), 0)}
+            for bucket in (0, 1)
+        ],
+    }
@@ -0,0 +1,117 @@
+import io
+
+from django.test import TestCase
+from rest_framework.test import APITestCase
+
+from application.entityAI.counters import SCORE_FIELDS, apply_comment_delta
+from application.entityAI.models import EntityAI, EntityAIType
+from application.user.models import User
+from utils.export_utils import read_rows
+
+from .bulk import import_comments
+from .serializers import CommentSerializer
+from .stats import apply_stat_deltas, comment_stat_deltas
+from .views import CommentViewSet
+from .models import Comment, CommentStat
+
+
+class ImportCommentsTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.entity = EntityAI.objects.create(
+            name='测试AI', url='https://example.com', type=EntityAIType.objects.create(name='测试类型')
+        )
+        cls.user = User.objects.create(username='tester')
+
+    def import_csv(self, *lines):
+        header = 'entityAI_id,author_id,content,score1,score2,score3,score4'
+        return import_comments(read_rows(io.StringIO('\n'.join([header, *lines]) + '\n'), 'csv'))
+
+    def test_non_finite_scores_are_skipped(self):
+        entity_id, user_id = self.entity.id, self.user.id
+        imported, errors = self.import_csv(
+            f'{entity_id},{user_id},坏数据,nan,1,1,1',
+            f'{entity_id},{user_id},有效评论,4,3,2,1',
+            f'{entity_id},{user_id},坏数据,1,inf,1,1',
+            f'{entity_id},{user_id},超出范围,1,1,6,1',
+        )
+
+        self.assertEqual(imported, 1)
+        self.assertEqual([line_no for line_no, _ in errors], [2, 4, 5])
+        self.assertEqual(list(Comment.objects.values_list('content', flat=True)), ['有效评论'])
+
+        self.entity.refresh_from_db()
+        self.assertEqual(self.entity.comment_count, 1)
+        self.assertEqual(self.entity.total_score1, 4)
+        self.assertEqual(CommentStat.objects.get(entityAI=self.entity, field='score1', bucket=8).count, 1)
+
+
+class DistributionTests(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.entity = EntityAI.objects.create(
+            name='测试AI', url='https://example.com', type=EntityAIType.objects.create(name='测试类型')
+        )
+        cls.user = User.objects.create(username='tester')
+
+    def setUp(self):
+        self.client.force_authenticate(self.user)
+
+    def test_distribution(self):
+        response = self.client.get('/api/comment/distribution/', {'entityAI': self.entity.id})
+        self.assertEqual(response.status_code, 200)
+
+    def test_unknown_entity(self):
+        response = self.client.get('/api/comment/distribution/', {'entityAI': self.entity.id + 1000})
+        self.assertEqual(response.status_code, 404)
+
+
+class CommentCounterTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.entity = EntityAI.objects.create(
+            name='测试AI', url='https://example.com', type=EntityAIType.objects.create(name='测试类型')
+        )
+        cls.user = User.objects.create(username='tester')
+
+    def create_comment(self, score):
+        comment = Comment.objects.create(entityAI=self.entity, author=self.user, content='评论', score1=score,
+                                         score2=score, score3=score, score4=score)
+        apply_comment_delta(self.entity.id, 1, [score] * len(SCORE_FIELDS))
+        apply_stat_deltas(comment_stat_deltas(comment, 1))
+        return comment
+
+    def assert_counters(self):
+        self.entity.refresh_from_db()
+        comments = Comment.objects.filter(entityAI=self.entity)
+        self.assertEqual(self.entity.comment_count, comments.count())
+        self.assertEqual(self.entity.score1_sum, sum(comments.values_list('score1', flat=True)))
+        self.assertEqual(
+            sum(CommentStat.objects.filter(entityAI=self.entity, field='score1').values_list('count', flat=True)),
+            comments.count()
+        )
+
+    def test_repeated_delete(self):
+        comment = self.create_comment(1)
+        self.create_comment(2)
+        # 两个并发的删除请求都在删除前读到了这条评论
+        stale = [Comment.objects.get(pk=comment.pk) for _ in range(2)]
+        for instance in stale:
+            CommentViewSet().perform_destroy(instance)
+        self.assert_counters()
+
+    def test_repeated_update(self):
+        comment = self.create_comment(1)
+        # 两个并发的修改请求都在修改前读到了旧评分
+        serializers = [
+            CommentSerializer(Comment.objects.get(pk=comment.pk), data={'score1': score}, partial=True)
+            for score in (3, 4)
+        ]
+        for serializer in serializers:
+            serializer.is_valid(raise_exception=True)
+            CommentViewSet().perform_update(serializer)
+        self.assert_counters()
+        self.assertEqual(CommentStat.objects.get(entityAI=self.entity, field='score1', bucket=8).count, 1)
@@ -1,36 +1,42 @@
 from rest_framework import viewsets, status
 from django.db import transaction
-from django.db.models import Avg, F, FloatField, Sum
+from django.db.models import F
 from django_filters.rest_framework import DjangoFilterBackend
 from django.db.models.functions import Round
-from rest_framework.exceptions import PermissionDenied
+from django.shortcuts import get_object_or_404
+from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound, PermissionDenied
+from rest_framework.parsers import MultiPartParser
+from rest_framework.response import Response
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, urlencode
 
 from .models import Comment, Notice
 from .serializers import CommentSerializer, NoticeSerializer
 
-from rest_framework.pagination import PageNumberPagination
+from .bulk import export_lines, import_comments
+from .cache import NOTICE_CACHE_KEY, NOTICE_GENERATION, get_notice_modified
+from .stats import apply_stat_deltas, comment_stat_deltas, get_distribution
 
-class CustomPageNumberPagination(PageNumberPagination):
-    page_size = 8  # 默认每页数据量
-    page_size_query_param = 'page_size'  # 允许前端传递的参数名
-    max_page_size = 100  # 限制每页的最大数据量
+from application.entityAI.counters import SCORE_FIELDS, apply_comment_delta
+from application.entityAI.models import EntityAI
+from utils.api_utils import success_response, fail_response
+from utils.cache_utils import get_generation, get_or_compute
+from utils.export_utils import (
+    EXPORT_FORMATS, get_export_format, get_file_format, open_text, read_rows, streaming_response
+)
+from utils.pagination import CustomPageNumberPagination
 
-    def paginate_queryset(self, queryset, request, view=None):
-        # 如果没有传入 `page` 参数，返回全部数据
-        if 'page' not in request.query_params or request.query_params['page'] == '':
-            return None  # 禁用分页
-        return super().paginate_queryset(queryset, request, view)
+BULK_REPORTED_ERRORS = 100  # 批量导入时最多返回的错误行数
 
 
 class CommentViewSet(viewsets.ModelViewSet):
-    queryset = Comment.objects.all().order_by('-created_time').annotate(
-        average_score=Round((
-                                    Sum('score1', output_field=FloatField()) +
-                                    Sum('score2', output_field=FloatField()) +
-                                    Sum('score3', output_field=FloatField()) +
-                                    Sum('score4', output_field=FloatField())
-                            ) / 4, 2)  # 保留两位小数
-    )
+    queryset = Comment.objects.select_related('entityAI', 'author').only(
+        *[field.name for field in Comment._meta.concrete_fields],
+        'entityAI__name', 'author__username'  # 序列化时只用到实体AI和作者的这两个字段
+    ).annotate(
+        average_score=Round((F('score1') + F('score2') + F('score3') + F('score4')) / 4, 2)  # 保留两位小数
+    ).order_by('-created_time')
     serializer_class = CommentSerializer
 
     pagination_class = CustomPageNumberPagination  # 自定义分页器
@@ -43,49 +49,131 @@ class CommentViewSet(viewsets.ModelViewSet):
         """
         with transaction.atomic():
             comment = serializer.save(author=self.request.user)  # 保存评论并设置作者
-            self.update_entityAI_scores(comment.entityAI)
+            apply_comment_delta(comment.entityAI_id, 1, get_scores(comment))
+            apply_stat_deltas(comment_stat_deltas(comment, 1))
 
     def perform_update(self, serializer):
         """
-        在更新评论时，重新计算并更新 entityAI 的评分。
+        在更新评论时，按评分的变化量更新 entityAI 的评分。
         """
         with transaction.atomic():
+            # 在事务内锁定并重新读取评论，并发修改同一条评论时，后到的请求基于前一次修改后的评分计算变化量
+            locked = Comment.objects.select_for_update().filter(pk=serializer.instance.pk).first()
+            if locked is None:
+                raise NotFound('评论不存在')
+            old_entity_id, old_scores = locked.entityAI_id, get_scores(locked)
+            stat_deltas = comment_stat_deltas(locked, -1)
+
             comment = serializer.save()  # 更新评论
-            self.update_entityAI_scores(comment.entityAI)
+            if comment.entityAI_id == old_entity_id:
+                apply_comment_delta(comment.entityAI_id, 0, [
+                    new - old for new, old in zip(get_scores(comment), old_scores)
+                ])
+            else:
+                # 评论换了所属实体AI，从原实体中减去，加到新实体上
+                apply_comment_delta(old_entity_id, -1, [-score for score in old_scores])
+                apply_comment_delta(comment.entityAI_id, 1, get_scores(comment))
+
+            # 旧分段减一、新分段加一，分段没变的相互抵消
+            stat_deltas.update(comment_stat_deltas(comment, 1))
+            apply_stat_deltas(stat_deltas)
 
     def perform_destroy(self, instance):
         """
-        在删除评论时，重新计算并更新 entityAI 的评分。
+        在删除评论时，从 entityAI 的评分中减去该评论。
         """
         with transaction.atomic():
-            entityAI = instance.entityAI  # 获取相关的实体AI
-            instance.delete()  # 删除评论
-            self.update_entityAI_scores(entityAI)
-
-    def update_entityAI_scores(self, entityAI):
+            # 按锁定后读到的评论计算变化量，评论已被并发请求删除时不再重复扣减
+            comment = Comment.objects.select_for_update().filter(pk=instance.pk).first()
+            if comment is None:
+                return
+            deleted, _ = comment.delete()  # 删除评论
+            if not deleted:
+                return
+            apply_comment_delta(comment.entityAI_id, -1, [-score for score in get_scores(comment)])
+            apply_stat_deltas(comment_stat_deltas(comment, -1))
+
+    @action(detail=False, methods=['get'])
+    def distribution(self, request):
         """
-        重新计算并更新 entityAI 的评分。
+        实体AI的评论分布：各维度评分的分段直方图，以及按评论类型、是否精品的评论数
         """
-        scores = Comment.objects.filter(entityAI=entityAI).aggregate(
-            avg_score1=Avg('score1'),
-            avg_score2=Avg('score2'),
-            avg_score3=Avg('score3'),
-            avg_score4=Avg('score4')
-        )
+        entity_id = request.query_params.get('entityAI', '')
+        if not entity_id.isdigit():
+            return fail_response(message="请指定实体AI", status_code=status.HTTP_400_BAD_REQUEST)
+        entity = get_object_or_404(EntityAI.objects.only('id'), id=int(entity_id))
+        return success_response(data=get_distribution(entity.id))
+
+    @action(detail=False, methods=['get'])
+    def export(self, request):
+        """
+        流式导出评论（file_format 为 csv 或 jsonl），支持与列表相同的过滤参数，按 ID 排序
+        """
+        file_format = get_export_format(request)
+        if file_format is None:
+            return fail_response(message="不支持的导出格式", status_code=status.HTTP_400_BAD_REQUEST)
+        queryset = self.filter_queryset(Comment.objects.all())
+        return streaming_response(export_lines(file_format, queryset), 'comments', file_format)
+
+    @action(detail=False, methods=['post'], url_path='bulk', parser_classes=[MultiPartParser])
+    def bulk_import(self, request):
+        """
+        管理员上传 CSV 或 JSONL 文件批量导入评论（字段 file，可用 format 指定格式）
+        """
+        if not request.user.is_staff:
+            raise PermissionDenied('只有管理员才能批量导入评论')  # 抛出权限异常
+        upload = request.FILES.get('file')
+        if upload is None:
+            return fail_response(message="请上传文件", status_code=status.HTTP_400_BAD_REQUEST)
+        file_format = request.data.get('format') or get_file_format(upload.name)
+        if file_format not in EXPORT_FORMATS:
+            return fail_response(message="不支持的文件格式", status_code=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            imported, errors = import_comments(read_rows(open_text(upload), file_format))
+        except UnicodeDecodeError:
+            return fail_response(message="文件必须使用 UTF-8 编码", status_code=status.HTTP_400_BAD_REQUEST)
+        return success_response(data={
+            'imported': imported,
+            'error_count': len(errors),
+            'errors': [{'line': line_no, 'message': message} for line_no, message in errors[:BULK_REPORTED_ERRORS]],
+        })
+
+
+def get_scores(comment):
+    return [getattr(comment, field) for field in SCORE_FIELDS]
 
-        # 更新 entityAI 的评分细则和平均分
-        entityAI.total_score1 = scores['avg_score1'] or 0
-        entityAI.total_score2 = scores['avg_score2'] or 0
-        entityAI.total_score3 = scores['avg_score3'] or 0
-        entityAI.total_score4 = scores['avg_score4'] or 0
-        entityAI.save()
 
 class NoticeViewSet(viewsets.ModelViewSet):
-    queryset = Notice.objects.all().order_by('-created_time')  # 按时间倒序排列
+    queryset = Notice.objects.select_related('author').order_by('-created_time')  # 按时间倒序排列
     serializer_class = NoticeSerializer
 
     pagination_class = CustomPageNumberPagination  # 自定义分页器
 
+    def list(self, request, *args, **kwargs):
+        """
+        通知列表按通知代数缓存；客户端带 If-None-Match 或 If-Modified-Since 轮询时，通知没有变化则返回 304
+        """
+        generation = get_generation(NOTICE_GENERATION)
+        etag = f'"notice-{generation}"'
+        last_modified = get_notice_modified()
+
+        not_modified = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if not_modified is not None:
+            return not_modified
+
+        params = urlencode(sorted(request.query_params.items()))
+        data = get_or_compute(
+            f'{NOTICE_CACHE_KEY}:{generation}:{params}',
+            lambda: super(NoticeViewSet, self).list(request, *args, **kwargs).data
+        )
+
+        response = Response(data)
+        response['ETag'] = etag
+        response['Last-Modified'] = http_date(last_modified)
+        patch_cache_control(response, private=True, no_cache=True)  # 每次使用前都需要向服务器确认
+        return response
+
     def perform_create(self, serializer):
         """
         在创建通知时，设置作者。
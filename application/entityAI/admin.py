@@ -1,7 +1,8 @@
 from django.contrib import admin
-from .models import EntityAI, EntityAITag, EntityAIType
+from .models import EntityAI, EntityAITag, EntityAIType, StatisticsSnapshot
 
 admin.site.register(EntityAI)
 admin.site.register(EntityAITag)
 admin.site.register(EntityAIType)
+admin.site.register(StatisticsSnapshot)
 
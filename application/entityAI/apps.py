@@ -5,3 +5,7 @@ class EntityaiConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'application.entityAI'
     verbose_name = '实体AI'
+
+    def ready(self):
+        # 注册缓存失效等信号处理
+        from application.entityAI import signals
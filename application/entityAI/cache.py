@@ -0,0 +1,35 @@
+from django.db import transaction
+
+from utils.cache_utils import bump_generation, incr_counter
+
+# 实体AI相关数据（实体、标签、点赞、评论）的缓存代数名称
+ENTITY_GENERATION = 'entityAI'
+
+RECOMMEND_CACHE_KEY = 'entityAI:recommend'
+STATISTICS_CACHE_KEY = 'entityAI:statistics'  # 最新统计快照
+STATISTICS_WRITES_KEY = 'entityAI:statistics:writes'  # 上次生成快照后的写入次数
+
+SEARCH_CACHE_KEY = 'search:results'
+SEARCH_CACHE_HITS_KEY = 'search:results:hits'
+SEARCH_CACHE_MISSES_KEY = 'search:results:misses'
+
+# 搜索建议前缀索引的代数，只在实体本身变化时增加
+SUGGEST_GENERATION = 'entityAI:suggest'
+
+
+def bump_entity_generation():
+    """
+    实体AI相关数据变化后使缓存失效，在事务提交后执行，避免其他请求把提交前的旧数据缓存到新代数下
+    """
+    def bump():
+        bump_generation(ENTITY_GENERATION)
+        count_statistics_write()
+
+    transaction.on_commit(bump)
+
+
+def count_statistics_write():
+    """
+    记录一次写入，统计快照的后台任务据此判断是否需要重建
+    """
+    incr_counter(STATISTICS_WRITES_KEY)
@@ -0,0 +1,110 @@
+import numpy as np
+from django.core.cache import cache
+from django.db import transaction
+from scipy import sparse
+from sklearn.preprocessing import normalize
+
+from application.entityAI.models import EntityAI
+from application.user.models import Like
+from utils.cache_utils import bump_generation, get_generation, get_or_compute
+
+ITEM_TOP_K = 30  # 每个实体保存的协同过滤近邻数量
+BLOCK_SIZE = 256  # 分块计算实体间相似度，内存占用为 BLOCK_SIZE × 实体数
+USER_RESULT_SIZE = 50  # 每个用户缓存的推荐数量上限
+USER_RESULT_TIMEOUT = 60 * 60 * 24
+
+NEIGHBOURS_CACHE_KEY = 'entityAI:cf:neighbours'
+NEIGHBOURS_GENERATION = 'entityAI:cf'
+
+
+def user_likes_generation(user_id):
+    return f'likes:user:{user_id}'
+
+
+def bump_user_likes_generation(*user_ids):
+    """
+    用户的点赞变化后，在事务提交后使其个性化推荐缓存失效
+    """
+    names = [user_likes_generation(user_id) for user_id in user_ids]
+    transaction.on_commit(lambda: bump_generation(*names))
+
+
+def build_item_neighbours():
+    """
+    基于用户×实体的点赞矩阵计算实体间的余弦相似度，返回每个实体的前 K 个近邻
+    """
+    pairs = np.array(list(Like.objects.values_list('user_id', 'entityAI_id').iterator(chunk_size=10000)),
+                     dtype=np.int64).reshape(-1, 2)
+    if not len(pairs):
+        return {}
+
+    user_ids, user_positions = np.unique(pairs[:, 0], return_inverse=True)
+    item_ids, item_positions = np.unique(pairs[:, 1], return_inverse=True)
+    likes = sparse.csr_matrix(
+        (np.ones(len(pairs), dtype=np.float32), (item_positions, user_positions)),
+        shape=(len(item_ids), len(user_ids))
+    )
+    likes.data[:] = 1  # 去掉可能的重复点赞
+    item_vectors = normalize(likes)
+
+    neighbours = {}
+    count = min(ITEM_TOP_K + 1, len(item_ids))
+    for start in range(0, len(item_ids), BLOCK_SIZE):
+        block = (item_vectors[start:start + BLOCK_SIZE] @ item_vectors.T).toarray()
+        for offset, similarities in enumerate(block):
+            position = start + offset
+            similarities[position] = 0  # 排除自身
+            candidates = np.argpartition(-similarities, count - 1)[:count]
+            candidates = candidates[np.argsort(-similarities[candidates])]
+            neighbours[int(item_ids[position])] = [
+                (int(item_ids[candidate]), float(similarities[candidate]))
+                for candidate in candidates
+                if similarities[candidate] > 0
+            ][:ITEM_TOP_K]
+    return neighbours
+
+
+def refresh_item_neighbours():
+    """
+    重新计算实体近邻并写入缓存，所有用户的推荐结果随之失效
+    """
+    neighbours = build_item_neighbours()
+    cache.set(NEIGHBOURS_CACHE_KEY, neighbours, timeout=None)
+    bump_generation(NEIGHBOURS_GENERATION)
+    return neighbours
+
+
+def get_item_neighbours():
+    return get_or_compute(NEIGHBOURS_CACHE_KEY, build_item_neighbours, timeout=None)
+
+
+def compute_user_recommendations(user_id):
+    """
+    累加用户点赞过的实体的近邻相似度作为推荐分，没有可推荐的实体时用点赞量最高的实体补足
+    """
+    liked_ids = set(Like.objects.filter(user_id=user_id).values_list('entityAI_id', flat=True))
+    neighbours = get_item_neighbours()
+
+    scores = {}
+    for liked_id in liked_ids:
+        for neighbour_id, similarity in neighbours.get(liked_id, ()):
+            if neighbour_id not in liked_ids:
+                scores[neighbour_id] = scores.get(neighbour_id, 0) + similarity
+    ranked = sorted(scores, key=scores.get, reverse=True)[:USER_RESULT_SIZE]
+
+    if len(ranked) < USER_RESULT_SIZE:
+        popular = EntityAI.objects.exclude(id__in=liked_ids | set(ranked)).order_by('-like_count', 'id').values_list(
+            'id', flat=True
+        )[:USER_RESULT_SIZE - len(ranked)]
+        ranked += list(popular)
+    return ranked
+
+
+def recommend_for_user(user_id):
+    """
+    读取用户的个性化推荐 ID 列表，近邻重算或用户点赞变化后自动重新计算
+    """
+    key = 'entityAI:cf:user:{}:{}:{}'.format(
+        user_id, get_generation(NEIGHBOURS_GENERATION), get_generation(user_likes_generation(user_id))
+    )
+    return get_or_compute(key, lambda: compute_user_recommendations(user_id), timeout=USER_RESULT_TIMEOUT)
@@ -0,0 +1,104 @@
+from django.db import connection
+from django.db.models import Case, Count, F, FloatField, IntegerField, OuterRef, Subquery, Sum, Value, When
+from django.db.models.functions import Coalesce, Round
+
+from application.entityAI.models import EntityAI
+from application.user.models import Like
+from application.comment.models import Comment
+
+
+def _entity_queryset(entity_ids=None):
+    queryset = EntityAI.objects.all()
+    if entity_ids is not None:
+        queryset = queryset.filter(id__in=entity_ids)
+    return queryset
+
+
+def rebuild_like_counts(entity_ids=None):
+    """
+    根据 user_like 表重新统计点赞量，返回更新的实体数
+    """
+    like_count = Subquery(
+        Like.objects.filter(entityAI=OuterRef('pk')).values('entityAI').annotate(
+            count=Count('id')
+        ).values('count')[:1],
+        output_field=IntegerField()
+    )
+    return _entity_queryset(entity_ids).update(like_count=Coalesce(like_count, 0))
+
+
+SCORE_FIELDS = ('score1', 'score2', 'score3', 'score4')
+
+
+def score_averages():
+    """
+    由评论数和各维度评分之和算出各维度平均分和总平均分，没有评论时为 0
+    """
+    def average(expression):
+        return Case(When(comment_count__gt=0, then=expression), default=Value(0.0), output_field=FloatField())
+
+    total = sum((F(f'{field}_sum') for field in SCORE_FIELDS[1:]), F(f'{SCORE_FIELDS[0]}_sum'))
+    return {
+        **{f'total_{field}': average(F(f'{field}_sum') / F('comment_count')) for field in SCORE_FIELDS},
+        'average_score': average(Round(total / (F('comment_count') * 4), 2)),
+    }
+
+
+def apply_comment_delta(entity_id, count_delta, score_deltas):
+    """
+    评论新增、修改或删除后增量更新实体评分：第一条 UPDATE 累加评论数和各维度评分之和，
+    第二条由新的总和算出平均分，不需要重新扫描该实体的所有评论
+    """
+    queryset = EntityAI.objects.filter(id=entity_id)
+    queryset.update(
+        comment_count=F('comment_count') + count_delta,
+        **{f'{field}_sum': F(f'{field}_sum') + delta for field, delta in zip(SCORE_FIELDS, score_deltas)}
+    )
+    queryset.update(**score_averages())
+
+
+def apply_comment_deltas(deltas, chunk_size=500):
+    """
+    批量增量更新多个实体的评分，deltas 为 {实体 ID: (评论数变化量, [各维度评分变化量])}。
+    每 chunk_size 个实体用一条按实体 ID 取值的 CASE 语句累加，再用一条 UPDATE 算出平均分
+    """
+    qn = connection.ops.quote_name
+    columns = ['comment_count', *[f'{field}_sum' for field in SCORE_FIELDS]]
+    entity_ids = list(deltas)
+    for start in range(0, len(entity_ids), chunk_size):
+        chunk = entity_ids[start:start + chunk_size]
+        cases = ' '.join(['WHEN %s THEN %s'] * len(chunk))
+        assignments = ', '.join(f'{qn(column)} = {qn(column)} + CASE {qn("id")} {cases} ELSE 0 END' for column in columns)
+        values = {entity_id: [deltas[entity_id][0], *deltas[entity_id][1]] for entity_id in chunk}
+        params = [value for i in range(len(columns)) for entity_id in chunk for value in (entity_id, values[entity_id][i])]
+        placeholders = ', '.join(['%s'] * len(chunk))
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'UPDATE {qn(EntityAI._meta.db_table)} SET {assignments} WHERE {qn("id")} IN ({placeholders})',
+                params + chunk
+            )
+        EntityAI.objects.filter(id__in=chunk).update(**score_averages())
+
+
+def rebuild_scores(entity_ids=None):
+    """
+    根据 comment_comment 表重新统计评论数、各维度评分之和与平均分，返回更新的实体数
+    """
+
+    def comment_aggregate(aggregate, output_field):
+        return Coalesce(
+            Subquery(
+                Comment.objects.filter(entityAI=OuterRef('pk')).values('entityAI').annotate(
+                    value=aggregate
+                ).values('value')[:1],
+                output_field=output_field
+            ),
+            Value(0, output_field=output_field)
+        )
+
+    queryset = _entity_queryset(entity_ids)
+    queryset.update(
+        comment_count=comment_aggregate(Count('id'), IntegerField()),
+        **{f'{field}_sum': comment_aggregate(Sum(field), FloatField()) for field in SCORE_FIELDS}
+    )
+    return queryset.update(**score_averages())
@@ -0,0 +1,49 @@
+"""
+实体AI和点赞的流式导出，按主键分块读取 values()，内存占用与表大小无关
+"""
+from collections import defaultdict
+
+from django.db.models import F
+
+from application.entityAI.models import EntityAI, EntityAITag
+from application.user.models import Like
+from utils.export_utils import iter_chunks, iter_lines, iter_values
+
+ENTITY_FIELDS = (
+    'id', 'name', 'url', 'description', 'type_id', 'type_name', 'like_count', 'comment_count', 'average_score',
+    'total_score1', 'total_score2', 'total_score3', 'total_score4',
+)
+ENTITY_EXPORT_FIELDS = (*ENTITY_FIELDS, 'tags')
+LIKE_EXPORT_FIELDS = ('id', 'user_id', 'entityAI_id', 'created_time')
+
+TAG_SEPARATOR = '|'
+
+
+def iter_entity_rows(queryset):
+    """
+    逐行产出实体AI，每块实体的标签用一条查询取出，多个标签用 | 连接
+    """
+    through = EntityAITag.entityAI.through
+    queryset = queryset.prefetch_related(None).annotate(type_name=F('type__name'))
+    for rows in iter_chunks(queryset, ENTITY_FIELDS):
+        tags = defaultdict(list)
+        for entity_id, name in through.objects.filter(
+            entityai_id__in=[row['id'] for row in rows]
+        ).order_by('id').values_list('entityai_id', 'entityaitag__name'):
+            tags[entity_id].append(name)
+
+        for row in rows:
+            row['tags'] = TAG_SEPARATOR.join(tags[row['id']])
+            yield row
+
+
+def export_entity_lines(file_format, queryset=None):
+    if queryset is None:
+        queryset = EntityAI.objects.all()
+    return iter_lines(iter_entity_rows(queryset), ENTITY_EXPORT_FIELDS, file_format)
+
+
+def export_like_lines(file_format, queryset=None):
+    if queryset is None:
+        queryset = Like.objects.all()
+    return iter_lines(iter_values(queryset, LIKE_EXPORT_FIELDS), LIKE_EXPORT_FIELDS, file_format)
@@ -0,0 +1,250 @@
+"""
+Redis 点赞存储：开启 settings.LIKE_STORE_REDIS 后，点赞先写入 Redis，由 flush_likes 后台任务批量写回数据库。
+
++ likes:user:<用户 ID>：用户点赞过的实体 ID 集合，首次访问时从数据库加载，集合中的 0 表示已加载
++ likes:counts：实体 ID → 点赞量，首次访问时从数据库加载
++ likes:pending：「用户 ID:实体 ID」→ 1（点赞）/ 0（取消），同一用户对同一实体只保留最后一次操作
+"""
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Count
+from django.utils import timezone
+from django_redis import get_redis_connection
+from redis.exceptions import ResponseError
+
+from application.entityAI.models import EntityAI
+from application.user.models import Like
+
+from .cache import bump_entity_generation
+from .collaborative import bump_user_likes_generation
+from .counters import rebuild_like_counts
+
+LIKE_COUNTS_KEY = 'likes:counts'
+PENDING_KEY = 'likes:pending'
+FLUSHING_KEY = 'likes:pending:flushing'  # 正在写回的操作，写回中断时下次继续处理
+LOADED_MARK = 0  # 实体 ID 从 1 开始，用 0 标记用户的点赞集合已从数据库加载
+FLUSH_BATCH_SIZE = 500
+
+# 点赞或取消点赞：修改用户集合，集合有变化时才调整点赞量并记录待写回的操作，保证并发的重复请求只计一次
+SET_LIKE_SCRIPT = """
+local changed
+if ARGV[3] == '1' then
+    changed = redis.call('SADD', KEYS[1], ARGV[1])
+else
+    changed = redis.call('SREM', KEYS[1], ARGV[1])
+end
+if changed == 1 then
+    redis.call('HINCRBY', KEYS[2], ARGV[1], ARGV[3] == '1' and 1 or -1)
+    redis.call('HSET', KEYS[3], ARGV[2], ARGV[3])
+end
+return {changed, tonumber(redis.call('HGET', KEYS[2], ARGV[1]))}
+"""
+
+# 用户的点赞集合不存在时才写入从数据库读出的点赞，判断和写入是原子的；
+# 否则并发请求在读数据库之后写入的修改会被旧数据覆盖（例如刚取消的点赞又被加回）。
+# 分批 SADD，避免 unpack 参数过多
+LOAD_USER_LIKES_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return 0
+end
+for i = 1, #ARGV, 1000 do
+    redis.call('SADD', KEYS[1], unpack(ARGV, i, math.min(i + 999, #ARGV)))
+end
+return 1
+"""
+
+
+def enabled():
+    return getattr(settings, 'LIKE_STORE_REDIS', False)
+
+
+def user_likes_key(user_id):
+    return f'likes:user:{user_id}'
+
+
+def _load_user_likes(redis, user_id):
+    """
+    用户的点赞集合不在 Redis 中时从数据库加载。
+    有待写回的操作时集合一定已经存在，所以此时数据库中的数据是完整的
+    """
+    key = user_likes_key(user_id)
+    if redis.exists(key):
+        return
+    entity_ids = Like.objects.filter(user_id=user_id).values_list('entityAI_id', flat=True)
+    # 读数据库期间其他请求可能已经加载并修改了集合，由脚本判断后再写入
+    redis.register_script(LOAD_USER_LIKES_SCRIPT)(keys=[key], args=[LOADED_MARK, *entity_ids])
+
+
+def get_like_counts(entity_ids):
+    """
+    返回 {实体 ID: 点赞量}，Redis 中没有的从数据库加载，不存在的实体不包含在结果中
+    """
+    redis = get_redis_connection()
+    entity_ids = list(dict.fromkeys(entity_ids))
+    if not entity_ids:
+        return {}
+
+    counts = {
+        entity_id: int(count)
+        for entity_id, count in zip(entity_ids, redis.hmget(LIKE_COUNTS_KEY, entity_ids))
+        if count is not None
+    }
+    missing_ids = [entity_id for entity_id in entity_ids if entity_id not in counts]
+    missing = list(EntityAI.objects.filter(id__in=missing_ids).values_list('id', 'like_count')) if missing_ids else []
+    if missing:
+        pipeline = redis.pipeline(transaction=False)
+        for entity_id, like_count in missing:
+            # 其他进程可能已经加载并修改过，以 Redis 中的为准
+            pipeline.hsetnx(LIKE_COUNTS_KEY, entity_id, like_count)
+            pipeline.hget(LIKE_COUNTS_KEY, entity_id)
+        results = pipeline.execute()
+        for (entity_id, _), count in zip(missing, results[1::2]):
+            counts[entity_id] = int(count)
+    return {entity_id: counts[entity_id] for entity_id in entity_ids if entity_id in counts}
+
+
+def get_liked_ids(user_id, entity_ids):
+    """
+    返回用户在给定实体中点赞过的实体 ID 集合，一次往返完成所有 SISMEMBER
+    """
+    redis = get_redis_connection()
+    _load_user_likes(redis, user_id)
+    key = user_likes_key(user_id)
+    pipeline = redis.pipeline(transaction=False)
+    for entity_id in entity_ids:
+        pipeline.sismember(key, entity_id)
+    return {entity_id for entity_id, liked in zip(entity_ids, pipeline.execute()) if liked}
+
+
+def set_likes(user_id, entity_ids, liked):
+    """
+    点赞或取消点赞，返回 {实体 ID: (是否有变化, 点赞量)}，不存在的实体不包含在结果中
+    """
+    redis = get_redis_connection()
+    entity_ids = list(get_like_counts(entity_ids))  # 同时确认实体存在并加载点赞量
+    if not entity_ids:
+        return {}
+    _load_user_likes(redis, user_id)
+
+    script = redis.register_script(SET_LIKE_SCRIPT)
+    pipeline = redis.pipeline(transaction=False)
+    for entity_id in entity_ids:
+        script(
+            keys=[user_likes_key(user_id), LIKE_COUNTS_KEY, PENDING_KEY],
+            args=[entity_id, f'{user_id}:{entity_id}', 1 if liked else 0],
+            client=pipeline
+        )
+    return {
+        entity_id: (bool(changed), like_count)
+        for entity_id, (changed, like_count) in zip(entity_ids, pipeline.execute())
+    }
+
+
+def remove_entity(entity_id):
+    """实体删除后清除其点赞量，用户集合中残留的 ID 不影响结果"""
+    get_redis_connection().hdel(LIKE_COUNTS_KEY, entity_id)
+
+
+def _write_back(operations):
+    """
+    把一批操作写回数据库：点赞批量插入并忽略重复，取消点赞批量删除，最后重新统计涉及实体的点赞量
+    """
+    likes, unlikes = [], []
+    for field, value in operations:
+        user_id, entity_id = map(int, field.split(':'))
+        (likes if value == '1' else unlikes).append((user_id, entity_id))
+
+    entity_ids = {entity_id for _, entity_id in likes + unlikes}
+    existing_ids = set(EntityAI.objects.filter(id__in=entity_ids).values_list('id', flat=True))
+    now = timezone.now()
+
+    with transaction.atomic():
+        Like.objects.bulk_create(
+            [Like(user_id=user_id, entityAI_id=entity_id, created_time=now)
+             for user_id, entity_id in likes if entity_id in existing_ids],
+            ignore_conflicts=True
+        )
+        if unlikes:
+            table = connection.ops.quote_name(Like._meta.db_table)
+            user_column = connection.ops.quote_name(Like._meta.get_field('user').column)
+            entity_column = connection.ops.quote_name(Like._meta.get_field('entityAI').column)
+            conditions = ' OR '.join([f'({user_column} = %s AND {entity_column} = %s)'] * len(unlikes))
+            with connection.cursor() as cursor:
+                cursor.execute(f'DELETE FROM {table} WHERE {conditions}',
+                               [value for pair in unlikes for value in pair])
+        rebuild_like_counts(existing_ids)
+
+        # 写回后数据库中的点赞才发生变化，此时再使相关缓存失效
+        bump_entity_generation()
+        bump_user_likes_generation(*{user_id for user_id, _ in likes + unlikes})
+
+
+def flush_pending(batch_size=FLUSH_BATCH_SIZE):
+    """
+    把待写回的操作写入数据库，返回写回的操作数量
+    """
+    redis = get_redis_connection()
+    # 先处理上次中断的；否则把当前待写回的操作整体改名，之后的新操作记录到新的哈希中
+    if not redis.exists(FLUSHING_KEY):
+        try:
+            redis.rename(PENDING_KEY, FLUSHING_KEY)
+        except ResponseError:
+            return 0  # 没有待写回的操作
+
+    operations = [
+        (field.decode(), value.decode())
+        for field, value in redis.hgetall(FLUSHING_KEY).items()
+    ]
+    for start in range(0, len(operations), batch_size):
+        _write_back(operations[start:start + batch_size])
+
+    redis.delete(FLUSHING_KEY)
+    return len(operations)
+
+
+def check_consistency(fix=False):
+    """
+    对比 Redis 与数据库中的点赞数据，返回不一致的实体点赞量和用户点赞集合。
+    还有待写回操作的实体和用户会被跳过；fix 为 True 时以数据库为准修正 Redis
+    """
+    redis = get_redis_connection()
+    pending = [
+        tuple(map(int, field.decode().split(':')))
+        for key in (FLUSHING_KEY, PENDING_KEY) for field in redis.hkeys(key)
+    ]
+    pending_users = {user_id for user_id, _ in pending}
+    pending_entities = {entity_id for _, entity_id in pending}
+
+    # 实体点赞量：与 user_like 表中的实际数量对比
+    redis_counts = {int(entity_id): int(count) for entity_id, count in redis.hgetall(LIKE_COUNTS_KEY).items()}
+    db_counts = dict(
+        Like.objects.filter(entityAI_id__in=list(redis_counts)).values('entityAI_id').annotate(
+            count=Count('id')
+        ).values_list('entityAI_id', 'count')
+    )
+    count_mismatches = [
+        (entity_id, count, db_counts.get(entity_id, 0))
+        for entity_id, count in sorted(redis_counts.items())
+        if entity_id not in pending_entities and count != db_counts.get(entity_id, 0)
+    ]
+
+    # 用户点赞集合：与 user_like 表中该用户的点赞对比
+    user_mismatches = []
+    for key in redis.scan_iter(match=user_likes_key('*')):
+        user_id = int(key.decode().rsplit(':', 1)[1])
+        if user_id in pending_users:
+            continue
+        redis_ids = {int(entity_id) for entity_id in redis.smembers(key)} - {LOADED_MARK}
+        db_ids = set(Like.objects.filter(user_id=user_id).values_list('entityAI_id', flat=True))
+        if redis_ids != db_ids:
+            user_mismatches.append((user_id, sorted(db_ids - redis_ids), sorted(redis_ids - db_ids)))
+
+    if fix:
+        pipeline = redis.pipeline(transaction=False)
+        for entity_id, _, db_count in count_mismatches:
+            pipeline.hset(LIKE_COUNTS_KEY, entity_id, db_count)
+        for user_id, _, _ in user_mismatches:
+            pipeline.delete(user_likes_key(user_id))  # 下次访问时重新从数据库加载
+        pipeline.execute()
+
+    return {'counts': count_mismatches, 'users': user_mismatches}
@@ -0,0 +1,154 @@
+from django.db import connection, transaction
+from django.db.models import Exists, OuterRef
+from django.db.models.constants import OnConflict
+from django.utils import timezone
+
+from application.entityAI.models import EntityAI
+from application.user.models import Like
+
+from . import like_store
+from .cache import bump_entity_generation
+from .collaborative import bump_user_likes_generation
+from .counters import rebuild_like_counts
+
+qn = connection.ops.quote_name
+
+ENTITY_TABLE = qn(EntityAI._meta.db_table)
+LIKE_TABLE = qn(Like._meta.db_table)
+LIKE_USER_COLUMN = qn(Like._meta.get_field('user').column)
+LIKE_ENTITY_COLUMN = qn(Like._meta.get_field('entityAI').column)
+LIKE_CREATED_COLUMN = qn(Like._meta.get_field('created_time').column)
+
+
+def _change_like_count(cursor, entity_id, delta):
+    """
+    点赞量加上 delta 并返回新值
+    """
+    if connection.vendor == 'mysql':
+        # LAST_INSERT_ID(expr) 会把更新后的值放进返回包，通过 lastrowid 读取，不需要再查询一次
+        cursor.execute(
+            f'UPDATE {ENTITY_TABLE} SET like_count = LAST_INSERT_ID(GREATEST(like_count + %s, 0)) WHERE id = %s',
+            [delta, entity_id]
+        )
+        return cursor.lastrowid
+
+    cursor.execute(f'UPDATE {ENTITY_TABLE} SET like_count = like_count + %s WHERE id = %s', [delta, entity_id])
+    return _get_like_count(cursor, entity_id)
+
+
+def _get_like_count(cursor, entity_id):
+    """
+    读取点赞量，实体不存在时返回 None
+    """
+    cursor.execute(f'SELECT like_count FROM {ENTITY_TABLE} WHERE id = %s', [entity_id])
+    row = cursor.fetchone()
+    return row[0] if row else None
+
+
+def _on_likes_changed(user_id):
+    # 绕过了 ORM，不会触发 post_save / post_delete 信号，需要手动使缓存失效
+    bump_entity_generation()
+    bump_user_likes_generation(user_id)
+
+
+def _insert_likes_sql(entity_count):
+    """
+    从实体表中选出要插入的行，实体不存在时不插入，已点赞的由唯一约束忽略
+    """
+    insert = connection.ops.insert_statement(on_conflict=OnConflict.IGNORE)
+    suffix = connection.ops.on_conflict_suffix_sql([], OnConflict.IGNORE, [], [])
+    placeholders = ', '.join(['%s'] * entity_count)
+    return (
+        f'{insert} {LIKE_TABLE} ({LIKE_USER_COLUMN}, {LIKE_ENTITY_COLUMN}, {LIKE_CREATED_COLUMN}) '
+        f'SELECT %s, id, %s FROM {ENTITY_TABLE} WHERE id IN ({placeholders}) {suffix}'
+    )
+
+
+def _now():
+    return Like._meta.get_field('created_time').get_db_prep_value(timezone.now(), connection)
+
+
+def like_entity(user_id, entity_id):
+    """
+    点赞，返回 (是否新增了点赞, 点赞量)，实体不存在时点赞量为 None。
+    依赖 (user, entityAI) 的唯一约束，重复点赞被数据库忽略，并发的重复请求也不会报错
+    """
+    if like_store.enabled():
+        return like_store.set_likes(user_id, [entity_id], True).get(entity_id, (False, None))
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(_insert_likes_sql(1), [user_id, _now(), entity_id])
+        if cursor.rowcount != 1:
+            return False, _get_like_count(cursor, entity_id)
+
+        like_count = _change_like_count(cursor, entity_id, 1)
+        _on_likes_changed(user_id)
+    return True, like_count
+
+
+def unlike_entity(user_id, entity_id):
+    """
+    取消点赞，返回 (是否删除了点赞, 点赞量)，实体不存在时点赞量为 None
+    """
+    if like_store.enabled():
+        return like_store.set_likes(user_id, [entity_id], False).get(entity_id, (False, None))
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            f'DELETE FROM {LIKE_TABLE} WHERE {LIKE_USER_COLUMN} = %s AND {LIKE_ENTITY_COLUMN} = %s',
+            [user_id, entity_id]
+        )
+        if cursor.rowcount != 1:
+            return False, _get_like_count(cursor, entity_id)
+
+        like_count = _change_like_count(cursor, entity_id, -1)
+        _on_likes_changed(user_id)
+    return True, like_count
+
+
+def get_like_statuses(user_id, entity_ids):
+    """
+    一次查询返回各实体的点赞状态和点赞量，按传入顺序排列，忽略不存在的实体
+    """
+    if like_store.enabled():
+        like_counts = like_store.get_like_counts(entity_ids)
+        liked_ids = like_store.get_liked_ids(user_id, list(like_counts))
+        return [
+            {'entity_id': entity_id, 'is_liked': entity_id in liked_ids, 'like_count': like_count}
+            for entity_id, like_count in like_counts.items()
+        ]
+
+    rows = EntityAI.objects.filter(id__in=entity_ids).annotate(
+        is_liked=Exists(Like.objects.filter(user_id=user_id, entityAI=OuterRef('pk')))
+    ).values('id', 'is_liked', 'like_count')
+    statuses = {row['id']: row for row in rows}
+    return [
+        {'entity_id': entity_id, 'is_liked': statuses[entity_id]['is_liked'],
+         'like_count': statuses[entity_id]['like_count']}
+        for entity_id in dict.fromkeys(entity_ids) if entity_id in statuses
+    ]
+
+
+def batch_like(user_id, entity_ids, liked):
+    """
+    批量点赞或取消点赞：一条 INSERT 或 DELETE 完成写入，有变化时再用一条 UPDATE 重新统计这些实体的点赞量
+    """
+    if like_store.enabled():
+        return sum(changed for changed, _ in like_store.set_likes(user_id, entity_ids, liked).values())
+
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            if liked:
+                cursor.execute(_insert_likes_sql(len(entity_ids)), [user_id, _now(), *entity_ids])
+            else:
+                placeholders = ', '.join(['%s'] * len(entity_ids))
+                cursor.execute(
+                    f'DELETE FROM {LIKE_TABLE} WHERE {LIKE_USER_COLUMN} = %s AND {LIKE_ENTITY_COLUMN} IN ({placeholders})',
+                    [user_id, *entity_ids]
+                )
+            changed = cursor.rowcount
+
+        if changed:
+            rebuild_like_counts(entity_ids)
+            _on_likes_changed(user_id)
+    return changed
@@ -0,0 +1,112 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.db.models import Count, FloatField, OuterRef, Subquery, Sum
+from django.db.models.functions import Cast, Round
+from django.test.utils import CaptureQueriesContext
+
+from application.entityAI.models import EntityAI, EntityAIType
+from application.entityAI.statistics import compute_statistics
+
+
+def legacy_statistics():
+    """
+    改造前的统计实现：每个榜单单独查询，点赞量和评分通过聚合与关联子查询现场计算
+    （注解名加了 legacy_ 前缀，避免与新增的冗余字段重名）
+    """
+
+    def score_sum(field):
+        return Sum(field, output_field=FloatField())
+
+    def correlated(annotation):
+        return Subquery(
+            EntityAI.objects.filter(id=OuterRef('id')).annotate(value=annotation).values('value')[:1],
+            output_field=FloatField()
+        )
+
+    average = (score_sum('total_score1') + score_sum('total_score2') +
+               score_sum('total_score3') + score_sum('total_score4')) / 4
+
+    total_scores = EntityAI.objects.annotate(
+        legacy_total_score=Round(average, 2)
+    ).values('name', 'legacy_total_score').order_by('-legacy_total_score')[:10]
+
+    like_counts = EntityAI.objects.annotate(
+        legacy_like_count=Count('like_entityAI')
+    ).values('name', 'legacy_like_count').order_by('-legacy_like_count')[:10]
+
+    type_statistics = EntityAIType.objects.annotate(
+        entity_count=Count('entityai'),
+    ).values('name', 'entity_count').order_by('-entity_count')
+
+    score_details = EntityAI.objects.annotate(
+        total_score1_rounded=Round(Cast(score_sum('total_score1'), FloatField()), 2),
+        total_score2_rounded=Round(Cast(score_sum('total_score2'), FloatField()), 2),
+        total_score3_rounded=Round(Cast(score_sum('total_score3'), FloatField()), 2),
+        total_score4_rounded=Round(Cast(score_sum('total_score4'), FloatField()), 2),
+        legacy_average_score=Round(average, 2)
+    ).values(
+        'name',
+        'total_score1_rounded',
+        'total_score2_rounded',
+        'total_score3_rounded',
+        'total_score4_rounded',
+        'legacy_average_score'
+    ).order_by('-legacy_average_score')[:5]
+
+    like_details = EntityAI.objects.annotate(
+        total_score1_rounded=Round(correlated(score_sum('total_score1')), 2),
+        total_score2_rounded=Round(correlated(score_sum('total_score2')), 2),
+        total_score3_rounded=Round(correlated(score_sum('total_score3')), 2),
+        total_score4_rounded=Round(correlated(score_sum('total_score4')), 2),
+        legacy_like_count=correlated(Count('like_entityAI'))
+    ).values(
+        'name',
+        'total_score1_rounded',
+        'total_score2_rounded',
+        'total_score3_rounded',
+        'total_score4_rounded',
+        'legacy_like_count'
+    ).order_by('-legacy_like_count')[:5]
+
+    top_scores = [
+        list(EntityAI.objects.values('name', field).order_by(f'-{field}')[:3])
+        for field in ('total_score1', 'total_score2', 'total_score3', 'total_score4')
+    ]
+
+    return [
+        list(total_scores), list(like_counts), list(type_statistics),
+        list(score_details), list(like_details), top_scores
+    ]
+
+
+class Command(BaseCommand):
+    help = '对比改造前后 /api/statistics/ 统计计算的查询次数和耗时（建议在导入 db.sql 的数据库上运行）'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--repeat', type=int, default=20, help='每种实现重复执行的次数')
+
+    def measure(self, label, func, repeat):
+        with CaptureQueriesContext(connection) as queries:
+            func()
+        query_count = len(queries)
+
+        start = time.perf_counter()
+        for _ in range(repeat):
+            func()
+        elapsed = (time.perf_counter() - start) / repeat * 1000
+
+        self.stdout.write(f'{label:<12} 查询次数 {query_count:>3}    平均耗时 {elapsed:8.2f} ms')
+        return query_count, elapsed
+
+    def handle(self, *args, **options):
+        repeat = options['repeat']
+        self.stdout.write(f'实体数 {EntityAI.objects.count()}，每种实现执行 {repeat} 次')
+
+        legacy_queries, legacy_time = self.measure('改造前', legacy_statistics, repeat)
+        new_queries, new_time = self.measure('合并统计', compute_statistics, repeat)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'查询次数 {legacy_queries} -> {new_queries}，耗时降低 {(1 - new_time / legacy_time) * 100:.1f}%'
+        ))
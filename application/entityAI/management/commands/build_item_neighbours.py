@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from application.entityAI.collaborative import refresh_item_neighbours
+
+
+class Command(BaseCommand):
+    help = '根据点赞记录重新计算协同过滤的实体近邻并写入缓存，建议配置定时任务定期执行'
+
+    def handle(self, *args, **options):
+        neighbours = refresh_item_neighbours()
+        self.stdout.write(self.style.SUCCESS(f'协同过滤近邻已更新，共 {len(neighbours)} 个实体'))
@@ -0,0 +1,15 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from application.entityAI.similarity import SimilarityIndex
+
+
+class Command(BaseCommand):
+    help = '全量构建相似推荐索引（TF-IDF 特征矩阵和每个实体的相似实体列表）'
+
+    def handle(self, *args, **options):
+        index = SimilarityIndex.build()
+        index.save()
+        self.stdout.write(self.style.SUCCESS(
+            f'相似索引已构建，共 {len(index.ids)} 个实体，保存至 {settings.SIMILARITY_INDEX_PATH}'
+        ))
@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+
+from application.entityAI.like_store import check_consistency, flush_pending
+
+
+class Command(BaseCommand):
+    help = '检查 Redis 点赞存储与数据库是否一致，默认先写回待处理的点赞'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--no-flush', action='store_true', help='检查前不写回待处理的点赞')
+        parser.add_argument('--fix', action='store_true', help='以数据库为准修正 Redis 中不一致的数据')
+
+    def handle(self, *args, **options):
+        if not options['no_flush']:
+            flush_pending()
+
+        result = check_consistency(fix=options['fix'])
+        for entity_id, redis_count, db_count in result['counts']:
+            self.stdout.write(f'实体 {entity_id} 点赞量不一致：Redis {redis_count}，数据库 {db_count}')
+        for user_id, missing_ids, extra_ids in result['users']:
+            self.stdout.write(f'用户 {user_id} 点赞集合不一致：Redis 缺少 {missing_ids}，多出 {extra_ids}')
+
+        total = len(result['counts']) + len(result['users'])
+        if not total:
+            self.stdout.write(self.style.SUCCESS('Redis 与数据库一致'))
+        elif options['fix']:
+            self.stdout.write(self.style.SUCCESS(f'已修正 {total} 处不一致'))
+        else:
+            self.stdout.write(self.style.WARNING(f'发现 {total} 处不一致，可加 --fix 修正'))
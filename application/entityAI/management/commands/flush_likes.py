@@ -0,0 +1,23 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from application.entityAI.like_store import flush_pending
+
+
+class Command(BaseCommand):
+    help = '把 Redis 中待写回的点赞批量写入数据库（LIKE_STORE_REDIS 开启时使用）；加 --loop 作为后台任务常驻'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--loop', action='store_true', help='常驻运行，定期写回')
+        parser.add_argument('--interval', type=float, default=5, help='写回间隔（秒）')
+        parser.add_argument('--batch-size', type=int, default=500, help='每个事务写回的操作数量')
+
+    def handle(self, *args, **options):
+        while True:
+            flushed = flush_pending(options['batch_size'])
+            if flushed:
+                self.stdout.write(self.style.SUCCESS(f'已写回 {flushed} 个点赞操作'))
+            if not options['loop']:
+                return
+            time.sleep(options['interval'])
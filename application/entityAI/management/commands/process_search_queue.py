@@ -0,0 +1,34 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from application.entityAI.search_signals import process_search_queue
+
+
+class Command(BaseCommand):
+    help = '批量处理搜索索引更新队列；加 --loop 作为后台任务常驻'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--loop', action='store_true', help='常驻运行，定期处理队列')
+        parser.add_argument('--interval', type=float, default=2, help='队列为空时的检查间隔（秒）')
+        parser.add_argument('--batch-size', type=int, default=500, help='每批更新的实体数量')
+
+    def handle(self, *args, **options):
+        while True:
+            processed = self.process(options['batch_size'])
+            if not options['loop']:
+                return
+            if not processed:
+                time.sleep(options['interval'])
+
+    def process(self, batch_size):
+        """处理到队列为空为止，返回处理的实体数量"""
+        total = 0
+        while True:
+            processed = process_search_queue(batch_size)
+            if not processed:
+                break
+            total += processed
+        if total:
+            self.stdout.write(self.style.SUCCESS(f'已更新 {total} 个实体的索引'))
+        return total
@@ -0,0 +1,24 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from application.entityAI.similarity import process_similarity_queue
+
+
+class Command(BaseCommand):
+    help = '批量处理相似索引刷新队列；加 --loop 作为后台任务常驻'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--loop', action='store_true', help='常驻运行，定期处理队列')
+        parser.add_argument('--interval', type=float, default=5, help='队列为空时的检查间隔（秒）')
+        parser.add_argument('--batch-size', type=int, default=100, help='每批刷新的实体数量，每批只保存一次索引文件')
+
+    def handle(self, *args, **options):
+        while True:
+            processed = process_similarity_queue(options['batch_size'])
+            if processed:
+                self.stdout.write(self.style.SUCCESS(f'已刷新 {processed} 个实体的相似索引'))
+            if not options['loop']:
+                return
+            if not processed:
+                time.sleep(options['interval'])
@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from application.comment.stats import rebuild_comment_stats
+from application.entityAI.counters import rebuild_like_counts, rebuild_scores
+
+
+class Command(BaseCommand):
+    help = '根据点赞表和评论表重建实体AI的冗余统计字段（点赞量、评论数、评分、评论分布），用于修复漂移'
+
+    def add_arguments(self, parser):
+        parser.add_argument('ids', nargs='*', type=int, help='只重建指定的实体AI，默认全部')
+
+    def handle(self, *args, **options):
+        entity_ids = options['ids'] or None
+
+        with transaction.atomic():
+            like_updated = rebuild_like_counts(entity_ids)
+            score_updated = rebuild_scores(entity_ids)
+            stat_rows = rebuild_comment_stats(entity_ids)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'点赞量已重建 {like_updated} 条，评论数和评分已重建 {score_updated} 条，评论分布已写入 {stat_rows} 个分段'
+        ))
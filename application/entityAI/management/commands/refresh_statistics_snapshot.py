@@ -0,0 +1,40 @@
+import time
+
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from application.entityAI.cache import STATISTICS_WRITES_KEY
+from application.entityAI.models import StatisticsSnapshot
+from application.entityAI.statistics import refresh_snapshot
+
+
+class Command(BaseCommand):
+    help = '重建统计快照；加 --loop 作为后台任务常驻，写入次数或快照时长达到阈值时自动重建'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--loop', action='store_true', help='常驻运行，定期检查是否需要重建')
+        parser.add_argument('--interval', type=int, default=30, help='检查间隔（秒）')
+        parser.add_argument('--writes', type=int, default=100, help='累计写入多少次后重建')
+        parser.add_argument('--max-age', type=int, default=600, help='快照最长保留时间（秒），到期后重建')
+
+    def handle(self, *args, **options):
+        if not options['loop']:
+            self.refresh()
+            return
+
+        while True:
+            if self.should_refresh(options['writes'], options['max_age']):
+                self.refresh()
+            time.sleep(options['interval'])
+
+    def should_refresh(self, writes, max_age):
+        if (cache.get(STATISTICS_WRITES_KEY) or 0) >= writes:
+            return True
+
+        latest = StatisticsSnapshot.objects.order_by('-id').values_list('created_time', flat=True).first()
+        return latest is None or (timezone.now() - latest).total_seconds() >= max_age
+
+    def refresh(self):
+        snapshot = refresh_snapshot()
+        self.stdout.write(self.style.SUCCESS(f'{snapshot} 已生成'))
@@ -1,4 +1,5 @@
 from django.db import models
+from django.utils import timezone
 from pypinyin import lazy_pinyin
 
 class EntityAI(models.Model):
@@ -24,6 +25,22 @@ class EntityAI(models.Model):
     total_score3 = models.FloatField(verbose_name='评分细则3-图片能力', default=0)
     total_score4 = models.FloatField(verbose_name='评分细则4-文本能力', default=0)
 
+    # 冗余统计字段，由点赞和评论写入时增量维护，用于排序和过滤
+    like_count = models.IntegerField(verbose_name='点赞量', default=0, db_index=True)
+    average_score = models.FloatField(verbose_name='平均评分', default=0, db_index=True)
+
+    # 评论数和各维度评分之和，评论写入时增量更新，各维度评分由此算出
+    comment_count = models.IntegerField(verbose_name='评论数', default=0)
+    score1_sum = models.FloatField(verbose_name='评分细则1总和', default=0)
+    score2_sum = models.FloatField(verbose_name='评分细则2总和', default=0)
+    score3_sum = models.FloatField(verbose_name='评分细则3总和', default=0)
+    score4_sum = models.FloatField(verbose_name='评分细则4总和', default=0)
+
+    # 只允许增量更新的字段，普通保存时不写回，避免覆盖并发的增量结果
+    COUNTER_FIELDS = (
+        'like_count', 'comment_count', 'score1_sum', 'score2_sum', 'score3_sum', 'score4_sum',
+        'total_score1', 'total_score2', 'total_score3', 'total_score4', 'average_score',
+    )
 
     def __str__(self):
         return self.name
@@ -35,6 +52,15 @@ class EntityAI(models.Model):
     def save(self, *args, **kwargs):
         # 在保存时自动计算拼音
         self.pinyin_name = ''.join(lazy_pinyin(self.name))
+        self.average_score = round(
+            (self.total_score1 + self.total_score2 + self.total_score3 + self.total_score4) / 4, 2
+        )
+
+        if not self._state.adding and not kwargs.get('force_insert') and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.COUNTER_FIELDS
+            ]
         super().save(*args, **kwargs)
 
 
@@ -67,4 +93,36 @@ class EntityAITag(models.Model):
 
     class Meta:
         verbose_name = '实体AI标签'
-        verbose_name_plural = verbose_name
\ No newline at end of file
+        verbose_name_plural = verbose_name
+
+
+class StatisticsSnapshot(models.Model):
+    """
+    统计数据快照模型，由 refresh_statistics_snapshot 定期重建，统计接口直接读取最新快照
+    """
+    total_scores = models.JSONField(verbose_name='总评分前十')
+    like_counts = models.JSONField(verbose_name='点赞量前十')
+    type_statistics = models.JSONField(verbose_name='各类型数量')
+    score_details = models.JSONField(verbose_name='评分细则前五')
+    like_details = models.JSONField(verbose_name='点赞细则前五')
+    top_scores = models.JSONField(verbose_name='各维度前三')
+
+    created_time = models.DateTimeField(auto_now_add=True, verbose_name='创建时间')
+
+    def __str__(self):
+        return f'统计快照 {timezone.localtime(self.created_time):%Y-%m-%d %H:%M:%S}'
+
+    class Meta:
+        verbose_name = '统计快照'
+        verbose_name_plural = verbose_name
+
+    def to_data(self):
+        return {
+            "total_scores": self.total_scores,
+            "like_counts": self.like_counts,
+            "type_statistics": self.type_statistics,
+            "score_details": self.score_details,
+            "like_details": self.like_details,
+            "top_scores": self.top_scores,
+            "updated_time": self.created_time.isoformat(),
+        }
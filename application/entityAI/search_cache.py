@@ -0,0 +1,88 @@
+import hashlib
+import json
+
+from django.core.cache import cache
+from haystack import connections
+from haystack.query import SearchQuerySet
+
+from application.entityAI.models import EntityAI
+from utils.cache_utils import get_generation, get_or_compute, incr_counter
+from utils.text_utils import tokenize
+
+from .cache import ENTITY_GENERATION, SEARCH_CACHE_HITS_KEY, SEARCH_CACHE_KEY, SEARCH_CACHE_MISSES_KEY
+
+SEARCH_MAX_RESULTS = 1000  # 每个查询最多缓存的命中数量
+SEARCH_CACHE_TIMEOUT = 60 * 10
+TAG_FACET_LIMIT = 20  # 标签分面最多返回的数量
+
+
+def get_search_cache_key(tokens, type_id, ordering):
+    """
+    以分词结果作为查询的规范形式，大小写、空格和标点不同的查询共用同一份缓存。
+    按相关度排序时只依赖索引代数，按点赞量、评分等字段排序时还依赖实体数据的代数
+    """
+    generation = connections['default'].get_backend().get_generation()
+    if ordering is not None:
+        generation = f'{generation}:{get_generation(ENTITY_GENERATION)}'
+    digest = hashlib.md5(json.dumps([tokens, type_id, ordering], ensure_ascii=False).encode('utf-8')).hexdigest()
+    return f'{SEARCH_CACHE_KEY}:{generation}:{digest}'
+
+
+def compute_search(query, type_id, ordering):
+    """
+    返回 {'ids': 命中的实体 ID, 'hits': 命中总数, 'facets': 类型和标签的分面数量}。
+    ids 最多 SEARCH_MAX_RESULTS 条，hits 是全部命中的数量
+    """
+    sqs = SearchQuerySet().models(EntityAI).filter(content=query)
+
+    # 通过 `type` 过滤，在索引中完成
+    if type_id is not None:
+        sqs = sqs.filter(type_id__exact=type_id)
+
+    # 只读取索引中存储的实体 ID，不逐条加载对象；分面数量在同一次查询中统计
+    sqs = sqs.facet('type_id').facet('tags', limit=TAG_FACET_LIMIT).values_list('pk', flat=True)
+    ids = [int(pk) for pk in sqs[:SEARCH_MAX_RESULTS]]
+    hits = sqs.count()  # 取自同一次查询返回的命中总数，不受切片影响
+    facets = sqs.facet_counts().get('fields', {})
+
+    if ordering is not None:
+        # 按点赞量、评分等字段排序：命中的 ID 交给数据库，利用字段索引排序
+        ids = list(EntityAI.objects.filter(id__in=ids).order_by(ordering, 'id').values_list('id', flat=True))
+
+    return {
+        'ids': ids,
+        'hits': hits,
+        'facets': {
+            'type_id': facets.get('type_id', []),
+            'tags': facets.get('tags', []),
+        }
+    }
+
+
+def search_entities(query, type_id=None, ordering=None):
+    """
+    返回搜索命中的实体 ID 列表、命中总数和分面数量，ordering 为 None 时按相关度排序，结果按规范化的查询缓存
+    """
+    tokens = tokenize(query)
+    if not tokens:
+        return {'ids': [], 'hits': 0, 'facets': {'type_id': [], 'tags': []}}
+
+    computed = []
+
+    def compute():
+        computed.append(True)
+        return compute_search(query, type_id, ordering)
+
+    result = get_or_compute(get_search_cache_key(tokens, type_id, ordering), compute, SEARCH_CACHE_TIMEOUT)
+    incr_counter(SEARCH_CACHE_MISSES_KEY if computed else SEARCH_CACHE_HITS_KEY)
+    return result
+
+
+def get_search_cache_stats():
+    hits = cache.get(SEARCH_CACHE_HITS_KEY) or 0
+    misses = cache.get(SEARCH_CACHE_MISSES_KEY) or 0
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_rate': round(hits / (hits + misses), 4) if hits + misses else 0,
+    }
@@ -12,14 +12,15 @@ class EntityAIIndex(indexes.SearchIndex, indexes.Indexable):
     name = indexes.CharField(model_attr='name')
     description = indexes.CharField(model_attr='description')
     type = indexes.CharField(model_attr='type__name')  # 索引类型名称
+    type_id = indexes.IntegerField(model_attr='type_id')  # 索引类型 ID，用于在索引中按类型过滤
     tags = indexes.MultiValueField()  # 用于存储标签信息
 
     def get_model(self):
         return EntityAI
 
     def index_queryset(self, using=None):
-        """定义要被索引的查询集"""
-        return self.get_model().objects.all()
+        """定义要被索引的查询集，一次取出类型和标签，避免逐条查询"""
+        return self.get_model().objects.select_related('type').prefetch_related('entityAI_tags')
 
     def prepare_tags(self, obj):
         """提取标签信息"""
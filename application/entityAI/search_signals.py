@@ -0,0 +1,99 @@
+from django.db import transaction
+from django.db.models import signals
+from django_redis import get_redis_connection
+from haystack import connections
+from haystack.exceptions import NotHandled
+from haystack.signals import BaseSignalProcessor
+from haystack.utils import get_identifier
+
+from application.entityAI.models import EntityAI, EntityAITag, EntityAIType
+
+SEARCH_QUEUE_KEY = 'search:queue'  # 待更新索引的实体 ID 集合
+
+
+def enqueue_entities(entity_ids):
+    """
+    把需要更新索引的实体 ID 放入队列，在事务提交后执行，集合会自动合并同一实体的多次修改
+    """
+    entity_ids = [entity_id for entity_id in entity_ids if entity_id is not None]
+    if entity_ids:
+        transaction.on_commit(lambda: get_redis_connection().sadd(SEARCH_QUEUE_KEY, *entity_ids))
+
+
+def process_search_queue(batch_size=500, using='default'):
+    """
+    从队列中取出一批实体批量更新索引：仍然存在的实体重新索引，已删除的从索引中移除。
+    返回处理的实体数量；更新失败时把实体放回队列，下次再处理
+    """
+    redis = get_redis_connection()
+    entity_ids = [int(entity_id) for entity_id in redis.spop(SEARCH_QUEUE_KEY, batch_size)]
+    if not entity_ids:
+        return 0
+
+    backend = connections[using].get_backend()
+    index = connections[using].get_unified_index().get_index(EntityAI)
+
+    try:
+        entities = list(index.index_queryset(using=using).filter(id__in=entity_ids))
+        if entities:
+            backend.update(index, entities)
+
+        existing_ids = {entity.id for entity in entities}
+        for entity_id in entity_ids:
+            if entity_id not in existing_ids:
+                backend.remove(get_identifier(EntityAI(id=entity_id)))
+    except Exception:
+        redis.sadd(SEARCH_QUEUE_KEY, *entity_ids)
+        raise
+
+    return len(entity_ids)
+
+
+class QueuedSignalProcessor(BaseSignalProcessor):
+    """
+    收集实体、标签、类型的变化放入 Redis 队列，由 process_search_queue 后台任务批量更新索引
+    """
+
+    def setup(self):
+        signals.post_save.connect(self.handle_entity_change, sender=EntityAI)
+        signals.post_delete.connect(self.handle_entity_change, sender=EntityAI)
+        signals.post_save.connect(self.handle_tag_save, sender=EntityAITag)
+        signals.pre_delete.connect(self.handle_tag_save, sender=EntityAITag)
+        signals.post_save.connect(self.handle_type_save, sender=EntityAIType)
+        signals.m2m_changed.connect(self.handle_tags_changed, sender=EntityAITag.entityAI.through)
+
+    def teardown(self):
+        signals.post_save.disconnect(self.handle_entity_change, sender=EntityAI)
+        signals.post_delete.disconnect(self.handle_entity_change, sender=EntityAI)
+        signals.post_save.disconnect(self.handle_tag_save, sender=EntityAITag)
+        signals.pre_delete.disconnect(self.handle_tag_save, sender=EntityAITag)
+        signals.post_save.disconnect(self.handle_type_save, sender=EntityAIType)
+        signals.m2m_changed.disconnect(self.handle_tags_changed, sender=EntityAITag.entityAI.through)
+
+    def handle_entity_change(self, sender, instance, **kwargs):
+        try:
+            self.connections['default'].get_unified_index().get_index(sender)
+        except NotHandled:
+            return
+        enqueue_entities([instance.pk])
+
+    def handle_tag_save(self, sender, instance, **kwargs):
+        """标签改名或删除时，重新索引使用该标签的实体（删除前先取出关联实体）"""
+        enqueue_entities(list(instance.entityAI.values_list('id', flat=True)))
+
+    def handle_type_save(self, sender, instance, created, **kwargs):
+        """类型改名时，重新索引该类型下的实体"""
+        if not created:
+            enqueue_entities(list(EntityAI.objects.filter(type=instance).values_list('id', flat=True)))
+
+    def handle_tags_changed(self, sender, instance, action, reverse, pk_set, **kwargs):
+        """实体与标签的关联变化时，重新索引涉及的实体"""
+        if action not in ('post_add', 'post_remove', 'pre_clear'):
+            return
+        if reverse:
+            # 从实体一侧修改其标签
+            enqueue_entities([instance.pk])
+        elif action == 'pre_clear':
+            enqueue_entities(list(instance.entityAI.values_list('id', flat=True)))
+        else:
+            enqueue_entities(list(pk_set))
@@ -1,7 +1,23 @@
+from django.db import models
 from rest_framework import serializers
 from .models import EntityAI, EntityAIType, EntityAITag
 from application.user.models import Like
 
+from . import like_store
+
+
+def get_liked_ids(user, entity_ids):
+    """
+    一次查出用户在给定实体中点赞过的实体 ID 集合
+    """
+    if not user.is_authenticated or not entity_ids:
+        return set()
+    if like_store.enabled():
+        return like_store.get_liked_ids(user.id, entity_ids)
+    return set(
+        Like.objects.filter(user=user, entityAI_id__in=entity_ids).values_list('entityAI_id', flat=True)
+    )
+
 
 class EntityAITypeSerializer(serializers.ModelSerializer):
     class Meta:
@@ -21,6 +37,22 @@ class EntityAITagSerializer(serializers.ModelSerializer):
         fields = '__all__'
 
 
+class EntityAIListSerializer(serializers.ListSerializer):
+    """
+    批量序列化实体AI时，先一次性算出当前用户的点赞集合，避免每行查询一次
+    """
+
+    def to_representation(self, data):
+        iterable = data.all() if isinstance(data, models.manager.BaseManager) else data
+        instances = list(iterable)
+        entity_ids = [instance.id for instance in instances]
+        self.context['liked_ids'] = get_liked_ids(self.context['request'].user, entity_ids)
+        if like_store.enabled():
+            # 点赞量以 Redis 中的为准，数据库中的要等写回后才更新
+            self.context['like_counts'] = like_store.get_like_counts(entity_ids)
+        return super().to_representation(instances)
+
+
 class EntityAISerializer(serializers.ModelSerializer):
     type_id = serializers.PrimaryKeyRelatedField(
         queryset=EntityAIType.objects.all(), source='type', write_only=True
@@ -33,24 +65,43 @@ class EntityAISerializer(serializers.ModelSerializer):
 
     entityAI_tags = serializers.SerializerMethodField()
 
-    like_count = serializers.IntegerField(read_only=True)
+    like_count = serializers.SerializerMethodField()
 
     is_liked = serializers.SerializerMethodField()
 
     average_score = serializers.FloatField(read_only=True)
 
+    # 以下字段在列表中依赖 select_related('type') 与 prefetch_related('entityAI_tags')
     def get_type(self, obj):
         return {"id": obj.type.id, "name": obj.type.name}
 
     def get_entityAI_tags(self, obj):
         return [{"id": tag.id, "name": tag.name} for tag in obj.entityAI_tags.all()]
 
+    def get_like_count(self, obj):
+        if not like_store.enabled():
+            return obj.like_count
+        like_counts = self.context.get('like_counts')
+        if like_counts is None:
+            like_counts = like_store.get_like_counts([obj.id])
+        return like_counts.get(obj.id, obj.like_count)
+
     def get_is_liked(self, obj):
         """判断当前用户是否已点赞"""
+        liked_ids = self.context.get('liked_ids')
+        if liked_ids is not None:
+            return obj.id in liked_ids
+
         user = self.context['request'].user
+        if not user.is_authenticated:
+            return False
+        if like_store.enabled():
+            return obj.id in like_store.get_liked_ids(user.id, [obj.id])
         return Like.objects.filter(user=user, entityAI=obj).exists()
 
     class Meta:
         model = EntityAI
         fields = '__all__'
+        list_serializer_class = EntityAIListSerializer
+        read_only_fields = EntityAI.COUNTER_FIELDS  # 统计字段由点赞和评论维护，不允许直接修改
         extra_fields = ['is_liked']  # 声明动态字段
\ No newline at end of file
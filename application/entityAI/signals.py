@@ -0,0 +1,70 @@
+from django.db import transaction
+from django.db.models import F
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from application.comment.models import Comment
+from application.entityAI.models import EntityAI, EntityAITag, EntityAIType
+from application.user.models import Like
+from utils.cache_utils import bump_generation
+
+from . import like_store
+from .cache import SUGGEST_GENERATION, bump_entity_generation
+from .collaborative import bump_user_likes_generation
+from .similarity import enqueue_refresh
+
+
+@receiver([post_save, post_delete], sender=EntityAI)
+@receiver([post_save, post_delete], sender=EntityAIType)
+@receiver([post_save, post_delete], sender=EntityAITag)
+@receiver([post_save, post_delete], sender=Like)
+@receiver([post_save, post_delete], sender=Comment)
+def invalidate_entity_cache(sender, **kwargs):
+    """实体、类型、标签、点赞、评论写入后，推荐和统计缓存失效"""
+    bump_entity_generation()
+
+
+@receiver(m2m_changed, sender=EntityAITag.entityAI.through)
+def invalidate_entity_cache_on_tags_changed(sender, action, **kwargs):
+    """实体与标签的关联变化后，推荐和统计缓存失效"""
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        bump_entity_generation()
+
+
+@receiver([post_save, post_delete], sender=EntityAI)
+def invalidate_suggest_index(sender, **kwargs):
+    """实体新增、修改或删除后，各进程的搜索建议索引重建"""
+    transaction.on_commit(lambda: bump_generation(SUGGEST_GENERATION))
+
+
+@receiver(post_delete, sender=EntityAI)
+def remove_like_count(sender, instance, **kwargs):
+    """实体删除后，清除 Redis 中保存的点赞量"""
+    if like_store.enabled():
+        entity_id = instance.id
+        transaction.on_commit(lambda: like_store.remove_entity(entity_id))
+
+
+@receiver(post_save, sender=Like)
+def increase_like_count(sender, instance, created, **kwargs):
+    """通过 ORM 新增点赞（后台管理等）后，点赞量加一；点赞接口用 SQL 直接写入，不会触发信号"""
+    if created:
+        EntityAI.objects.filter(id=instance.entityAI_id).update(like_count=F('like_count') + 1)
+
+
+@receiver(post_delete, sender=Like)
+def decrease_like_count(sender, instance, **kwargs):
+    """通过 ORM 删除点赞（包括删除用户时级联删除）后，点赞量减一"""
+    EntityAI.objects.filter(id=instance.entityAI_id).update(like_count=F('like_count') - 1)
+
+
+@receiver([post_save, post_delete], sender=Like)
+def invalidate_user_recommendations(sender, instance, **kwargs):
+    """用户点赞变化后，其个性化推荐缓存失效"""
+    bump_user_likes_generation(instance.user_id)
+
+
+@receiver([post_save, post_delete], sender=EntityAI)
+def refresh_similarity_index(sender, instance, **kwargs):
+    """实体新增、修改或删除后，在事务提交后放入相似索引刷新队列，由后台任务批量刷新"""
+    enqueue_refresh(instance.id)
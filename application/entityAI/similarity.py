@@ -0,0 +1,280 @@
+import os
+import threading
+
+import joblib
+import numpy as np
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django_redis import get_redis_connection
+from scipy import sparse
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.preprocessing import MinMaxScaler, normalize
+
+from application.entityAI.models import EntityAI
+from utils.text_utils import tokenize
+
+TOP_K = 20  # 每个实体预先保存的相似实体数量
+BLOCK_SIZE = 256  # 全量构建时分块计算相似度，内存占用为 BLOCK_SIZE × 实体数
+LIKED_BOOST = 0.1  # 查询时对用户已收藏实体的加分
+UPDATE_LOCK_KEY = 'entityAI:similarity:lock'
+UPDATE_LOCK_TIMEOUT = 30
+SIMILARITY_QUEUE_KEY = 'similarity:queue'  # 待刷新相似索引的实体 ID 集合
+
+_index = None
+_index_mtime = None
+_index_lock = threading.Lock()
+
+
+def get_entity_features(entities):
+    """
+    提取实体的文本特征（名称和描述）和数值特征（总评分、点赞量）
+    """
+    texts = [f"{entity.name} {entity.description}" for entity in entities]
+    numbers = np.array([
+        [
+            entity.total_score1 + entity.total_score2 + entity.total_score3 + entity.total_score4,
+            entity.like_count,
+        ] for entity in entities
+    ], dtype=float).reshape(-1, 2)
+    return texts, numbers
+
+
+class SimilarityIndex:
+    """
+    相似实体索引：保存实体特征的稀疏矩阵，以及每个实体预先计算好的前 K 个相似实体
+    """
+
+    def __init__(self, vectorizer, scaler, ids, matrix, neighbours):
+        self.vectorizer = vectorizer
+        self.scaler = scaler
+        self.ids = list(ids)
+        self.matrix = matrix.tocsr()  # 每行已做 L2 归一化，点积即余弦相似度
+        self.neighbours = neighbours  # {实体 ID: [(相似实体 ID, 相似度), ...]}
+        self.positions = {entity_id: position for position, entity_id in enumerate(self.ids)}
+
+    @classmethod
+    def build(cls):
+        """
+        基于全部实体重新训练特征并计算相似实体
+        """
+        entities = list(EntityAI.objects.order_by('id'))
+        texts, numbers = get_entity_features(entities)
+
+        vectorizer = TfidfVectorizer(tokenizer=tokenize, token_pattern=None, dtype=np.float32)
+        scaler = MinMaxScaler()
+        if entities:
+            text_vectors = vectorizer.fit_transform(texts)
+            number_vectors = scaler.fit_transform(numbers)
+            matrix = normalize(sparse.hstack([text_vectors, sparse.csr_matrix(number_vectors)], format='csr'))
+        else:
+            matrix = sparse.csr_matrix((0, 0), dtype=np.float32)
+
+        index = cls(vectorizer, scaler, [entity.id for entity in entities], matrix, {})
+
+        # 分块计算相似度，避免生成 N × N 的稠密矩阵
+        for start in range(0, len(index.ids), BLOCK_SIZE):
+            block = (index.matrix[start:start + BLOCK_SIZE] @ index.matrix.T).toarray()
+            for offset, similarities in enumerate(block):
+                entity_id = index.ids[start + offset]
+                index.neighbours[entity_id] = index.top_neighbours(similarities, exclude=entity_id)
+        return index
+
+    def transform(self, entities):
+        texts, numbers = get_entity_features(entities)
+        number_vectors = np.clip(self.scaler.transform(numbers), 0, 1)
+        return normalize(sparse.hstack(
+            [self.vectorizer.transform(texts), sparse.csr_matrix(number_vectors)], format='csr'
+        ).astype(np.float32))
+
+    def similarities(self, vector):
+        """
+        计算特征向量与所有实体的余弦相似度（稀疏矩阵乘法）
+        """
+        return (self.matrix @ vector.T).toarray().ravel()
+
+    def top_neighbours(self, similarities, exclude):
+        """
+        根据相似度数组取出前 K 个实体，用 argpartition 避免全量排序
+        """
+        if not self.ids:
+            return []
+        count = min(TOP_K + 1, len(similarities))
+        candidates = np.argpartition(-similarities, count - 1)[:count]
+        candidates = candidates[np.argsort(-similarities[candidates])]
+        return [
+            (self.ids[position], float(similarities[position]))
+            for position in candidates
+            if self.ids[position] != exclude
+        ][:TOP_K]
+
+    def update_entity(self, entity):
+        """
+        增量更新单个实体：替换或追加其特征行，并修正受影响实体的相似列表
+        """
+        vector = self.transform([entity])
+        if entity.id in self.positions:
+            rows = [self.matrix[:self.positions[entity.id]], vector, self.matrix[self.positions[entity.id] + 1:]]
+            self.matrix = sparse.vstack(rows).tocsr()
+        else:
+            self.positions[entity.id] = len(self.ids)
+            self.ids.append(entity.id)
+            self.matrix = sparse.vstack([self.matrix, vector]).tocsr()
+
+        similarities = self.similarities(vector)
+        self.neighbours[entity.id] = self.top_neighbours(similarities, exclude=entity.id)
+        self.refresh_affected(entity.id, similarities)
+
+    def remove_entity(self, entity_id):
+        """
+        从索引中删除实体，并修正原本包含它的相似列表
+        """
+        if entity_id not in self.positions:
+            return
+        position = self.positions[entity_id]
+        self.matrix = sparse.vstack([self.matrix[:position], self.matrix[position + 1:]]).tocsr()
+        self.ids.pop(position)
+        self.positions = {other_id: other_position for other_position, other_id in enumerate(self.ids)}
+        self.neighbours.pop(entity_id, None)
+        self.refresh_affected(entity_id, None)
+
+    def refresh_affected(self, entity_id, similarities):
+        """
+        相似列表中原本含有该实体的，整行重算；新相似度能挤进前 K 的，插入并截断
+        """
+        for other_id, neighbours in self.neighbours.items():
+            if other_id == entity_id:
+                continue
+            if any(neighbour_id == entity_id for neighbour_id, _ in neighbours):
+                position = self.positions[other_id]
+                self.neighbours[other_id] = self.top_neighbours(
+                    self.similarities(self.matrix[position]), exclude=other_id
+                )
+            elif similarities is not None:
+                similarity = float(similarities[self.positions[other_id]])
+                if len(neighbours) < TOP_K or similarity > neighbours[-1][1]:
+                    neighbours = neighbours + [(entity_id, similarity)]
+                    neighbours.sort(key=lambda item: item[1], reverse=True)
+                    self.neighbours[other_id] = neighbours[:TOP_K]
+
+    def neighbours_for(self, entity):
+        """
+        计算不在索引中的实体的相似列表，不修改索引
+        """
+        return self.top_neighbours(self.similarities(self.transform([entity])), exclude=entity.id)
+
+    def similar(self, entity_id, liked_ids=(), count=3, neighbours=None):
+        """
+        返回与实体最相似的若干实体 ID，用户收藏过的实体适当加分；neighbours 为空时从索引中读取
+        """
+        if neighbours is None:
+            neighbours = self.neighbours.get(entity_id)
+        if neighbours is None:
+            return None
+        ranked = sorted(
+            neighbours,
+            key=lambda item: item[1] + (LIKED_BOOST if item[0] in liked_ids else 0),
+            reverse=True
+        )
+        return [neighbour_id for neighbour_id, _ in ranked[:count]]
+
+    def save(self, path=None):
+        """
+        先写临时文件再替换，保证其他进程读到的始终是完整的索引
+        """
+        path = path or settings.SIMILARITY_INDEX_PATH
+        temp_path = f'{path}.{os.getpid()}.tmp'
+        joblib.dump({
+            'vectorizer': self.vectorizer,
+            'scaler': self.scaler,
+            'ids': self.ids,
+            'matrix': self.matrix,
+            'neighbours': self.neighbours,
+        }, temp_path)
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path=None):
+        data = joblib.load(path or settings.SIMILARITY_INDEX_PATH)
+        return cls(data['vectorizer'], data['scaler'], data['ids'], data['matrix'], data['neighbours'])
+
+
+def get_similarity_index():
+    """
+    获取当前进程的相似索引，索引文件被其他进程更新后自动重新加载，不存在时现场构建
+    """
+    global _index, _index_mtime
+
+    path = settings.SIMILARITY_INDEX_PATH
+    with _index_lock:
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            mtime = None
+
+        if mtime is None:
+            _index = SimilarityIndex.build()
+            _index.save(path)
+            _index_mtime = os.path.getmtime(path)
+        elif _index is None or mtime != _index_mtime:
+            _index = SimilarityIndex.load(path)
+            _index_mtime = mtime
+        return _index
+
+
+def enqueue_refresh(entity_id):
+    """
+    把需要刷新相似索引的实体 ID 放入队列，在事务提交后执行，由 process_similarity_queue 后台任务处理
+    """
+    transaction.on_commit(lambda: get_redis_connection().sadd(SIMILARITY_QUEUE_KEY, entity_id))
+
+
+def refresh_entities(entity_ids):
+    """
+    增量刷新一批实体的相似索引，只保存一次索引文件。
+    其他进程正在更新时不等待，返回 False
+    """
+    global _index, _index_mtime
+
+    if not cache.add(UPDATE_LOCK_KEY, 1, timeout=UPDATE_LOCK_TIMEOUT):
+        return False
+
+    try:
+        index = get_similarity_index()
+        entities = EntityAI.objects.in_bulk(entity_ids)
+        with _index_lock:
+            if not index.ids:
+                # 空索引尚未训练特征，直接全量构建
+                _index = index = SimilarityIndex.build()
+            else:
+                for entity_id in entity_ids:
+                    if entity_id in entities:
+                        index.update_entity(entities[entity_id])
+                    else:
+                        index.remove_entity(entity_id)
+            index.save()
+            _index_mtime = os.path.getmtime(settings.SIMILARITY_INDEX_PATH)
+    finally:
+        cache.delete(UPDATE_LOCK_KEY)
+    return True
+
+
+def process_similarity_queue(batch_size=100):
+    """
+    从队列中取出一批实体刷新相似索引，返回处理的实体数量；
+    其他进程正在更新索引时把实体放回队列，下次再处理
+    """
+    redis = get_redis_connection()
+    entity_ids = [int(entity_id) for entity_id in redis.spop(SIMILARITY_QUEUE_KEY, batch_size)]
+    if not entity_ids:
+        return 0
+
+    try:
+        refreshed = refresh_entities(entity_ids)
+    except Exception:
+        redis.sadd(SIMILARITY_QUEUE_KEY, *entity_ids)
+        raise
+    if not refreshed:
+        redis.sadd(SIMILARITY_QUEUE_KEY, *entity_ids)
+        return 0
+    return len(entity_ids)
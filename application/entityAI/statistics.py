@@ -0,0 +1,129 @@
+from django.core.cache import cache
+from django.db.models import Count, F, Window
+from django.db.models.functions import Least, Round, RowNumber
+
+from application.entityAI.models import EntityAI, EntityAIType, StatisticsSnapshot
+from utils.cache_utils import get_or_compute
+
+from .cache import STATISTICS_CACHE_KEY, STATISTICS_WRITES_KEY
+
+SNAPSHOT_KEEP = 24  # 保留最近的快照数量，便于排查统计数据的变化
+
+# 各排行榜的排序字段和保留名次
+RANKINGS = {
+    'score_rank': ('average_score', 10),  # 总评分前 10，其中前 5 用于评分细则
+    'like_rank': ('like_count', 10),  # 点赞量前 10，其中前 5 用于点赞细则
+    'score1_rank': ('total_score1', 3),  # 各维度前 3
+    'score2_rank': ('total_score2', 3),
+    'score3_rank': ('total_score3', 3),
+    'score4_rank': ('total_score4', 3),
+}
+
+TOP_SCORE_SECTIONS = {
+    'math_ability': ('score1_rank', 'total_score1'),
+    'language_ability': ('score2_rank', 'total_score2'),
+    'image_ability': ('score3_rank', 'total_score3'),
+    'text_ability': ('score4_rank', 'total_score4'),
+}
+
+
+def get_ranked_entities():
+    """
+    一次扫描实体表，用窗口函数为每个排行榜计算名次，只取出至少在一个榜单内的实体
+    """
+    ranks = {
+        name: Window(RowNumber(), order_by=[F(field).desc(), F('id').asc()])
+        for name, (field, _) in RANKINGS.items()
+    }
+    return list(
+        EntityAI.objects.annotate(
+            **ranks,
+            total_score1_rounded=Round('total_score1', 2),
+            total_score2_rounded=Round('total_score2', 2),
+            total_score3_rounded=Round('total_score3', 2),
+            total_score4_rounded=Round('total_score4', 2),
+        ).annotate(
+            # 名次减去保留名次后取最小值，小于等于 0 即至少进入了一个榜单
+            best_rank=Least(*[F(name) - limit for name, (_, limit) in RANKINGS.items()])
+        ).filter(best_rank__lte=0).values(
+            'name',
+            'total_score1',
+            'total_score2',
+            'total_score3',
+            'total_score4',
+            'total_score1_rounded',
+            'total_score2_rounded',
+            'total_score3_rounded',
+            'total_score4_rounded',
+            'average_score',
+            'like_count',
+            *RANKINGS
+        )
+    )
+
+
+def top(rows, rank_name, limit, fields):
+    ranked = sorted((row for row in rows if row[rank_name] <= limit), key=lambda row: row[rank_name])
+    return [{field: row[field] for field in fields} for row in ranked]
+
+
+def compute_statistics():
+    """
+    计算 entityAI 的统计数据：一次窗口函数扫描得到所有排行榜，一次分组查询得到类型统计
+    """
+    rows = get_ranked_entities()
+
+    detail_fields = [
+        'name',
+        'total_score1_rounded',
+        'total_score2_rounded',
+        'total_score3_rounded',
+        'total_score4_rounded',
+    ]
+
+    # 各类型的数量
+    type_statistics = EntityAIType.objects.annotate(
+        entity_count=Count('entityai'),
+    ).values('name', 'entity_count').order_by('-entity_count')
+
+    return {
+        "total_scores": [
+            {"name": row["name"], "total_score": row["average_score"]}
+            for row in top(rows, 'score_rank', 10, ['name', 'average_score'])
+        ],
+        "like_counts": top(rows, 'like_rank', 10, ['name', 'like_count']),
+        "type_statistics": list(type_statistics),
+        "score_details": top(rows, 'score_rank', 5, detail_fields + ['average_score']),
+        "like_details": top(rows, 'like_rank', 5, detail_fields + ['like_count']),
+        "top_scores": {
+            section: top(rows, rank_name, 3, ['name', field])
+            for section, (rank_name, field) in TOP_SCORE_SECTIONS.items()
+        }
+    }
+
+
+def refresh_snapshot():
+    """
+    重新计算统计数据并保存为最新快照
+    """
+    # 先清零写入计数，计算期间发生的写入留到下一次重建
+    cache.set(STATISTICS_WRITES_KEY, 0, timeout=None)
+    snapshot = StatisticsSnapshot.objects.create(**compute_statistics())
+
+    expired_ids = StatisticsSnapshot.objects.order_by('-id').values_list('id', flat=True)[SNAPSHOT_KEEP:]
+    StatisticsSnapshot.objects.filter(id__in=list(expired_ids)).delete()
+
+    cache.set(STATISTICS_CACHE_KEY, snapshot.to_data(), timeout=None)
+    return snapshot
+
+
+def get_latest_statistics():
+    """
+    读取最新的统计快照，缓存中没有时从数据库读取，一个快照都没有时现场生成
+    """
+
+    def load_latest():
+        snapshot = StatisticsSnapshot.objects.order_by('-id').first() or refresh_snapshot()
+        return snapshot.to_data()
+
+    return get_or_compute(STATISTICS_CACHE_KEY, load_latest, timeout=None)
@@ -0,0 +1,101 @@
+import bisect
+import heapq
+import threading
+import time
+
+from pypinyin import Style, lazy_pinyin
+
+from application.entityAI.models import EntityAI
+from utils.cache_utils import get_generation
+
+from .cache import SUGGEST_GENERATION
+
+SUGGEST_CHECK_INTERVAL = 1  # 每个进程最多每秒检查一次实体是否变化
+SUGGEST_MAX_AGE = 60 * 5  # 点赞量变化不会触发重建，最多 5 分钟后重建以更新排序
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def normalize(text):
+    """
+    统一大小写，去掉空白，输入 "Chat GPT" 和 "chatgpt" 得到相同结果
+    """
+    return ''.join(text.lower().split())
+
+
+def get_keys(name, pinyin_name):
+    """
+    实体的检索键：名称、全拼、拼音首字母
+    """
+    keys = {
+        normalize(name),
+        normalize(pinyin_name or ''.join(lazy_pinyin(name))),
+        normalize(''.join(lazy_pinyin(name, style=Style.FIRST_LETTER))),
+    }
+    keys.discard('')
+    return keys
+
+
+class SuggestIndex:
+    """
+    前缀索引：检索键按字典序排列，前缀相同的键在数组中相邻，二分查找即可取出
+    """
+
+    def __init__(self, entities, generation):
+        self.entities = entities  # [(实体 ID, 名称, 点赞量, 拼音名)]
+        self.generation = generation
+        self.built_time = time.monotonic()
+        self.checked_time = self.built_time
+
+        pairs = sorted(
+            (key, position)
+            for position, (_, name, _, pinyin_name) in enumerate(entities)
+            for key in get_keys(name, pinyin_name)
+        )
+        self.keys = [key for key, _ in pairs]
+        self.positions = [position for _, position in pairs]
+
+    @classmethod
+    def build(cls):
+        generation = get_generation(SUGGEST_GENERATION)
+        entities = list(EntityAI.objects.values_list('id', 'name', 'like_count', 'pinyin_name'))
+        return cls(entities, generation)
+
+    def suggest(self, query, count):
+        """
+        返回检索键以 query 开头的实体中点赞量最高的 count 个
+        """
+        prefix = normalize(query)
+        if not prefix:
+            return []
+
+        start = bisect.bisect_left(self.keys, prefix)
+        end = bisect.bisect_left(self.keys, prefix + '\U0010ffff', start)
+        positions = set(self.positions[start:end])
+        top = heapq.nsmallest(count, positions, key=lambda position: (-self.entities[position][2], position))
+        return [
+            {'id': entity_id, 'name': name, 'like_count': like_count}
+            for entity_id, name, like_count, _ in (self.entities[position] for position in top)
+        ]
+
+
+def get_suggest_index():
+    """
+    获取当前进程的前缀索引，实体新增、修改、删除后或超过最长保留时间时重建
+    """
+    global _index
+    now = time.monotonic()
+    index = _index
+    if index is not None and now - index.checked_time < SUGGEST_CHECK_INTERVAL:
+        return index
+
+    if index is not None and now - index.built_time < SUGGEST_MAX_AGE \
+            and index.generation == get_generation(SUGGEST_GENERATION):
+        index.checked_time = now
+        return index
+
+    with _index_lock:
+        if _index is index:
+            _index = SuggestIndex.build()
+        return _index
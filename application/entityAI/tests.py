@@ -0,0 +1,110 @@
+import base64
+import json
+import os
+import tempfile
+from unittest import mock
+
+from haystack import connections
+from rest_framework.test import APITestCase
+
+from application.entityAI.models import EntityAI, EntityAIType
+from application.user.models import Like, User
+from utils.pagination import CustomPageNumberPagination
+
+
+def make_cursor(value, pk):
+    return base64.urlsafe_b64encode(json.dumps([value, pk]).encode('utf-8')).decode('ascii')
+
+
+class CursorPaginationTests(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        entity_type = EntityAIType.objects.create(name='测试类型')
+        for i in range(3):
+            EntityAI.objects.create(name=f'测试AI{i}', url='https://example.com', type=entity_type)
+        cls.user = User.objects.create(username='tester')
+
+    def setUp(self):
+        self.client.force_authenticate(self.user)
+
+    def test_valid_cursor(self):
+        response = self.client.get('/api/entity-ai/', {'cursor': '', 'page_size': 2})
+        self.assertEqual(response.status_code, 200)
+        next_link = response.json()['data']['next']
+        self.assertIsNotNone(next_link)
+
+        response = self.client.get(next_link)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()['data']['results']), 1)
+
+    def test_tampered_cursor(self):
+        for cursor in (
+            'W3siYSI6IDF9LCAzXQ==',  # [{"a": 1}, 3]
+            make_cursor(1, [3]),
+            make_cursor(1, True),
+            make_cursor('abc', 3),  # 无法转换为整数排序字段
+            'not-base64!',
+        ):
+            with self.subTest(cursor=cursor):
+                response = self.client.get('/api/entity-ai/', {'cursor': cursor})
+                self.assertEqual(response.status_code, 404)
+
+    def test_decode_cursor_round_trip(self):
+        cursor = CustomPageNumberPagination.encode_cursor(2.5, 7)
+        self.assertEqual(CustomPageNumberPagination.decode_cursor(cursor), (2.5, 7))
+
+
+class SearchTypeFilterTests(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        # 类型 ID 1 是 11 的子串，按类型过滤时不能互相匹配
+        for type_id in (1, 11):
+            entity_type = EntityAIType.objects.create(id=type_id, name=f'类型{type_id}')
+            EntityAI.objects.create(name=f'智能助手{type_id}', url='https://example.com', type=entity_type)
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        backend = connections['default'].get_backend()
+        patcher = mock.patch.object(backend, 'path', os.path.join(directory.name, 'entityAI.idx'))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        backend.update(connections['default'].get_unified_index().get_index(EntityAI), EntityAI.objects.all())
+
+    def test_filter_by_type(self):
+        response = self.client.get('/api/search/', {'q': '智能', 'type': 1, 'page': 1, 'facets': 1})
+        self.assertEqual(response.status_code, 200)
+        data = response.json()['data']
+        self.assertEqual([item['name'] for item in data['results']], ['智能助手1'])
+        self.assertEqual(data['count'], 1)
+        self.assertEqual([item['id'] for item in data['facets']['types']], [1])
+
+
+class LikeCountTests(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.entity = EntityAI.objects.create(
+            name='测试AI', url='https://example.com', type=EntityAIType.objects.create(name='测试类型')
+        )
+
+    def assert_like_count(self, expected):
+        self.entity.refresh_from_db()
+        self.assertEqual(self.entity.like_count, expected)
+        self.assertEqual(Like.objects.filter(entityAI=self.entity).count(), expected)
+
+    def test_orm_writes(self):
+        users = [User.objects.create(username=f'tester{i}') for i in range(2)]
+        likes = [Like.objects.create(user=user, entityAI=self.entity) for user in users]
+        self.assert_like_count(2)
+
+        likes[0].save()  # 修改已有的点赞不改变点赞量
+        self.assert_like_count(2)
+
+        likes[0].delete()
+        self.assert_like_count(1)
+
+        users[1].delete()  # 删除用户时级联删除其点赞
+        self.assert_like_count(0)
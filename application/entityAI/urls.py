@@ -10,8 +10,13 @@ router.register(r'entity-ai-tag', views.EntityAITagViewSet, basename='实体AI
 
 urlpatterns = [
     path('like/<int:entity_id>/', views.LikeView.as_view(), name='点赞'),
+    path('like/batch/', views.like_batch, name='批量点赞'),
+    path('like/export/', views.like_export, name='导出点赞'),
     path('recommend/', views.entityAI_recommend, name='推荐实体AI'),
     path('statistics/', views.entityAI_statistics, name='实体AI统计'),
     path('search/', views.search, name='实体AI搜索'),
+    path('search/suggest/', views.search_suggest, name='实体AI搜索提示'),
+    path('search/cache-stats/', views.search_cache_stats, name='实体AI搜索缓存统计'),
     path('recommend-similar/', views.recommend_similar_entityAI, name='推荐实体AI'),
+    path('recommend-for-me/', views.recommend_for_me, name='个性化推荐实体AI'),
 ] + router.urls
\ No newline at end of file
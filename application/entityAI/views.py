@@ -1,70 +1,79 @@
-from rest_framework.decorators import api_view, permission_classes
-from django.db.models import Count, Avg, Sum, FloatField
-from django.db.models import OuterRef, Subquery
-from django.db.models.functions import Substr, Round, Cast
+from rest_framework.decorators import action, api_view, permission_classes
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
 from rest_framework.views import APIView
 from rest_framework import status, viewsets, filters
 from django_filters.rest_framework import DjangoFilterBackend
 from pypinyin import lazy_pinyin, Style
 from rest_framework.filters import OrderingFilter
-from haystack.query import SearchQuerySet
 from rest_framework.permissions import AllowAny
 
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.preprocessing import MinMaxScaler
-from sklearn.metrics.pairwise import cosine_similarity
-import numpy as np
-
 from application.entityAI.models import EntityAI, EntityAIType, EntityAITag
 from application.user.models import Like
 
-from .serializers import EntityAISerializer, EntityAITypeSerializer, EntityAITagSerializer
+from .serializers import EntityAISerializer, EntityAITypeSerializer, EntityAITagSerializer, get_liked_ids
+from .likes import batch_like, get_like_statuses, like_entity, unlike_entity
+from .similarity import get_similarity_index
+from .collaborative import recommend_for_user
+from .search_cache import get_search_cache_stats, search_entities
+from .statistics import get_latest_statistics, refresh_snapshot
+from .suggest import get_suggest_index
+from .export import export_entity_lines, export_like_lines
 
 from utils.api_utils import success_response, fail_response
+from utils.cache_utils import get_or_compute_by_generation
+from utils.export_utils import get_export_format, streaming_response
 
-from rest_framework.pagination import PageNumberPagination
-
-
-class CustomPageNumberPagination(PageNumberPagination):
-    page_size = 8  # 默认每页数据量
-    page_size_query_param = 'page_size'  # 允许前端传递的参数名
-    max_page_size = 100  # 限制每页的最大数据量
+from .cache import ENTITY_GENERATION, RECOMMEND_CACHE_KEY
 
-    def paginate_queryset(self, queryset, request, view=None):
-        # 如果没有传入 `page` 参数，返回全部数据
-        if 'page' not in request.query_params or request.query_params['page'] == '':
-            return None  # 禁用分页
-        return super().paginate_queryset(queryset, request, view)
+from utils.pagination import CustomPageNumberPagination
 
 
 class LikeView(APIView):
     def post(self, request, *args, **kwargs):
-        user = request.user
-        entity_id = kwargs.get('entity_id')
-        try:
-            entity = EntityAI.objects.get(id=entity_id)
-        except EntityAI.DoesNotExist:
+        # 一条 INSERT 完成点赞，重复点赞由唯一约束忽略，同一事务内更新点赞量
+        created, like_count = like_entity(request.user.id, kwargs.get('entity_id'))
+        if like_count is None:
             return fail_response(message="实体不存在", status_code=status.HTTP_400_BAD_REQUEST)
-
-        if Like.objects.filter(user=user, entityAI=entity).exists():
-            return fail_response(message="已经点赞", status_code=status.HTTP_400_BAD_REQUEST)
-
-        Like.objects.create(user=user, entityAI=entity)
-        return success_response(message="点赞成功")
+        return success_response(
+            data={'is_liked': True, 'like_count': like_count},
+            message="点赞成功" if created else "已经点赞"
+        )
 
     def delete(self, request, *args, **kwargs):
-        user = request.user
-        entity_id = kwargs.get('entity_id')
-        try:
-            entity = EntityAI.objects.get(id=entity_id)
-        except EntityAI.DoesNotExist:
+        # 一条 DELETE 完成取消点赞，未点赞时不做任何修改
+        deleted, like_count = unlike_entity(request.user.id, kwargs.get('entity_id'))
+        if like_count is None:
             return fail_response(message="实体不存在", status_code=status.HTTP_400_BAD_REQUEST)
+        return success_response(
+            data={'is_liked': False, 'like_count': like_count},
+            message="取消点赞成功" if deleted else "未点赞"
+        )
+
+
+BATCH_LIKE_LIMIT = 100  # 批量操作最多包含的实体数量
+
+
+@api_view(['POST'])
+def like_batch(request):
+    """
+    批量点赞、取消点赞或查询点赞状态，请求体为 {"action": "like" | "unlike" | "status", "entity_ids": [...]}
+    """
+    action = request.data.get('action')
+    entity_ids = request.data.get('entity_ids')
+    if action not in ('like', 'unlike', 'status'):
+        return fail_response(message="无效的操作", status_code=status.HTTP_400_BAD_REQUEST)
+    if not isinstance(entity_ids, list) or not all(isinstance(i, int) and not isinstance(i, bool) for i in entity_ids):
+        return fail_response(message="entity_ids 必须是实体 ID 列表", status_code=status.HTTP_400_BAD_REQUEST)
+    if len(entity_ids) > BATCH_LIKE_LIMIT:
+        return fail_response(message=f"一次最多操作 {BATCH_LIKE_LIMIT} 个实体", status_code=status.HTTP_400_BAD_REQUEST)
+
+    entity_ids = list(dict.fromkeys(entity_ids))
+    if entity_ids and action != 'status':
+        batch_like(request.user.id, entity_ids, liked=action == 'like')
 
-        like = Like.objects.filter(user=user, entityAI=entity).first()
-        if like:
-            like.delete()
-            return success_response(message="取消点赞成功")
-        return fail_response(message="未点赞", status_code=status.HTTP_400_BAD_REQUEST)
+    # 返回操作后各实体的点赞状态和点赞量
+    return success_response(data=get_like_statuses(request.user.id, entity_ids))
 
 
 class EntityAITypeViewSet(viewsets.ModelViewSet):
@@ -93,22 +102,7 @@ class EntityAITagViewSet(viewsets.ModelViewSet):
 
 
 class EntityAIViewSet(viewsets.ModelViewSet):
-    queryset = EntityAI.objects.annotate(
-        like_count=Count('like_entityAI'),
-        average_score=Round(
-            Subquery(
-                EntityAI.objects.filter(id=OuterRef('id')).annotate(
-                    total_avg=(
-                                      Sum('total_score1', output_field=FloatField()) +
-                                      Sum('total_score2', output_field=FloatField()) +
-                                      Sum('total_score3', output_field=FloatField()) +
-                                      Sum('total_score4', output_field=FloatField())
-                              ) / 4
-                ).values('total_avg')[:1],
-                output_field=FloatField()
-            ), 2
-        )
-    )
+    queryset = EntityAI.objects.select_related('type').prefetch_related('entityAI_tags')
 
     serializer_class = EntityAISerializer
     pagination_class = CustomPageNumberPagination
@@ -132,79 +126,78 @@ class EntityAIViewSet(viewsets.ModelViewSet):
 
         return queryset
 
+    @action(detail=False, methods=['get'])
+    def export(self, request):
+        """
+        流式导出实体AI（file_format 为 csv 或 jsonl），支持与列表相同的过滤参数，按 ID 排序
+        """
+        file_format = get_export_format(request)
+        if file_format is None:
+            return fail_response(message="不支持的导出格式", status_code=status.HTTP_400_BAD_REQUEST)
+        queryset = self.filter_queryset(self.get_queryset())
+        return streaming_response(export_entity_lines(file_format, queryset), 'entityAI', file_format)
 
-@api_view(['GET'])
-def entityAI_recommend(request):
+
+def top_entity_per_type(order_field, limit=2):
     """
-    推荐实体AI
+    在数据库中用窗口函数取出每个类型排名第一的实体，再按同一字段取前 limit 个类型
     """
-
-    high_score_entityAIs = (
-        EntityAI.objects.all().annotate(
-            average_score=Round((
-                                        Sum('total_score1', output_field=FloatField()) +
-                                        Sum('total_score2', output_field=FloatField()) +
-                                        Sum('total_score3', output_field=FloatField()) +
-                                        Sum('total_score4', output_field=FloatField())
-                                ) / 4, 2)  # 保留两位小数
-        ).order_by('-average_score').select_related('type')
-    )
-
-    high_score_recommend = []
-    seen_types = set()
-
-    for entityAI in high_score_entityAIs:
-        if len(high_score_recommend) >= 2:
-            break
-        if entityAI.type not in seen_types:
-            high_score_recommend.append({
-                'title': f'{entityAI.type.name}高评分模型',
-                'entityAI': entityAI
-            })
-            seen_types.add(entityAI.type)
-
-    high_like_entityAIs = (
-        EntityAI.objects.annotate(
-            like_count=Count('like_entityAI'),
-            average_score=Round(
-                Subquery(
-                    EntityAI.objects.filter(id=OuterRef('id')).annotate(
-                        total_avg=(
-                                          Sum('total_score1', output_field=FloatField()) +
-                                          Sum('total_score2', output_field=FloatField()) +
-                                          Sum('total_score3', output_field=FloatField()) +
-                                          Sum('total_score4', output_field=FloatField())
-                                  ) / 4
-                    ).values('total_avg')[:1],
-                    output_field=FloatField()
-                ), 2
+    return (
+        EntityAI.objects.select_related('type').annotate(
+            type_rank=Window(
+                RowNumber(),
+                partition_by=[F('type_id')],
+                order_by=[F(order_field).desc(), F('id').asc()]
             )
-        )
-        .order_by('-like_count')
-        .select_related('type')
+        ).filter(type_rank=1).order_by(f'-{order_field}', 'id')[:limit]
     )
 
-    high_like_recommend = []
-    seen_types = set()
 
-    for entityAI in high_like_entityAIs:
-        if len(high_like_recommend) >= 2:
-            break
-        if entityAI.type not in seen_types:
-            high_like_recommend.append({
-                'title': f'{entityAI.type.name}高收藏模型',
-                'entityAI': entityAI
-            })
-            seen_types.add(entityAI.type)
+def build_recommendations():
+    """
+    计算推荐的实体AI，只返回标题和实体 ID，结果与用户无关，可以缓存
+    """
+    high_score_recommend = [
+        {
+            'title': f'{entityAI.type.name}高评分模型',
+            'entity_id': entityAI.id
+        }
+        for entityAI in top_entity_per_type('average_score')
+    ]
+
+    high_like_recommend = [
+        {
+            'title': f'{entityAI.type.name}高收藏模型',
+            'entity_id': entityAI.id
+        }
+        for entityAI in top_entity_per_type('like_count')
+    ]
+
+    return high_score_recommend + high_like_recommend
+
 
-    recommendations = high_score_recommend + high_like_recommend
+@api_view(['GET'])
+def entityAI_recommend(request):
+    """
+    推荐实体AI
+    """
+    recommendations = get_or_compute_by_generation(RECOMMEND_CACHE_KEY, ENTITY_GENERATION, build_recommendations)
+
+    # 实体信息和点赞状态与用户相关，按缓存的 ID 一次性查出后序列化
+    entities = EntityAI.objects.select_related('type').prefetch_related('entityAI_tags').in_bulk(
+        [rec["entity_id"] for rec in recommendations]
+    )
+    recommendations = [rec for rec in recommendations if rec["entity_id"] in entities]
+    serialized_entities = EntityAISerializer(
+        [entities[rec["entity_id"]] for rec in recommendations], many=True, context={"request": request}
+    ).data
 
     serialized_recommendations = [
         {
             "title": rec["title"],
-            "entity": EntityAISerializer(rec["entityAI"], context={"request": request}).data
+            "entity": entity
         }
-        for rec in recommendations
+        for rec, entity in zip(recommendations, serialized_entities)
     ]
 
     return success_response(data=serialized_recommendations)
@@ -215,114 +208,38 @@ def entityAI_statistics(request):
     """
     获取 entityAI 的统计数据
     """
-    # 1. 总评分对比（前 10）
-    total_scores = EntityAI.objects.annotate(
-        total_score=Round((
-                                  Sum('total_score1', output_field=FloatField()) +
-                                  Sum('total_score2', output_field=FloatField()) +
-                                  Sum('total_score3', output_field=FloatField()) +
-                                  Sum('total_score4', output_field=FloatField())
-                          ) / 4, 2)  # 保留两位小数
-    ).values('name', 'total_score').order_by('-total_score')[:10]
-
-    # 2. 点赞量对比（前 10）
-    like_counts = EntityAI.objects.annotate(like_count=Count('like_entityAI')).values('name', 'like_count').order_by(
-        '-like_count')[:10]
-
-    # 3. 各类型的数量、平均评分和点赞量
-    type_statistics = EntityAIType.objects.annotate(
-        entity_count=Count('entityai'),
-    ).values('name', 'entity_count').order_by('-entity_count')
-
-    # 4. 评分细则前五
-    score_details = EntityAI.objects.annotate(
-        total_score1_rounded=Round(Cast(Sum('total_score1', output_field=FloatField()), FloatField()), 2),
-        total_score2_rounded=Round(Cast(Sum('total_score2', output_field=FloatField()), FloatField()), 2),
-        total_score3_rounded=Round(Cast(Sum('total_score3', output_field=FloatField()), FloatField()), 2),
-        total_score4_rounded=Round(Cast(Sum('total_score4', output_field=FloatField()), FloatField()), 2),
-        average_score=Round((
-                                    Sum('total_score1', output_field=FloatField()) +
-                                    Sum('total_score2', output_field=FloatField()) +
-                                    Sum('total_score3', output_field=FloatField()) +
-                                    Sum('total_score4', output_field=FloatField())
-                            ) / 4, 2)
-    ).values(
-        'name',
-        'total_score1_rounded',
-        'total_score2_rounded',
-        'total_score3_rounded',
-        'total_score4_rounded',
-        'average_score'
-    ).order_by('-average_score')[:5]
-
-    # 5. 点赞细则前五
-    like_details = EntityAI.objects.annotate(
-        total_score1_rounded=Round(
-            Subquery(
-                EntityAI.objects.filter(id=OuterRef('id')).annotate(
-                    total=Sum('total_score1', output_field=FloatField())
-                ).values('total')[:1],
-                output_field=FloatField()
-            ), 2
-        ),
-        total_score2_rounded=Round(
-            Subquery(
-                EntityAI.objects.filter(id=OuterRef('id')).annotate(
-                    total=Sum('total_score2', output_field=FloatField())
-                ).values('total')[:1],
-                output_field=FloatField()
-            ), 2
-        ),
-        total_score3_rounded=Round(
-            Subquery(
-                EntityAI.objects.filter(id=OuterRef('id')).annotate(
-                    total=Sum('total_score3', output_field=FloatField())
-                ).values('total')[:1],
-                output_field=FloatField()
-            ), 2
-        ),
-        total_score4_rounded=Round(
-            Subquery(
-                EntityAI.objects.filter(id=OuterRef('id')).annotate(
-                    total=Sum('total_score4', output_field=FloatField())
-                ).values('total')[:1],
-                output_field=FloatField()
-            ), 2
-        ),
-        like_count=Subquery(
-            EntityAI.objects.filter(id=OuterRef('id')).annotate(
-                count=Count('like_entityAI')
-            ).values('count')[:1],
-            output_field=FloatField()
-        )
-    ).values(
-        'name',
-        'total_score1_rounded',
-        'total_score2_rounded',
-        'total_score3_rounded',
-        'total_score4_rounded',
-        'like_count'
-    ).order_by('-like_count')[:5]
-
-    # 6. 每个维度的前三名
-    top_score1 = EntityAI.objects.values('name', 'total_score1').order_by('-total_score1')[:3]
-    top_score2 = EntityAI.objects.values('name', 'total_score2').order_by('-total_score2')[:3]
-    top_score3 = EntityAI.objects.values('name', 'total_score3').order_by('-total_score3')[:3]
-    top_score4 = EntityAI.objects.values('name', 'total_score4').order_by('-total_score4')[:3]
-
-    return success_response(data={
-        "total_scores": list(total_scores),
-        "like_counts": list(like_counts),
-        "type_statistics": list(type_statistics),
-        "score_details": list(score_details),
-        "like_details": list(like_details),
-        "top_scores": {
-            "math_ability": list(top_score1),
-            "language_ability": list(top_score2),
-            "image_ability": list(top_score3),
-            "text_ability": list(top_score4),
-        }
-    })
+    # 管理员可以通过 `fresh=1` 跳过快照，现场计算并生成新快照
+    if request.GET.get('fresh') == '1' and request.user.is_staff:
+        return success_response(data=refresh_snapshot().to_data())
+
+    # 读取定期重建的统计快照
+    return success_response(data=get_latest_statistics())
+
+
+SEARCH_ORDERINGS = ['average_score', '-average_score', 'like_count', '-like_count', 'pinyin_name', '-pinyin_name']
+
+
+class SearchPagination(CustomPageNumberPagination):
+    cursor_query_param = None  # 搜索结果按缓存的 ID 列表分页，不支持游标分页
+
+    def __init__(self, hits):
+        self.hits = hits
+
+    def get_paginated_response(self, data):
+        response = super().get_paginated_response(data)
+        if self.mode == 'page':
+            # 只缓存前 SEARCH_MAX_RESULTS 条命中：count 为全部命中数量，truncated 表示超出部分无法翻页
+            response.data['count'] = self.hits
+            response.data['truncated'] = self.hits > self.page.paginator.count
+        return response
+
+
+def load_entities(ids):
+    """
+    按给定 ID 的顺序一次性查出实体，忽略索引中已不存在的实体
+    """
+    entities = EntityAI.objects.select_related('type').prefetch_related('entityAI_tags').in_bulk(ids)
+    return [entities[i] for i in ids if i in entities]
 
 
 @api_view(['GET'])
@@ -332,119 +249,132 @@ def search(request):
     if not query:
         return fail_response(message="请输入搜索关键词", status_code=status.HTTP_400_BAD_REQUEST)
 
-    # 搜索结果
-    sqs = SearchQuerySet().filter(content=query)
-    ids = [result.object.id for result in sqs if result.object]  # 获取搜索结果中对应的实体 ID
-
-    # 查询数据库，计算评分和点赞量
-    queryset = EntityAI.objects.filter(id__in=ids).annotate(
-        like_count=Count('like_entityAI'),  # 点赞量
-        average_score=Round(  # 平均评分
-            Subquery(
-                EntityAI.objects.filter(id=OuterRef('id')).annotate(
-                    total_avg=(
-                                      Sum('total_score1', output_field=FloatField()) +
-                                      Sum('total_score2', output_field=FloatField()) +
-                                      Sum('total_score3', output_field=FloatField()) +
-                                      Sum('total_score4', output_field=FloatField())
-                              ) / 4
-                ).values('total_avg')[:1],
-                output_field=FloatField()
-            ), 2
-        )
-    )
+    type_id = request.GET.get('type', '')
+    type_id = int(type_id) if type_id.isdigit() else None
 
-    # 通过 `type` 过滤
-    type_id = request.GET.get('type', None)
-    if type_id:
-        queryset = queryset.filter(type__id=type_id)
+    # 默认按相关度排序，也可以按点赞量、评分等字段排序
+    ordering = request.GET.get('ordering', 'relevance')
+    ordering = ordering if ordering in SEARCH_ORDERINGS else None
 
-    # 排序支持
-    ordering = request.GET.get('ordering', None)
-    if ordering in ['average_score', '-average_score', 'like_count', '-like_count', 'pinyin_name', '-pinyin_name']:
-        queryset = queryset.order_by(ordering)
+    # 命中的 ID 列表按规范化后的查询缓存，热门查询不再访问索引和数据库，只加载当前页的实体
+    result = search_entities(query, type_id, ordering)
+    paginator = SearchPagination(result['hits'])
+    page = load_entities(paginator.paginate_queryset(result['ids'], request))
 
-    # 使用分页器对结果进行分页
-    paginator = CustomPageNumberPagination()
-    page = paginator.paginate_queryset(queryset, request)
+    serializer = EntityAISerializer(page, many=True, context={'request': request})
+    response = paginator.get_paginated_response(serializer.data)
 
-    if page is not None:
-        serializer = EntityAISerializer(page, many=True, context={'request': request})
-        return paginator.get_paginated_response(serializer.data)
+    # 传入 `facets=1` 时附带各类型、各标签的命中数量，用于筛选导航
+    if request.GET.get('facets') == '1':
+        if not isinstance(response.data, dict):
+            response.data = {'results': response.data}
+        response.data['facets'] = build_facets(result['facets'])
+    return response
 
-    # 如果没有分页，返回所有结果
-    serializer = EntityAISerializer(queryset, many=True, context={'request': request})
-    return success_response(data=serializer.data)
 
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-from sklearn.preprocessing import MinMaxScaler
-import numpy as np
-from rest_framework.decorators import api_view
-from rest_framework.response import Response
-from application.entityAI.models import EntityAI
-from application.user.models import Like
-from .serializers import EntityAISerializer
+def build_facets(facets):
+    """
+    把索引中统计的分面数量转换为接口格式，类型名称通过一次查询补充
+    """
+    type_names = dict(EntityAIType.objects.filter(
+        id__in=[type_id for type_id, _ in facets['type_id']]
+    ).values_list('id', 'name'))
+    return {
+        'types': [
+            {'id': type_id, 'name': type_names[type_id], 'count': count}
+            for type_id, count in facets['type_id'] if type_id in type_names
+        ],
+        'tags': [{'name': name, 'count': count} for name, count in facets['tags']],
+    }
 
 
 @api_view(['GET'])
-def recommend_similar_entityAI(request):
+def like_export(request):
     """
-    基于当前 AI 信息和用户收藏推荐类似的 3 个 AI
+    流式导出点赞记录（file_format 为 csv 或 jsonl），可用 user、entityAI 过滤，仅管理员可用
     """
-    entity_id = request.GET.get('entityAI')
-
-    try:
-        # 获取当前 AI
-        all_entities = EntityAI.objects.all()
-        current_entity = EntityAI.objects.get(id=entity_id)
-    except EntityAI.DoesNotExist:
-        return fail_response(message="AI 不存在", status_code=404)
-
-    # 获取用户收藏的 AI
-    user = request.user
-    if user.is_authenticated:
-        user_liked_entities = EntityAI.objects.filter(like_entityAI__user=user)
-    else:
-        user_liked_entities = EntityAI.objects.none()
+    if not request.user.is_staff:
+        return fail_response(message="只有管理员才能导出", status_code=status.HTTP_403_FORBIDDEN)
+    file_format = get_export_format(request)
+    if file_format is None:
+        return fail_response(message="不支持的导出格式", status_code=status.HTTP_400_BAD_REQUEST)
 
-    # 文本特征：名称和描述
-    text_data = [f"{entity.name} {entity.description}" for entity in all_entities]
+    queryset = Like.objects.all()
+    for param, field in (('user', 'user_id'), ('entityAI', 'entityAI_id')):
+        value = request.query_params.get(param, '')
+        if value.isdigit():
+            queryset = queryset.filter(**{field: int(value)})
+    return streaming_response(export_like_lines(file_format, queryset), 'likes', file_format)
 
-    # 数值特征：评分、点赞量、用户是否收藏
-    scores = np.array([
-        [
-            entity.total_score1 + entity.total_score2 + entity.total_score3 + entity.total_score4,
-            entity.like_entityAI.count(),
-            1 if entity in user_liked_entities else 0  # 收藏特征
-        ] for entity in all_entities
-    ])
 
-    # 标准化数值特征
-    scaler = MinMaxScaler()
-    normalized_scores = scaler.fit_transform(scores)
+@api_view(['GET'])
+def search_cache_stats(request):
+    """
+    搜索结果缓存的命中次数、未命中次数和命中率，仅管理员可见
+    """
+    if not request.user.is_staff:
+        return fail_response(message="只有管理员才能查看", status_code=status.HTTP_403_FORBIDDEN)
+    return success_response(data=get_search_cache_stats())
 
-    # 文本特征向量化
-    vectorizer = TfidfVectorizer()
-    text_vectors = vectorizer.fit_transform(text_data)
 
-    # 合并文本向量和数值特征向量
-    combined_vectors = np.hstack([text_vectors.toarray(), normalized_scores])
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def search_suggest(request):
+    """
+    搜索框输入提示：按名称、全拼或拼音首字母前缀匹配，按点赞量排序
+    """
+    count = request.GET.get('count', '8')
+    count = min(int(count), 20) if count.isdigit() and int(count) > 0 else 8
 
-    # 获取当前实体的索引
-    current_index = list(all_entities).index(current_entity)
+    # 在进程内的前缀索引中查找，不访问数据库
+    return success_response(data=get_suggest_index().suggest(request.GET.get('q', ''), count))
 
-    # 计算相似度
-    similarities = cosine_similarity([combined_vectors[current_index]], combined_vectors)[0]
 
-    # 排序并获取最相似的 3 个实体
-    similar_indices = similarities.argsort()[::-1][1:4]  # 排除当前实体
+@api_view(['GET'])
+def recommend_similar_entityAI(request):
+    """
+    基于当前 AI 信息和用户收藏推荐类似的 3 个 AI
+    """
+    entity_id = request.GET.get('entityAI', '')
+    if not entity_id.isdigit():
+        return fail_response(message="AI 不存在", status_code=404)
+    entity_id = int(entity_id)
+
+    # 从预先计算好的相似索引中取出候选实体
+    index = get_similarity_index()
+    neighbours = index.neighbours.get(entity_id)
+    if neighbours is None:
+        entity = EntityAI.objects.filter(id=entity_id).first()
+        if entity is None:
+            return fail_response(message="AI 不存在", status_code=404)
+        # 索引中还没有该实体（例如刚刚新增，后台任务尚未刷新），临时计算其相似列表，不修改索引
+        neighbours = index.neighbours_for(entity)
+
+    # 查询时只对候选实体计算用户收藏加分
+    liked_ids = get_liked_ids(request.user, [neighbour_id for neighbour_id, _ in neighbours])
+    similar_ids = index.similar(entity_id, liked_ids, neighbours=neighbours) or []
 
     # 获取推荐的实体
-    # 将 numpy.int64 转换为标准的 int
-    recommended_entities = [all_entities[int(i)] for i in similar_indices]
+    entities = EntityAI.objects.select_related('type').prefetch_related('entityAI_tags').in_bulk(similar_ids)
+    recommended_entities = [entities[i] for i in similar_ids if i in entities]
 
     # 序列化推荐结果
     serializer = EntityAISerializer(recommended_entities, many=True, context={'request': request})
     return success_response(data=serializer.data)
 
+
+@api_view(['GET'])
+def recommend_for_me(request):
+    """
+    基于点赞记录的协同过滤个性化推荐
+    """
+    count = request.GET.get('count', '8')
+    count = min(int(count), 50) if count.isdigit() and int(count) > 0 else 8
+
+    # 推荐 ID 列表由缓存直接给出，只需批量查出实体用于序列化
+    recommended_ids = recommend_for_user(request.user.id)[:count]
+    entities = EntityAI.objects.select_related('type').prefetch_related('entityAI_tags').in_bulk(recommended_ids)
+    recommended_entities = [entities[i] for i in recommended_ids if i in entities]
+
+    serializer = EntityAISerializer(recommended_entities, many=True, context={'request': request})
+    return success_response(data=serializer.data)
@@ -15,7 +15,6 @@ import os.path
 import pymysql
 import yaml
 from datetime import timedelta
-from jieba.analyse import ChineseAnalyzer
 
 with open('config.yaml', 'r') as f:
     config = yaml.safe_load(f)
@@ -120,6 +119,9 @@ CACHES = {
     }
 }
 
+# 开启后点赞先写入 Redis（用户点赞集合 + 点赞量计数），由 flush_likes 后台任务批量写回数据库
+LIKE_STORE_REDIS = False
+
 # aliyun sms
 
 ALIYUN_SMS = {
@@ -222,10 +224,14 @@ SIMPLEUI_LOGO = '/static/Ai.svg'
 
 HAYSTACK_CONNECTIONS = {
     'default': {
-        'ENGINE': 'haystack.backends.whoosh_backend.WhooshEngine',
-        'PATH': os.path.join(BASE_DIR, 'whoosh_index'),  # 索引文件存放的路径
-        'EXTRA_ANALYZERS': {
-            'default': ChineseAnalyzer(),  # 使用中文分词器
-        },
+        # 进程内倒排索引，jieba 分词 + BM25，索引文件通过 mmap 在多个进程间共享
+        'ENGINE': 'utils.search_backend.InvertedIndexEngine',
+        'PATH': os.path.join(BASE_DIR, 'search_index', 'entityAI.idx'),  # 索引文件存放的路径
     },
 }
+
+# 实体、标签、类型变化时放入 Redis 队列，由 process_search_queue 后台任务批量更新索引
+HAYSTACK_SIGNAL_PROCESSOR = 'application.entityAI.search_signals.QueuedSignalProcessor'
+
+# 相似推荐索引文件，由 build_similarity_index 构建，实体变化时增量刷新
+SIMILARITY_INDEX_PATH = os.path.join(BASE_DIR, 'similarity_index.joblib')
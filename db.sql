@@ -1691,310 +1691,310 @@ INSERT INTO entityai_entityaitype (id, name, description) VALUES (13, 'AIGC基
 INSERT INTO entityai_entityaitype (id, name, description) VALUES (14, 'AIGC开发平台', 'AIGC开发平台');
 INSERT INTO entityai_entityaitype (id, name, description) VALUES (15, 'AIGC应用场景', 'AIGC应用场景');
 INSERT INTO entityai_entityaitype (id, name, description) VALUES (16, 'AIGC行业应用', 'AIGC行业应用');
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (1, '讯飞星火', 'https://xinghuo.xfyun.cn/desk?ch=xhweb_Squ', '讯飞星火AI助手，高性能AI语言模型，具备多模态理解和生成能力，服务于企业服务、智能硬件、智慧政务、智慧金融、智慧生活和智慧医疗等多个领域。', 'entityAI/logo_AIGC写作平台_讯飞星火.png', 'entityAI/cover_AIGC写作平台_讯飞星火.png', 2, 'xunfeixinghuo', 1.75, 3.0, 3.0, 3.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (2, '小鱼AI写作 – 免费', 'https://www.xiaoyuxiezuo.com/AI_A13d921', '满足自媒体人和办公人写作创作的在线智能AI写作平台，可以用AI自动生成高质量原创内容，内容创作覆盖多种类型，满足不同场景、人群的AI创作需求以及提供个性化的自定', 'entityAI/logo_AIGC写作平台_小鱼AI写作 – 免费.png', 'entityAI/cover_AIGC写作平台_小鱼AI写作 – 免费.png', 2, 'xiaoyuAIxiezuo – mianfei', 1.8333333333333333, 3.6666666666666665, 1.6666666666666667, 3.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (3, '新华妙笔AI', 'https://miaobi.xinhuaskl.com?channel=AIGC', '公文写作设计的高效工具，它通过集成的查、写、审、学功能，为公职人员提供了一个全面、智能的写作环境', 'entityAI/logo_AIGC写作平台_新华妙笔AI.png', 'entityAI/cover_AIGC写作平台_新华妙笔AI.png', 2, 'xinhuamiaobiAI', 2.5, 4.0, 1.6666666666666667, 3.8333333333333335);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (4, 'AI论文-高质量论文写作', 'https://www.66paper.cn/AI_A13D921', '10秒大纲，3分钟万字论文，66论文网是面向720+学科专业的论文写作平台，支持毕业论文、期刊论文等。提供开题报告、任务书，10秒生成千字大纲，3分钟极速生成万字论文，知网论文查重率稳定在10%左右。', 'entityAI/logo_AIGC写作平台_AI论文-高质量论文写作.png', 'entityAI/cover_AIGC写作平台_AI论文-高质量论文写作.png', 2, 'AIlunwen-gaozhilianglunwenxiezuo', 0.8333333333333334, 1.0, 2.0, 3.3333333333333335);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (5, 'PaperFake AI写论文', 'https://paperfake.cn/?q=aigc', '一键AI生成3万字论文，查重率、aigc率双重担保', 'entityAI/logo_AIGC写作平台_PaperFake AI写论文.png', 'entityAI/cover_AIGC写作平台_PaperFake AI写论文.png', 2, 'PaperFake AIxielunwen', 2.1666666666666665, 2.1666666666666665, 1.6666666666666667, 2.1666666666666665);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (6, '万能小in一键论文', 'https://xiaoin.com.cn/home/creation/submission-list?sharerUserId=1749323819392270338', '3分钟4万字130+应用，只需标题，快速生成文献综述、开题报告、PPT、工作总结等 ', 'entityAI/logo_AIGC写作平台_万能小in一键论文.png', 'entityAI/cover_AIGC写作平台_万能小in一键论文.png', 2, 'wannengxiaoinyijianlunwen', 2.3333333333333335, 4.5, 2.0, 1.8333333333333333);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (7, '慧言AI', 'https://aigc.huiyan-ai.cn', '一站式AI解决方案，全能聚合平台', 'entityAI/logo_AIGC写作平台_慧言AI.png', 'entityAI/cover_AIGC写作平台_慧言AI.png', 2, 'huiyanAI', 2.6666666666666665, 2.5, 3.6666666666666665, 2.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (8, '文字游侠-AI一键写头条', 'https://wenan.tcbot.cc/h5/#/pages/login/reg?code=vCUySW', '全网最牛逼的AI一键写头条文章全自动工具！', 'entityAI/logo_AIGC写作平台_文字游侠-AI一键写头条.png', 'entityAI/cover_AIGC写作平台_文字游侠-AI一键写头条.png', 2, 'wenziyouxia-AIyijianxietoutiao', 3.5, 2.6666666666666665, 1.1666666666666667, 3.5);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (9, '百度文库AI助手', 'https://wenku.baidu.com/ndlaunch/browse/chat?fr=dist_wk_aiasis&dist_source=kfpt-WD&utm_account=dist&searchFr=1&third_id=wkds_fac1faa6998fcc22bdd10d2a_400000007', '智能PPT、智能创作、智能编辑、智能总结四大AI能力，全面提升文档生产力', 'entityAI/logo_AIGC写作平台_百度文库AI助手.png', 'entityAI/cover_AIGC写作平台_百度文库AI助手.png', 2, 'baiduwenkuAIzhushou', 3.0, 1.8333333333333333, 3.0, 4.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (10, '万彩AI', 'https://ai.kezhan365.com/inviteCode/n6AW84', '一款由广州万彩信息技术有限公司推出的强大AI内容创作工具合集。它不仅提供AI智能写作支持，还集成了AI换脸、照片数字人制作和AI短视频制作等AI生成内容功能，进一步扩展了AI的创作领域，使您的创作具有无限可能。', 'entityAI/logo_AIGC写作平台_万彩AI.png', 'entityAI/cover_AIGC写作平台_万彩AI.png', 2, 'wancaiAI', 1.6666666666666667, 2.6666666666666665, 1.0, 2.8333333333333335);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (11, '言笔AI', 'https://www.yanbiai.com/workplace?ly=aigc', '多功能AI写作助手，专注智能创作与优化', 'entityAI/logo_AIGC写作平台_言笔AI.png', 'entityAI/cover_AIGC写作平台_言笔AI.png', 2, 'yanbiAI', 2.5, 2.3333333333333335, 2.6666666666666665, 3.6666666666666665);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (12, 'AI内容管家-免费100篇', 'https://guanjia.seowhy.com/?o3lzkd', 'AI驱动的SEO挖词、写作、发布工具', 'entityAI/logo_AIGC写作平台_AI内容管家-免费100篇.png', 'entityAI/cover_AIGC写作平台_AI内容管家-免费100篇.png', 2, 'AIneirongguanjia-mianfei100pian', 3.6666666666666665, 3.0, 1.8333333333333333, 1.6666666666666667);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (13, 'CopyDone-AI营销内容创作', 'https://copyai.cn/?channel=aigc.cn', '一键生成营销文本、配图与短视频等', 'entityAI/logo_AIGC写作平台_CopyDone-AI营销内容创作.png', 'entityAI/cover_AIGC写作平台_CopyDone-AI营销内容创作.png', 2, 'CopyDone-AIyingxiaoneirongchuangzuo', 2.5, 1.3333333333333333, 1.5, 1.5);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (14, 'Hulu AI', 'https://h5.cxyhub.com/?invitation=BYsXJb&redirect=home', '一个GPT、文心一言、Midjourney和Dall-E对话作图可以永久、不限次数使用的工具，Hulu AI会根据用户的需求，不断更新上线新的功能，比如图片解析、图片融合等等常用功能。', 'entityAI/logo_AIGC写作平台_Hulu AI.png', 'entityAI/cover_AIGC写作平台_Hulu AI.png', 2, 'Hulu AI', 1.1666666666666667, 2.6666666666666665, 3.1666666666666665, 2.5);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (15, '事半网', 'https://halfwork.cn/?invite=9dce88b4-431c-4fb7-bc4c-483f8ec41d41', '无论是创意写作、技术编程还是艺术绘图，事半都能成为用户提升工作效率、享受生活的得力助手。', 'entityAI/logo_AIGC写作平台_事半网.png', 'entityAI/cover_AIGC写作平台_事半网.png', 2, 'shibanwang', 3.6666666666666665, 2.1666666666666665, 2.0, 2.3333333333333335);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (16, 'Wordvice AI', 'https://wordvice.ai/cn', '多功能的AI智能写作工具，它通过提供文本编辑、校对、写作辅助等功能，帮助用户提升写作品质。无论是学生、研究人员还是专业人士，都可以通过Wordvice AI提高写作效率和质量。', 'entityAI/logo_AIGC写作平台_Wordvice AI.png', 'entityAI/cover_AIGC写作平台_Wordvice AI.png', 2, 'Wordvice AI', 2.8333333333333335, 2.3333333333333335, 2.6666666666666665, 4.333333333333333);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (17, '有道翻译·AI写作', 'https://fanyi.youdao.com/aiwrite', '一个强大的智能写作工具，它通过一键生成和高级润色功能，极大地提高了写作的效率和质量。多端同步和智能唤起功能使得用户可以随时随地进行创作，非常适合需要快速产出高质量文档的用户。', 'entityAI/logo_AIGC写作平台_有道翻译·AI写作.png', 'entityAI/cover_AIGC写作平台_有道翻译·AI写作.png', 2, 'youdaofanyi·AIxiezuo', 3.5, 3.5, 2.0, 2.8333333333333335);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (18, '即梦Dreamina – 免费', 'https://jimeng.jianying.com/ai-tool/home/?utm_medium=aitools&utm_source=aigc&utm_campaign=null&utm_content=hw_jm_aigc', '即梦Dreamina是一个功能丰富的AI创作工具，它通过理解和应用用户的创意输入，提供了从视频生成到AI绘画的一站式解决方案。', 'entityAI/logo_AIGC绘画工具_即梦Dreamina – 免费.png', 'entityAI/cover_AIGC绘画工具_即梦Dreamina – 免费.png', 3, 'jimengDreamina – mianfei', 3.3333333333333335, 2.3333333333333335, 2.0, 2.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (19, '稿定AI-文生图', 'https://www.gaoding.com/utms/c7615c8ebcd84c3a8199e743d71f9433', '稿定科技推出的一站式免费AI创意和绘画平台。一张图，一句话，满足灵感绘图，场景生成，素材生成。', 'entityAI/logo_AIGC绘画工具_稿定AI-文生图.png', 'entityAI/cover_AIGC绘画工具_稿定AI-文生图.png', 3, 'gaodingAI-wenshengtu', 2.8333333333333335, 2.3333333333333335, 2.8333333333333335, 1.6666666666666667);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (20, '美间AI设计', 'https://www.meijian.com/ai?from=mj_navigation&utm_source=dsdhaigc', 'AI创意商拍是专注于电商高效图片设计的工具，免费为设计师们提供海量正版电商设计素材、白底图AI生成N张场景图等，通过AI的技术，帮助设计师们实现10秒搞定所有电商物料，更高效，更智能！', 'entityAI/logo_AIGC绘画工具_美间AI设计.png', 'entityAI/cover_AIGC绘画工具_美间AI设计.png', 3, 'meijianAIsheji', 3.8333333333333335, 3.3333333333333335, 2.3333333333333335, 1.1666666666666667);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (21, 'Openflow', 'https://www.openflowai.net/midjourney?puid=6442', 'OpenFlow是一个多功能的AI平台，它通过提供行业特定的工作流优化、内容创作支持、社区管理和变现途径，为个体用户提供了一个全面的解决方案。', 'entityAI/logo_AIGC绘画工具_Openflow.png', 'entityAI/cover_AIGC绘画工具_Openflow.png', 3, 'Openflow', 3.3333333333333335, 2.0, 3.6666666666666665, 3.1666666666666665);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (22, '智谱AI绘画', 'https://chatglm.cn/apps?image=https%3A%2F%2Fsfile.chatglm.cn%2Factiveimg%2Fbdms%2F66b97e348217030036f486f1&open_from=ads_web_aigc&fr=ads_web_aigc', '智谱AI绘画可根据用户的描述创作出新的艺术作品，还能够模仿不同的艺术风格，提供个性化的图像编辑和创作服务', 'entityAI/logo_AIGC绘画工具_智谱AI绘画.png', 'entityAI/cover_AIGC绘画工具_智谱AI绘画.png', 3, 'zhipuAIhuihua', 2.8333333333333335, 1.1666666666666667, 2.0, 2.1666666666666665);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (23, '巨日禄AI漫画', 'https://ai.jurilu.com/#/register?inviteCode=106843', '超多绚美风格的AI漫画视频创作平台', 'entityAI/logo_AIGC绘画工具_巨日禄AI漫画.png', 'entityAI/cover_AIGC绘画工具_巨日禄AI漫画.png', 3, 'juriluAImanhua', 2.0, 3.0, 1.1666666666666667, 2.8333333333333335);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (24, '触手AI绘画-4090极速出图', 'https://acgnai.art/login?inviteCode=221141&channel=channel_invite', '触手AI绘画通过提供多样化的AI辅助创作功能，为插画、漫画、设计等领域的专业人士提供了一个强大的数字创作平台。', 'entityAI/logo_AIGC绘画工具_触手AI绘画-4090极速出图.png', 'entityAI/cover_AIGC绘画工具_触手AI绘画-4090极速出图.png', 3, 'chushouAIhuihua-4090jisuchutu', 0.8333333333333334, 2.5, 3.1666666666666665, 2.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (25, 'LiblibAI·哩布哩布AI', 'https://www.liblib.ai', '限时免费的LoRA炼丹炉！更全、更热门的素材，为所有AI绘画者提供更得心应手的平台，持续深耕专业领域。', 'entityAI/logo_AIGC绘画工具_LiblibAI·哩布哩布AI.png', 'entityAI/cover_AIGC绘画工具_LiblibAI·哩布哩布AI.png', 3, 'LiblibAI·libulibuAI', 3.0, 1.6666666666666667, 2.5, 2.6666666666666665);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (26, '炉米Lumi', 'https://artistrylab.net', '字节推出的一个为创作者提供一站式服务的平台，它通过提供便捷的登录方式、丰富的素材库和强大的编辑工具，使得创作变得更加简单和高效。无论是新手还是专业创作者，都可以在这个平台上找到适合自己的创作工具和资源，实现创意的快速落地。', 'entityAI/logo_AIGC绘画工具_炉米Lumi.png', 'entityAI/cover_AIGC绘画工具_炉米Lumi.png', 3, 'lumiLumi', 2.0, 2.3333333333333335, 2.5, 1.8333333333333333);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (27, '搜狐简单AI', 'https://ai.sohu.com/pc/generate?trans=030001_pjj_0809', '搜狐旗下全能型AI创作助手，一站式满足文本创作、图片创作', 'entityAI/logo_AIGC绘画工具_搜狐简单AI.png', 'entityAI/cover_AIGC绘画工具_搜狐简单AI.png', 3, 'souhujiandanAI', 3.5, 3.5, 2.8333333333333335, 2.3333333333333335);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (28, '云界AI', 'https://www.yunjie.art', '一个免费且易于使用的AI绘图工具，它通过AI技术降低了艺术创作的门槛，使得用户可以快速上手并创作出具有个人风格的作品。无论是专业艺术家还是绘图新手，都可以利用云界AI来探索和实现自己的创意。', 'entityAI/logo_AIGC绘画工具_云界AI.png', 'entityAI/cover_AIGC绘画工具_云界AI.png', 3, 'yunjieAI', 2.5, 3.6666666666666665, 2.0, 4.333333333333333);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (29, 'Ideogram', 'https://ideogram.ai', '优秀的在线AI绘画平台，以其强大的图像生成能力和多样化的功能，满足了从设计师到开发者，从学生到自由职业者的广泛需求。', 'entityAI/logo_AIGC绘画工具_Ideogram.png', 'entityAI/cover_AIGC绘画工具_Ideogram.png', 3, 'Ideogram', 0.6666666666666666, 1.1666666666666667, 4.5, 1.8333333333333333);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (30, '腾讯混元生图', 'https://image.hunyuan.tencent.com', '为创新性的设计、故事讲述以及更多场景提供一种强大而灵活的解决方案。', 'entityAI/logo_AIGC绘画工具_腾讯混元生图.png', 'entityAI/cover_AIGC绘画工具_腾讯混元生图.png', 3, 'tengxunhunyuanshengtu', 4.666666666666667, 3.0, 2.5, 2.5);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (31, 'FLUX.1', 'https://blackforestlabs.ai', 'Stable Diffusion原班人马推出的开源文生图模型，Black Forest Labs推出的一系列AI图像生成工具，旨在为不同需求的用户提供定制化的服务。无论是专业的图像生成需求，还是开发和个人使用，FLUX.1都能提供相应的解决方案。', 'entityAI/logo_AIGC绘画工具_FLUX.1.png', 'entityAI/cover_AIGC绘画工具_FLUX.1.png', 3, 'FLUX.1', 1.5, 1.8333333333333333, 2.1666666666666665, 2.3333333333333335);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (32, 'AI画一画-9折专享', 'https://www.tishi.top/draw/square/gallery/?invite=er36Jf', 'AI提示语是一个综合性的艺术创作平台，它通过结合AI技术，为用户提供了一个广阔的创作空间。无论是初学者还是专业艺术家，都能在这个平台上找到适合自己的创作方式，实现个性化的艺术创作。', 'entityAI/logo_AIGC绘画工具_AI画一画-9折专享.png', 'entityAI/cover_AIGC绘画工具_AI画一画-9折专享.png', 3, 'AIhuayihua-9zhezhuanxiang', 3.1666666666666665, 2.6666666666666665, 1.3333333333333333, 1.5);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (33, '包图AI文生图', 'https://ibaotu.com/?m=AigcTi&spm=aigcai', '包图AI文生图是一个高效的AI图像生成工具，它通过理解用户的文字描述来创造出相应的视觉内容，极大地提高了设计和创意工作的效率。', 'entityAI/logo_AIGC绘画工具_包图AI文生图.png', 'entityAI/cover_AIGC绘画工具_包图AI文生图.png', 3, 'baotuAIwenshengtu', 3.1666666666666665, 3.3333333333333335, 2.8333333333333335, 0.16666666666666666);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (34, '猫目社区', 'https://www.maomu.com?form=aigccn', '猫目社区是一个专注于人工智能生成内容（AIGC）的平台，提供多种先进的AI工具和模型，旨在探索AIGC技术的无限可能性。', 'entityAI/logo_AIGC绘画工具_猫目社区.png', 'entityAI/cover_AIGC绘画工具_猫目社区.png', 3, 'maomushequ', 2.3333333333333335, 4.166666666666667, 4.166666666666667, 1.5);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (35, '笔魂AI绘画', 'https://ibihun.com/?hf=7', '笔魂AI绘画-免费在线AI绘画、AI画图、AI设计工具软件', 'entityAI/logo_AIGC绘画工具_笔魂AI绘画.png', 'entityAI/cover_AIGC绘画工具_笔魂AI绘画.png', 3, 'bihunAIhuihua', 2.0, 3.1666666666666665, 3.8333333333333335, 1.6666666666666667);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (36, '智启特', 'https://img.zhiqite.com', '智启特绘图API是一款专注于提供人工智能图像处理服务的产品。', 'entityAI/logo_AIGC绘画工具_智启特.png', 'entityAI/cover_AIGC绘画工具_智启特.png', 3, 'zhiqite', 1.6666666666666667, 2.0, 1.6666666666666667, 1.5);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (37, '千图设计室', 'https://hihaibao.com/?from=aigc', '只需输入一句话或关键词，即可快速生成各种类型的海报，包括节日海报、日签、邀请函、电商主图、公告通知、喜报、倒计时等等。这些海报不仅美观大方，而且能够准确传达您想要表达的信息。', 'entityAI/logo_AIGC绘画工具_千图设计室.png', 'entityAI/cover_AIGC绘画工具_千图设计室.png', 3, 'qiantushejishi', 1.8333333333333333, 1.5, 3.6666666666666665, 3.6666666666666665);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (38, '可图 KOLORS', 'https://kolors.kuaishou.com', '可图Kolors是一个创新的AI艺术创作工具，它通过结合AI技术与艺术创作，为用户提供了一个简单、高效的艺术创作途径。', 'entityAI/logo_AIGC绘画工具_可图 KOLORS.png', 'entityAI/cover_AIGC绘画工具_可图 KOLORS.png', 3, 'ketu KOLORS', 1.8333333333333333, 1.3333333333333333, 3.3333333333333335, 3.1666666666666665);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (39, '星火绘镜', 'https://typemovie.art/?utm_source=nt-aigc#/dashboard', 'AI生成视频创作平台。分镜自动拆分，画面一键生成。支持短剧、MV、预告片多题材。描述及创作，短视频轻松生成。', 'entityAI/logo_AIGC视频平台_星火绘镜.png', 'entityAI/cover_AIGC视频平台_星火绘镜.png', 4, 'xinghuohuijing', 2.5, 4.0, 1.3333333333333333, 3.6666666666666665);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (40, '清影 – AI视频生成', 'https://chatglm.cn/apps?image=https%3A%2F%2Fsfile.chatglm.cn%2Factiveimg%2Fbdms%2F66b97e348217030036f486f1&open_from=ads_web_aigc&fr=ads_web_aigc', '智谱旗下AI视频模型通过其创新的技术和用户友好的功能，为用户提供了一个简单快捷的视频创作平台。无论是从文字描述还是图片生成视频，清影都能帮助用户轻松实现视频内容的创作，丰富了创意表达的方式。', 'entityAI/logo_AIGC视频平台_清影 – AI视频生成.png', 'entityAI/cover_AIGC视频平台_清影 – AI视频生成.png', 4, 'qingying – AIshipinshengcheng', 3.0, 3.5, 2.8333333333333335, 1.5);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (41, '有言', 'https://www.youyan3d.com/platform/?utm_source=zhanwaidaoliu&utm_campaign=zwj&utm_content=aigc&from=aigc', '一站式AI视频创作，1200+免费3D数字人。', 'entityAI/logo_AIGC视频平台_有言.png', 'entityAI/cover_AIGC视频平台_有言.png', 4, 'youyan', 1.3333333333333333, 2.1666666666666665, 2.1666666666666665, 0.5);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (42, '白日梦AI生成视频', 'https://aibrm.com/?code=fx_cyc', '多功能AIGC视频内容创作平台，提供丰富的活动、角色库、创作支持和社区交流功能。它旨在为用户提供一个综合性的在线体验和创作空间，适合喜欢在线互动和创作的用户。', 'entityAI/logo_AIGC视频平台_白日梦AI生成视频.png', 'entityAI/cover_AIGC视频平台_白日梦AI生成视频.png', 4, 'bairimengAIshengchengshipin', 2.6666666666666665, 1.5, 3.1666666666666665, 3.8333333333333335);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (43, '一帧秒创', 'https://aigc.yizhentv.com/?_f=aigc.cn', '一帧秒创是一款智能AI内容生成工具，以“文生视频”为核心功能。它能够将一段文字扩展成为视频脚本，并根据文字内容在视频素材库中匹配相应的视频片段，从而省略了手动搜索视频和剪辑的过程。', 'entityAI/logo_AIGC视频平台_一帧秒创.png', 'entityAI/cover_AIGC视频平台_一帧秒创.png', 4, 'yizhenmiaochuang', 2.0, 2.5, 3.1666666666666665, 1.6666666666666667);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (44, '即梦AI-中文版SORA', 'https://jimeng.jianying.com/ai-tool/home/?utm_medium=aitools&utm_source=aigc&utm_campaign=null&utm_content=hw_jm_aigc', '剪映旗下的一款AI视频生成工具，能够根据用户提供的文本内容生成由AI制作的创意视频！', 'entityAI/logo_AIGC视频平台_即梦AI-中文版SORA.png', 'entityAI/cover_AIGC视频平台_即梦AI-中文版SORA.png', 4, 'jimengAI-zhongwenbanSORA', 1.1666666666666667, 3.0, 0.5, 2.3333333333333335);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (45, 'Tora', 'https://ali-videoai.github.io/tora_video', 'Tora是阿里推出的一个强大的视频生成工具，它通过集成多种条件来创造高质量的视频内容。其主要优势在于对运动轨迹的精确控制和对物理世界运动的真实模拟，这使得Tora在视频内容创作领域具有广泛的应用潜力。', 'entityAI/logo_AIGC视频平台_Tora.png', 'entityAI/cover_AIGC视频平台_Tora.png', 4, 'Tora', 3.3333333333333335, 2.3333333333333335, 2.8333333333333335, 3.3333333333333335);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (46, '海螺AI视频', 'https://hailuoai.com/video', '多功能的AI助手，通过提供视频创作、音乐创作、图像识别和文本写作等功能，帮助用户提升工作和学习的效率。它的智能化和高效率的特点，使其成为提升生产力的有力工具。', 'entityAI/logo_AIGC视频平台_海螺AI视频.png', 'entityAI/cover_AIGC视频平台_海螺AI视频.png', 4, 'hailuoAIshipin', 3.8333333333333335, 2.1666666666666665, 2.0, 2.5);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (47, 'Decohere', 'https://www.decohere.ai', '适合希望通过AI技术创造新颖视频内容的用户，如音乐视频、教育内容等。它为独立视频创作者、广告和营销专业人士、音乐视频制作人、教育机构、企业宣传部门、动画师和视觉艺术家、以及社交媒体创作者提供了一个强大的工具，以更生动的方式传达信息和创意。', 'entityAI/logo_AIGC视频平台_Decohere.png', 'entityAI/cover_AIGC视频平台_Decohere.png', 4, 'Decohere', 1.1666666666666667, 2.6666666666666665, 4.666666666666667, 2.3333333333333335);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (48, 'MOKI', 'https://www.moki.cn', 'MOKI是美图旗下一个提供一站式AI短片制作服务的平台，通过其AI技术，为用户提供从前期策划到后期制作的全方位短片制作解决方案。无论是创意构思、素材生成还是后期剪辑，MOKI都能帮助用户实现个性化的短片创作，让短片制作变得更加简单、高效。', 'entityAI/logo_AIGC视频平台_MOKI.png', 'entityAI/cover_AIGC视频平台_MOKI.png', 4, 'MOKI', 1.3333333333333333, 1.6666666666666667, 2.8333333333333335, 0.6666666666666666);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (49, 'SkyReels', 'https://skyreels.ai/beta', 'SkyReels是一个创新的视频创作工具，特别适合那些寻求通过技术简化创作流程并实现创意的用户。它通过结合3D引擎和AI技术，为用户提供了一个强大而易于使用的平台，以实现从创意到短片的快速转化。', 'entityAI/logo_AIGC视频平台_SkyReels.png', 'entityAI/cover_AIGC视频平台_SkyReels.png', 4, 'SkyReels', 2.3333333333333335, 2.3333333333333335, 3.8333333333333335, 1.8333333333333333);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (50, '神笔马良', 'https://shenbi.maoyan.com', '一个为电影爱好者和行业从业者提供数据支持和市场分析的工具。它通过实时数据和多维度分析，帮助用户更好地理解电影市场，做出更明智的观影选择。', 'entityAI/logo_AIGC视频平台_神笔马良.png', 'entityAI/cover_AIGC视频平台_神笔马良.png', 4, 'shenbimaliang', 3.6666666666666665, 1.5, 2.5, 1.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (51, '可灵大模型', 'https://kling.kuaishou.com', '可灵大模型是快手推出的一款创新的视频生成工具，它通过先进的AI技术，为用户提供了一个能够将创意快速转化为视频内容的平台。', 'entityAI/logo_AIGC视频平台_可灵大模型.png', 'entityAI/cover_AIGC视频平台_可灵大模型.png', 4, 'kelingdamoxing', 2.0, 3.1666666666666665, 2.5, 1.3333333333333333);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (52, 'Vidu', 'https://www.vidu.studio', 'Vidu是一个创新的视频制作平台，它通过提供快速、多样化的视频创作工具，使得即使是非专业人士也能轻松制作出具有专业感的视频。', 'entityAI/logo_AIGC视频平台_Vidu.png', 'entityAI/cover_AIGC视频平台_Vidu.png', 4, 'Vidu', 1.5, 3.5, 2.3333333333333335, 2.1666666666666665);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (53, 'Viggle', 'https://www.viggle.ai', 'Viggle是一个强大的AI视频生成工具，它通过易于使用的命令为用户提供了丰富的视频创作可能性。无论是将静态角色转化为动态视频，还是完全控制角色动作，Viggle都能满足用户的创意需求。', 'entityAI/logo_AIGC视频平台_Viggle.png', 'entityAI/cover_AIGC视频平台_Viggle.png', 4, 'Viggle', 3.3333333333333335, 2.8333333333333335, 2.3333333333333335, 1.6666666666666667);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (54, 'Reachout.ai', 'https://reachout.ai', 'Reachout.ai是一个人工智能驱动的视频开发平台，专为忙碌的企业家和销售团队打造，他们希望突破收件箱的噪音，大规模生成个性化视频，并获得更高的电子邮件回复率和更多与理想客户的会议。', 'entityAI/logo_AIGC视频平台_Reachout.ai.png', 'entityAI/cover_AIGC视频平台_Reachout.ai.png', 4, 'Reachout.ai', 1.3333333333333333, 4.333333333333333, 2.6666666666666665, 1.5);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (55, '轻幕', 'https://mika365.com', '点点鼠标快速生成诗词、成语故事等的短视频，多模型生图、AI对话，AI音乐创作', 'entityAI/logo_AIGC视频平台_轻幕.png', 'entityAI/cover_AIGC视频平台_轻幕.png', 4, 'qingmu', 4.166666666666667, 2.3333333333333335, 3.6666666666666665, 1.8333333333333333);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (56, 'Fliki.ai', 'https://fliki.ai', '将文本变成带有 AI 语音的视频,在 2 分钟内使用逼真的声音从脚本或博客文章创建视频！', 'entityAI/logo_AIGC视频平台_Fliki.ai.png', 'entityAI/cover_AIGC视频平台_Fliki.ai.png', 4, 'Fliki.ai', 1.0, 4.333333333333333, 0.8333333333333334, 4.166666666666667);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (57, 'Loom AI', 'https://www.loom.com/ai', 'Loom AI是一个强大的视频处理工具，它通过人工智能简化了视频的录制、编辑和分享过程。它不仅提高了视频内容的可访问性和参与度，还通过自动化功能显著提升了工作效率。', 'entityAI/logo_AIGC视频平台_Loom AI.png', 'entityAI/cover_AIGC视频平台_Loom AI.png', 4, 'Loom AI', 3.1666666666666665, 2.1666666666666665, 2.1666666666666665, 1.6666666666666667);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (58, '达摩院·寻光', 'https://xunguang.damo-vision.com', '达摩院·寻光是一个创新的AI驱动的视频创作工具，它通过提供一系列自动化和辅助性功能，大大降低了视频创作的技术门槛，使得用户可以更加专注于创意和故事表达。', 'entityAI/logo_AIGC视频平台_达摩院·寻光.png', 'entityAI/cover_AIGC视频平台_达摩院·寻光.png', 4, 'damoyuan·xunguang', 2.0, 2.3333333333333335, 3.3333333333333335, 2.6666666666666665);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (59, 'NextClip', 'https://www.nextclip.cn', '利用先进的人工智能技术，我们为您打造了一个无需专业背景即可轻松创作沉浸式视频小说的平台', 'entityAI/logo_AIGC视频平台_NextClip.png', 'entityAI/cover_AIGC视频平台_NextClip.png', 4, 'NextClip', 3.1666666666666665, 2.1666666666666665, 3.6666666666666665, 3.8333333333333335);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (60, 'Stable Video', 'https://www.stablevideo.com', '通过简化视频制作过程，即使是没有专业视频编辑技能的用户也能快速创建吸引人的视频。Stable Video目前处于公测阶段，每个人都可以免费使用。', 'entityAI/logo_AIGC视频平台_Stable Video.png', 'entityAI/cover_AIGC视频平台_Stable Video.png', 4, 'Stable Video', 2.8333333333333335, 2.5, 3.0, 3.3333333333333335);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (61, 'Sora', 'https://openai.com/index/sora', '能够生成长达 1 分钟的高清视频，涵盖广泛的视觉数据类型和分辨率。Sora通过在视频和图像的压缩潜在空间中训练，将其分解为时空位置补丁，实现了可扩展的视频生成。', 'entityAI/logo_AIGC视频平台_Sora.png', 'entityAI/cover_AIGC视频平台_Sora.png', 4, 'Sora', 3.5, 1.3333333333333333, 3.0, 1.1666666666666667);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (62, '智谱清言', 'https://chatglm.cn/apps?image=https%3A%2F%2Fsfile.chatglm.cn%2Factiveimg%2Fbdms%2F66b97e348217030036f486f1&open_from=ads_web_aigc&fr=ads_web_aigc', '智谱清言是一款基于人工智能技术的千亿参数对话模型，遵循中国政府的立场和社会主义价值观，提供多领域知识问答、信息检索、文本生成等服务。', 'entityAI/logo_AIGC智能对话_智谱清言.png', 'entityAI/cover_AIGC智能对话_智谱清言.png', 5, 'zhipuqingyan', 3.0, 2.5, 4.666666666666667, 2.1666666666666665);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (63, '讯飞星火', 'https://xinghuo.xfyun.cn/desk?ch=xhweb_Squ', '讯飞星火是科大讯飞推出的高性能AI语言模型，具备多模态理解和生成能力，服务于企业服务、智能硬件、智慧政务、智慧金融、智慧生活和智慧医疗等多个领域。', 'entityAI/logo_AIGC智能对话_讯飞星火.png', 'entityAI/cover_AIGC智能对话_讯飞星火.png', 5, 'xunfeixinghuo', 2.0, 1.5, 2.6666666666666665, 1.6666666666666667);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (64, '文心一言', 'https://yiyan.baidu.com/?utm_source=aigcdh', '文心一言是由百度基于文心大模型技术推出的生成式对话产品。它位于百度人工智能的四层架构中的模型层，具备跨模态功能。', 'entityAI/logo_AIGC智能对话_文心一言.png', 'entityAI/cover_AIGC智能对话_文心一言.png', 5, 'wenxinyiyan', 1.1666666666666667, 3.6666666666666665, 3.1666666666666665, 2.6666666666666665);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (65, '通义千问', 'https://tongyi.aliyun.com/qianwen', '通义千问是由阿里云推出的一种超大规模语言模型，它可以理解和回答各种领域的问题，包括常见、复杂甚至是少见的问题。它不仅是一个效率助手，也是一个点子生成机，可以帮助用户完成各种任务，如写邮件、写文章、写脚本、写情书、写诗等。此外，它还能提供娱乐功能，比如讲笑话、唱歌等。', 'entityAI/logo_AIGC智能对话_通义千问.png', 'entityAI/cover_AIGC智能对话_通义千问.png', 5, 'tongyiqianwen', 1.6666666666666667, 3.1666666666666665, 3.1666666666666665, 1.8333333333333333);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (66, '商汤商量SenseChat', 'https://chat.sensetime.com', '商汤商量SenseChat是由商汤科技推出的语言大模型，提供对话和文档理解服务，能够处理百科问答、图片理解、数学解答、代码编写等多种任务。', 'entityAI/logo_AIGC智能对话_商汤商量SenseChat.png', 'entityAI/cover_AIGC智能对话_商汤商量SenseChat.png', 5, 'shangtangshangliangSenseChat', 2.3333333333333335, 2.0, 3.8333333333333335, 1.6666666666666667);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (67, 'Kimi Chat', 'https://volctrack.com/w/pJxYBwii', 'Kimi Chat 是由月之暗面科技有限公司开发的智能聊天助手，旨在为用户提供高效、智能和友好的交流体验。作为一款先进的人工智能产品，Kimi Chat 集成了多种功能和特点，使其能够满足用户在多种场景下的沟通需求。', 'entityAI/logo_AIGC智能对话_Kimi Chat.png', 'entityAI/cover_AIGC智能对话_Kimi Chat.png', 5, 'Kimi Chat', 2.6666666666666665, 2.8333333333333335, 2.0, 1.8333333333333333);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (68, '天工AI助手', 'https://www.tiangong.cn', '天工AI是一个多功能的智能助手，它通过整合搜索、数据分析和智能预测等技术，为用户提供了一个全面、便捷和个性化的服务体验。', 'entityAI/logo_AIGC智能对话_天工AI助手.png', 'entityAI/cover_AIGC智能对话_天工AI助手.png', 5, 'tiangongAIzhushou', 1.6666666666666667, 2.6666666666666665, 1.8333333333333333, 1.8333333333333333);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (69, 'CueMe', 'https://cueme.cn?entry=qudao_aigcdaohang', 'CueMe 是由夸克自主研发的一款智能对话助手，旨在为用户的学习、工作、生活提供一站式的信息服务。 支持用户的文学创作、知识获取、感情陪伴等需求。', 'entityAI/logo_AIGC智能对话_CueMe.png', 'entityAI/cover_AIGC智能对话_CueMe.png', 5, 'CueMe', 1.8333333333333333, 1.3333333333333333, 3.0, 3.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (70, '360智脑', 'https://chat.360.com', '360智脑是360公司自研的认知型通用大模型，依托于360多年积累的大算力、大数据、工程化等关键优势，集成了360GPT大模型、360CV大模型、360多模态大模型技术能力。它具备生成创作、多轮对话、逻辑推理等十大核心能力和数百项细分功能，旨在重塑人机协作的新范式。', 'entityAI/logo_AIGC智能对话_360智脑.png', 'entityAI/cover_AIGC智能对话_360智脑.png', 5, '360zhinao', 3.6666666666666665, 2.1666666666666665, 3.0, 3.6666666666666665);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (71, 'DeepSeek', 'https://www.deepseek.com', 'DeepSeek-V2是由杭州深度求索公司发布的第二代开源MoE模型，DeepSeek-V2 在中文综合能力与 GPT-4-Turbo，文心 4.0 等闭源模型在评测中处于同一梯队，英文综合能力英文综合能力（MT-Bench）与最强的开源模型 LLaMA3-70B 处于同一梯队，超过最强 MoE 开源模型 Mixtral8x22B，特别擅长数学、编程和逻辑推理任务。它在多个大型模型排行榜上名列前茅，支持长达128K的上下文长度，并提供开放源代码。', 'entityAI/logo_AIGC智能对话_DeepSeek.png', 'entityAI/cover_AIGC智能对话_DeepSeek.png', 5, 'DeepSeek', 2.3333333333333335, 2.5, 3.6666666666666665, 2.1666666666666665);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (72, '海螺问问', 'https://hailuoai.com', '一款多功能的AI智能问答助手 MiniMax公司旗下的海螺问问，是一款依托于深度学习技术的问答系统，它采用了公司自主研发的MoE模型。', 'entityAI/logo_AIGC智能对话_海螺问问.png', 'entityAI/cover_AIGC智能对话_海螺问问.png', 5, 'hailuowenwen', 1.0, 3.5, 2.0, 3.5);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (73, '知乎直答', 'https://zhida.zhihu.com', '知乎直答是知乎推出的一项基于人工智能技术的搜索问答服务。它利用AI大模型技术，为用户提供智能搜索和可靠的回答，使得用户能够快速找到最相关的答案和专业的知乎答主。', 'entityAI/logo_AIGC智能对话_知乎直答.png', 'entityAI/cover_AIGC智能对话_知乎直答.png', 5, 'zhihuzhida', 0.5, 1.8333333333333333, 3.5, 2.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (74, '腾讯元宝', 'https://yuanbao.tencent.com/chat', '腾讯元宝，由腾讯公司精心打造，依托于混元大模型以及搜索引擎的强大驱动，诞生了一个高效的信息整合利器。', 'entityAI/logo_AIGC智能对话_腾讯元宝.png', 'entityAI/cover_AIGC智能对话_腾讯元宝.png', 5, 'tengxunyuanbao', 3.8333333333333335, 1.5, 2.5, 3.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (75, '万知', 'https://www.wanzhi.com/home', '问答、阅读、创作的一站式AI工作平台', 'entityAI/logo_AIGC智能对话_万知.png', 'entityAI/cover_AIGC智能对话_万知.png', 5, 'wanzhi', 1.6666666666666667, 2.3333333333333335, 2.8333333333333335, 3.1666666666666665);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (76, '百小应', 'https://ying.baichuan-ai.com/chat', '百小应是由百川智能推出的人工智能助手。', 'entityAI/logo_AIGC智能对话_百小应.png', 'entityAI/cover_AIGC智能对话_百小应.png', 5, 'baixiaoying', 2.5, 3.6666666666666665, 2.3333333333333335, 2.8333333333333335);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (77, 'AI小聚', 'https://ii.cn', 'AI小聚是一个提供智能对话、文本创作和艺术绘画服务的在线平台', 'entityAI/logo_AIGC智能对话_AI小聚.png', 'entityAI/cover_AIGC智能对话_AI小聚.png', 5, 'AIxiaoju', 2.3333333333333335, 2.8333333333333335, 1.3333333333333333, 2.3333333333333335);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (78, '问小白', 'https://www.wenxiaobai.com', '问小白是一个旨在简化用户日常生活的智能助手，它通过对话的形式提供陪伴、信息搜索、资料整理、情绪支持和生活规划等服务。', 'entityAI/logo_AIGC智能对话_问小白.png', 'entityAI/cover_AIGC智能对话_问小白.png', 5, 'wenxiaobai', 3.6666666666666665, 2.8333333333333335, 2.3333333333333335, 2.3333333333333335);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (79, '稿定AI设计', 'https://www.gaoding.com/utms/656bcb8b01104751993ced9f343f418e', '国内知名在线AI设计作图工具&amp;新媒体人必备素材库，它通过AI设计，AI绘画，AI抠图，在线PS，图片编辑/延展等功能，将AI能力逐步渗透到灵感获取，创作，作品优化等环节，降低设计门槛，累计使用用户1亿+！', 'entityAI/logo_AIGC设计工具_稿定AI设计.png', 'entityAI/cover_AIGC设计工具_稿定AI设计.png', 6, 'gaodingAIsheji', 3.1666666666666665, 2.8333333333333335, 3.5, 2.1666666666666665);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (80, '美间AI设计', 'https://www.meijian.com/ai?from=mj_navigation&utm_source=dsdhaigc', '美间是一款AI创意内容云设计工具，由国产3D室内设计软件酷家乐所属公司推出，提供海量方案模板和快速设计工具，为平面设计创作者量身打造流畅、高效、美观的创作体验。致力于服务软装设计师，通过海量的设计素材和简单易用的编辑功能，帮助设计师高效、快速地完成软装搭配创作。', 'entityAI/logo_AIGC设计工具_美间AI设计.png', 'entityAI/cover_AIGC设计工具_美间AI设计.png', 6, 'meijianAIsheji', 2.3333333333333335, 1.5, 2.3333333333333335, 1.8333333333333333);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (81, '神采PromeAI', 'https://www.ishencai.com/?vsource=aigc.cnweb', '神采PromeAI是一款专为建筑师、室内设计师、产品设计师和游戏动漫设计师打造的AI图像处理工具。利用强大的人工智能技术和广泛可控的AIGC模型风格库，神采PromeAI可以帮助用户创建惊人的图形、视频和动画，是实现你想象的最佳工具。', 'entityAI/logo_AIGC设计工具_神采PromeAI.png', 'entityAI/cover_AIGC设计工具_神采PromeAI.png', 6, 'shencaiPromeAI', 3.1666666666666665, 2.5, 1.8333333333333333, 2.1666666666666665);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (82, '美图设计室', 'https://www.x-design.com/?channel=aigc', '美图设计室是美图秀秀旗下的智能平面设计在线协作平台，提供丰富的设计资源和便捷的在线设计工具。它主要面向需要平面设计服务的用户，包括但不限于海报制作、电商设计、PPT制作等领域。', 'entityAI/logo_AIGC设计工具_美图设计室.png', 'entityAI/cover_AIGC设计工具_美图设计室.png', 6, 'meitushejishi', 0.8333333333333334, 0.3333333333333333, 2.8333333333333335, 1.6666666666666667);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (83, 'AI小方-包装设计', 'https://www.xiaofang.design', 'AI小方是一款高效的AIGC设计工具，它通过人工智能技术简化了设计流程，提高了设计工作的效率和质量。', 'entityAI/logo_AIGC设计工具_AI小方-包装设计.png', 'entityAI/cover_AIGC设计工具_AI小方-包装设计.png', 6, 'AIxiaofang-baozhuangsheji', 2.6666666666666665, 3.1666666666666665, 4.666666666666667, 3.3333333333333335);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (84, '创客贴', 'https://www.chuangkit.com/?utm_source=aigccn', '创客贴是由北京艺源酷科技有限公司推出的一个多平台图形编辑和平面设计工具，支持Web、Mobile、Mac、Windows等平台。它提供一站式在线设计平台服务，覆盖创意全场景和全流程，用户可以通过简单的拖、拉、拽方式，利用创客贴提供的大量图片、字体、模板等设计元素来制作所需的设计作品。', 'entityAI/logo_AIGC设计工具_创客贴.png', 'entityAI/cover_AIGC设计工具_创客贴.png', 6, 'chuangketie', 1.8333333333333333, 1.1666666666666667, 2.1666666666666665, 1.5);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (85, '设计宝藏', 'http://www.shejibaozang.com', '一个致力于提供免费资源的宝藏网站。', 'entityAI/logo_AIGC设计工具_设计宝藏.png', 'entityAI/cover_AIGC设计工具_设计宝藏.png', 6, 'shejibaozang', 3.5, 0.6666666666666666, 3.5, 4.333333333333333);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (86, '千图网', 'https://www.58pic.com/?from=aigc', '千图网是一个综合性的设计素材平台，提供从高清图片到PPT模板、视频模板等多样化的设计资源。', 'entityAI/logo_AIGC设计工具_千图网.png', 'entityAI/cover_AIGC设计工具_千图网.png', 6, 'qiantuwang', 3.8333333333333335, 2.8333333333333335, 3.3333333333333335, 2.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (87, '智绘设计', 'https://taishan.qq.com/brand', '腾讯云智绘（AI Design Creative），是腾讯推出的面向个人创作者、中小型企业在泛内容领域的素材智能化设计生产平台，提供在线工具创作各类形态素材，可用于各行业新媒体等运营。为企业提供深度定制接口，丰富优质的创意素材，秒速海量的生产服务，稳定可靠的输出品质，助力用户与企业达成增效降本目标。', 'entityAI/logo_AIGC设计工具_智绘设计.png', 'entityAI/cover_AIGC设计工具_智绘设计.png', 6, 'zhihuisheji', 1.6666666666666667, 1.5, 4.166666666666667, 2.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (88, '摹客', 'https://www.mockplus.cn', '摹客为产品开发团队提供全流程协作、原型设计、UI设计和设计规范管理支持。摹客可以自产出原型及高保真设计，也支持多款主流设计工具（Figma/Sketch/PS/XD/Axure等）的设计稿交付，团队成员在产品、设计到开发的各个工作环节，使用不同设计工具，可通过摹客平台协同工作。为助力企业数字化和在线化，摹客为企业提供私有部署和定制化服务，以“快和简单”的产品特性，帮助企业提升设计效能、降低成本。', 'entityAI/logo_AIGC设计工具_摹客.png', 'entityAI/cover_AIGC设计工具_摹客.png', 6, 'moke', 3.1666666666666665, 3.3333333333333335, 2.8333333333333335, 3.1666666666666665);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (89, '图界网', 'https://www.tujie66.com/ ', '图界网 是国内保持创新的素材设计平台', 'entityAI/logo_AIGC设计工具_图界网.png', 'entityAI/cover_AIGC设计工具_图界网.png', 6, 'tujiewang', 2.3333333333333335, 4.333333333333333, 2.0, 3.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (90, '图怪兽AI设计', 'https://818ps.com/aihaibao', 'AI在线设计工具，一键生成海报热门模版', 'entityAI/logo_AIGC设计工具_图怪兽AI设计.png', 'entityAI/cover_AIGC设计工具_图怪兽AI设计.png', 6, 'tuguaishouAIsheji', 2.0, 1.6666666666666667, 1.5, 2.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (91, '潮际好麦', 'https://marketing.k-fashionshop.com?relCode=J1P9TJD2', 'AI 电商营销平台，助力电商从业者高效创作', 'entityAI/logo_AIGC设计工具_潮际好麦.png', 'entityAI/cover_AIGC设计工具_潮际好麦.png', 6, 'chaojihaomai', 2.1666666666666665, 2.5, 3.3333333333333335, 1.3333333333333333);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (92, '墨刀AI', 'https://modao.cc', '墨刀（modao.cc）是一款隶属于万兴科技集团的在线原型设计与协同工具，旨在打通产品设计、研发和销售团队之间的协作，实现原型设计、设计、流程、思维导图的一体化。它不仅支持用户搭建产品原型和演示项目效果，还作为一个协作平台，允许项目成员协作编辑和审阅文档。', 'entityAI/logo_AIGC设计工具_墨刀AI.png', 'entityAI/cover_AIGC设计工具_墨刀AI.png', 6, 'modaoAI', 4.666666666666667, 3.5, 0.6666666666666666, 1.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (93, '因赛AIGC', 'https://gpt.idealead.com', '因赛AIGC解决营销全链路应用场景', 'entityAI/logo_AIGC设计工具_因赛AIGC.png', 'entityAI/cover_AIGC设计工具_因赛AIGC.png', 6, 'yinsaiAIGC', 2.1666666666666665, 2.0, 2.6666666666666665, 1.8333333333333333);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (94, 'MasterGo', 'https://mastergo.com', 'MasterGo是一款面向团队的专业在线UI/UX设计工具，支持多达500人同时在线协同工作。它不仅仅是一个设计工具，而是一个贯穿产品设计研发全链条的在线协作平台，实现了设计师、产品经理和工程师之间的协同工作。', 'entityAI/logo_AIGC设计工具_MasterGo.png', 'entityAI/cover_AIGC设计工具_MasterGo.png', 6, 'MasterGo', 0.5, 1.5, 4.0, 2.5);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (95, '千鹿设计助手', 'https://www.qianlu.cc', '一款为设计师量身打造的AI桌面助手', 'entityAI/logo_AIGC设计工具_千鹿设计助手.png', 'entityAI/cover_AIGC设计工具_千鹿设计助手.png', 6, 'qianlushejizhushou', 3.0, 3.25, 1.75, 0.75);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (96, 'AI智能小秘', 'http://www.aiznxm.com', '这款AI产品以其创新技术和多样化功能，为用户提供了一个全面、高效的图像处理和创作平台，极大地丰富了数字内容创作的边界。', 'entityAI/logo_AIGC设计工具_AI智能小秘.png', 'entityAI/cover_AIGC设计工具_AI智能小秘.png', 6, 'AIzhinengxiaomi', 3.25, 4.5, 0.5, 1.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (97, '易企秀 – 小易AI', 'https://ai.eqxiu.com', '无论是营销人员、设计师还是普通用户，都可以利用这个工具提升工作效率，创造出更具吸引力的视觉和文案作品。随着AI技术的不断进步，小易AI有望成为创意产业中的重要辅助工具。', 'entityAI/logo_AIGC设计工具_易企秀 – 小易AI.png', 'entityAI/cover_AIGC设计工具_易企秀 – 小易AI.png', 6, 'yiqixiu – xiaoyiAI', 2.5, 1.0, 2.0, 2.75);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (98, 'IdGPT【工业设计垂直领域AI平台】', 'https://www.id-gpt.com', 'IdGPT-工业设计领域Ai创意平台', 'entityAI/logo_AIGC设计工具_IdGPT【工业设计垂直领域AI平台】.png', 'entityAI/cover_AIGC设计工具_IdGPT【工业设计垂直领域AI平台】.png', 6, 'IdGPT【gongyeshejichuizhilingyuAIpingtai】', 2.25, 2.75, 2.0, 2.25);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (99, '创自由', 'https://www.chuangziyou.com', '致力于帮助电商、自媒体和传统企业的AI超强AI工具', 'entityAI/logo_AIGC设计工具_创自由.png', 'entityAI/cover_AIGC设计工具_创自由.png', 6, 'chuangziyou', 4.75, 2.5, 2.25, 2.5);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (100, 'Motiff', 'https://motiff.com', 'AI时代设计工具', 'entityAI/logo_AIGC设计工具_Motiff.png', 'entityAI/cover_AIGC设计工具_Motiff.png', 6, 'Motiff', 0.75, 0.75, 3.25, 2.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (101, '即时设计', 'https://ad.js.design/special/ui/?source=ldx&plan=6b2ead8ae3807096', '即时设计是一个强大的UI设计工具，它通过提供实时协作、AI辅助设计、跨平台使用和全流程体验等功能，帮助设计团队提高工作效率和产品质量。', 'entityAI/logo_AIGC设计工具_即时设计.png', 'entityAI/cover_AIGC设计工具_即时设计.png', 6, 'jishisheji', 2.75, 0.5, 2.75, 1.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (102, '琅琅配音', 'https://lang123.top?rmd=62892', '琅琅配音是一款卓越的智能文本转语音工具，提供语音合成服务。', 'entityAI/logo_AIGC音频工具_琅琅配音.png', 'entityAI/cover_AIGC音频工具_琅琅配音.png', 7, 'langlangpeiyin', 1.75, 1.5, 3.5, 1.5);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (103, '标贝悦读AI配音', 'https://yuedu.data-baker.com/?source=AIGC', '标贝悦读作为一个在线文字转语音软件，以其快速、逼真的语音合成效果和丰富的发音人角色，适用于视频配音、美食教程、知识科普、生活妙招分享等多种场景。', 'entityAI/logo_AIGC音频工具_标贝悦读AI配音.png', 'entityAI/cover_AIGC音频工具_标贝悦读AI配音.png', 7, 'biaobeiyueduAIpeiyin', 1.25, 3.25, 2.5, 2.5);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (104, '魔音工坊', 'https://www.moyin.com/?channelCode=AIGC_20231020', '魔音工坊是由北京小问智能科技有限公司开发的一款配音软件，为用户提供一站式AI配音服务。它被广泛应用于短视频制作、有声书、广告、宣传纪录片等领域，是一款专业的AI语音配音与剪辑工具。', 'entityAI/logo_AIGC音频工具_魔音工坊.png', 'entityAI/cover_AIGC音频工具_魔音工坊.png', 7, 'moyingongfang', 1.25, 1.25, 2.25, 3.25);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (105, '逗哥配音神器', 'https://douge.club/index?from=aaQbYf', '逗哥配音神器是一个功能全面的在线配音平台，提供了从文案输入到配音生成、下载及字幕制作的一站式服务。', 'entityAI/logo_AIGC音频工具_逗哥配音神器.png', 'entityAI/cover_AIGC音频工具_逗哥配音神器.png', 7, 'dougepeiyinshenqi', 2.0, 1.0, 0.25, 1.5);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (106, 'TTSMaker马克配音', 'https://ttsmaker.cn', '免费的AI配音平台，可以将文本转换成语音，支持50多种语言和300多种语音风格', 'entityAI/logo_AIGC音频工具_TTSMaker马克配音.png', 'entityAI/cover_AIGC音频工具_TTSMaker马克配音.png', 7, 'TTSMakermakepeiyin', 0.75, 2.25, 3.0, 4.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (107, 'Text To Speech', 'https://www.text-to-speech.cn', '构建自然说话的应用和服务，从 147 种语言和变体中选择 456 种语音', 'entityAI/logo_AIGC音频工具_Text To Speech.png', 'entityAI/cover_AIGC音频工具_Text To Speech.png', 7, 'Text To Speech', 3.5, 4.5, 1.75, 2.5);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (108, 'Resemble AI', 'https://www.resemble.ai', 'Resemble.ai的AI语音生成器是一个完整的生成式语音AI工具包，允许您在几秒钟内创建类似人类的声音。', 'entityAI/logo_AIGC音频工具_Resemble AI.png', 'entityAI/cover_AIGC音频工具_Resemble AI.png', 7, 'Resemble AI', 4.0, 3.25, 1.5, 3.5);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (109, 'Narration Box', 'https://narrationbox.com', 'Narration Box是一种语音合成服务，用户可以创建画外音、旁白、有声读物、音频页面、播客等。它拥有超过700个人工智能增强的仿人叙述者，支持20多种语言，功能强大的语音编辑器，以及博客和新闻网站的音频小部件。它还包括常见问题解答、反馈、更新等资源。它是免费的，并提供了分发、分析、盈利等工具。', 'entityAI/logo_AIGC音频工具_Narration Box.png', 'entityAI/cover_AIGC音频工具_Narration Box.png', 7, 'Narration Box', 2.25, 2.75, 1.5, 0.5);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (110, 'LOVO.AI', 'https://lovo.ai', 'LOVO AI是一个功能强大的AI语音生成器，它通过提供多样化的语音选项和易用的编辑工具，帮助用户快速创建引人入胜的视频和音频内容。', 'entityAI/logo_AIGC音频工具_LOVO.AI.png', 'entityAI/cover_AIGC音频工具_LOVO.AI.png', 7, 'LOVO.AI', 2.5, 2.5, 1.5, 4.25);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (111, 'Resemble AI', 'https://www.resemble.ai', 'Resemble AI是一个在线文本转语音平台，允许用户在30秒内将任何书面文本转换为音频文件。它提供了16种多种语言的国际声音和一个表达性内容编辑器来定制声音的输出。', 'entityAI/logo_AIGC音频工具_Resemble AI.png', 'entityAI/cover_AIGC音频工具_Resemble AI.png', 7, 'Resemble AI', 2.25, 1.25, 2.5, 0.5);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (112, 'Speechify', 'https://speechify.com', 'Speechify是一款文本转语音的应用程序，通过将文本转换成自然的声音，帮助你理解和记住更多你所阅读的内容。它可以在Chrome、iOS、Android和Mac上使用。', 'entityAI/logo_AIGC音频工具_Speechify.png', 'entityAI/cover_AIGC音频工具_Speechify.png', 7, 'Speechify', 0.75, 2.75, 2.5, 4.25);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (113, 'Uberduck', 'https://uberduck.ai', 'Uberduck是一个开源的语音AI社区，可以帮助用户在几分钟内通过api创建人工智能生成的音频应用程序。它允许用户使用5000 +富有表现力的声音制作AI画外音，并使用他们的AI生成的说唱工具创建自己的自定义语音克隆。', 'entityAI/logo_AIGC音频工具_Uberduck.png', 'entityAI/cover_AIGC音频工具_Uberduck.png', 7, 'Uberduck', 3.25, 2.5, 3.25, 4.5);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (114, '声咔AI配音', 'https://peiyin.soundcos.com', '声咔AI配音是在线配音软件平台，垂直深度音频效率工具，支持30多种个性化调音功能等，限制少对用户友好。', 'entityAI/logo_AIGC音频工具_声咔AI配音.png', 'entityAI/cover_AIGC音频工具_声咔AI配音.png', 7, 'shengkaAIpeiyin', 3.25, 0.25, 2.75, 2.75);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (115, 'Dubbingx', 'https://www.dubbingx.com', '全球唯一、多情绪、多语态、全可控的AI配音产品', 'entityAI/logo_AIGC音频工具_Dubbingx.png', 'entityAI/cover_AIGC音频工具_Dubbingx.png', 7, 'Dubbingx', 4.0, 2.0, 2.25, 2.25);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (116, 'LiSTNR', 'https://www.listnr.com', 'Listnr是一个人工智能语音生成器和文本到语音的在线工具，允许用户从142种不同语言的900多个声音的文本创建逼真的画外音。', 'entityAI/logo_AIGC音频工具_LiSTNR.png', 'entityAI/cover_AIGC音频工具_LiSTNR.png', 7, 'LiSTNR', 0.0, 3.0, 1.25, 2.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (117, 'Kits AI', 'https://www.kits.ai', 'Kits AI是一款用于音乐家使用和创建AI语音的AI语音生成和免费AI语音训练平台。', 'entityAI/logo_AIGC音频工具_Kits AI.png', 'entityAI/cover_AIGC音频工具_Kits AI.png', 7, 'Kits AI', 2.25, 2.75, 2.75, 5.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (118, 'WellSaid labs', 'https://wellsaidlabs.com', 'WellSaid是一款人工智能文本转语音工具，允许用户根据文本创建真实、自然的画外音。它提供了一系列语音化身，并帮助团队在项目上协作，允许更快的生产时间。它适用于企业，可用于各种应用，如有声书、营销、客户支持等等。', 'entityAI/logo_AIGC音频工具_WellSaid labs.png', 'entityAI/cover_AIGC音频工具_WellSaid labs.png', 7, 'WellSaid labs', 1.0, 2.0, 0.5, 3.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (119, 'NaturalReader', 'https://www.naturalreaders.com', 'NaturalReaders是一个提供文本到语音转换服务的网站。', 'entityAI/logo_AIGC音频工具_NaturalReader.png', 'entityAI/cover_AIGC音频工具_NaturalReader.png', 7, 'NaturalReader', 1.25, 0.75, 0.5, 2.25);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (120, 'Azure AI', 'https://azure.microsoft.com/zh-cn/products/ai-services/text-to-speech', 'Azure AI 语音服务为用户提供了一套全面的语音处理解决方案，支持多种语言，具备高度的自定义能力，适用于各种规模的公司和多样化的应用场景。', 'entityAI/logo_AIGC音频工具_Azure AI.png', 'entityAI/cover_AIGC音频工具_Azure AI.png', 7, 'Azure AI', 3.0, 1.5, 1.0, 1.75);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (121, '酷音', 'http://ai.kuyin.cn', '酷音网是一个真人配音与AI配音、视频拍摄与制作、音乐作词与谱曲、视频策划与创意等领域的创作、交易、推广运营于一体的音视频交易服务平台，致力于打造专注音视频领域的商业生态圈。', 'entityAI/logo_AIGC音频工具_酷音.png', 'entityAI/cover_AIGC音频工具_酷音.png', 7, 'kuyin', 1.5, 1.25, 3.5, 1.5);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (122, '音子AI', 'https://www.yinziai.com', '音子AI利用人工智能技术提供了一系列便捷的音频处理服务，无论是音乐制作的音轨分离，还是有声读物的文本转语音，都能满足用户的不同需求。', 'entityAI/logo_AIGC音频工具_音子AI.png', 'entityAI/cover_AIGC音频工具_音子AI.png', 7, 'yinziAI', 2.75, 3.0, 2.25, 1.75);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (123, 'MotionSound', 'https://motionsound.yoo-ai.com', 'MotionSound是一款智能AI语音生成器，采用领先的语音合成技术，利用深度学习算法和自然语言处理技术，生成自然流畅、声音清晰、表达准确的语音。这款工具支持多种语言和声音类型，并提供丰富的声音控制选项，使用户能够自由定制所需的语音。', 'entityAI/logo_AIGC音频工具_MotionSound.png', 'entityAI/cover_AIGC音频工具_MotionSound.png', 7, 'MotionSound', 1.75, 1.25, 1.5, 1.25);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (124, 'Rask.ai', 'https://www.rask.ai', 'Rask.ai平台以其自动化和智能化的翻译及配音服务，帮助企业节省时间和成本，同时提高内容的全球可访问性。', 'entityAI/logo_AIGC音频工具_Rask.ai.png', 'entityAI/cover_AIGC音频工具_Rask.ai.png', 7, 'Rask.ai', 2.25, 2.75, 1.75, 2.25);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (125, 'Poly.ai', 'https://poly.ai', '我们现在正在构建下一代语音助手，能够在客户服务中处理真正的人类对话。', 'entityAI/logo_AIGC音频工具_Poly.ai.png', 'entityAI/cover_AIGC音频工具_Poly.ai.png', 7, 'Poly.ai', 3.75, 2.25, 2.75, 2.25);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (126, 'iSlide PPT', 'https://www.islide.cc?mtm_campaign=AIGC', 'iSlide是一款由AI赋能的PPT制作工具，支持AI一键生成、导入文档生成以及上传模板生成PPT，内置8大资源库，超过1400w+PPT素材资源，包含模板、图示、图表、图片等。支持PPT一键美化、智能编辑、AI润色等，支持多格式文件导出，助力快速产出高质量PPT！', 'entityAI/logo_AIGC办公效率_iSlide PPT.png', 'entityAI/cover_AIGC办公效率_iSlide PPT.png', 8, 'iSlide PPT', 4.75, 1.5, 2.75, 3.5);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (127, '全智能AI一键生成PPT', 'https://www.aippt.cn/?utm_type=Navweb&utm_source=aigc&utm_page=aippt&utm_plan=ppt&utm_unit=aigc&utm_keyword=39756', 'AiPPT是一款创新的AI辅助PPT制作工具，通过智能化的一键生成和模板更换功能，极大地提升了用户制作PPT的效率和质量。', 'entityAI/logo_AIGC办公效率_全智能AI一键生成PPT.png', 'entityAI/cover_AIGC办公效率_全智能AI一键生成PPT.png', 8, 'quanzhinengAIyijianshengchengPPT', 3.0, 2.5, 4.0, 2.25);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (128, 'ChatPPT', 'https://www.chat-ppt.com/?channel=aigc.cn', 'ChatPPT是一个创新的AI驱动的PPT生成工具，它通过对话式交互和全流程AI创作，大幅简化了PPT的制作过程。', 'entityAI/logo_AIGC办公效率_ChatPPT.png', 'entityAI/cover_AIGC办公效率_ChatPPT.png', 8, 'ChatPPT', 3.5, 1.5, 4.75, 0.5);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (129, '爱设计PPT', 'https://ppt.isheji.com/?utm_type=AIGC&utm_source=aigc&utm_page=aippt&utm_plan=ppt&utm_unit=aigc&utm_keyword=129548', '爱设计PPT是一款AI驱动的PPT制作神器', 'entityAI/logo_AIGC办公效率_爱设计PPT.png', 'entityAI/cover_AIGC办公效率_爱设计PPT.png', 8, 'aishejiPPT', 0.75, 2.0, 4.0, 4.25);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (130, '歌者PPT', 'https://gezhe.com/r/UJ94k6K', '一键智能生成，内置海量模板，支持在线编辑美化，轻松做出令人惊艳的 PPT', 'entityAI/logo_AIGC办公效率_歌者PPT.png', 'entityAI/cover_AIGC办公效率_歌者PPT.png', 8, 'gezhePPT', 3.0, 3.0, 0.75, 2.75);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (131, '塔猫ChatPPT', 'http://www.tamao.fun:5277/?promotion_code=aigc', '仅需一句话，智能生成整套PPT文件', 'entityAI/logo_AIGC办公效率_塔猫ChatPPT.png', 'entityAI/cover_AIGC办公效率_塔猫ChatPPT.png', 8, 'tamaoChatPPT', 0.5, 1.0, 2.0, 3.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (132, 'boardmix博思白板-AIPPT', 'https://boardmix.cn/ai-powerpoint', '自定义主题，可选风格，多人协同，轻松制作出令人惊艳的演示文档', 'entityAI/logo_AIGC办公效率_boardmix博思白板-AIPPT.png', 'entityAI/cover_AIGC办公效率_boardmix博思白板-AIPPT.png', 8, 'boardmixbosibaiban-AIPPT', 0.0, 1.75, 3.25, 2.5);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (133, '讯飞智文', 'https://zhiwen.xfyun.cn', '自动生成令人印象深刻的PPT文档', 'entityAI/logo_AIGC办公效率_讯飞智文.png', 'entityAI/cover_AIGC办公效率_讯飞智文.png', 8, 'xunfeizhiwen', 0.5, 2.25, 2.0, 4.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (134, '轻竹办公-AI一键生成PPT', 'https://qzoffice.com/?from=aigc', 'AI一键生成精美PPT，海量模板任选', 'entityAI/logo_AIGC办公效率_轻竹办公-AI一键生成PPT.png', 'entityAI/cover_AIGC办公效率_轻竹办公-AI一键生成PPT.png', 8, 'qingzhubangong-AIyijianshengchengPPT', 3.0, 1.5, 4.5, 2.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (135, 'Canva可画', 'https://www.canva.cn/create/ppt-slides', '免费PPT制作工具，轻松搞定PPT设计', 'entityAI/logo_AIGC办公效率_Canva可画.png', 'entityAI/cover_AIGC办公效率_Canva可画.png', 8, 'Canvakehua', 1.75, 2.75, 0.0, 1.5);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (136, 'MotionGo官网', 'https://motion.yoo-ai.com', '让PPT动效、动画表达更专业', 'entityAI/logo_AIGC办公效率_MotionGo官网.png', 'entityAI/cover_AIGC办公效率_MotionGo官网.png', 8, 'MotionGoguanwang', 1.5, 3.75, 1.25, 2.5);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (137, '麦当秀智能演示系统', 'https://www.mindshow.vip?from=aigc.cn', '麦当秀｜MINDSHOW是一款百万用户正在使用的三分钟生成一份PPT的AI应用系统', 'entityAI/logo_AIGC办公效率_麦当秀智能演示系统.png', 'entityAI/cover_AIGC办公效率_麦当秀智能演示系统.png', 8, 'maidangxiuzhinengyanshixitong', 4.75, 2.75, 4.75, 0.75);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (138, '文多多AIPPT', 'https://docmee.cn/?source=aigc.cn', '仅需一分钟，文多多帮您制作专业PPT!', 'entityAI/logo_AIGC办公效率_文多多AIPPT.png', 'entityAI/cover_AIGC办公效率_文多多AIPPT.png', 8, 'wenduoduoAIPPT', 1.75, 2.25, 2.25, 2.25);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (139, 'huippt', 'https://www.huippt.com/?from_source=aigc.cn', '综合先进AI技术，自动生成并优化PPT大纲及内容。真正做到无需二次修改，内容高质量丰富的产出效果。huippt所生成的PPT内容均可二次修改并提供ppt源文件，怕加班就用会PPT，你会了吗！', 'entityAI/logo_AIGC办公效率_huippt.png', 'entityAI/cover_AIGC办公效率_huippt.png', 8, 'huippt', 0.75, 1.75, 2.5, 2.25);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (140, '美图AI PPT', 'https://design.meitu.com/ppt', '免费在线AI生成PPT设计工具', 'entityAI/logo_AIGC办公效率_美图AI PPT.png', 'entityAI/cover_AIGC办公效率_美图AI PPT.png', 8, 'meituAI PPT', 2.25, 0.75, 3.75, 0.75);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (141, '博思AIPPT', 'https://pptgo.cn', '博思AIPPT是一个强大的在线PPT辅助工具，它通过AI技术简化了PPT的创建过程，提高了制作效率，同时保证了演示文稿的专业性和吸引力。', 'entityAI/logo_AIGC办公效率_博思AIPPT.png', 'entityAI/cover_AIGC办公效率_博思AIPPT.png', 8, 'bosiAIPPT', 1.0, 2.75, 1.75, 2.75);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (142, 'PPT百科', 'https://www.pptwiki.com', '基于人工智能技术的在线PPT生成工具，免费优质PPT模板、PPT课件免费下载网站', 'entityAI/logo_AIGC办公效率_PPT百科.png', 'entityAI/cover_AIGC办公效率_PPT百科.png', 8, 'PPTbaike', 1.5, 2.25, 3.5, 3.25);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (143, 'PPT世界', 'https://www.pptx.cn/aigc', '拥有海量优秀PPT设计资源', 'entityAI/logo_AIGC办公效率_PPT世界.png', 'entityAI/cover_AIGC办公效率_PPT世界.png', 8, 'PPTshijie', 2.0, 2.25, 2.75, 1.75);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (144, 'GaiPPT', 'https://www.gaippt.com', 'PPT美化神器，据内容生成带有高度结构化可视化的PPT版式', 'entityAI/logo_AIGC办公效率_GaiPPT.png', 'entityAI/cover_AIGC办公效率_GaiPPT.png', 8, 'GaiPPT', 1.75, 2.0, 3.25, 0.75);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (145, 'Slidesgo', 'https://slidesgo.com/ai-presentations', 'AI Presentation Maker是解决PPT制作难题的理想选择', 'entityAI/logo_AIGC办公效率_Slidesgo.png', 'entityAI/cover_AIGC办公效率_Slidesgo.png', 8, 'Slidesgo', 1.25, 3.0, 1.25, 3.25);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (146, '万兴智演', 'https://zhiyan.wondershare.cn/app/dashboard/?refer=aigc.cn', '泛知识AI视频演示工具，让讲演更酷炫出圈，是名师必备讲演神器', 'entityAI/logo_AIGC办公效率_万兴智演.png', 'entityAI/cover_AIGC办公效率_万兴智演.png', 8, 'wanxingzhiyan', 0.75, 1.75, 3.75, 4.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (147, '彩漩PPT', 'https://caixuan.cc', '彩漩PPT是一个一站式 PPT 协作分享平台。这个平台利用人工智能技术帮助用户在 PPT 创作过程中提高效率和质量。', 'entityAI/logo_AIGC办公效率_彩漩PPT.png', 'entityAI/cover_AIGC办公效率_彩漩PPT.png', 8, 'caixuanPPT', 2.75, 1.5, 1.25, 3.25);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (148, '秒出PPT', 'https://10sppt.com/pptx', '秒出PPT是一个高效的PPT制作工具，它通过简化设计流程，使用户能够在短时间内创建出专业的演示文稿。', 'entityAI/logo_AIGC办公效率_秒出PPT.png', 'entityAI/cover_AIGC办公效率_秒出PPT.png', 8, 'miaochuPPT', 0.5, 3.75, 1.75, 3.25);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (149, 'Gamma App', 'https://gamma.app', '在线网页版创建演示文稿的工具', 'entityAI/logo_AIGC办公效率_Gamma App.png', 'entityAI/cover_AIGC办公效率_Gamma App.png', 8, 'Gamma App', 2.75, 2.75, 3.5, 1.75);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (150, '每天一节免费AIGC视频课', 'https://huke88.com/threeddigital/34-4332-0-0-0-1-1-16-1/?identity=da9e988089a4', 'AIGC教程涵盖了GPT进阶教程、AI绘画教程(例如Midjourney、Stable Diffusion)、电商设计等多种AI设计培训课。', 'entityAI/logo_AIGC学习资源_每天一节免费AIGC视频课.png', 'entityAI/cover_AIGC学习资源_每天一节免费AIGC视频课.png', 10, 'meitianyijiemianfeiAIGCshipinke', 0.75, 1.25, 2.5, 4.5);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (151, '常用AIGC工具注册和使用', 'https://huke88.com/threeddigital/34-4332-0-0-0-1-1-16-1/?identity=da9e988089a4', 'AIGC工具注册和使用共有118个教程', 'entityAI/logo_AIGC学习资源_常用AIGC工具注册和使用.png', 'entityAI/cover_AIGC学习资源_常用AIGC工具注册和使用.png', 10, 'changyongAIGCgongjuzhuceheshiyong', 2.25, 3.25, 2.75, 0.75);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (152, 'AI提示词应用课', 'https://huke88.com/threeddigital/34-4596-0-0-0-1-1-16-1/?identity=da9e988089a4', '提示词目前共有127个教程', 'entityAI/logo_AIGC学习资源_AI提示词应用课.png', 'entityAI/cover_AIGC学习资源_AI提示词应用课.png', 10, 'AItishiciyingyongke', 0.25, 2.25, 2.0, 3.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (153, 'AI绘画课', 'https://huke88.com/threeddigital/34-4330-0-0-0-1-1-16-1/?identity=da9e988089a4', 'AI绘画课目前共有529个教程', 'entityAI/logo_AIGC学习资源_AI绘画课.png', 'entityAI/cover_AIGC学习资源_AI绘画课.png', 10, 'AIhuihuake', 2.0, 3.75, 2.25, 0.75);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (154, 'AI三维课', 'https://huke88.com/threeddigital/34-4331-0-0-0-1-1-16-1/?identity=da9e988089a4', 'AI三维课目前共有22个教程', 'entityAI/logo_AIGC学习资源_AI三维课.png', 'entityAI/cover_AIGC学习资源_AI三维课.png', 10, 'AIsanweike', 4.25, 1.0, 3.5, 1.25);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (155, 'AIGC工具使用小技巧', 'https://huke88.com/threeddigital/34-4602-0-0-0-1-1-16-1/?identity=da9e988089a4', '手把手教你用AI做视频26个教程', 'entityAI/logo_AIGC学习资源_AIGC工具使用小技巧.png', 'entityAI/cover_AIGC学习资源_AIGC工具使用小技巧.png', 10, 'AIGCgongjushiyongxiaojiqiao', 1.75, 1.25, 2.75, 2.5);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (156, 'AI制作PPT课', 'https://huke88.com/threeddigital/34-4594-0-0-0-1-1-16-1/?identity=da9e988089a4', 'AI制作PPT自带的AI设计器，22个教程', 'entityAI/logo_AIGC学习资源_AI制作PPT课.png', 'entityAI/cover_AIGC学习资源_AI制作PPT课.png', 10, 'AIzhizuoPPTke', 1.75, 2.75, 3.75, 2.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (157, 'AI辅助Excel课', 'https://huke88.com/threeddigital/34-4595-0-0-0-1-1-16-1/?identity=da9e988089a4', 'GPT与Word VBA应用实战21个教程', 'entityAI/logo_AIGC学习资源_AI辅助Excel课.png', 'entityAI/cover_AIGC学习资源_AI辅助Excel课.png', 10, 'AIfuzhuExcelke', 1.25, 3.25, 3.25, 1.5);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (158, 'AI运营课', 'https://huke88.com/threeddigital/34-4593-0-0-0-1-1-16-1/?identity=da9e988089a4', '有了Notion AI，智能办公不在话下', 'entityAI/logo_AIGC学习资源_AI运营课.png', 'entityAI/cover_AIGC学习资源_AI运营课.png', 10, 'AIyunyingke', 3.75, 3.25, 3.0, 2.5);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (159, 'AI写作课', 'https://huke88.com/threeddigital/34-4590-0-0-0-1-1-16-1/?identity=da9e988089a4', '如何驾驭GPT为我们工作？7个教程', 'entityAI/logo_AIGC学习资源_AI写作课.png', 'entityAI/cover_AIGC学习资源_AI写作课.png', 10, 'AIxiezuoke', 2.0, 3.25, 3.25, 4.75);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (160, 'AI辅助室内设计', 'https://huke88.com/threeddigital/34-4597-0-0-0-1-1-16-1/?identity=da9e988089a4', 'Midjourney-快速生成可商用的室内场景', 'entityAI/logo_AIGC学习资源_AI辅助室内设计.png', 'entityAI/cover_AIGC学习资源_AI辅助室内设计.png', 10, 'AIfuzhushineisheji', 4.25, 2.0, 2.75, 3.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (161, 'AI图像处理', 'https://huke88.com/threeddigital/34-4598-0-0-0-1-1-16-1/?identity=da9e988089a4', 'AI图像处理目前共有187个教程', 'entityAI/logo_AIGC学习资源_AI图像处理.png', 'entityAI/cover_AIGC学习资源_AI图像处理.png', 10, 'AItuxiangchuli', 2.75, 2.75, 3.0, 2.25);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (162, 'Coze AI平台', 'https://www.coze.cn/?utm_medium=daohang&utm_source=aigc&utm_content=home&utm_id=0&utm_campaign=&utm_term=49156769u&utm_source_platform=', '海量 AI 应用免费用', 'entityAI/logo_AI 智能体平台_Coze AI平台.png', 'entityAI/cover_AI 智能体平台_Coze AI平台.png', 11, 'Coze AIpingtai', 2.75, 3.0, 3.0, 1.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (163, '豆包助手 – 抖音旗下AI产品', 'https://www.doubao.com?channel=AIGC&source=hw_db_aigc', '豆包是一款基于云雀模型构建的多功能人工智能工具和免费AI聊天机器人，能够理解用户需求并提供个性化服务。豆包提供网页端、Chrome浏览器插件、iOS、Android、Mac和Windows端应用程序，支持文案创作、PDF问答、长文本分析、图像生成、信息搜索与整合等功能。', 'entityAI/logo_AI 智能体平台_豆包助手 – 抖音旗下AI产品.png', 'entityAI/cover_AI 智能体平台_豆包助手 – 抖音旗下AI产品.png', 11, 'doubaozhushou – douyinqixiaAIchanpin', 3.5, 4.25, 1.75, 3.75);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (164, '智谱清言ChatGLM', 'https://chatglm.cn/apps?image=https%3A%2F%2Fsfile.chatglm.cn%2Factiveimg%2Fbdms%2F66b97e348217030036f486f1&open_from=ads_web_aigc&fr=ads_web_aigc', '智谱清言是一款基于人工智能技术的对话助手，遵循中国政府的立场和社会主义价值观，提供多领域知识问答、信息检索、文本生成等服务。', 'entityAI/logo_AI 智能体平台_智谱清言ChatGLM.png', 'entityAI/cover_AI 智能体平台_智谱清言ChatGLM.png', 11, 'zhipuqingyanChatGLM', 2.5, 3.0, 3.25, 1.5);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (165, 'Kimi+', 'https://volctrack.com/w/pJxYBwii', 'Kimi 是由月之暗面科技有限公司开发的人工智能助手。它具备多语言对话能力，擅长中文和英文，能够处理长文本，支持文件阅读和网址解析，具备搜索能力，并且能够结合搜索结果为用户提供回答。', 'entityAI/logo_AI 智能体平台_Kimi+.png', 'entityAI/cover_AI 智能体平台_Kimi+.png', 11, 'Kimi+', 1.75, 2.25, 2.0, 3.5);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (166, '百贝AI-企业级智能体平台', 'https://www.baibei-ai.com', '外贸、跨境行业首选的AI智能体平台，轻松打造企业专家级的AI数字员工。从客户开发、客户背调、询盘分析，到客服、美工设计等全链路加速企业AI数智化转型。', 'entityAI/logo_AI 智能体平台_百贝AI-企业级智能体平台.png', 'entityAI/cover_AI 智能体平台_百贝AI-企业级智能体平台.png', 11, 'baibeiAI-qiyejizhinengtipingtai', 4.75, 1.75, 2.5, 1.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (167, '司马诸葛', 'https://smartchoose.cn', '基于企业知识文档，就可训练专属AI数字员工', 'entityAI/logo_AI 智能体平台_司马诸葛.png', 'entityAI/cover_AI 智能体平台_司马诸葛.png', 11, 'simazhuge', 2.75, 3.75, 1.0, 1.75);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (168, 'Zion', 'https://www.functorz.com/zai', '一个全面的无代码平台，用于开发和集成AI智能体应用。它的特点包括一站式开发环境、灵活的生成式AI应用开发框架、多数据源支持、结构化输出、工具调用能力以及商业化应用开发的支持。', 'entityAI/logo_AI 智能体平台_Zion.png', 'entityAI/cover_AI 智能体平台_Zion.png', 11, 'Zion', 3.0, 1.25, 1.25, 3.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (169, '腾讯元器', 'https://yuanqi.tencent.com', '腾讯元器是腾讯推出的一站式AI智能体创作与分发平台，基于腾讯混元大模型', 'entityAI/logo_AI 智能体平台_腾讯元器.png', 'entityAI/cover_AI 智能体平台_腾讯元器.png', 11, 'tengxunyuanqi', 3.75, 3.0, 1.5, 3.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (170, 'Agent Q', 'https://www.multion.ai/blog/introducing-agent-q-research-breakthrough-for-the-next-generation-of-ai-agents-with-planning-and-self-healing-capabilities', 'MultiOn的Agent Q为自主网络代理设定了一个新的重要里程碑，结合了先进的搜索技术、AI自我批评和强化学习来克服当前的限制，代表着自主代理能力的重大飞跃。', 'entityAI/logo_AI 智能体平台_Agent Q.png', 'entityAI/cover_AI 智能体平台_Agent Q.png', 11, 'Agent Q', 3.75, 0.0, 3.25, 2.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (171, '天工AI助手', 'https://www.tiangong.cn', '天工AI是一个多功能的智能助手，它通过整合搜索、数据分析和智能预测等技术，为用户提供了一个全面、便捷和个性化的服务体验。', 'entityAI/logo_AI 智能体平台_天工AI助手.png', 'entityAI/cover_AI 智能体平台_天工AI助手.png', 11, 'tiangongAIzhushou', 4.0, 1.5, 2.25, 3.75);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (172, '钉钉AI助理', 'https://page.dingtalk.com/wow/dingtalk/default/dingtalk/I0HfYX4QStBIpLgxnZQe', '钉钉AI助理是一款集成了多种智能办公工具的综合性平台。它通过个性化和场景化的服务，大幅提高了工作效率和办公体验。', 'entityAI/logo_AI 智能体平台_钉钉AI助理.png', 'entityAI/cover_AI 智能体平台_钉钉AI助理.png', 11, 'dingdingAIzhuli', 2.75, 2.5, 2.5, 5.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (173, '文心智能体平台', 'https://agents.baidu.com', '文心智能体平台是由百度推出的基于文心大模型的Agent平台，支持开发者根据自身行业领域、应用场景，选取不同类型的开发方式。', 'entityAI/logo_AI 智能体平台_文心智能体平台.png', 'entityAI/cover_AI 智能体平台_文心智能体平台.png', 11, 'wenxinzhinengtipingtai', 2.25, 1.25, 1.5, 1.25);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (174, 'Lyzr AI', 'https://www.lyzr.ai', 'Lyzr AI提供了一个强大的平台，使用户能够快速构建和部署自主的AI Agents。通过AIMS门户，用户可以轻松管理、监控AI Agents的性能，并确保它们的安全性和合规性。', 'entityAI/logo_AI 智能体平台_Lyzr AI.png', 'entityAI/cover_AI 智能体平台_Lyzr AI.png', 11, 'Lyzr AI', 1.75, 1.25, 2.5, 1.75);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (175, '飞书智能伙伴', 'https://www.feishu.cn/product/ai_companion', '飞书智能伙伴是字节跳动旗下企业办公和协作平台飞书最新推出的AI办公助手，能在多种工作场景中发挥作用，例如帮助用户提炼会议要点、总结未读消息、分析PDF与音视频、自动续写或生成文档、表格、邮件、思维导图、问卷等。飞书智能伙伴帮助企业拥抱AI，提升办公体验，增强业务智能，开启新时代办公。', 'entityAI/logo_AI 智能体平台_飞书智能伙伴.png', 'entityAI/cover_AI 智能体平台_飞书智能伙伴.png', 11, 'feishuzhinenghuoban', 3.5, 1.75, 1.5, 1.5);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (176, '集简云', 'https://www.jijyun.cn', '集简云是一个强大的企业自动化工具，它通过提供无代码的可视化操作界面，简化了软件集成的复杂性，使得业务流程自动化变得简单快捷。', 'entityAI/logo_AI 智能体平台_集简云.png', 'entityAI/cover_AI 智能体平台_集简云.png', 11, 'jijianyun', 3.0, 3.5, 1.25, 3.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (177, '语聚AI', 'https://yuju.jijyun.cn', '语聚AI是一个强大的AI语言模型工具，它通过集成企业知识文档和多种语言模型，提供了一个能够创造性生成内容并提升企业知识管理能力的智能助手。', 'entityAI/logo_AI 智能体平台_语聚AI.png', 'entityAI/cover_AI 智能体平台_语聚AI.png', 11, 'yujuAI', 3.5, 2.75, 3.25, 2.25);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (178, 'Firsthand AI', 'https://www.firsthand.ai', 'Firsthand AI提供了一个强大的平台，使品牌和出版商能够通过AI Agents与消费者进行个性化对话，同时完全控制自己的数据和内容。', 'entityAI/logo_AI 智能体平台_Firsthand AI.png', 'entityAI/cover_AI 智能体平台_Firsthand AI.png', 11, 'Firsthand AI', 3.25, 4.0, 2.75, 3.5);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (179, 'Bitscale', 'https://bitscale.ai', 'Bitscale是一个强大的AI平台，它通过提供易于使用的电子表格界面，帮助增长团队构建可扩展的工作流，从而简化了市场研究、个性化推广和内容生成的过程。', 'entityAI/logo_AI 智能体平台_Bitscale.png', 'entityAI/cover_AI 智能体平台_Bitscale.png', 11, 'Bitscale', 3.0, 1.25, 2.75, 3.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (180, 'Agent.so', 'https://www.agent.so', 'Agent.so是一个创新的AI平台，通过易于训练的个性化AI Agents，为用户提供快速、定制化的服务。无论是个人还是企业，Agent.so都能提供强大的支持，帮助用户提高效率，实现目标。', 'entityAI/logo_AI 智能体平台_Agent.so.png', 'entityAI/cover_AI 智能体平台_Agent.so.png', 11, 'Agent.so', 3.5, 5.0, 0.75, 2.25);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (181, '实在智能', 'https://www.ai-indeed.com', '实在智能，一款基于AI+RPA技术的智能助理，他可以模拟人类操作和决策流程，来提高工作的效率', 'entityAI/logo_AI 智能体平台_实在智能.png', 'entityAI/cover_AI 智能体平台_实在智能.png', 11, 'shizaizhineng', 2.25, 2.5, 1.75, 3.25);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (182, 'Beam AI', 'https://beam.ai', 'Beam AI提供了一个功能强大的平台，使用户能够创建和定制AI Agents来自动化各种任务。通过AI Agent数据库、工具配置、任务模板和个性设置，Beam AI的AI Agents能够以高度自动化和个性化的方式执行复杂的工作流程。', 'entityAI/logo_AI 智能体平台_Beam AI.png', 'entityAI/cover_AI 智能体平台_Beam AI.png', 11, 'Beam AI', 4.5, 3.25, 3.0, 3.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (183, 'LightAI', 'https://www.lightai.com', 'LightAI是一个综合性的AI服务平台，通过提供AI销售和客服功能，帮助企业提升客户接待效率和销售业绩。', 'entityAI/logo_AI 智能体平台_LightAI.png', 'entityAI/cover_AI 智能体平台_LightAI.png', 11, 'LightAI', 3.75, 2.0, 1.25, 3.5);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (184, 'Anakin.ai', 'http://anakin.ai/zh-cn', '生成内容、图片、视频和声音；构建自动化工作流程、定制AI应用和智能代理。您专属的AI应用定制工作站。', 'entityAI/logo_AI 智能体平台_Anakin.ai.png', 'entityAI/cover_AI 智能体平台_Anakin.ai.png', 11, 'Anakin.ai', 3.25, 2.0, 2.5, 1.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (185, '智谱清言ChatGLM', 'https://chatglm.cn/apps?image=https%3A%2F%2Fsfile.chatglm.cn%2Factiveimg%2Fbdms%2F66b97e348217030036f486f1&open_from=ads_web_aigc&fr=ads_web_aigc', '智谱清言是一款基于人工智能技术的对话助手，遵循中国政府的立场和社会主义价值观，提供多领域知识问答、信息检索、文本生成等服务。', 'entityAI/logo_AI 大模型平台_智谱清言ChatGLM.png', 'entityAI/cover_AI 大模型平台_智谱清言ChatGLM.png', 12, 'zhipuqingyanChatGLM', 3.5, 2.0, 1.25, 3.5);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (186, '思必驰 DFM-2 大模型', 'https://www.duiopen.com', '思必驰 DFM-2 大模型作为思必驰的自研对话式语言大模型，展现了其在多模态交互和行业应用中的潜力。它通过结合先进的AI技术，为用户提供了更加智能化和个性化的体验，推动了智能语音交互技术在不同行业中的应用和发展。', 'entityAI/logo_AI 大模型平台_思必驰 DFM-2 大模型.png', 'entityAI/cover_AI 大模型平台_思必驰 DFM-2 大模型.png', 12, 'sibichi DFM-2 damoxing', 0.75, 2.5, 3.0, 0.75);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (187, '左医医疗大语言模型', 'https://open.zuoshouyisheng.com', '左手医生通过开放平台赋能医疗健康行业，为医疗机构、信息化厂商、医药企业、连锁药店、健康管理机构、智能硬件等合作伙伴提供多种类型的高质量智能医生服务。', 'entityAI/logo_AI 大模型平台_左医医疗大语言模型.png', 'entityAI/cover_AI 大模型平台_左医医疗大语言模型.png', 12, 'zuoyiyiliaodayuyanmoxing', 3.5, 4.25, 1.25, 3.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (188, '慧政大模型', 'https://www.huilan.com/web/cp/jsdz/hzdmxpt/index.shtml', '一个综合性的智慧政务工具，它通过智能化的手段，帮助政务工作人员提高工作效率，优化决策过程，并创造高质量的政务内容。', 'entityAI/logo_AI 大模型平台_慧政大模型.png', 'entityAI/cover_AI 大模型平台_慧政大模型.png', 12, 'huizhengdamoxing', 2.0, 3.25, 1.75, 3.75);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (189, '商汤商量SenseChat', 'https://chat.sensetime.com', '商汤商量SenseChat是由商汤科技推出的语言大模型，提供对话和文档理解服务，能够处理百科问答、图片理解、数学解答、代码编写等多种任务。', 'entityAI/logo_AI 大模型平台_商汤商量SenseChat.png', 'entityAI/cover_AI 大模型平台_商汤商量SenseChat.png', 12, 'shangtangshangliangSenseChat', 1.75, 3.5, 3.25, 3.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (190, '八斗智能', 'https://www.chatbot.cn/increase.html', '八斗智能的语义理解模型是一个强大的工具，它通过大规模预训练和行业特定的迁移学习，能够提供高度准确的语义理解服务。', 'entityAI/logo_AI 大模型平台_八斗智能.png', 'entityAI/cover_AI 大模型平台_八斗智能.png', 12, 'badouzhineng', 1.25, 2.25, 1.75, 2.5);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (191, '通义千问', 'https://tongyi.aliyun.com/qianwen', '通义千问是由阿里云推出的一种超大规模语言模型，它可以理解和回答各种领域的问题，包括常见、复杂甚至是少见的问题。它不仅是一个效率助手，也是一个点子生成机，可以帮助用户完成各种任务，如写邮件、写文章、写脚本、写情书、写诗等。此外，它还能提供娱乐功能，比如讲笑话、唱歌等。', 'entityAI/logo_AI 大模型平台_通义千问.png', 'entityAI/cover_AI 大模型平台_通义千问.png', 12, 'tongyiqianwen', 2.0, 1.75, 3.25, 1.75);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (192, '阶跃星辰', 'https://www.stepfun.com', '通过其领先的多模态理解和内容生成技术，为用户提供了一个高效、智能的工具', 'entityAI/logo_AI 大模型平台_阶跃星辰.png', 'entityAI/cover_AI 大模型平台_阶跃星辰.png', 12, 'jieyuexingchen', 2.25, 2.0, 2.5, 0.75);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (193, '原子回声AtomGPT大模型', 'https://grow.atomecho.cn', '原子回声AtomGPT大模型是一个不断学习和进步的中文大模型项目，它通过向用户展示模型的学习过程，提供了一个参与和观察模型成长的平台。', 'entityAI/logo_AI 大模型平台_原子回声AtomGPT大模型.png', 'entityAI/cover_AI 大模型平台_原子回声AtomGPT大模型.png', 12, 'yuanzihuishengAtomGPTdamoxing', 2.25, 3.0, 4.75, 2.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (194, '博看大模型', 'https://llm-pc.bookan.com.cn/?id=65889#/bk_llm_pc', '博看大模型是吉林外国语大学推出的一款多功能图书馆服务AI，它通过智能对话和信息检索功能，为用户提供了一个方便快捷的图书馆信息获取渠道。', 'entityAI/logo_AI 大模型平台_博看大模型.png', 'entityAI/cover_AI 大模型平台_博看大模型.png', 12, 'bokandamoxing', 3.0, 3.25, 1.0, 2.75);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (195, '语鲸大模型', 'https://lingowhale.com', '语鲸大模型是一个多功能的AI语言处理工具，它通过先进的算法和持续的学习，为用户提供高效、准确的语言服务。', 'entityAI/logo_AI 大模型平台_语鲸大模型.png', 'entityAI/cover_AI 大模型平台_语鲸大模型.png', 12, 'yujingdamoxing', 2.25, 3.75, 2.75, 3.75);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (196, '智星AI', 'https://www.wisstars.com', '智星AI作为一个多功能的人工智能对话软件，以其丰富的插件功能和不断扩展的插件库，为用户提供了一个灵活、有用的工具，以增强工作和日常生活的效率和乐趣。', 'entityAI/logo_AI 大模型平台_智星AI.png', 'entityAI/cover_AI 大模型平台_智星AI.png', 12, 'zhixingAI', 3.75, 4.0, 4.25, 1.75);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (197, '腾讯混元', 'https://hunyuan.tencent.com', '腾讯混元大模型是由腾讯研发的大语言模型，具备跨领域知识和自然语言理解能力，实现基于人机自然语言对话的方式，理解用户指令并执行任务，帮助用户实现人获取信息，知识和灵感。', 'entityAI/logo_AI 大模型平台_腾讯混元.png', 'entityAI/cover_AI 大模型平台_腾讯混元.png', 12, 'tengxunhunyuan', 2.0, 2.25, 4.0, 1.25);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (198, 'MiniMax 大语言模型', 'https://www.minimaxi.com', '它基于海量中文数据训练而成，拥有超过1000亿个参数，能够处理上百TB的文本数据。', 'entityAI/logo_AI 大模型平台_MiniMax 大语言模型.png', 'entityAI/cover_AI 大模型平台_MiniMax 大语言模型.png', 12, 'MiniMax dayuyanmoxing', 0.0, 1.75, 3.25, 2.25);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (199, '文心大模型', 'https://wenxin.baidu.com', '文心大模型是一种知识增强的自然语言处理（NLP）模型，由百度开发。它在技术开放日上首次亮相，展示了其在AI领域的最新技术突破和产业应用实践。', 'entityAI/logo_AI 大模型平台_文心大模型.png', 'entityAI/cover_AI 大模型平台_文心大模型.png', 12, 'wenxindamoxing', 4.25, 1.5, 0.0, 3.75);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (200, '蓝心大模型BlueLM', 'https://developers.vivo.com/product/ai/bluelm', '蓝心大模型（BlueLM）是vivo推出的自研通用大模型矩阵，包含十亿、百亿、千亿三个参数量级共5款，主要面向端侧和云端服务，用于复杂逻辑推理等应用场景。', 'entityAI/logo_AI 大模型平台_蓝心大模型BlueLM.png', 'entityAI/cover_AI 大模型平台_蓝心大模型BlueLM.png', 12, 'lanxindamoxingBlueLM', 1.25, 3.75, 3.5, 2.75);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (201, 'DeepSeek', 'https://www.deepseek.com', 'DeepSeek-V2是由杭州深度求索公司发布的第二代开源MoE模型，DeepSeek-V2 在中文综合能力与 GPT-4-Turbo，文心 4.0 等闭源模型在评测中处于同一梯队，英文综合能力英文综合能力（MT-Bench）与最强的开源模型 LLaMA3-70B 处于同一梯队，超过最强 MoE 开源模型 Mixtral8x22B，特别擅长数学、编程和逻辑推理任务。它在多个大型模型排行榜上名列前茅，支持长达128K的上下文长度，并提供开放源代码。', 'entityAI/logo_AI 大模型平台_DeepSeek.png', 'entityAI/cover_AI 大模型平台_DeepSeek.png', 12, 'DeepSeek', 1.25, 3.0, 1.75, 0.75);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (202, '盘古大模型', 'https://www.huaweicloud.com/product/pangu.html', '盘古大模型是华为云推出的全面AI解决方案，覆盖了自然语言处理、计算机视觉、多模态学习、预测分析和科学计算等多个领域。', 'entityAI/logo_AI 大模型平台_盘古大模型.png', 'entityAI/cover_AI 大模型平台_盘古大模型.png', 12, 'pangudamoxing', 3.25, 2.75, 2.75, 0.25);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (203, '讯飞星火认知大模型', 'https://xinghuo.xfyun.cn/desk?ch=xhweb_Squ', '讯飞星火认知大模型是由科大讯飞发布的大模型，具有7大核心能力，包括文本生成、语言理解、知识问答、逻辑推理、数学能力、代码能力、多模交互，对标ChatGPT。', 'entityAI/logo_AI 大模型平台_讯飞星火认知大模型.png', 'entityAI/cover_AI 大模型平台_讯飞星火认知大模型.png', 12, 'xunfeixinghuorenzhidamoxing', 1.0, 4.0, 1.5, 3.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (204, '火山方舟', 'https://www.volcengine.com/product/ark', '火山方舟是火山引擎推出的大模型服务平台，作为一个开放的MaaS（Model as a Service）平台，其愿景是让更多的企业和个人能够轻松地接入和使用大模型技术，实现体验创新、数据驱动和敏捷迭代。', 'entityAI/logo_AI 大模型平台_火山方舟.png', 'entityAI/cover_AI 大模型平台_火山方舟.png', 12, 'huoshanfangzhou', 3.25, 3.25, 3.25, 4.25);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (205, '元象大模型XChat', 'https://chat.xverse.cn', '元象大模型XChat是元象XVERSE推出的高性能AI产品，它通过自研技术，能够满足不同复杂度任务的需求，并在中文领域表现突出。', 'entityAI/logo_AI 大模型平台_元象大模型XChat.png', 'entityAI/cover_AI 大模型平台_元象大模型XChat.png', 12, 'yuanxiangdamoxingXChat', 1.25, 1.5, 2.75, 2.75);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (206, 'MOSS 复旦大模型', 'https://moss.fastnlp.top', '复旦大模型MOSS，正式开源了', 'entityAI/logo_AI 大模型平台_MOSS 复旦大模型.png', 'entityAI/cover_AI 大模型平台_MOSS 复旦大模型.png', 12, 'MOSS fudandamoxing', 1.0, 2.25, 0.25, 2.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (207, '封神榜-IDEA研究院', 'https://fengshenbang-lm.com', '封神榜-IDEA研究院是一套致力于中文认知智能的研究项目，它通过一系列先进的语言模型和多模态模型，推动了中文自然语言处理技术的发展。', 'entityAI/logo_AI 大模型平台_封神榜-IDEA研究院.png', 'entityAI/cover_AI 大模型平台_封神榜-IDEA研究院.png', 12, 'fengshenbang-IDEAyanjiuyuan', 3.25, 2.0, 1.5, 3.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (208, 'KwaiYii快意大模型', 'https://github.com/kwai/KwaiYii', 'KwaiYii快意大模型是快手AI团队研发的大规模语言模型，它在多个权威Benchmark上展现出卓越的性能，尤其在中英文跨学科专业能力、数理逻辑及代码能力方面表现突出。', 'entityAI/logo_AI 大模型平台_KwaiYii快意大模型.png', 'entityAI/cover_AI 大模型平台_KwaiYii快意大模型.png', 12, 'KwaiYiikuaiyidamoxing', 1.25, 2.75, 1.0, 3.25);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (209, '智谱API-免费领取', 'https://www.bigmodel.cn/login?utm_source=3&utm_campaign=xmh0708&_channel_track_key=d9UVXKfk', '新用户免费领1亿tokens，基于领先的千亿级多语言、多模态预训练模型，打造高效率、通用化的“模型即服务”AI开发新范式。', 'entityAI/logo_AIGC基础设施_智谱API-免费领取.png', 'entityAI/cover_AIGC基础设施_智谱API-免费领取.png', 13, 'zhipuAPI-mianfeilingqu', 2.5, 3.75, 3.0, 1.25);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (210, '讯飞星火API', 'https://xinghuo.xfyun.cn/sparkapi?ch=xh_srx_nQ1o', 'API无需认证申请，领取即可用！', 'entityAI/logo_AIGC基础设施_讯飞星火API.png', 'entityAI/cover_AIGC基础设施_讯飞星火API.png', 13, 'xunfeixinghuoAPI', 2.0, 3.5, 3.0, 2.75);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (211, '文心大模型 api', 'https://qianfan.cloud.baidu.com', '文心大模型企业级服务唯一入口，一站式企业级大模型平台，提供先进的生成式AI生产及应用全流程开发工具链', 'entityAI/logo_AIGC基础设施_文心大模型 api.png', 'entityAI/cover_AIGC基础设施_文心大模型 api.png', 13, 'wenxindamoxing api', 2.25, 2.5, 2.75, 2.75);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (212, '通义千问 api', 'https://help.aliyun.com/zh/dashscope/developer-reference/api-details?disableWebsiteRedirect=true', '通义千问模型具有强大的自然语言处理能力，您可以使用DashScope SDK或HTTP接口调用通义千问模型，将通义千问模型集成到您的业务中。', 'entityAI/logo_AIGC基础设施_通义千问 api.png', 'entityAI/cover_AIGC基础设施_通义千问 api.png', 13, 'tongyiqianwen api', 2.75, 2.25, 3.5, 3.75);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (213, '腾讯混元大模型 api', 'https://cloud.tencent.com/document/product/1729/101848', '腾讯混元大模型 api', 'entityAI/logo_AIGC基础设施_腾讯混元大模型 api.png', 'entityAI/cover_AIGC基础设施_腾讯混元大模型 api.png', 13, 'tengxunhunyuandamoxing api', 1.75, 5.0, 1.25, 4.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (214, '硅基流动', 'https://siliconflow.cn/zh-cn/siliconcloud', 'SiliconCloud 是硅基流动推出的一站式大模型云服务平台。', 'entityAI/logo_AIGC基础设施_硅基流动.png', 'entityAI/cover_AIGC基础设施_硅基流动.png', 13, 'guijiliudong', 3.0, 1.5, 2.75, 5.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (215, 'Gemini api', 'https://docs.gemini.com/rest-api', 'Gemini api', 'entityAI/logo_AIGC基础设施_Gemini api.png', 'entityAI/cover_AIGC基础设施_Gemini api.png', 13, 'Gemini api', 3.0, 3.0, 3.75, 2.5);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (216, '云雀语言模型api', 'https://www.volcengine.com/product/yunque', '云雀语言模型api', 'entityAI/logo_AIGC基础设施_云雀语言模型api.png', 'entityAI/cover_AIGC基础设施_云雀语言模型api.png', 13, 'yunqueyuyanmoxingapi', 4.75, 3.0, 3.25, 2.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (217, '天工开放平台 api', 'https://model-platform.tiangong.cn/api-reference', '天工开放平台 api', 'entityAI/logo_AIGC基础设施_天工开放平台 api.png', 'entityAI/cover_AIGC基础设施_天工开放平台 api.png', 13, 'tiangongkaifangpingtai api', 1.75, 4.25, 2.5, 2.25);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (218, 'minimax api', 'https://www.minimaxi.com', '提供安全、灵活、可靠的API服务，助力企业和开发者快速搭建AI应用', 'entityAI/logo_AIGC基础设施_minimax api.png', 'entityAI/cover_AIGC基础设施_minimax api.png', 13, 'minimax api', 3.0, 1.5, 2.25, 0.5);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (219, '商汤日日新 api', 'https://platform.sensenova.cn/home', '商汤日日新 api', 'entityAI/logo_AIGC基础设施_商汤日日新 api.png', 'entityAI/cover_AIGC基础设施_商汤日日新 api.png', 13, 'shangtangririxin api', 1.75, 4.0, 1.75, 0.75);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (220, '百川智能 api', 'https://platform.baichuan-ai.com/docs/api', '百川智能的 API 开放平台文档页面，提供开发者接入百川大模型的服务。在使用 API 前，需要完成实名认证、充值和创建 API Key。', 'entityAI/logo_AIGC基础设施_百川智能 api.png', 'entityAI/cover_AIGC基础设施_百川智能 api.png', 13, 'baichuanzhineng api', 4.25, 2.75, 3.25, 3.25);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (221, 'BlueLm蓝心大模型 api', 'https://developers.vivo.com/product/ai/bluelm', 'BlueLm蓝心大模型 api', 'entityAI/logo_AIGC基础设施_BlueLm蓝心大模型 api.png', 'entityAI/cover_AIGC基础设施_BlueLm蓝心大模型 api.png', 13, 'BlueLmlanxindamoxing api', 3.75, 2.0, 3.75, 3.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (222, '华为盘古大模型api', 'https://support.huawei.com/enterprise/zh/doc/EDOC1100327551', '华为盘古大模型api', 'entityAI/logo_AIGC基础设施_华为盘古大模型api.png', 'entityAI/cover_AIGC基础设施_华为盘古大模型api.png', 13, 'huaweipangudamoxingapi', 2.0, 1.0, 2.75, 3.75);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (223, 'kimi chat(Moonshot api)', 'https://platform.moonshot.cn/docs/api/chat', '该平台与 OpenAI SDK 兼容，支持使用 Python 和 Node.js 语言进行开发。开发者可以通过 API 访问 Moonshot AI 的语言模型，例如 "moonshot-v1-8k"，来进行聊天对话的生成。', 'entityAI/logo_AIGC基础设施_kimi chat(Moonshot api).png', 'entityAI/cover_AIGC基础设施_kimi chat(Moonshot api).png', 13, 'kimi chat(Moonshot api)', 2.0, 1.75, 1.25, 2.5);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (224, '出门问问api', 'https://ai.chumenwenwen.com/pages/document/get-started', '出门问问（Chumen Wenwen）是一家中国的人工智能公司，以其智能语音助手和相关技术而闻名。出门问问提供的OPEN API（开放应用程序编程接口）允许开发者将出门问问的技术集成到自己的应用程序、服务或产品中。', 'entityAI/logo_AIGC基础设施_出门问问api.png', 'entityAI/cover_AIGC基础设施_出门问问api.png', 13, 'chumenwenwenapi', 2.5, 4.25, 1.5, 2.25);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (225, 'Gork api', 'https://developers.x.ai/api', 'xAI API 旨在让开发者能够集成和使用 xAI 的先进人工智能技术，以增强自己的应用程序和服务。', 'entityAI/logo_AIGC基础设施_Gork api.png', 'entityAI/cover_AIGC基础设施_Gork api.png', 13, 'Gork api', 1.25, 1.5, 3.0, 2.75);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (226, 'ollama api', 'https://github.com/ollama/ollama', 'Ollama 是一个轻量级、可扩展的框架，用于在本地机器上构建和运行大型语言模型。', 'entityAI/logo_AIGC基础设施_ollama api.png', 'entityAI/cover_AIGC基础设施_ollama api.png', 13, 'ollama api', 3.5, 2.25, 1.5, 3.25);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (227, 'openai api', 'https://openai.com/api', '它为开发者和研究人员提供了访问 OpenAI 人工智能技术的接口。通过这些 API，用户可以集成和利用 OpenAI 的先进算法和模型，如自然语言处理、图像识别和机器学习等，来增强自己的应用程序和服务。', 'entityAI/logo_AIGC基础设施_openai api.png', 'entityAI/cover_AIGC基础设施_openai api.png', 13, 'openai api', 1.75, 3.5, 1.0, 2.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (228, 'JinaChat', 'https://chat.jina.ai', '多模态、超省钱的大模型服务', 'entityAI/logo_AIGC基础设施_JinaChat.png', 'entityAI/cover_AIGC基础设施_JinaChat.png', 13, 'JinaChat', 0.5, 2.0, 2.5, 2.5);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (229, 'Sonantic.io', 'https://app.sonantic.io', 'Sonantic Limited是一个利用人工智能，通过其API及网络应用程序进行内容创作、分析、编辑及分发的文字转语音工具。', 'entityAI/logo_AIGC基础设施_Sonantic.io.png', 'entityAI/cover_AIGC基础设施_Sonantic.io.png', 13, 'Sonantic.io', 3.5, 3.0, 3.0, 4.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (230, 'Cleanup.picture', 'https://cleanup.pictures', 'Cleanup.picture 是一种基于人工智能的高级编辑工具，比其他克隆图章工具要好得多。像 adobe photoshop fix 这样的克隆工具需要背景参考，而我们的 AI 只需点击几下，就能真正猜出不需要的文本、不需要的人、不需要的对象背后的内容。', 'entityAI/logo_AIGC基础设施_Cleanup.picture.png', 'entityAI/cover_AIGC基础设施_Cleanup.picture.png', 13, 'Cleanup.picture', 1.0, 2.25, 1.5, 1.25);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (231, 'Convai', 'https://convai.com', '对话式 AI API，用于语音识别、语言理解和生成，以及用于设计游戏和支持语音的应用程序的文本转语音。', 'entityAI/logo_AIGC基础设施_Convai.png', 'entityAI/cover_AIGC基础设施_Convai.png', 13, 'Convai', 2.0, 3.75, 4.25, 3.25);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (232, 'Inworld.ai', 'https://www.inworld.ai', 'Inworld 提供了一个平台，用于将高级 NPC 行为和即兴对话添加到游戏和实时媒体中。使用文本到字符的提示来创建角色个性并使用 Inworld SDK 集成到体验中。', 'entityAI/logo_AIGC基础设施_Inworld.ai.png', 'entityAI/cover_AIGC基础设施_Inworld.ai.png', 13, 'Inworld.ai', 2.75, 1.0, 3.5, 3.25);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (233, '豆包MarsCode', 'https://marscode.cn/?utm_source=aigc.cn&utm_medium=xycpa&utm_campaign=', '豆包MarsCode是字节跳动旗下的公司推出的一个免费AI编程工具，既提供一个AI驱动的云端集成开发环境（IDE），也支持作为VS Code和JetBrains的智能编程扩展（Extension）使用。基于豆包大模型，MarsCode通过AI助手提供代码补全、生成、优化等功能，支持云函数开发，具备API测试、存储和部署工具，能够自动生成JSON Schema。此外，MarsCode扩展支持主流编程语言和IDE，提供代码编辑、解释、注释生成、单元测试生成、错误修复等辅助功能，增强了编码的效率和质量，覆盖了包括后端、前端、App开发在内的多种编程语言和框架。', 'entityAI/logo_AIGC开发平台_豆包MarsCode.png', 'entityAI/cover_AIGC开发平台_豆包MarsCode.png', 14, 'doubaoMarsCode', 2.25, 0.0, 1.75, 1.75);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (234, '小浣熊AI助手', 'https://raccoon.sensetime.com/login?utm_source=bljuly02', '代码小浣熊Raccoon是商汤科技最新推出的一个智能AI编程助手和工具，由商汤自研的大模型驱动，支持多种编程语言和多项任务能力，可为开发人员带来全新的编程体验。', 'entityAI/logo_AIGC开发平台_小浣熊AI助手.png', 'entityAI/cover_AIGC开发平台_小浣熊AI助手.png', 14, 'xiaohuanxiongAIzhushou', 4.25, 2.25, 2.0, 3.25);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (235, 'Open Voice OS', 'https://openvoiceos.com', '一个社区驱动的开源语音 AI 平台，用于使用 NLP、可自定义的 UI 以及对隐私和安全的关注跨设备创建自定义语音控制界面。', 'entityAI/logo_AIGC开发平台_Open Voice OS.png', 'entityAI/cover_AIGC开发平台_Open Voice OS.png', 14, 'Open Voice OS', 4.0, 4.75, 2.75, 2.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (236, '腾讯云AI代码助手', 'https://acc.cloud.tencent.com/downloads', '腾讯云AI代码助手是由腾讯云自主研发的AI编程辅助工具，旨在通过人工智能技术提高开发者的编码效率。', 'entityAI/logo_AIGC开发平台_腾讯云AI代码助手.png', 'entityAI/cover_AIGC开发平台_腾讯云AI代码助手.png', 14, 'tengxunyunAIdaimazhushou', 2.75, 2.0, 4.25, 0.25);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (237, 'Bolt.new', 'https://bolt.new', '一个为全栈 Web 开发者设计的高效工具，它通过简化开发流程，使得从创建到部署的整个过程更加快捷和方便。', 'entityAI/logo_AIGC开发平台_Bolt.new.png', 'entityAI/cover_AIGC开发平台_Bolt.new.png', 14, 'Bolt.new', 2.5, 2.0, 3.75, 3.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (238, 'Plandex', 'https://plandex.ai', 'Plandex是一个基于终端的开源 AI 编程引擎，可帮助程序员完成复杂的软件编程开发任务、解决不良输出并最大限度地提高生产力。', 'entityAI/logo_AIGC开发平台_Plandex.png', 'entityAI/cover_AIGC开发平台_Plandex.png', 14, 'Plandex', 2.25, 1.75, 1.25, 2.25);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (239, 'Tabby', 'https://tabby.tabbyml.com', 'Tabby是一个自托管的人工智能编程助手，为开发人员提供了一个开源和本地部署的替代方案，支持通过利用第三方开源代码大模型（如StarCoder、CodeLlama、DeepseekCoder）以实现类似于 GitHub Copilot 的功能。Tabby的设计目标是帮助开发者通过提供代码建议、自动完成和其他编程相关的辅助功能来提高编程效率和体验。', 'entityAI/logo_AIGC开发平台_Tabby.png', 'entityAI/cover_AIGC开发平台_Tabby.png', 14, 'Tabby', 3.0, 2.75, 3.0, 3.5);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (240, 'Fitten Code', 'https://code.fittentech.com', 'Fitten Code是一个由GPT驱动的代码生成和补全工具。它支持80多种编程语言，包括Python、Javascript、Typescript、Java等，旨在提高编码效率和减少手动编写时间，让编码更轻松。Fitten Code AI助手目前对个人用户是完全免费的。', 'entityAI/logo_AIGC开发平台_Fitten Code.png', 'entityAI/cover_AIGC开发平台_Fitten Code.png', 14, 'Fitten Code', 0.75, 2.25, 1.5, 1.5);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (241, 'SoloLearn', 'https://www.sololearn.com/en', 'SoloLearn 是一个在线学习平台，提供编程、设计、数据科学、移动开发等领域的课程和教程。', 'entityAI/logo_AIGC开发平台_SoloLearn.png', 'entityAI/cover_AIGC开发平台_SoloLearn.png', 14, 'SoloLearn', 3.75, 2.5, 3.75, 2.25);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (242, '驭码CodeRider', 'https://coderider.gitlab.cn', '驭码CodeRider是极狐GitLab推出的AI编程与软件智能研发助手，专为提升程序员的编码效率和研发效能而设计。', 'entityAI/logo_AIGC开发平台_驭码CodeRider.png', 'entityAI/cover_AIGC开发平台_驭码CodeRider.png', 14, 'yumaCodeRider', 3.75, 1.75, 4.0, 2.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (243, 'CHTML', 'https://www.chtml.cn', 'chtml即code helper tag mark law 代码辅助标记方法，是一款简洁好用的在线的代码命名工具、变量命名工具、变量命名规则库，使用它可以让您轻松摆脱翻译软件的困扰，快速选择合适的变量名称用于开发工作中。', 'entityAI/logo_AIGC开发平台_CHTML.png', 'entityAI/cover_AIGC开发平台_CHTML.png', 14, 'CHTML', 2.25, 1.5, 4.75, 1.5);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (244, 'iFlyCode', 'https://iflycode.xfyun.cn', 'iFlyCode 是科大讯飞最新推出的智能编程助手，基于讯飞星火认知大模型，可以帮助开发人员编程更轻松，创意更自由。该AI编程工具拥有代码生成、代码补齐、代码纠错、代码解释、生成单元测试等功能。', 'entityAI/logo_AIGC开发平台_iFlyCode.png', 'entityAI/cover_AIGC开发平台_iFlyCode.png', 14, 'iFlyCode', 1.0, 1.0, 1.75, 2.75);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (245, '天壤小白', 'https://www.tianrang.com', '天壤小白大模型应用开发平台，提供一站式的大模型开发服务和全面的赋能，为开发者和零编程基础人员轻松创建个性化的AI应用。', 'entityAI/logo_AIGC开发平台_天壤小白.png', 'entityAI/cover_AIGC开发平台_天壤小白.png', 14, 'tianrangxiaobai', 2.5, 3.0, 0.75, 4.25);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (246, 'JetBrains AI', 'https://www.jetbrains.com', 'JetBrains AI是编程软件开发公司JetBrains最新为其旗下系列IDE推出的类似于GitHub Copilot的AI编程助手，可与IntelliJ IDEA、PyCharm、PhpStorm、ReSharper、Fleet等集成开发环境工具深度整合，提供代码聊天、代码生成、上下文代码分析、代码解释、代码翻译等功能，帮助开发人员提高开发效率和代码质量。', 'entityAI/logo_AIGC开发平台_JetBrains AI.png', 'entityAI/cover_AIGC开发平台_JetBrains AI.png', 14, 'JetBrains AI', 1.0, 4.5, 0.25, 2.75);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (247, 'Sky-code', 'https://sky-code.singularity-ai.com/index.html#', 'Sky-code 是 SingularityAI 研发的一款AI代码生成工具，支持各种主流编程语言，助力开发人员更快更好的编码。Sky-code 可以直接集成到编辑器中，无缝衔接在开发环境，在键入代码的同时，智能高效补全代码，提升工作效率，节省开发时间。', 'entityAI/logo_AIGC开发平台_Sky-code.png', 'entityAI/cover_AIGC开发平台_Sky-code.png', 14, 'Sky-code', 3.75, 2.5, 1.75, 2.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (248, '图像大厨Imgcook', 'https://www.imgcook.com', '图像大厨Imgcook阿里巴巴出品...', 'entityAI/logo_AIGC开发平台_图像大厨Imgcook.png', 'entityAI/cover_AIGC开发平台_图像大厨Imgcook.png', 14, 'tuxiangdachuImgcook', 0.25, 2.5, 1.75, 1.5);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (249, '通义灵码', 'https://tongyi.aliyun.com/lingma', '基于通义大模型的智能编码辅助工具', 'entityAI/logo_AIGC开发平台_通义灵码.png', 'entityAI/cover_AIGC开发平台_通义灵码.png', 14, 'tongyilingma', 4.75, 2.5, 3.0, 2.5);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (250, 'CodeGeeX', 'https://codegeex.cn/zh-CN', '自动代码生成、代码翻译、自动编写注释等功能，支持20多种编程语言', 'entityAI/logo_AIGC开发平台_CodeGeeX.png', 'entityAI/cover_AIGC开发平台_CodeGeeX.png', 14, 'CodeGeeX', 1.5, 3.5, 1.25, 2.75);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (251, 'JamGPT', 'https://jam.dev', 'JamGPT是Bug报告工具Jam最新推出的AI Debug助手，JamGPT可帮助开发人员分析所有的Bug报告细节，在你开始阅读之前就找到相关原因和解决方案。', 'entityAI/logo_AIGC开发平台_JamGPT.png', 'entityAI/cover_AIGC开发平台_JamGPT.png', 14, 'JamGPT', 2.5, 2.5, 2.75, 3.75);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (252, 'CodeFuse', 'https://codefuse.alipay.com', '蚂蚁自研智能研发助手', 'entityAI/logo_AIGC开发平台_CodeFuse.png', 'entityAI/cover_AIGC开发平台_CodeFuse.png', 14, 'CodeFuse', 2.5, 0.75, 3.0, 0.75);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (253, 'HeyCLI', 'https://www.heycli.com', '自然语言转义为CLI命令', 'entityAI/logo_AIGC开发平台_HeyCLI.png', 'entityAI/cover_AIGC开发平台_HeyCLI.png', 14, 'HeyCLI', 0.5, 1.5, 2.25, 3.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (254, 'Retool AI', 'https://retool.com/products/ai', 'Retool AI 是一个低代码平台，它允许用户快速地将人工智能（AI）集成到应用程序和工作流中。该平台提供了预构建的AI组件，如GPT-4查询器、图像分类器、文本摘要器等，使用户能够轻松使用任何AI模型。此外，Retool 还允许用户安全地连接业务数据，如数据库、API、SaaS工具等，为AI模型提供上下文和输入。这样，用户就可以为他们的业务定制AI工具，如内容生成器、数据分析器、客户支持助手等，并且比传统的开发方式更快地交付。', 'entityAI/logo_AIGC开发平台_Retool AI.png', 'entityAI/cover_AIGC开发平台_Retool AI.png', 14, 'Retool AI', 4.5, 2.5, 2.75, 1.75);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (255, 'Visual Studio IntelliCode', 'https://visualstudio.microsoft.com', 'Visual Studio AI辅助开发', 'entityAI/logo_AIGC开发平台_Visual Studio IntelliCode.png', 'entityAI/cover_AIGC开发平台_Visual Studio IntelliCode.png', 14, 'Visual Studio IntelliCode', 3.0, 1.5, 2.25, 3.25);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (256, 'BitoAI', 'https://bito.ai', '将生成代码的速度提高 10 倍', 'entityAI/logo_AIGC开发平台_BitoAI.png', 'entityAI/cover_AIGC开发平台_BitoAI.png', 14, 'BitoAI', 1.5, 3.0, 1.75, 2.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (257, 'AITDK', 'https://aitdk.com/?utm_source=aigc', '为网站生成SEO优化标题、描述和关键词', 'entityAI/logo_AIGC应用场景_AITDK.png', 'entityAI/cover_AIGC应用场景_AITDK.png', 15, 'AITDK', 2.5, 3.0, 1.25, 1.75);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (258, '豹变种草', 'https://www.bbzc-ai.com', '豹变种草是一款AI赋能的SEO内容种草工具，旨在帮助业务快速获取全网搜索流量。通过挖掘高价值关键词，生成有吸引力的种草内容，并一键发布到多个平台，实现低成本精准引流。该工具能够节省时间和人力成本，提高平台曝光量和投入产出比。', 'entityAI/logo_AIGC应用场景_豹变种草.png', 'entityAI/cover_AIGC应用场景_豹变种草.png', 15, 'baobianzhongcao', 2.75, 2.5, 2.25, 3.5);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (259, '谷歌seo AI写作工具', 'https://www.artseo.cn/ai-writing-tool', '该工具会按照谷歌on page seo的标准创建文章，根据输入的关键词或标题进行文章创作，自动布局关键词!高原创度!可自定义LSI关键词、—键添加内部链接。', 'entityAI/logo_AIGC应用场景_谷歌seo AI写作工具.png', 'entityAI/cover_AIGC应用场景_谷歌seo AI写作工具.png', 15, 'gugeseo AIxiezuogongju', 2.5, 1.25, 1.0, 4.25);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (260, 'BloggerGPT', 'https://langface.ai', '让其自主工作，发展你的博客', 'entityAI/logo_AIGC应用场景_BloggerGPT.png', 'entityAI/cover_AIGC应用场景_BloggerGPT.png', 15, 'BloggerGPT', 1.75, 2.25, 1.0, 4.25);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (261, 'BlogSEO AI', 'https://blogseo.ai', '用AI生成带内链和图片的SEO优化的Blog', 'entityAI/logo_AIGC应用场景_BlogSEO AI.png', 'entityAI/cover_AIGC应用场景_BlogSEO AI.png', 15, 'BlogSEO AI', 2.25, 2.25, 4.0, 2.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (262, 'SurferSEO', 'https://surferseo.com', 'SurferSEO优化大纲是一款基于...', 'entityAI/logo_AIGC应用场景_SurferSEO.png', 'entityAI/cover_AIGC应用场景_SurferSEO.png', 15, 'SurferSEO', 3.5, 3.5, 4.25, 1.5);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (263, 'Eilla AI', 'https://eilla.ai', 'Eilla.ai是一个由人工智能驱...', 'entityAI/logo_AIGC应用场景_Eilla AI.png', 'entityAI/cover_AIGC应用场景_Eilla AI.png', 15, 'Eilla AI', 0.75, 2.5, 0.75, 4.75);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (264, 'Closers Copy', 'https://www.closerscopy.com', '它通过提供易于使用的界面、丰富的功能和强大的社区支持，帮助用户提高内容创作的效率和质量。无论是初学者还是经验丰富的营销专家，ClosersCopy都能提供有价值的资源和工具，以提升他们的营销努力。', 'entityAI/logo_AIGC应用场景_Closers Copy.png', 'entityAI/cover_AIGC应用场景_Closers Copy.png', 15, 'Closers Copy', 1.25, 2.5, 2.5, 3.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (265, 'Article Fiesta', 'https://www.futurepedia.io/tool/article-fiesta', '提供关键字即可为您的网站或博客创建文章', 'entityAI/logo_AIGC应用场景_Article Fiesta.png', 'entityAI/cover_AIGC应用场景_Article Fiesta.png', 15, 'Article Fiesta', 2.75, 0.25, 2.5, 1.75);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (266, 'growthbar', 'https://www.growthbarseo.com', '为博客文章、网站页面和文章...', 'entityAI/logo_AIGC应用场景_growthbar.png', 'entityAI/cover_AIGC应用场景_growthbar.png', 15, 'growthbar', 1.75, 2.5, 2.25, 3.5);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (267, 'SEOmatic AI', 'https://seomatic.ai', 'SEOmatic通过程序化搜索引擎...', 'entityAI/logo_AIGC应用场景_SEOmatic AI.png', 'entityAI/cover_AIGC应用场景_SEOmatic AI.png', 15, 'SEOmatic AI', 0.25, 2.25, 0.75, 2.25);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (268, 'Blog Booster', 'https://blogbooster.ai', 'WordPress 网站上编写并自动发布博客文章', 'entityAI/logo_AIGC应用场景_Blog Booster.png', 'entityAI/cover_AIGC应用场景_Blog Booster.png', 15, 'Blog Booster', 1.25, 2.25, 4.25, 4.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (269, 'Seo.ai', 'https://seo.ai', 'SEO.ai让你利用世界领先的生...', 'entityAI/logo_AIGC应用场景_Seo.ai.png', 'entityAI/cover_AIGC应用场景_Seo.ai.png', 15, 'Seo.ai', 3.0, 4.0, 1.5, 4.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (270, 'SEO GPT', 'https://seovendor.co/seo-gpt', 'SEO GPT是一种创建你的SEO页...', 'entityAI/logo_AIGC应用场景_SEO GPT.png', 'entityAI/cover_AIGC应用场景_SEO GPT.png', 15, 'SEO GPT', 2.5, 3.5, 3.25, 3.5);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (271, 'SheetAI.app', 'https://www.sheetai.app', '用通俗易懂的英语描述您想要的内容，然后在您的电子表格中观看魔法发生！', 'entityAI/logo_AIGC应用场景_SheetAI.app.png', 'entityAI/cover_AIGC应用场景_SheetAI.app.png', 15, 'SheetAI.app', 4.0, 3.0, 3.0, 1.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (272, 'Thundercontent', 'https://thundercontent.com', 'Thundercontent使用人工智能...', 'entityAI/logo_AIGC应用场景_Thundercontent.png', 'entityAI/cover_AIGC应用场景_Thundercontent.png', 15, 'Thundercontent', 2.5, 2.5, 2.0, 2.25);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (273, 'Optimo', 'https://askoptimo.com', 'AI驱动的营销程序，可以简化和加速营销过程。', 'entityAI/logo_AIGC应用场景_Optimo.png', 'entityAI/cover_AIGC应用场景_Optimo.png', 15, 'Optimo', 2.5, 1.5, 4.75, 2.5);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (274, 'Mentioned', 'https://www.mentioned.ai', '我们扫描您的内容以识别您提到的人和公司，然后发送电子邮件活动让他们知道。', 'entityAI/logo_AIGC应用场景_Mentioned.png', 'entityAI/cover_AIGC应用场景_Mentioned.png', 15, 'Mentioned', 1.0, 0.5, 2.5, 1.75);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (275, 'Katteb', 'https://katteb.com/en', 'Katteb AI使您能够快速而轻松...', 'entityAI/logo_AIGC应用场景_Katteb.png', 'entityAI/cover_AIGC应用场景_Katteb.png', 15, 'Katteb', 1.0, 0.75, 1.75, 2.75);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (276, 'Jenni', 'https://jenni.ai', '智能写作助手，提升研究和写作效率', 'entityAI/logo_AIGC应用场景_Jenni.png', 'entityAI/cover_AIGC应用场景_Jenni.png', 15, 'Jenni', 3.5, 4.25, 2.5, 2.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (277, 'Neuronwriter', 'https://www.neuronwriter.com', 'NEURONwriter帮助您以用户意...', 'entityAI/logo_AIGC应用场景_Neuronwriter.png', 'entityAI/cover_AIGC应用场景_Neuronwriter.png', 15, 'Neuronwriter', 2.75, 3.25, 2.0, 2.5);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (278, 'LongShot', 'https://longshot.ai', 'LongShot是一个人工智能写作...', 'entityAI/logo_AIGC应用场景_LongShot.png', 'entityAI/cover_AIGC应用场景_LongShot.png', 15, 'LongShot', 2.5, 1.25, 2.5, 1.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (279, 'BlogNLP', 'https://www.blognlp.com', 'BlogNLP是一个免费的人工智能...', 'entityAI/logo_AIGC应用场景_BlogNLP.png', 'entityAI/cover_AIGC应用场景_BlogNLP.png', 15, 'BlogNLP', 1.5, 0.75, 2.75, 3.25);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (280, 'CheckForAI', 'https://checkforai.com', 'AI项目更新订阅服务', 'entityAI/logo_AIGC应用场景_CheckForAI.png', 'entityAI/cover_AIGC应用场景_CheckForAI.png', 15, 'CheckForAI', 2.25, 2.75, 4.0, 0.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (281, '算了么AI', 'https://suanleme.gebagi.com/?source=aigccn', '卦解心声的AI易经占卜师', 'entityAI/logo_AIGC行业应用_算了么AI.png', 'entityAI/cover_AIGC行业应用_算了么AI.png', 16, 'suanlemeAI', 0.25, 3.5, 2.5, 4.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (282, 'Promethean AI', 'https://www.prometheanai.com', 'Promethean AI是一个强大的AI助手，为创意团队提供了一个无需上传资产和更换编辑器即可使用的平台。它通过企业级的数据安全和工作流定制功能，帮助团队提高生产效率，同时保持创意流程的完整性。', 'entityAI/logo_AIGC行业应用_Promethean AI.png', 'entityAI/cover_AIGC行业应用_Promethean AI.png', 16, 'Promethean AI', 4.25, 1.0, 1.75, 2.5);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (283, 'Meshy', 'https://www.meshy.ai/zh', 'Meshy作为一个创新的AI 3D模型生成器，通过其强大的AI技术，为用户提供了一个快速、简单且高效的3D创作解决方案。无论是专业的3D艺术家还是初学者，都能利用Meshy轻松创作出逼真的3D模型，推动3D内容创作的未来。', 'entityAI/logo_AIGC行业应用_Meshy.png', 'entityAI/cover_AIGC行业应用_Meshy.png', 16, 'Meshy', 1.25, 3.5, 1.5, 4.5);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (284, 'Fotor AI游戏资产生成器', 'https://www.fotor.com/features/ai-game-assets-generator', 'Fotor AI游戏资产生成器是一个创新的工具，它通过AI技术降低了游戏资产创作的门槛，使得各类游戏开发者都能够快速获得所需的高质量游戏资产。', 'entityAI/logo_AIGC行业应用_Fotor AI游戏资产生成器.png', 'entityAI/cover_AIGC行业应用_Fotor AI游戏资产生成器.png', 16, 'Fotor AIyouxizichanshengchengqi', 0.75, 4.75, 1.5, 2.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (285, 'Charisma', 'https://charisma.ai', 'Charisma通过其AI驱动的故事引擎，为创造引人入胜的虚拟角色对话提供了强大支持。无论是在教育、娱乐还是其他领域，Charisma都能够通过其可控AI和GenAI即兴创作能力，帮助开发者构建富有吸引力的交互体验。', 'entityAI/logo_AIGC行业应用_Charisma.png', 'entityAI/cover_AIGC行业应用_Charisma.png', 16, 'Charisma', 4.25, 2.75, 0.5, 0.75);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (286, 'Inworld AI', 'https://inworld.ai/zh-cn', 'Inworld AI是一个综合性的AI游戏开发平台，它通过提供先进的NPC逻辑、互动剧情设计工具、实时AI反应和自然语音生成等功能，极大地增强了游戏的沉浸感和互动性。', 'entityAI/logo_AIGC行业应用_Inworld AI.png', 'entityAI/cover_AIGC行业应用_Inworld AI.png', 16, 'Inworld AI', 3.75, 0.0, 2.75, 1.75);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (287, 'VEED AI', 'https://www.veed.io/tools/ai-image-generator/ai-game-generator', 'VEED AI游戏生成器是一个多功能的AI工具，它通过文本到图像的转换技术，帮助游戏开发者快速获取游戏设计和营销的视觉素材。', 'entityAI/logo_AIGC行业应用_VEED AI.png', 'entityAI/cover_AIGC行业应用_VEED AI.png', 16, 'VEED AI', 3.75, 3.75, 2.5, 2.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (288, 'Layer AI', 'https://www.layer.ai', 'Layer AI是一个强大的工具，它通过AI技术帮助游戏工作室在保持艺术风格一致性的同时，提高生产效率和创造力。', 'entityAI/logo_AIGC行业应用_Layer AI.png', 'entityAI/cover_AIGC行业应用_Layer AI.png', 16, 'Layer AI', 4.75, 3.25, 2.0, 1.5);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (289, 'AI RPG Generator Freeplay', 'https://flowgpt.com', 'AI RPG Generator Freeplay 是一个强大且灵活的工具，适用于RPG爱好者或游戏设计师，能够快速生成丰富的游戏内容和故事情节，提供独特的游戏体验。', 'entityAI/logo_AIGC行业应用_AI RPG Generator Freeplay.png', 'entityAI/cover_AIGC行业应用_AI RPG Generator Freeplay.png', 16, 'AI RPG Generator Freeplay', 2.5, 3.5, 4.5, 2.25);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (290, 'Rosebud AI', 'https://www.rosebud.ai', 'Rosebud AI是一个创新的游戏开发工具，它通过AI技术简化了游戏创作的复杂性，使得从初学者到经验丰富的开发者都能够快速地将想法转化为游戏。', 'entityAI/logo_AIGC行业应用_Rosebud AI.png', 'entityAI/cover_AIGC行业应用_Rosebud AI.png', 16, 'Rosebud AI', 4.0, 2.0, 3.75, 3.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (291, 'Hotpot AI游戏生成器', 'https://hotpot.ai/game-asset-generator', 'Hotpot AI游戏生成器是游戏开发者的创意盟友，通过其AI驱动的方法，不仅加速了制作流程，还为游戏设计创新开辟了新的可能性。', 'entityAI/logo_AIGC行业应用_Hotpot AI游戏生成器.png', 'entityAI/cover_AIGC行业应用_Hotpot AI游戏生成器.png', 16, 'Hotpot AIyouxishengchengqi', 3.0, 2.5, 2.5, 2.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (292, 'Scenario', 'https://www.scenario.com', 'Scenario是一个强大的工具，它通过AI技术帮助游戏开发者和设计师创建和定制游戏资产。用户可以根据自己的需求训练AI模型，并通过高级控制功能精确调整生成的资产。', 'entityAI/logo_AIGC行业应用_Scenario.png', 'entityAI/cover_AIGC行业应用_Scenario.png', 16, 'Scenario', 3.25, 1.5, 4.75, 0.5);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (293, 'Ludo.ai', 'https://ludo.ai', 'Ludo.ai是一个强大的AI辅助游戏设计平台，它通过提供一系列AI工具，帮助游戏开发者在游戏设计过程中提高效率和创新能力。', 'entityAI/logo_AIGC行业应用_Ludo.ai.png', 'entityAI/cover_AIGC行业应用_Ludo.ai.png', 16, 'Ludo.ai', 3.25, 1.75, 1.75, 4.5);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (294, 'DefinityLegend', 'https://www.definitylegend.com', 'DefinityLegend是一个创新的游戏平台，它通过提供无代码的游戏构建工具，降低了游戏开发的门槛，使得任何有创意的人都可以成为游戏开发者', 'entityAI/logo_AIGC行业应用_DefinityLegend.png', 'entityAI/cover_AIGC行业应用_DefinityLegend.png', 16, 'DefinityLegend', 4.5, 3.5, 1.5, 2.0);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (295, 'Octokit', 'https://octokit.co', 'Octokit是一个多功能的无代码游戏创作工具，它通过提供丰富的模板和资产，简化了游戏开发和部署流程，使得任何用户都能轻松创建游戏化产品。', 'entityAI/logo_AIGC行业应用_Octokit.png', 'entityAI/cover_AIGC行业应用_Octokit.png', 16, 'Octokit', 2.75, 0.0, 0.5, 4.25);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (296, 'Charmed AI', 'https://charmed.ai', 'Charmed AI是一个强大的3D创作工具，它通过AI技术简化了3D建模和动画制作的流程。无论是生成3D几何体、应用纹理、还是动画绑定，Charmed AI都提供了高效的解决方案，使用户能够快速将创意转化为现实，同时保持对细节的精确控制。', 'entityAI/logo_AIGC行业应用_Charmed AI.png', 'entityAI/cover_AIGC行业应用_Charmed AI.png', 16, 'Charmed AI', 1.75, 4.0, 3.0, 1.5);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (297, 'AI游戏素材生成器', 'https://game-generator.com', 'AI游戏素材生成器是一个创新的游戏开发辅助工具，它通过AI技术简化了游戏美术资源的创作过程。这个平台不仅为独立开发者和小团队节省了成本，也为大型团队提高了工作效率，使得游戏开发变得更加高效和便捷。', 'entityAI/logo_AIGC行业应用_AI游戏素材生成器.png', 'entityAI/cover_AIGC行业应用_AI游戏素材生成器.png', 16, 'AIyouxisucaishengchengqi', 3.5, 2.5, 1.75, 2.75);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (298, 'Biomes', 'https://www.biomes.gg', '一款专为网络打造的开源沙盒 MMORPG', 'entityAI/logo_AIGC行业应用_Biomes.png', 'entityAI/cover_AIGC行业应用_Biomes.png', 16, 'Biomes', 2.75, 3.75, 0.0, 2.25);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (299, 'GGPredict', 'https://ggpredict.io', '提高你的CS:技能的力量AI-gen...', 'entityAI/logo_AIGC行业应用_GGPredict.png', 'entityAI/cover_AIGC行业应用_GGPredict.png', 16, 'GGPredict', 1.5, 0.75, 1.0, 2.25);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (300, 'The Simulation', 'https://fablesimulation.com', '仿真是一个人工intelligence-...', 'entityAI/logo_AIGC行业应用_The Simulation.png', 'entityAI/cover_AIGC行业应用_The Simulation.png', 16, 'The Simulation', 2.25, 3.5, 3.5, 2.75);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (301, 'LitRPG Adventures', 'https://litrpgadventures.com', '先进的桌面RPG发电机内容库D', 'entityAI/logo_AIGC行业应用_LitRPG Adventures.png', 'entityAI/cover_AIGC行业应用_LitRPG Adventures.png', 16, 'LitRPG Adventures', 3.0, 1.25, 3.0, 1.75);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (302, 'Convai Technologies Inc.', 'https://convai.com', 'Convai Technologies Inc.为...', 'entityAI/logo_AIGC行业应用_Convai Technologies Inc..png', 'entityAI/cover_AIGC行业应用_Convai Technologies Inc..png', 16, 'Convai Technologies Inc.', 2.5, 4.0, 2.75, 3.25);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (303, 'Orbofi', 'https://www.orbofi.com', 'Orbofi允许用户为web3、游戏...', 'entityAI/logo_AIGC行业应用_Orbofi.png', 'entityAI/cover_AIGC行业应用_Orbofi.png', 16, 'Orbofi', 1.5, 1.5, 2.5, 4.25);
-INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4) VALUES (304, 'AI Roguelite', 'https://store.steampowered.com/app/1889620/AI_Roguelite', '【付费】AI Roguelite是一款...', 'entityAI/logo_AIGC行业应用_AI Roguelite.png', 'entityAI/cover_AIGC行业应用_AI Roguelite.png', 16, 'AI Roguelite', 3.0, 1.5, 3.0, 4.5);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (1, '讯飞星火', 'https://xinghuo.xfyun.cn/desk?ch=xhweb_Squ', '讯飞星火AI助手，高性能AI语言模型，具备多模态理解和生成能力，服务于企业服务、智能硬件、智慧政务、智慧金融、智慧生活和智慧医疗等多个领域。', 'entityAI/logo_AIGC写作平台_讯飞星火.png', 'entityAI/cover_AIGC写作平台_讯飞星火.png', 2, 'xunfeixinghuo', 1.75, 3.0, 3.0, 3.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (2, '小鱼AI写作 – 免费', 'https://www.xiaoyuxiezuo.com/AI_A13d921', '满足自媒体人和办公人写作创作的在线智能AI写作平台，可以用AI自动生成高质量原创内容，内容创作覆盖多种类型，满足不同场景、人群的AI创作需求以及提供个性化的自定', 'entityAI/logo_AIGC写作平台_小鱼AI写作 – 免费.png', 'entityAI/cover_AIGC写作平台_小鱼AI写作 – 免费.png', 2, 'xiaoyuAIxiezuo – mianfei', 1.8333333333333333, 3.6666666666666665, 1.6666666666666667, 3.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (3, '新华妙笔AI', 'https://miaobi.xinhuaskl.com?channel=AIGC', '公文写作设计的高效工具，它通过集成的查、写、审、学功能，为公职人员提供了一个全面、智能的写作环境', 'entityAI/logo_AIGC写作平台_新华妙笔AI.png', 'entityAI/cover_AIGC写作平台_新华妙笔AI.png', 2, 'xinhuamiaobiAI', 2.5, 4.0, 1.6666666666666667, 3.8333333333333335, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (4, 'AI论文-高质量论文写作', 'https://www.66paper.cn/AI_A13D921', '10秒大纲，3分钟万字论文，66论文网是面向720+学科专业的论文写作平台，支持毕业论文、期刊论文等。提供开题报告、任务书，10秒生成千字大纲，3分钟极速生成万字论文，知网论文查重率稳定在10%左右。', 'entityAI/logo_AIGC写作平台_AI论文-高质量论文写作.png', 'entityAI/cover_AIGC写作平台_AI论文-高质量论文写作.png', 2, 'AIlunwen-gaozhilianglunwenxiezuo', 0.8333333333333334, 1.0, 2.0, 3.3333333333333335, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (5, 'PaperFake AI写论文', 'https://paperfake.cn/?q=aigc', '一键AI生成3万字论文，查重率、aigc率双重担保', 'entityAI/logo_AIGC写作平台_PaperFake AI写论文.png', 'entityAI/cover_AIGC写作平台_PaperFake AI写论文.png', 2, 'PaperFake AIxielunwen', 2.1666666666666665, 2.1666666666666665, 1.6666666666666667, 2.1666666666666665, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (6, '万能小in一键论文', 'https://xiaoin.com.cn/home/creation/submission-list?sharerUserId=1749323819392270338', '3分钟4万字130+应用，只需标题，快速生成文献综述、开题报告、PPT、工作总结等 ', 'entityAI/logo_AIGC写作平台_万能小in一键论文.png', 'entityAI/cover_AIGC写作平台_万能小in一键论文.png', 2, 'wannengxiaoinyijianlunwen', 2.3333333333333335, 4.5, 2.0, 1.8333333333333333, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (7, '慧言AI', 'https://aigc.huiyan-ai.cn', '一站式AI解决方案，全能聚合平台', 'entityAI/logo_AIGC写作平台_慧言AI.png', 'entityAI/cover_AIGC写作平台_慧言AI.png', 2, 'huiyanAI', 2.6666666666666665, 2.5, 3.6666666666666665, 2.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (8, '文字游侠-AI一键写头条', 'https://wenan.tcbot.cc/h5/#/pages/login/reg?code=vCUySW', '全网最牛逼的AI一键写头条文章全自动工具！', 'entityAI/logo_AIGC写作平台_文字游侠-AI一键写头条.png', 'entityAI/cover_AIGC写作平台_文字游侠-AI一键写头条.png', 2, 'wenziyouxia-AIyijianxietoutiao', 3.5, 2.6666666666666665, 1.1666666666666667, 3.5, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (9, '百度文库AI助手', 'https://wenku.baidu.com/ndlaunch/browse/chat?fr=dist_wk_aiasis&dist_source=kfpt-WD&utm_account=dist&searchFr=1&third_id=wkds_fac1faa6998fcc22bdd10d2a_400000007', '智能PPT、智能创作、智能编辑、智能总结四大AI能力，全面提升文档生产力', 'entityAI/logo_AIGC写作平台_百度文库AI助手.png', 'entityAI/cover_AIGC写作平台_百度文库AI助手.png', 2, 'baiduwenkuAIzhushou', 3.0, 1.8333333333333333, 3.0, 4.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (10, '万彩AI', 'https://ai.kezhan365.com/inviteCode/n6AW84', '一款由广州万彩信息技术有限公司推出的强大AI内容创作工具合集。它不仅提供AI智能写作支持，还集成了AI换脸、照片数字人制作和AI短视频制作等AI生成内容功能，进一步扩展了AI的创作领域，使您的创作具有无限可能。', 'entityAI/logo_AIGC写作平台_万彩AI.png', 'entityAI/cover_AIGC写作平台_万彩AI.png', 2, 'wancaiAI', 1.6666666666666667, 2.6666666666666665, 1.0, 2.8333333333333335, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (11, '言笔AI', 'https://www.yanbiai.com/workplace?ly=aigc', '多功能AI写作助手，专注智能创作与优化', 'entityAI/logo_AIGC写作平台_言笔AI.png', 'entityAI/cover_AIGC写作平台_言笔AI.png', 2, 'yanbiAI', 2.5, 2.3333333333333335, 2.6666666666666665, 3.6666666666666665, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (12, 'AI内容管家-免费100篇', 'https://guanjia.seowhy.com/?o3lzkd', 'AI驱动的SEO挖词、写作、发布工具', 'entityAI/logo_AIGC写作平台_AI内容管家-免费100篇.png', 'entityAI/cover_AIGC写作平台_AI内容管家-免费100篇.png', 2, 'AIneirongguanjia-mianfei100pian', 3.6666666666666665, 3.0, 1.8333333333333333, 1.6666666666666667, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (13, 'CopyDone-AI营销内容创作', 'https://copyai.cn/?channel=aigc.cn', '一键生成营销文本、配图与短视频等', 'entityAI/logo_AIGC写作平台_CopyDone-AI营销内容创作.png', 'entityAI/cover_AIGC写作平台_CopyDone-AI营销内容创作.png', 2, 'CopyDone-AIyingxiaoneirongchuangzuo', 2.5, 1.3333333333333333, 1.5, 1.5, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (14, 'Hulu AI', 'https://h5.cxyhub.com/?invitation=BYsXJb&redirect=home', '一个GPT、文心一言、Midjourney和Dall-E对话作图可以永久、不限次数使用的工具，Hulu AI会根据用户的需求，不断更新上线新的功能，比如图片解析、图片融合等等常用功能。', 'entityAI/logo_AIGC写作平台_Hulu AI.png', 'entityAI/cover_AIGC写作平台_Hulu AI.png', 2, 'Hulu AI', 1.1666666666666667, 2.6666666666666665, 3.1666666666666665, 2.5, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (15, '事半网', 'https://halfwork.cn/?invite=9dce88b4-431c-4fb7-bc4c-483f8ec41d41', '无论是创意写作、技术编程还是艺术绘图，事半都能成为用户提升工作效率、享受生活的得力助手。', 'entityAI/logo_AIGC写作平台_事半网.png', 'entityAI/cover_AIGC写作平台_事半网.png', 2, 'shibanwang', 3.6666666666666665, 2.1666666666666665, 2.0, 2.3333333333333335, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (16, 'Wordvice AI', 'https://wordvice.ai/cn', '多功能的AI智能写作工具，它通过提供文本编辑、校对、写作辅助等功能，帮助用户提升写作品质。无论是学生、研究人员还是专业人士，都可以通过Wordvice AI提高写作效率和质量。', 'entityAI/logo_AIGC写作平台_Wordvice AI.png', 'entityAI/cover_AIGC写作平台_Wordvice AI.png', 2, 'Wordvice AI', 2.8333333333333335, 2.3333333333333335, 2.6666666666666665, 4.333333333333333, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (17, '有道翻译·AI写作', 'https://fanyi.youdao.com/aiwrite', '一个强大的智能写作工具，它通过一键生成和高级润色功能，极大地提高了写作的效率和质量。多端同步和智能唤起功能使得用户可以随时随地进行创作，非常适合需要快速产出高质量文档的用户。', 'entityAI/logo_AIGC写作平台_有道翻译·AI写作.png', 'entityAI/cover_AIGC写作平台_有道翻译·AI写作.png', 2, 'youdaofanyi·AIxiezuo', 3.5, 3.5, 2.0, 2.8333333333333335, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (18, '即梦Dreamina – 免费', 'https://jimeng.jianying.com/ai-tool/home/?utm_medium=aitools&utm_source=aigc&utm_campaign=null&utm_content=hw_jm_aigc', '即梦Dreamina是一个功能丰富的AI创作工具，它通过理解和应用用户的创意输入，提供了从视频生成到AI绘画的一站式解决方案。', 'entityAI/logo_AIGC绘画工具_即梦Dreamina – 免费.png', 'entityAI/cover_AIGC绘画工具_即梦Dreamina – 免费.png', 3, 'jimengDreamina – mianfei', 3.3333333333333335, 2.3333333333333335, 2.0, 2.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (19, '稿定AI-文生图', 'https://www.gaoding.com/utms/c7615c8ebcd84c3a8199e743d71f9433', '稿定科技推出的一站式免费AI创意和绘画平台。一张图，一句话，满足灵感绘图，场景生成，素材生成。', 'entityAI/logo_AIGC绘画工具_稿定AI-文生图.png', 'entityAI/cover_AIGC绘画工具_稿定AI-文生图.png', 3, 'gaodingAI-wenshengtu', 2.8333333333333335, 2.3333333333333335, 2.8333333333333335, 1.6666666666666667, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (20, '美间AI设计', 'https://www.meijian.com/ai?from=mj_navigation&utm_source=dsdhaigc', 'AI创意商拍是专注于电商高效图片设计的工具，免费为设计师们提供海量正版电商设计素材、白底图AI生成N张场景图等，通过AI的技术，帮助设计师们实现10秒搞定所有电商物料，更高效，更智能！', 'entityAI/logo_AIGC绘画工具_美间AI设计.png', 'entityAI/cover_AIGC绘画工具_美间AI设计.png', 3, 'meijianAIsheji', 3.8333333333333335, 3.3333333333333335, 2.3333333333333335, 1.1666666666666667, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (21, 'Openflow', 'https://www.openflowai.net/midjourney?puid=6442', 'OpenFlow是一个多功能的AI平台，它通过提供行业特定的工作流优化、内容创作支持、社区管理和变现途径，为个体用户提供了一个全面的解决方案。', 'entityAI/logo_AIGC绘画工具_Openflow.png', 'entityAI/cover_AIGC绘画工具_Openflow.png', 3, 'Openflow', 3.3333333333333335, 2.0, 3.6666666666666665, 3.1666666666666665, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (22, '智谱AI绘画', 'https://chatglm.cn/apps?image=https%3A%2F%2Fsfile.chatglm.cn%2Factiveimg%2Fbdms%2F66b97e348217030036f486f1&open_from=ads_web_aigc&fr=ads_web_aigc', '智谱AI绘画可根据用户的描述创作出新的艺术作品，还能够模仿不同的艺术风格，提供个性化的图像编辑和创作服务', 'entityAI/logo_AIGC绘画工具_智谱AI绘画.png', 'entityAI/cover_AIGC绘画工具_智谱AI绘画.png', 3, 'zhipuAIhuihua', 2.8333333333333335, 1.1666666666666667, 2.0, 2.1666666666666665, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (23, '巨日禄AI漫画', 'https://ai.jurilu.com/#/register?inviteCode=106843', '超多绚美风格的AI漫画视频创作平台', 'entityAI/logo_AIGC绘画工具_巨日禄AI漫画.png', 'entityAI/cover_AIGC绘画工具_巨日禄AI漫画.png', 3, 'juriluAImanhua', 2.0, 3.0, 1.1666666666666667, 2.8333333333333335, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (24, '触手AI绘画-4090极速出图', 'https://acgnai.art/login?inviteCode=221141&channel=channel_invite', '触手AI绘画通过提供多样化的AI辅助创作功能，为插画、漫画、设计等领域的专业人士提供了一个强大的数字创作平台。', 'entityAI/logo_AIGC绘画工具_触手AI绘画-4090极速出图.png', 'entityAI/cover_AIGC绘画工具_触手AI绘画-4090极速出图.png', 3, 'chushouAIhuihua-4090jisuchutu', 0.8333333333333334, 2.5, 3.1666666666666665, 2.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (25, 'LiblibAI·哩布哩布AI', 'https://www.liblib.ai', '限时免费的LoRA炼丹炉！更全、更热门的素材，为所有AI绘画者提供更得心应手的平台，持续深耕专业领域。', 'entityAI/logo_AIGC绘画工具_LiblibAI·哩布哩布AI.png', 'entityAI/cover_AIGC绘画工具_LiblibAI·哩布哩布AI.png', 3, 'LiblibAI·libulibuAI', 3.0, 1.6666666666666667, 2.5, 2.6666666666666665, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (26, '炉米Lumi', 'https://artistrylab.net', '字节推出的一个为创作者提供一站式服务的平台，它通过提供便捷的登录方式、丰富的素材库和强大的编辑工具，使得创作变得更加简单和高效。无论是新手还是专业创作者，都可以在这个平台上找到适合自己的创作工具和资源，实现创意的快速落地。', 'entityAI/logo_AIGC绘画工具_炉米Lumi.png', 'entityAI/cover_AIGC绘画工具_炉米Lumi.png', 3, 'lumiLumi', 2.0, 2.3333333333333335, 2.5, 1.8333333333333333, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (27, '搜狐简单AI', 'https://ai.sohu.com/pc/generate?trans=030001_pjj_0809', '搜狐旗下全能型AI创作助手，一站式满足文本创作、图片创作', 'entityAI/logo_AIGC绘画工具_搜狐简单AI.png', 'entityAI/cover_AIGC绘画工具_搜狐简单AI.png', 3, 'souhujiandanAI', 3.5, 3.5, 2.8333333333333335, 2.3333333333333335, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (28, '云界AI', 'https://www.yunjie.art', '一个免费且易于使用的AI绘图工具，它通过AI技术降低了艺术创作的门槛，使得用户可以快速上手并创作出具有个人风格的作品。无论是专业艺术家还是绘图新手，都可以利用云界AI来探索和实现自己的创意。', 'entityAI/logo_AIGC绘画工具_云界AI.png', 'entityAI/cover_AIGC绘画工具_云界AI.png', 3, 'yunjieAI', 2.5, 3.6666666666666665, 2.0, 4.333333333333333, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (29, 'Ideogram', 'https://ideogram.ai', '优秀的在线AI绘画平台，以其强大的图像生成能力和多样化的功能，满足了从设计师到开发者，从学生到自由职业者的广泛需求。', 'entityAI/logo_AIGC绘画工具_Ideogram.png', 'entityAI/cover_AIGC绘画工具_Ideogram.png', 3, 'Ideogram', 0.6666666666666666, 1.1666666666666667, 4.5, 1.8333333333333333, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (30, '腾讯混元生图', 'https://image.hunyuan.tencent.com', '为创新性的设计、故事讲述以及更多场景提供一种强大而灵活的解决方案。', 'entityAI/logo_AIGC绘画工具_腾讯混元生图.png', 'entityAI/cover_AIGC绘画工具_腾讯混元生图.png', 3, 'tengxunhunyuanshengtu', 4.666666666666667, 3.0, 2.5, 2.5, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (31, 'FLUX.1', 'https://blackforestlabs.ai', 'Stable Diffusion原班人马推出的开源文生图模型，Black Forest Labs推出的一系列AI图像生成工具，旨在为不同需求的用户提供定制化的服务。无论是专业的图像生成需求，还是开发和个人使用，FLUX.1都能提供相应的解决方案。', 'entityAI/logo_AIGC绘画工具_FLUX.1.png', 'entityAI/cover_AIGC绘画工具_FLUX.1.png', 3, 'FLUX.1', 1.5, 1.8333333333333333, 2.1666666666666665, 2.3333333333333335, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (32, 'AI画一画-9折专享', 'https://www.tishi.top/draw/square/gallery/?invite=er36Jf', 'AI提示语是一个综合性的艺术创作平台，它通过结合AI技术，为用户提供了一个广阔的创作空间。无论是初学者还是专业艺术家，都能在这个平台上找到适合自己的创作方式，实现个性化的艺术创作。', 'entityAI/logo_AIGC绘画工具_AI画一画-9折专享.png', 'entityAI/cover_AIGC绘画工具_AI画一画-9折专享.png', 3, 'AIhuayihua-9zhezhuanxiang', 3.1666666666666665, 2.6666666666666665, 1.3333333333333333, 1.5, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (33, '包图AI文生图', 'https://ibaotu.com/?m=AigcTi&spm=aigcai', '包图AI文生图是一个高效的AI图像生成工具，它通过理解用户的文字描述来创造出相应的视觉内容，极大地提高了设计和创意工作的效率。', 'entityAI/logo_AIGC绘画工具_包图AI文生图.png', 'entityAI/cover_AIGC绘画工具_包图AI文生图.png', 3, 'baotuAIwenshengtu', 3.1666666666666665, 3.3333333333333335, 2.8333333333333335, 0.16666666666666666, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (34, '猫目社区', 'https://www.maomu.com?form=aigccn', '猫目社区是一个专注于人工智能生成内容（AIGC）的平台，提供多种先进的AI工具和模型，旨在探索AIGC技术的无限可能性。', 'entityAI/logo_AIGC绘画工具_猫目社区.png', 'entityAI/cover_AIGC绘画工具_猫目社区.png', 3, 'maomushequ', 2.3333333333333335, 4.166666666666667, 4.166666666666667, 1.5, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (35, '笔魂AI绘画', 'https://ibihun.com/?hf=7', '笔魂AI绘画-免费在线AI绘画、AI画图、AI设计工具软件', 'entityAI/logo_AIGC绘画工具_笔魂AI绘画.png', 'entityAI/cover_AIGC绘画工具_笔魂AI绘画.png', 3, 'bihunAIhuihua', 2.0, 3.1666666666666665, 3.8333333333333335, 1.6666666666666667, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (36, '智启特', 'https://img.zhiqite.com', '智启特绘图API是一款专注于提供人工智能图像处理服务的产品。', 'entityAI/logo_AIGC绘画工具_智启特.png', 'entityAI/cover_AIGC绘画工具_智启特.png', 3, 'zhiqite', 1.6666666666666667, 2.0, 1.6666666666666667, 1.5, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (37, '千图设计室', 'https://hihaibao.com/?from=aigc', '只需输入一句话或关键词，即可快速生成各种类型的海报，包括节日海报、日签、邀请函、电商主图、公告通知、喜报、倒计时等等。这些海报不仅美观大方，而且能够准确传达您想要表达的信息。', 'entityAI/logo_AIGC绘画工具_千图设计室.png', 'entityAI/cover_AIGC绘画工具_千图设计室.png', 3, 'qiantushejishi', 1.8333333333333333, 1.5, 3.6666666666666665, 3.6666666666666665, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (38, '可图 KOLORS', 'https://kolors.kuaishou.com', '可图Kolors是一个创新的AI艺术创作工具，它通过结合AI技术与艺术创作，为用户提供了一个简单、高效的艺术创作途径。', 'entityAI/logo_AIGC绘画工具_可图 KOLORS.png', 'entityAI/cover_AIGC绘画工具_可图 KOLORS.png', 3, 'ketu KOLORS', 1.8333333333333333, 1.3333333333333333, 3.3333333333333335, 3.1666666666666665, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (39, '星火绘镜', 'https://typemovie.art/?utm_source=nt-aigc#/dashboard', 'AI生成视频创作平台。分镜自动拆分，画面一键生成。支持短剧、MV、预告片多题材。描述及创作，短视频轻松生成。', 'entityAI/logo_AIGC视频平台_星火绘镜.png', 'entityAI/cover_AIGC视频平台_星火绘镜.png', 4, 'xinghuohuijing', 2.5, 4.0, 1.3333333333333333, 3.6666666666666665, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (40, '清影 – AI视频生成', 'https://chatglm.cn/apps?image=https%3A%2F%2Fsfile.chatglm.cn%2Factiveimg%2Fbdms%2F66b97e348217030036f486f1&open_from=ads_web_aigc&fr=ads_web_aigc', '智谱旗下AI视频模型通过其创新的技术和用户友好的功能，为用户提供了一个简单快捷的视频创作平台。无论是从文字描述还是图片生成视频，清影都能帮助用户轻松实现视频内容的创作，丰富了创意表达的方式。', 'entityAI/logo_AIGC视频平台_清影 – AI视频生成.png', 'entityAI/cover_AIGC视频平台_清影 – AI视频生成.png', 4, 'qingying – AIshipinshengcheng', 3.0, 3.5, 2.8333333333333335, 1.5, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (41, '有言', 'https://www.youyan3d.com/platform/?utm_source=zhanwaidaoliu&utm_campaign=zwj&utm_content=aigc&from=aigc', '一站式AI视频创作，1200+免费3D数字人。', 'entityAI/logo_AIGC视频平台_有言.png', 'entityAI/cover_AIGC视频平台_有言.png', 4, 'youyan', 1.3333333333333333, 2.1666666666666665, 2.1666666666666665, 0.5, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (42, '白日梦AI生成视频', 'https://aibrm.com/?code=fx_cyc', '多功能AIGC视频内容创作平台，提供丰富的活动、角色库、创作支持和社区交流功能。它旨在为用户提供一个综合性的在线体验和创作空间，适合喜欢在线互动和创作的用户。', 'entityAI/logo_AIGC视频平台_白日梦AI生成视频.png', 'entityAI/cover_AIGC视频平台_白日梦AI生成视频.png', 4, 'bairimengAIshengchengshipin', 2.6666666666666665, 1.5, 3.1666666666666665, 3.8333333333333335, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (43, '一帧秒创', 'https://aigc.yizhentv.com/?_f=aigc.cn', '一帧秒创是一款智能AI内容生成工具，以“文生视频”为核心功能。它能够将一段文字扩展成为视频脚本，并根据文字内容在视频素材库中匹配相应的视频片段，从而省略了手动搜索视频和剪辑的过程。', 'entityAI/logo_AIGC视频平台_一帧秒创.png', 'entityAI/cover_AIGC视频平台_一帧秒创.png', 4, 'yizhenmiaochuang', 2.0, 2.5, 3.1666666666666665, 1.6666666666666667, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (44, '即梦AI-中文版SORA', 'https://jimeng.jianying.com/ai-tool/home/?utm_medium=aitools&utm_source=aigc&utm_campaign=null&utm_content=hw_jm_aigc', '剪映旗下的一款AI视频生成工具，能够根据用户提供的文本内容生成由AI制作的创意视频！', 'entityAI/logo_AIGC视频平台_即梦AI-中文版SORA.png', 'entityAI/cover_AIGC视频平台_即梦AI-中文版SORA.png', 4, 'jimengAI-zhongwenbanSORA', 1.1666666666666667, 3.0, 0.5, 2.3333333333333335, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (45, 'Tora', 'https://ali-videoai.github.io/tora_video', 'Tora是阿里推出的一个强大的视频生成工具，它通过集成多种条件来创造高质量的视频内容。其主要优势在于对运动轨迹的精确控制和对物理世界运动的真实模拟，这使得Tora在视频内容创作领域具有广泛的应用潜力。', 'entityAI/logo_AIGC视频平台_Tora.png', 'entityAI/cover_AIGC视频平台_Tora.png', 4, 'Tora', 3.3333333333333335, 2.3333333333333335, 2.8333333333333335, 3.3333333333333335, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (46, '海螺AI视频', 'https://hailuoai.com/video', '多功能的AI助手，通过提供视频创作、音乐创作、图像识别和文本写作等功能，帮助用户提升工作和学习的效率。它的智能化和高效率的特点，使其成为提升生产力的有力工具。', 'entityAI/logo_AIGC视频平台_海螺AI视频.png', 'entityAI/cover_AIGC视频平台_海螺AI视频.png', 4, 'hailuoAIshipin', 3.8333333333333335, 2.1666666666666665, 2.0, 2.5, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (47, 'Decohere', 'https://www.decohere.ai', '适合希望通过AI技术创造新颖视频内容的用户，如音乐视频、教育内容等。它为独立视频创作者、广告和营销专业人士、音乐视频制作人、教育机构、企业宣传部门、动画师和视觉艺术家、以及社交媒体创作者提供了一个强大的工具，以更生动的方式传达信息和创意。', 'entityAI/logo_AIGC视频平台_Decohere.png', 'entityAI/cover_AIGC视频平台_Decohere.png', 4, 'Decohere', 1.1666666666666667, 2.6666666666666665, 4.666666666666667, 2.3333333333333335, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (48, 'MOKI', 'https://www.moki.cn', 'MOKI是美图旗下一个提供一站式AI短片制作服务的平台，通过其AI技术，为用户提供从前期策划到后期制作的全方位短片制作解决方案。无论是创意构思、素材生成还是后期剪辑，MOKI都能帮助用户实现个性化的短片创作，让短片制作变得更加简单、高效。', 'entityAI/logo_AIGC视频平台_MOKI.png', 'entityAI/cover_AIGC视频平台_MOKI.png', 4, 'MOKI', 1.3333333333333333, 1.6666666666666667, 2.8333333333333335, 0.6666666666666666, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (49, 'SkyReels', 'https://skyreels.ai/beta', 'SkyReels是一个创新的视频创作工具，特别适合那些寻求通过技术简化创作流程并实现创意的用户。它通过结合3D引擎和AI技术，为用户提供了一个强大而易于使用的平台，以实现从创意到短片的快速转化。', 'entityAI/logo_AIGC视频平台_SkyReels.png', 'entityAI/cover_AIGC视频平台_SkyReels.png', 4, 'SkyReels', 2.3333333333333335, 2.3333333333333335, 3.8333333333333335, 1.8333333333333333, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (50, '神笔马良', 'https://shenbi.maoyan.com', '一个为电影爱好者和行业从业者提供数据支持和市场分析的工具。它通过实时数据和多维度分析，帮助用户更好地理解电影市场，做出更明智的观影选择。', 'entityAI/logo_AIGC视频平台_神笔马良.png', 'entityAI/cover_AIGC视频平台_神笔马良.png', 4, 'shenbimaliang', 3.6666666666666665, 1.5, 2.5, 1.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (51, '可灵大模型', 'https://kling.kuaishou.com', '可灵大模型是快手推出的一款创新的视频生成工具，它通过先进的AI技术，为用户提供了一个能够将创意快速转化为视频内容的平台。', 'entityAI/logo_AIGC视频平台_可灵大模型.png', 'entityAI/cover_AIGC视频平台_可灵大模型.png', 4, 'kelingdamoxing', 2.0, 3.1666666666666665, 2.5, 1.3333333333333333, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (52, 'Vidu', 'https://www.vidu.studio', 'Vidu是一个创新的视频制作平台，它通过提供快速、多样化的视频创作工具，使得即使是非专业人士也能轻松制作出具有专业感的视频。', 'entityAI/logo_AIGC视频平台_Vidu.png', 'entityAI/cover_AIGC视频平台_Vidu.png', 4, 'Vidu', 1.5, 3.5, 2.3333333333333335, 2.1666666666666665, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (53, 'Viggle', 'https://www.viggle.ai', 'Viggle是一个强大的AI视频生成工具，它通过易于使用的命令为用户提供了丰富的视频创作可能性。无论是将静态角色转化为动态视频，还是完全控制角色动作，Viggle都能满足用户的创意需求。', 'entityAI/logo_AIGC视频平台_Viggle.png', 'entityAI/cover_AIGC视频平台_Viggle.png', 4, 'Viggle', 3.3333333333333335, 2.8333333333333335, 2.3333333333333335, 1.6666666666666667, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (54, 'Reachout.ai', 'https://reachout.ai', 'Reachout.ai是一个人工智能驱动的视频开发平台，专为忙碌的企业家和销售团队打造，他们希望突破收件箱的噪音，大规模生成个性化视频，并获得更高的电子邮件回复率和更多与理想客户的会议。', 'entityAI/logo_AIGC视频平台_Reachout.ai.png', 'entityAI/cover_AIGC视频平台_Reachout.ai.png', 4, 'Reachout.ai', 1.3333333333333333, 4.333333333333333, 2.6666666666666665, 1.5, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (55, '轻幕', 'https://mika365.com', '点点鼠标快速生成诗词、成语故事等的短视频，多模型生图、AI对话，AI音乐创作', 'entityAI/logo_AIGC视频平台_轻幕.png', 'entityAI/cover_AIGC视频平台_轻幕.png', 4, 'qingmu', 4.166666666666667, 2.3333333333333335, 3.6666666666666665, 1.8333333333333333, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (56, 'Fliki.ai', 'https://fliki.ai', '将文本变成带有 AI 语音的视频,在 2 分钟内使用逼真的声音从脚本或博客文章创建视频！', 'entityAI/logo_AIGC视频平台_Fliki.ai.png', 'entityAI/cover_AIGC视频平台_Fliki.ai.png', 4, 'Fliki.ai', 1.0, 4.333333333333333, 0.8333333333333334, 4.166666666666667, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (57, 'Loom AI', 'https://www.loom.com/ai', 'Loom AI是一个强大的视频处理工具，它通过人工智能简化了视频的录制、编辑和分享过程。它不仅提高了视频内容的可访问性和参与度，还通过自动化功能显著提升了工作效率。', 'entityAI/logo_AIGC视频平台_Loom AI.png', 'entityAI/cover_AIGC视频平台_Loom AI.png', 4, 'Loom AI', 3.1666666666666665, 2.1666666666666665, 2.1666666666666665, 1.6666666666666667, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (58, '达摩院·寻光', 'https://xunguang.damo-vision.com', '达摩院·寻光是一个创新的AI驱动的视频创作工具，它通过提供一系列自动化和辅助性功能，大大降低了视频创作的技术门槛，使得用户可以更加专注于创意和故事表达。', 'entityAI/logo_AIGC视频平台_达摩院·寻光.png', 'entityAI/cover_AIGC视频平台_达摩院·寻光.png', 4, 'damoyuan·xunguang', 2.0, 2.3333333333333335, 3.3333333333333335, 2.6666666666666665, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (59, 'NextClip', 'https://www.nextclip.cn', '利用先进的人工智能技术，我们为您打造了一个无需专业背景即可轻松创作沉浸式视频小说的平台', 'entityAI/logo_AIGC视频平台_NextClip.png', 'entityAI/cover_AIGC视频平台_NextClip.png', 4, 'NextClip', 3.1666666666666665, 2.1666666666666665, 3.6666666666666665, 3.8333333333333335, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (60, 'Stable Video', 'https://www.stablevideo.com', '通过简化视频制作过程，即使是没有专业视频编辑技能的用户也能快速创建吸引人的视频。Stable Video目前处于公测阶段，每个人都可以免费使用。', 'entityAI/logo_AIGC视频平台_Stable Video.png', 'entityAI/cover_AIGC视频平台_Stable Video.png', 4, 'Stable Video', 2.8333333333333335, 2.5, 3.0, 3.3333333333333335, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (61, 'Sora', 'https://openai.com/index/sora', '能够生成长达 1 分钟的高清视频，涵盖广泛的视觉数据类型和分辨率。Sora通过在视频和图像的压缩潜在空间中训练，将其分解为时空位置补丁，实现了可扩展的视频生成。', 'entityAI/logo_AIGC视频平台_Sora.png', 'entityAI/cover_AIGC视频平台_Sora.png', 4, 'Sora', 3.5, 1.3333333333333333, 3.0, 1.1666666666666667, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (62, '智谱清言', 'https://chatglm.cn/apps?image=https%3A%2F%2Fsfile.chatglm.cn%2Factiveimg%2Fbdms%2F66b97e348217030036f486f1&open_from=ads_web_aigc&fr=ads_web_aigc', '智谱清言是一款基于人工智能技术的千亿参数对话模型，遵循中国政府的立场和社会主义价值观，提供多领域知识问答、信息检索、文本生成等服务。', 'entityAI/logo_AIGC智能对话_智谱清言.png', 'entityAI/cover_AIGC智能对话_智谱清言.png', 5, 'zhipuqingyan', 3.0, 2.5, 4.666666666666667, 2.1666666666666665, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (63, '讯飞星火', 'https://xinghuo.xfyun.cn/desk?ch=xhweb_Squ', '讯飞星火是科大讯飞推出的高性能AI语言模型，具备多模态理解和生成能力，服务于企业服务、智能硬件、智慧政务、智慧金融、智慧生活和智慧医疗等多个领域。', 'entityAI/logo_AIGC智能对话_讯飞星火.png', 'entityAI/cover_AIGC智能对话_讯飞星火.png', 5, 'xunfeixinghuo', 2.0, 1.5, 2.6666666666666665, 1.6666666666666667, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (64, '文心一言', 'https://yiyan.baidu.com/?utm_source=aigcdh', '文心一言是由百度基于文心大模型技术推出的生成式对话产品。它位于百度人工智能的四层架构中的模型层，具备跨模态功能。', 'entityAI/logo_AIGC智能对话_文心一言.png', 'entityAI/cover_AIGC智能对话_文心一言.png', 5, 'wenxinyiyan', 1.1666666666666667, 3.6666666666666665, 3.1666666666666665, 2.6666666666666665, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (65, '通义千问', 'https://tongyi.aliyun.com/qianwen', '通义千问是由阿里云推出的一种超大规模语言模型，它可以理解和回答各种领域的问题，包括常见、复杂甚至是少见的问题。它不仅是一个效率助手，也是一个点子生成机，可以帮助用户完成各种任务，如写邮件、写文章、写脚本、写情书、写诗等。此外，它还能提供娱乐功能，比如讲笑话、唱歌等。', 'entityAI/logo_AIGC智能对话_通义千问.png', 'entityAI/cover_AIGC智能对话_通义千问.png', 5, 'tongyiqianwen', 1.6666666666666667, 3.1666666666666665, 3.1666666666666665, 1.8333333333333333, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (66, '商汤商量SenseChat', 'https://chat.sensetime.com', '商汤商量SenseChat是由商汤科技推出的语言大模型，提供对话和文档理解服务，能够处理百科问答、图片理解、数学解答、代码编写等多种任务。', 'entityAI/logo_AIGC智能对话_商汤商量SenseChat.png', 'entityAI/cover_AIGC智能对话_商汤商量SenseChat.png', 5, 'shangtangshangliangSenseChat', 2.3333333333333335, 2.0, 3.8333333333333335, 1.6666666666666667, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (67, 'Kimi Chat', 'https://volctrack.com/w/pJxYBwii', 'Kimi Chat 是由月之暗面科技有限公司开发的智能聊天助手，旨在为用户提供高效、智能和友好的交流体验。作为一款先进的人工智能产品，Kimi Chat 集成了多种功能和特点，使其能够满足用户在多种场景下的沟通需求。', 'entityAI/logo_AIGC智能对话_Kimi Chat.png', 'entityAI/cover_AIGC智能对话_Kimi Chat.png', 5, 'Kimi Chat', 2.6666666666666665, 2.8333333333333335, 2.0, 1.8333333333333333, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (68, '天工AI助手', 'https://www.tiangong.cn', '天工AI是一个多功能的智能助手，它通过整合搜索、数据分析和智能预测等技术，为用户提供了一个全面、便捷和个性化的服务体验。', 'entityAI/logo_AIGC智能对话_天工AI助手.png', 'entityAI/cover_AIGC智能对话_天工AI助手.png', 5, 'tiangongAIzhushou', 1.6666666666666667, 2.6666666666666665, 1.8333333333333333, 1.8333333333333333, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (69, 'CueMe', 'https://cueme.cn?entry=qudao_aigcdaohang', 'CueMe 是由夸克自主研发的一款智能对话助手，旨在为用户的学习、工作、生活提供一站式的信息服务。 支持用户的文学创作、知识获取、感情陪伴等需求。', 'entityAI/logo_AIGC智能对话_CueMe.png', 'entityAI/cover_AIGC智能对话_CueMe.png', 5, 'CueMe', 1.8333333333333333, 1.3333333333333333, 3.0, 3.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (70, '360智脑', 'https://chat.360.com', '360智脑是360公司自研的认知型通用大模型，依托于360多年积累的大算力、大数据、工程化等关键优势，集成了360GPT大模型、360CV大模型、360多模态大模型技术能力。它具备生成创作、多轮对话、逻辑推理等十大核心能力和数百项细分功能，旨在重塑人机协作的新范式。', 'entityAI/logo_AIGC智能对话_360智脑.png', 'entityAI/cover_AIGC智能对话_360智脑.png', 5, '360zhinao', 3.6666666666666665, 2.1666666666666665, 3.0, 3.6666666666666665, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (71, 'DeepSeek', 'https://www.deepseek.com', 'DeepSeek-V2是由杭州深度求索公司发布的第二代开源MoE模型，DeepSeek-V2 在中文综合能力与 GPT-4-Turbo，文心 4.0 等闭源模型在评测中处于同一梯队，英文综合能力英文综合能力（MT-Bench）与最强的开源模型 LLaMA3-70B 处于同一梯队，超过最强 MoE 开源模型 Mixtral8x22B，特别擅长数学、编程和逻辑推理任务。它在多个大型模型排行榜上名列前茅，支持长达128K的上下文长度，并提供开放源代码。', 'entityAI/logo_AIGC智能对话_DeepSeek.png', 'entityAI/cover_AIGC智能对话_DeepSeek.png', 5, 'DeepSeek', 2.3333333333333335, 2.5, 3.6666666666666665, 2.1666666666666665, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (72, '海螺问问', 'https://hailuoai.com', '一款多功能的AI智能问答助手 MiniMax公司旗下的海螺问问，是一款依托于深度学习技术的问答系统，它采用了公司自主研发的MoE模型。', 'entityAI/logo_AIGC智能对话_海螺问问.png', 'entityAI/cover_AIGC智能对话_海螺问问.png', 5, 'hailuowenwen', 1.0, 3.5, 2.0, 3.5, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (73, '知乎直答', 'https://zhida.zhihu.com', '知乎直答是知乎推出的一项基于人工智能技术的搜索问答服务。它利用AI大模型技术，为用户提供智能搜索和可靠的回答，使得用户能够快速找到最相关的答案和专业的知乎答主。', 'entityAI/logo_AIGC智能对话_知乎直答.png', 'entityAI/cover_AIGC智能对话_知乎直答.png', 5, 'zhihuzhida', 0.5, 1.8333333333333333, 3.5, 2.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (74, '腾讯元宝', 'https://yuanbao.tencent.com/chat', '腾讯元宝，由腾讯公司精心打造，依托于混元大模型以及搜索引擎的强大驱动，诞生了一个高效的信息整合利器。', 'entityAI/logo_AIGC智能对话_腾讯元宝.png', 'entityAI/cover_AIGC智能对话_腾讯元宝.png', 5, 'tengxunyuanbao', 3.8333333333333335, 1.5, 2.5, 3.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (75, '万知', 'https://www.wanzhi.com/home', '问答、阅读、创作的一站式AI工作平台', 'entityAI/logo_AIGC智能对话_万知.png', 'entityAI/cover_AIGC智能对话_万知.png', 5, 'wanzhi', 1.6666666666666667, 2.3333333333333335, 2.8333333333333335, 3.1666666666666665, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (76, '百小应', 'https://ying.baichuan-ai.com/chat', '百小应是由百川智能推出的人工智能助手。', 'entityAI/logo_AIGC智能对话_百小应.png', 'entityAI/cover_AIGC智能对话_百小应.png', 5, 'baixiaoying', 2.5, 3.6666666666666665, 2.3333333333333335, 2.8333333333333335, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (77, 'AI小聚', 'https://ii.cn', 'AI小聚是一个提供智能对话、文本创作和艺术绘画服务的在线平台', 'entityAI/logo_AIGC智能对话_AI小聚.png', 'entityAI/cover_AIGC智能对话_AI小聚.png', 5, 'AIxiaoju', 2.3333333333333335, 2.8333333333333335, 1.3333333333333333, 2.3333333333333335, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (78, '问小白', 'https://www.wenxiaobai.com', '问小白是一个旨在简化用户日常生活的智能助手，它通过对话的形式提供陪伴、信息搜索、资料整理、情绪支持和生活规划等服务。', 'entityAI/logo_AIGC智能对话_问小白.png', 'entityAI/cover_AIGC智能对话_问小白.png', 5, 'wenxiaobai', 3.6666666666666665, 2.8333333333333335, 2.3333333333333335, 2.3333333333333335, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (79, '稿定AI设计', 'https://www.gaoding.com/utms/656bcb8b01104751993ced9f343f418e', '国内知名在线AI设计作图工具&amp;新媒体人必备素材库，它通过AI设计，AI绘画，AI抠图，在线PS，图片编辑/延展等功能，将AI能力逐步渗透到灵感获取，创作，作品优化等环节，降低设计门槛，累计使用用户1亿+！', 'entityAI/logo_AIGC设计工具_稿定AI设计.png', 'entityAI/cover_AIGC设计工具_稿定AI设计.png', 6, 'gaodingAIsheji', 3.1666666666666665, 2.8333333333333335, 3.5, 2.1666666666666665, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (80, '美间AI设计', 'https://www.meijian.com/ai?from=mj_navigation&utm_source=dsdhaigc', '美间是一款AI创意内容云设计工具，由国产3D室内设计软件酷家乐所属公司推出，提供海量方案模板和快速设计工具，为平面设计创作者量身打造流畅、高效、美观的创作体验。致力于服务软装设计师，通过海量的设计素材和简单易用的编辑功能，帮助设计师高效、快速地完成软装搭配创作。', 'entityAI/logo_AIGC设计工具_美间AI设计.png', 'entityAI/cover_AIGC设计工具_美间AI设计.png', 6, 'meijianAIsheji', 2.3333333333333335, 1.5, 2.3333333333333335, 1.8333333333333333, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (81, '神采PromeAI', 'https://www.ishencai.com/?vsource=aigc.cnweb', '神采PromeAI是一款专为建筑师、室内设计师、产品设计师和游戏动漫设计师打造的AI图像处理工具。利用强大的人工智能技术和广泛可控的AIGC模型风格库，神采PromeAI可以帮助用户创建惊人的图形、视频和动画，是实现你想象的最佳工具。', 'entityAI/logo_AIGC设计工具_神采PromeAI.png', 'entityAI/cover_AIGC设计工具_神采PromeAI.png', 6, 'shencaiPromeAI', 3.1666666666666665, 2.5, 1.8333333333333333, 2.1666666666666665, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (82, '美图设计室', 'https://www.x-design.com/?channel=aigc', '美图设计室是美图秀秀旗下的智能平面设计在线协作平台，提供丰富的设计资源和便捷的在线设计工具。它主要面向需要平面设计服务的用户，包括但不限于海报制作、电商设计、PPT制作等领域。', 'entityAI/logo_AIGC设计工具_美图设计室.png', 'entityAI/cover_AIGC设计工具_美图设计室.png', 6, 'meitushejishi', 0.8333333333333334, 0.3333333333333333, 2.8333333333333335, 1.6666666666666667, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (83, 'AI小方-包装设计', 'https://www.xiaofang.design', 'AI小方是一款高效的AIGC设计工具，它通过人工智能技术简化了设计流程，提高了设计工作的效率和质量。', 'entityAI/logo_AIGC设计工具_AI小方-包装设计.png', 'entityAI/cover_AIGC设计工具_AI小方-包装设计.png', 6, 'AIxiaofang-baozhuangsheji', 2.6666666666666665, 3.1666666666666665, 4.666666666666667, 3.3333333333333335, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (84, '创客贴', 'https://www.chuangkit.com/?utm_source=aigccn', '创客贴是由北京艺源酷科技有限公司推出的一个多平台图形编辑和平面设计工具，支持Web、Mobile、Mac、Windows等平台。它提供一站式在线设计平台服务，覆盖创意全场景和全流程，用户可以通过简单的拖、拉、拽方式，利用创客贴提供的大量图片、字体、模板等设计元素来制作所需的设计作品。', 'entityAI/logo_AIGC设计工具_创客贴.png', 'entityAI/cover_AIGC设计工具_创客贴.png', 6, 'chuangketie', 1.8333333333333333, 1.1666666666666667, 2.1666666666666665, 1.5, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (85, '设计宝藏', 'http://www.shejibaozang.com', '一个致力于提供免费资源的宝藏网站。', 'entityAI/logo_AIGC设计工具_设计宝藏.png', 'entityAI/cover_AIGC设计工具_设计宝藏.png', 6, 'shejibaozang', 3.5, 0.6666666666666666, 3.5, 4.333333333333333, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (86, '千图网', 'https://www.58pic.com/?from=aigc', '千图网是一个综合性的设计素材平台，提供从高清图片到PPT模板、视频模板等多样化的设计资源。', 'entityAI/logo_AIGC设计工具_千图网.png', 'entityAI/cover_AIGC设计工具_千图网.png', 6, 'qiantuwang', 3.8333333333333335, 2.8333333333333335, 3.3333333333333335, 2.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (87, '智绘设计', 'https://taishan.qq.com/brand', '腾讯云智绘（AI Design Creative），是腾讯推出的面向个人创作者、中小型企业在泛内容领域的素材智能化设计生产平台，提供在线工具创作各类形态素材，可用于各行业新媒体等运营。为企业提供深度定制接口，丰富优质的创意素材，秒速海量的生产服务，稳定可靠的输出品质，助力用户与企业达成增效降本目标。', 'entityAI/logo_AIGC设计工具_智绘设计.png', 'entityAI/cover_AIGC设计工具_智绘设计.png', 6, 'zhihuisheji', 1.6666666666666667, 1.5, 4.166666666666667, 2.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (88, '摹客', 'https://www.mockplus.cn', '摹客为产品开发团队提供全流程协作、原型设计、UI设计和设计规范管理支持。摹客可以自产出原型及高保真设计，也支持多款主流设计工具（Figma/Sketch/PS/XD/Axure等）的设计稿交付，团队成员在产品、设计到开发的各个工作环节，使用不同设计工具，可通过摹客平台协同工作。为助力企业数字化和在线化，摹客为企业提供私有部署和定制化服务，以“快和简单”的产品特性，帮助企业提升设计效能、降低成本。', 'entityAI/logo_AIGC设计工具_摹客.png', 'entityAI/cover_AIGC设计工具_摹客.png', 6, 'moke', 3.1666666666666665, 3.3333333333333335, 2.8333333333333335, 3.1666666666666665, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (89, '图界网', 'https://www.tujie66.com/ ', '图界网 是国内保持创新的素材设计平台', 'entityAI/logo_AIGC设计工具_图界网.png', 'entityAI/cover_AIGC设计工具_图界网.png', 6, 'tujiewang', 2.3333333333333335, 4.333333333333333, 2.0, 3.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (90, '图怪兽AI设计', 'https://818ps.com/aihaibao', 'AI在线设计工具，一键生成海报热门模版', 'entityAI/logo_AIGC设计工具_图怪兽AI设计.png', 'entityAI/cover_AIGC设计工具_图怪兽AI设计.png', 6, 'tuguaishouAIsheji', 2.0, 1.6666666666666667, 1.5, 2.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (91, '潮际好麦', 'https://marketing.k-fashionshop.com?relCode=J1P9TJD2', 'AI 电商营销平台，助力电商从业者高效创作', 'entityAI/logo_AIGC设计工具_潮际好麦.png', 'entityAI/cover_AIGC设计工具_潮际好麦.png', 6, 'chaojihaomai', 2.1666666666666665, 2.5, 3.3333333333333335, 1.3333333333333333, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (92, '墨刀AI', 'https://modao.cc', '墨刀（modao.cc）是一款隶属于万兴科技集团的在线原型设计与协同工具，旨在打通产品设计、研发和销售团队之间的协作，实现原型设计、设计、流程、思维导图的一体化。它不仅支持用户搭建产品原型和演示项目效果，还作为一个协作平台，允许项目成员协作编辑和审阅文档。', 'entityAI/logo_AIGC设计工具_墨刀AI.png', 'entityAI/cover_AIGC设计工具_墨刀AI.png', 6, 'modaoAI', 4.666666666666667, 3.5, 0.6666666666666666, 1.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (93, '因赛AIGC', 'https://gpt.idealead.com', '因赛AIGC解决营销全链路应用场景', 'entityAI/logo_AIGC设计工具_因赛AIGC.png', 'entityAI/cover_AIGC设计工具_因赛AIGC.png', 6, 'yinsaiAIGC', 2.1666666666666665, 2.0, 2.6666666666666665, 1.8333333333333333, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (94, 'MasterGo', 'https://mastergo.com', 'MasterGo是一款面向团队的专业在线UI/UX设计工具，支持多达500人同时在线协同工作。它不仅仅是一个设计工具，而是一个贯穿产品设计研发全链条的在线协作平台，实现了设计师、产品经理和工程师之间的协同工作。', 'entityAI/logo_AIGC设计工具_MasterGo.png', 'entityAI/cover_AIGC设计工具_MasterGo.png', 6, 'MasterGo', 0.5, 1.5, 4.0, 2.5, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (95, '千鹿设计助手', 'https://www.qianlu.cc', '一款为设计师量身打造的AI桌面助手', 'entityAI/logo_AIGC设计工具_千鹿设计助手.png', 'entityAI/cover_AIGC设计工具_千鹿设计助手.png', 6, 'qianlushejizhushou', 3.0, 3.25, 1.75, 0.75, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (96, 'AI智能小秘', 'http://www.aiznxm.com', '这款AI产品以其创新技术和多样化功能，为用户提供了一个全面、高效的图像处理和创作平台，极大地丰富了数字内容创作的边界。', 'entityAI/logo_AIGC设计工具_AI智能小秘.png', 'entityAI/cover_AIGC设计工具_AI智能小秘.png', 6, 'AIzhinengxiaomi', 3.25, 4.5, 0.5, 1.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (97, '易企秀 – 小易AI', 'https://ai.eqxiu.com', '无论是营销人员、设计师还是普通用户，都可以利用这个工具提升工作效率，创造出更具吸引力的视觉和文案作品。随着AI技术的不断进步，小易AI有望成为创意产业中的重要辅助工具。', 'entityAI/logo_AIGC设计工具_易企秀 – 小易AI.png', 'entityAI/cover_AIGC设计工具_易企秀 – 小易AI.png', 6, 'yiqixiu – xiaoyiAI', 2.5, 1.0, 2.0, 2.75, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (98, 'IdGPT【工业设计垂直领域AI平台】', 'https://www.id-gpt.com', 'IdGPT-工业设计领域Ai创意平台', 'entityAI/logo_AIGC设计工具_IdGPT【工业设计垂直领域AI平台】.png', 'entityAI/cover_AIGC设计工具_IdGPT【工业设计垂直领域AI平台】.png', 6, 'IdGPT【gongyeshejichuizhilingyuAIpingtai】', 2.25, 2.75, 2.0, 2.25, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (99, '创自由', 'https://www.chuangziyou.com', '致力于帮助电商、自媒体和传统企业的AI超强AI工具', 'entityAI/logo_AIGC设计工具_创自由.png', 'entityAI/cover_AIGC设计工具_创自由.png', 6, 'chuangziyou', 4.75, 2.5, 2.25, 2.5, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (100, 'Motiff', 'https://motiff.com', 'AI时代设计工具', 'entityAI/logo_AIGC设计工具_Motiff.png', 'entityAI/cover_AIGC设计工具_Motiff.png', 6, 'Motiff', 0.75, 0.75, 3.25, 2.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (101, '即时设计', 'https://ad.js.design/special/ui/?source=ldx&plan=6b2ead8ae3807096', '即时设计是一个强大的UI设计工具，它通过提供实时协作、AI辅助设计、跨平台使用和全流程体验等功能，帮助设计团队提高工作效率和产品质量。', 'entityAI/logo_AIGC设计工具_即时设计.png', 'entityAI/cover_AIGC设计工具_即时设计.png', 6, 'jishisheji', 2.75, 0.5, 2.75, 1.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (102, '琅琅配音', 'https://lang123.top?rmd=62892', '琅琅配音是一款卓越的智能文本转语音工具，提供语音合成服务。', 'entityAI/logo_AIGC音频工具_琅琅配音.png', 'entityAI/cover_AIGC音频工具_琅琅配音.png', 7, 'langlangpeiyin', 1.75, 1.5, 3.5, 1.5, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (103, '标贝悦读AI配音', 'https://yuedu.data-baker.com/?source=AIGC', '标贝悦读作为一个在线文字转语音软件，以其快速、逼真的语音合成效果和丰富的发音人角色，适用于视频配音、美食教程、知识科普、生活妙招分享等多种场景。', 'entityAI/logo_AIGC音频工具_标贝悦读AI配音.png', 'entityAI/cover_AIGC音频工具_标贝悦读AI配音.png', 7, 'biaobeiyueduAIpeiyin', 1.25, 3.25, 2.5, 2.5, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (104, '魔音工坊', 'https://www.moyin.com/?channelCode=AIGC_20231020', '魔音工坊是由北京小问智能科技有限公司开发的一款配音软件，为用户提供一站式AI配音服务。它被广泛应用于短视频制作、有声书、广告、宣传纪录片等领域，是一款专业的AI语音配音与剪辑工具。', 'entityAI/logo_AIGC音频工具_魔音工坊.png', 'entityAI/cover_AIGC音频工具_魔音工坊.png', 7, 'moyingongfang', 1.25, 1.25, 2.25, 3.25, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (105, '逗哥配音神器', 'https://douge.club/index?from=aaQbYf', '逗哥配音神器是一个功能全面的在线配音平台，提供了从文案输入到配音生成、下载及字幕制作的一站式服务。', 'entityAI/logo_AIGC音频工具_逗哥配音神器.png', 'entityAI/cover_AIGC音频工具_逗哥配音神器.png', 7, 'dougepeiyinshenqi', 2.0, 1.0, 0.25, 1.5, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (106, 'TTSMaker马克配音', 'https://ttsmaker.cn', '免费的AI配音平台，可以将文本转换成语音，支持50多种语言和300多种语音风格', 'entityAI/logo_AIGC音频工具_TTSMaker马克配音.png', 'entityAI/cover_AIGC音频工具_TTSMaker马克配音.png', 7, 'TTSMakermakepeiyin', 0.75, 2.25, 3.0, 4.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (107, 'Text To Speech', 'https://www.text-to-speech.cn', '构建自然说话的应用和服务，从 147 种语言和变体中选择 456 种语音', 'entityAI/logo_AIGC音频工具_Text To Speech.png', 'entityAI/cover_AIGC音频工具_Text To Speech.png', 7, 'Text To Speech', 3.5, 4.5, 1.75, 2.5, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (108, 'Resemble AI', 'https://www.resemble.ai', 'Resemble.ai的AI语音生成器是一个完整的生成式语音AI工具包，允许您在几秒钟内创建类似人类的声音。', 'entityAI/logo_AIGC音频工具_Resemble AI.png', 'entityAI/cover_AIGC音频工具_Resemble AI.png', 7, 'Resemble AI', 4.0, 3.25, 1.5, 3.5, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (109, 'Narration Box', 'https://narrationbox.com', 'Narration Box是一种语音合成服务，用户可以创建画外音、旁白、有声读物、音频页面、播客等。它拥有超过700个人工智能增强的仿人叙述者，支持20多种语言，功能强大的语音编辑器，以及博客和新闻网站的音频小部件。它还包括常见问题解答、反馈、更新等资源。它是免费的，并提供了分发、分析、盈利等工具。', 'entityAI/logo_AIGC音频工具_Narration Box.png', 'entityAI/cover_AIGC音频工具_Narration Box.png', 7, 'Narration Box', 2.25, 2.75, 1.5, 0.5, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (110, 'LOVO.AI', 'https://lovo.ai', 'LOVO AI是一个功能强大的AI语音生成器，它通过提供多样化的语音选项和易用的编辑工具，帮助用户快速创建引人入胜的视频和音频内容。', 'entityAI/logo_AIGC音频工具_LOVO.AI.png', 'entityAI/cover_AIGC音频工具_LOVO.AI.png', 7, 'LOVO.AI', 2.5, 2.5, 1.5, 4.25, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (111, 'Resemble AI', 'https://www.resemble.ai', 'Resemble AI是一个在线文本转语音平台，允许用户在30秒内将任何书面文本转换为音频文件。它提供了16种多种语言的国际声音和一个表达性内容编辑器来定制声音的输出。', 'entityAI/logo_AIGC音频工具_Resemble AI.png', 'entityAI/cover_AIGC音频工具_Resemble AI.png', 7, 'Resemble AI', 2.25, 1.25, 2.5, 0.5, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (112, 'Speechify', 'https://speechify.com', 'Speechify是一款文本转语音的应用程序，通过将文本转换成自然的声音，帮助你理解和记住更多你所阅读的内容。它可以在Chrome、iOS、Android和Mac上使用。', 'entityAI/logo_AIGC音频工具_Speechify.png', 'entityAI/cover_AIGC音频工具_Speechify.png', 7, 'Speechify', 0.75, 2.75, 2.5, 4.25, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (113, 'Uberduck', 'https://uberduck.ai', 'Uberduck是一个开源的语音AI社区，可以帮助用户在几分钟内通过api创建人工智能生成的音频应用程序。它允许用户使用5000 +富有表现力的声音制作AI画外音，并使用他们的AI生成的说唱工具创建自己的自定义语音克隆。', 'entityAI/logo_AIGC音频工具_Uberduck.png', 'entityAI/cover_AIGC音频工具_Uberduck.png', 7, 'Uberduck', 3.25, 2.5, 3.25, 4.5, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (114, '声咔AI配音', 'https://peiyin.soundcos.com', '声咔AI配音是在线配音软件平台，垂直深度音频效率工具，支持30多种个性化调音功能等，限制少对用户友好。', 'entityAI/logo_AIGC音频工具_声咔AI配音.png', 'entityAI/cover_AIGC音频工具_声咔AI配音.png', 7, 'shengkaAIpeiyin', 3.25, 0.25, 2.75, 2.75, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (115, 'Dubbingx', 'https://www.dubbingx.com', '全球唯一、多情绪、多语态、全可控的AI配音产品', 'entityAI/logo_AIGC音频工具_Dubbingx.png', 'entityAI/cover_AIGC音频工具_Dubbingx.png', 7, 'Dubbingx', 4.0, 2.0, 2.25, 2.25, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (116, 'LiSTNR', 'https://www.listnr.com', 'Listnr是一个人工智能语音生成器和文本到语音的在线工具，允许用户从142种不同语言的900多个声音的文本创建逼真的画外音。', 'entityAI/logo_AIGC音频工具_LiSTNR.png', 'entityAI/cover_AIGC音频工具_LiSTNR.png', 7, 'LiSTNR', 0.0, 3.0, 1.25, 2.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (117, 'Kits AI', 'https://www.kits.ai', 'Kits AI是一款用于音乐家使用和创建AI语音的AI语音生成和免费AI语音训练平台。', 'entityAI/logo_AIGC音频工具_Kits AI.png', 'entityAI/cover_AIGC音频工具_Kits AI.png', 7, 'Kits AI', 2.25, 2.75, 2.75, 5.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (118, 'WellSaid labs', 'https://wellsaidlabs.com', 'WellSaid是一款人工智能文本转语音工具，允许用户根据文本创建真实、自然的画外音。它提供了一系列语音化身，并帮助团队在项目上协作，允许更快的生产时间。它适用于企业，可用于各种应用，如有声书、营销、客户支持等等。', 'entityAI/logo_AIGC音频工具_WellSaid labs.png', 'entityAI/cover_AIGC音频工具_WellSaid labs.png', 7, 'WellSaid labs', 1.0, 2.0, 0.5, 3.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (119, 'NaturalReader', 'https://www.naturalreaders.com', 'NaturalReaders是一个提供文本到语音转换服务的网站。', 'entityAI/logo_AIGC音频工具_NaturalReader.png', 'entityAI/cover_AIGC音频工具_NaturalReader.png', 7, 'NaturalReader', 1.25, 0.75, 0.5, 2.25, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (120, 'Azure AI', 'https://azure.microsoft.com/zh-cn/products/ai-services/text-to-speech', 'Azure AI 语音服务为用户提供了一套全面的语音处理解决方案，支持多种语言，具备高度的自定义能力，适用于各种规模的公司和多样化的应用场景。', 'entityAI/logo_AIGC音频工具_Azure AI.png', 'entityAI/cover_AIGC音频工具_Azure AI.png', 7, 'Azure AI', 3.0, 1.5, 1.0, 1.75, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (121, '酷音', 'http://ai.kuyin.cn', '酷音网是一个真人配音与AI配音、视频拍摄与制作、音乐作词与谱曲、视频策划与创意等领域的创作、交易、推广运营于一体的音视频交易服务平台，致力于打造专注音视频领域的商业生态圈。', 'entityAI/logo_AIGC音频工具_酷音.png', 'entityAI/cover_AIGC音频工具_酷音.png', 7, 'kuyin', 1.5, 1.25, 3.5, 1.5, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (122, '音子AI', 'https://www.yinziai.com', '音子AI利用人工智能技术提供了一系列便捷的音频处理服务，无论是音乐制作的音轨分离，还是有声读物的文本转语音，都能满足用户的不同需求。', 'entityAI/logo_AIGC音频工具_音子AI.png', 'entityAI/cover_AIGC音频工具_音子AI.png', 7, 'yinziAI', 2.75, 3.0, 2.25, 1.75, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (123, 'MotionSound', 'https://motionsound.yoo-ai.com', 'MotionSound是一款智能AI语音生成器，采用领先的语音合成技术，利用深度学习算法和自然语言处理技术，生成自然流畅、声音清晰、表达准确的语音。这款工具支持多种语言和声音类型，并提供丰富的声音控制选项，使用户能够自由定制所需的语音。', 'entityAI/logo_AIGC音频工具_MotionSound.png', 'entityAI/cover_AIGC音频工具_MotionSound.png', 7, 'MotionSound', 1.75, 1.25, 1.5, 1.25, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (124, 'Rask.ai', 'https://www.rask.ai', 'Rask.ai平台以其自动化和智能化的翻译及配音服务，帮助企业节省时间和成本，同时提高内容的全球可访问性。', 'entityAI/logo_AIGC音频工具_Rask.ai.png', 'entityAI/cover_AIGC音频工具_Rask.ai.png', 7, 'Rask.ai', 2.25, 2.75, 1.75, 2.25, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (125, 'Poly.ai', 'https://poly.ai', '我们现在正在构建下一代语音助手，能够在客户服务中处理真正的人类对话。', 'entityAI/logo_AIGC音频工具_Poly.ai.png', 'entityAI/cover_AIGC音频工具_Poly.ai.png', 7, 'Poly.ai', 3.75, 2.25, 2.75, 2.25, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (126, 'iSlide PPT', 'https://www.islide.cc?mtm_campaign=AIGC', 'iSlide是一款由AI赋能的PPT制作工具，支持AI一键生成、导入文档生成以及上传模板生成PPT，内置8大资源库，超过1400w+PPT素材资源，包含模板、图示、图表、图片等。支持PPT一键美化、智能编辑、AI润色等，支持多格式文件导出，助力快速产出高质量PPT！', 'entityAI/logo_AIGC办公效率_iSlide PPT.png', 'entityAI/cover_AIGC办公效率_iSlide PPT.png', 8, 'iSlide PPT', 4.75, 1.5, 2.75, 3.5, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (127, '全智能AI一键生成PPT', 'https://www.aippt.cn/?utm_type=Navweb&utm_source=aigc&utm_page=aippt&utm_plan=ppt&utm_unit=aigc&utm_keyword=39756', 'AiPPT是一款创新的AI辅助PPT制作工具，通过智能化的一键生成和模板更换功能，极大地提升了用户制作PPT的效率和质量。', 'entityAI/logo_AIGC办公效率_全智能AI一键生成PPT.png', 'entityAI/cover_AIGC办公效率_全智能AI一键生成PPT.png', 8, 'quanzhinengAIyijianshengchengPPT', 3.0, 2.5, 4.0, 2.25, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (128, 'ChatPPT', 'https://www.chat-ppt.com/?channel=aigc.cn', 'ChatPPT是一个创新的AI驱动的PPT生成工具，它通过对话式交互和全流程AI创作，大幅简化了PPT的制作过程。', 'entityAI/logo_AIGC办公效率_ChatPPT.png', 'entityAI/cover_AIGC办公效率_ChatPPT.png', 8, 'ChatPPT', 3.5, 1.5, 4.75, 0.5, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (129, '爱设计PPT', 'https://ppt.isheji.com/?utm_type=AIGC&utm_source=aigc&utm_page=aippt&utm_plan=ppt&utm_unit=aigc&utm_keyword=129548', '爱设计PPT是一款AI驱动的PPT制作神器', 'entityAI/logo_AIGC办公效率_爱设计PPT.png', 'entityAI/cover_AIGC办公效率_爱设计PPT.png', 8, 'aishejiPPT', 0.75, 2.0, 4.0, 4.25, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (130, '歌者PPT', 'https://gezhe.com/r/UJ94k6K', '一键智能生成，内置海量模板，支持在线编辑美化，轻松做出令人惊艳的 PPT', 'entityAI/logo_AIGC办公效率_歌者PPT.png', 'entityAI/cover_AIGC办公效率_歌者PPT.png', 8, 'gezhePPT', 3.0, 3.0, 0.75, 2.75, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (131, '塔猫ChatPPT', 'http://www.tamao.fun:5277/?promotion_code=aigc', '仅需一句话，智能生成整套PPT文件', 'entityAI/logo_AIGC办公效率_塔猫ChatPPT.png', 'entityAI/cover_AIGC办公效率_塔猫ChatPPT.png', 8, 'tamaoChatPPT', 0.5, 1.0, 2.0, 3.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (132, 'boardmix博思白板-AIPPT', 'https://boardmix.cn/ai-powerpoint', '自定义主题，可选风格，多人协同，轻松制作出令人惊艳的演示文档', 'entityAI/logo_AIGC办公效率_boardmix博思白板-AIPPT.png', 'entityAI/cover_AIGC办公效率_boardmix博思白板-AIPPT.png', 8, 'boardmixbosibaiban-AIPPT', 0.0, 1.75, 3.25, 2.5, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (133, '讯飞智文', 'https://zhiwen.xfyun.cn', '自动生成令人印象深刻的PPT文档', 'entityAI/logo_AIGC办公效率_讯飞智文.png', 'entityAI/cover_AIGC办公效率_讯飞智文.png', 8, 'xunfeizhiwen', 0.5, 2.25, 2.0, 4.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (134, '轻竹办公-AI一键生成PPT', 'https://qzoffice.com/?from=aigc', 'AI一键生成精美PPT，海量模板任选', 'entityAI/logo_AIGC办公效率_轻竹办公-AI一键生成PPT.png', 'entityAI/cover_AIGC办公效率_轻竹办公-AI一键生成PPT.png', 8, 'qingzhubangong-AIyijianshengchengPPT', 3.0, 1.5, 4.5, 2.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (135, 'Canva可画', 'https://www.canva.cn/create/ppt-slides', '免费PPT制作工具，轻松搞定PPT设计', 'entityAI/logo_AIGC办公效率_Canva可画.png', 'entityAI/cover_AIGC办公效率_Canva可画.png', 8, 'Canvakehua', 1.75, 2.75, 0.0, 1.5, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (136, 'MotionGo官网', 'https://motion.yoo-ai.com', '让PPT动效、动画表达更专业', 'entityAI/logo_AIGC办公效率_MotionGo官网.png', 'entityAI/cover_AIGC办公效率_MotionGo官网.png', 8, 'MotionGoguanwang', 1.5, 3.75, 1.25, 2.5, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (137, '麦当秀智能演示系统', 'https://www.mindshow.vip?from=aigc.cn', '麦当秀｜MINDSHOW是一款百万用户正在使用的三分钟生成一份PPT的AI应用系统', 'entityAI/logo_AIGC办公效率_麦当秀智能演示系统.png', 'entityAI/cover_AIGC办公效率_麦当秀智能演示系统.png', 8, 'maidangxiuzhinengyanshixitong', 4.75, 2.75, 4.75, 0.75, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (138, '文多多AIPPT', 'https://docmee.cn/?source=aigc.cn', '仅需一分钟，文多多帮您制作专业PPT!', 'entityAI/logo_AIGC办公效率_文多多AIPPT.png', 'entityAI/cover_AIGC办公效率_文多多AIPPT.png', 8, 'wenduoduoAIPPT', 1.75, 2.25, 2.25, 2.25, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (139, 'huippt', 'https://www.huippt.com/?from_source=aigc.cn', '综合先进AI技术，自动生成并优化PPT大纲及内容。真正做到无需二次修改，内容高质量丰富的产出效果。huippt所生成的PPT内容均可二次修改并提供ppt源文件，怕加班就用会PPT，你会了吗！', 'entityAI/logo_AIGC办公效率_huippt.png', 'entityAI/cover_AIGC办公效率_huippt.png', 8, 'huippt', 0.75, 1.75, 2.5, 2.25, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (140, '美图AI PPT', 'https://design.meitu.com/ppt', '免费在线AI生成PPT设计工具', 'entityAI/logo_AIGC办公效率_美图AI PPT.png', 'entityAI/cover_AIGC办公效率_美图AI PPT.png', 8, 'meituAI PPT', 2.25, 0.75, 3.75, 0.75, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (141, '博思AIPPT', 'https://pptgo.cn', '博思AIPPT是一个强大的在线PPT辅助工具，它通过AI技术简化了PPT的创建过程，提高了制作效率，同时保证了演示文稿的专业性和吸引力。', 'entityAI/logo_AIGC办公效率_博思AIPPT.png', 'entityAI/cover_AIGC办公效率_博思AIPPT.png', 8, 'bosiAIPPT', 1.0, 2.75, 1.75, 2.75, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (142, 'PPT百科', 'https://www.pptwiki.com', '基于人工智能技术的在线PPT生成工具，免费优质PPT模板、PPT课件免费下载网站', 'entityAI/logo_AIGC办公效率_PPT百科.png', 'entityAI/cover_AIGC办公效率_PPT百科.png', 8, 'PPTbaike', 1.5, 2.25, 3.5, 3.25, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (143, 'PPT世界', 'https://www.pptx.cn/aigc', '拥有海量优秀PPT设计资源', 'entityAI/logo_AIGC办公效率_PPT世界.png', 'entityAI/cover_AIGC办公效率_PPT世界.png', 8, 'PPTshijie', 2.0, 2.25, 2.75, 1.75, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (144, 'GaiPPT', 'https://www.gaippt.com', 'PPT美化神器，据内容生成带有高度结构化可视化的PPT版式', 'entityAI/logo_AIGC办公效率_GaiPPT.png', 'entityAI/cover_AIGC办公效率_GaiPPT.png', 8, 'GaiPPT', 1.75, 2.0, 3.25, 0.75, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (145, 'Slidesgo', 'https://slidesgo.com/ai-presentations', 'AI Presentation Maker是解决PPT制作难题的理想选择', 'entityAI/logo_AIGC办公效率_Slidesgo.png', 'entityAI/cover_AIGC办公效率_Slidesgo.png', 8, 'Slidesgo', 1.25, 3.0, 1.25, 3.25, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (146, '万兴智演', 'https://zhiyan.wondershare.cn/app/dashboard/?refer=aigc.cn', '泛知识AI视频演示工具，让讲演更酷炫出圈，是名师必备讲演神器', 'entityAI/logo_AIGC办公效率_万兴智演.png', 'entityAI/cover_AIGC办公效率_万兴智演.png', 8, 'wanxingzhiyan', 0.75, 1.75, 3.75, 4.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (147, '彩漩PPT', 'https://caixuan.cc', '彩漩PPT是一个一站式 PPT 协作分享平台。这个平台利用人工智能技术帮助用户在 PPT 创作过程中提高效率和质量。', 'entityAI/logo_AIGC办公效率_彩漩PPT.png', 'entityAI/cover_AIGC办公效率_彩漩PPT.png', 8, 'caixuanPPT', 2.75, 1.5, 1.25, 3.25, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (148, '秒出PPT', 'https://10sppt.com/pptx', '秒出PPT是一个高效的PPT制作工具，它通过简化设计流程，使用户能够在短时间内创建出专业的演示文稿。', 'entityAI/logo_AIGC办公效率_秒出PPT.png', 'entityAI/cover_AIGC办公效率_秒出PPT.png', 8, 'miaochuPPT', 0.5, 3.75, 1.75, 3.25, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (149, 'Gamma App', 'https://gamma.app', '在线网页版创建演示文稿的工具', 'entityAI/logo_AIGC办公效率_Gamma App.png', 'entityAI/cover_AIGC办公效率_Gamma App.png', 8, 'Gamma App', 2.75, 2.75, 3.5, 1.75, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (150, '每天一节免费AIGC视频课', 'https://huke88.com/threeddigital/34-4332-0-0-0-1-1-16-1/?identity=da9e988089a4', 'AIGC教程涵盖了GPT进阶教程、AI绘画教程(例如Midjourney、Stable Diffusion)、电商设计等多种AI设计培训课。', 'entityAI/logo_AIGC学习资源_每天一节免费AIGC视频课.png', 'entityAI/cover_AIGC学习资源_每天一节免费AIGC视频课.png', 10, 'meitianyijiemianfeiAIGCshipinke', 0.75, 1.25, 2.5, 4.5, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (151, '常用AIGC工具注册和使用', 'https://huke88.com/threeddigital/34-4332-0-0-0-1-1-16-1/?identity=da9e988089a4', 'AIGC工具注册和使用共有118个教程', 'entityAI/logo_AIGC学习资源_常用AIGC工具注册和使用.png', 'entityAI/cover_AIGC学习资源_常用AIGC工具注册和使用.png', 10, 'changyongAIGCgongjuzhuceheshiyong', 2.25, 3.25, 2.75, 0.75, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (152, 'AI提示词应用课', 'https://huke88.com/threeddigital/34-4596-0-0-0-1-1-16-1/?identity=da9e988089a4', '提示词目前共有127个教程', 'entityAI/logo_AIGC学习资源_AI提示词应用课.png', 'entityAI/cover_AIGC学习资源_AI提示词应用课.png', 10, 'AItishiciyingyongke', 0.25, 2.25, 2.0, 3.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (153, 'AI绘画课', 'https://huke88.com/threeddigital/34-4330-0-0-0-1-1-16-1/?identity=da9e988089a4', 'AI绘画课目前共有529个教程', 'entityAI/logo_AIGC学习资源_AI绘画课.png', 'entityAI/cover_AIGC学习资源_AI绘画课.png', 10, 'AIhuihuake', 2.0, 3.75, 2.25, 0.75, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (154, 'AI三维课', 'https://huke88.com/threeddigital/34-4331-0-0-0-1-1-16-1/?identity=da9e988089a4', 'AI三维课目前共有22个教程', 'entityAI/logo_AIGC学习资源_AI三维课.png', 'entityAI/cover_AIGC学习资源_AI三维课.png', 10, 'AIsanweike', 4.25, 1.0, 3.5, 1.25, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (155, 'AIGC工具使用小技巧', 'https://huke88.com/threeddigital/34-4602-0-0-0-1-1-16-1/?identity=da9e988089a4', '手把手教你用AI做视频26个教程', 'entityAI/logo_AIGC学习资源_AIGC工具使用小技巧.png', 'entityAI/cover_AIGC学习资源_AIGC工具使用小技巧.png', 10, 'AIGCgongjushiyongxiaojiqiao', 1.75, 1.25, 2.75, 2.5, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (156, 'AI制作PPT课', 'https://huke88.com/threeddigital/34-4594-0-0-0-1-1-16-1/?identity=da9e988089a4', 'AI制作PPT自带的AI设计器，22个教程', 'entityAI/logo_AIGC学习资源_AI制作PPT课.png', 'entityAI/cover_AIGC学习资源_AI制作PPT课.png', 10, 'AIzhizuoPPTke', 1.75, 2.75, 3.75, 2.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (157, 'AI辅助Excel课', 'https://huke88.com/threeddigital/34-4595-0-0-0-1-1-16-1/?identity=da9e988089a4', 'GPT与Word VBA应用实战21个教程', 'entityAI/logo_AIGC学习资源_AI辅助Excel课.png', 'entityAI/cover_AIGC学习资源_AI辅助Excel课.png', 10, 'AIfuzhuExcelke', 1.25, 3.25, 3.25, 1.5, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (158, 'AI运营课', 'https://huke88.com/threeddigital/34-4593-0-0-0-1-1-16-1/?identity=da9e988089a4', '有了Notion AI，智能办公不在话下', 'entityAI/logo_AIGC学习资源_AI运营课.png', 'entityAI/cover_AIGC学习资源_AI运营课.png', 10, 'AIyunyingke', 3.75, 3.25, 3.0, 2.5, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (159, 'AI写作课', 'https://huke88.com/threeddigital/34-4590-0-0-0-1-1-16-1/?identity=da9e988089a4', '如何驾驭GPT为我们工作？7个教程', 'entityAI/logo_AIGC学习资源_AI写作课.png', 'entityAI/cover_AIGC学习资源_AI写作课.png', 10, 'AIxiezuoke', 2.0, 3.25, 3.25, 4.75, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (160, 'AI辅助室内设计', 'https://huke88.com/threeddigital/34-4597-0-0-0-1-1-16-1/?identity=da9e988089a4', 'Midjourney-快速生成可商用的室内场景', 'entityAI/logo_AIGC学习资源_AI辅助室内设计.png', 'entityAI/cover_AIGC学习资源_AI辅助室内设计.png', 10, 'AIfuzhushineisheji', 4.25, 2.0, 2.75, 3.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (161, 'AI图像处理', 'https://huke88.com/threeddigital/34-4598-0-0-0-1-1-16-1/?identity=da9e988089a4', 'AI图像处理目前共有187个教程', 'entityAI/logo_AIGC学习资源_AI图像处理.png', 'entityAI/cover_AIGC学习资源_AI图像处理.png', 10, 'AItuxiangchuli', 2.75, 2.75, 3.0, 2.25, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (162, 'Coze AI平台', 'https://www.coze.cn/?utm_medium=daohang&utm_source=aigc&utm_content=home&utm_id=0&utm_campaign=&utm_term=49156769u&utm_source_platform=', '海量 AI 应用免费用', 'entityAI/logo_AI 智能体平台_Coze AI平台.png', 'entityAI/cover_AI 智能体平台_Coze AI平台.png', 11, 'Coze AIpingtai', 2.75, 3.0, 3.0, 1.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (163, '豆包助手 – 抖音旗下AI产品', 'https://www.doubao.com?channel=AIGC&source=hw_db_aigc', '豆包是一款基于云雀模型构建的多功能人工智能工具和免费AI聊天机器人，能够理解用户需求并提供个性化服务。豆包提供网页端、Chrome浏览器插件、iOS、Android、Mac和Windows端应用程序，支持文案创作、PDF问答、长文本分析、图像生成、信息搜索与整合等功能。', 'entityAI/logo_AI 智能体平台_豆包助手 – 抖音旗下AI产品.png', 'entityAI/cover_AI 智能体平台_豆包助手 – 抖音旗下AI产品.png', 11, 'doubaozhushou – douyinqixiaAIchanpin', 3.5, 4.25, 1.75, 3.75, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (164, '智谱清言ChatGLM', 'https://chatglm.cn/apps?image=https%3A%2F%2Fsfile.chatglm.cn%2Factiveimg%2Fbdms%2F66b97e348217030036f486f1&open_from=ads_web_aigc&fr=ads_web_aigc', '智谱清言是一款基于人工智能技术的对话助手，遵循中国政府的立场和社会主义价值观，提供多领域知识问答、信息检索、文本生成等服务。', 'entityAI/logo_AI 智能体平台_智谱清言ChatGLM.png', 'entityAI/cover_AI 智能体平台_智谱清言ChatGLM.png', 11, 'zhipuqingyanChatGLM', 2.5, 3.0, 3.25, 1.5, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (165, 'Kimi+', 'https://volctrack.com/w/pJxYBwii', 'Kimi 是由月之暗面科技有限公司开发的人工智能助手。它具备多语言对话能力，擅长中文和英文，能够处理长文本，支持文件阅读和网址解析，具备搜索能力，并且能够结合搜索结果为用户提供回答。', 'entityAI/logo_AI 智能体平台_Kimi+.png', 'entityAI/cover_AI 智能体平台_Kimi+.png', 11, 'Kimi+', 1.75, 2.25, 2.0, 3.5, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (166, '百贝AI-企业级智能体平台', 'https://www.baibei-ai.com', '外贸、跨境行业首选的AI智能体平台，轻松打造企业专家级的AI数字员工。从客户开发、客户背调、询盘分析，到客服、美工设计等全链路加速企业AI数智化转型。', 'entityAI/logo_AI 智能体平台_百贝AI-企业级智能体平台.png', 'entityAI/cover_AI 智能体平台_百贝AI-企业级智能体平台.png', 11, 'baibeiAI-qiyejizhinengtipingtai', 4.75, 1.75, 2.5, 1.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (167, '司马诸葛', 'https://smartchoose.cn', '基于企业知识文档，就可训练专属AI数字员工', 'entityAI/logo_AI 智能体平台_司马诸葛.png', 'entityAI/cover_AI 智能体平台_司马诸葛.png', 11, 'simazhuge', 2.75, 3.75, 1.0, 1.75, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (168, 'Zion', 'https://www.functorz.com/zai', '一个全面的无代码平台，用于开发和集成AI智能体应用。它的特点包括一站式开发环境、灵活的生成式AI应用开发框架、多数据源支持、结构化输出、工具调用能力以及商业化应用开发的支持。', 'entityAI/logo_AI 智能体平台_Zion.png', 'entityAI/cover_AI 智能体平台_Zion.png', 11, 'Zion', 3.0, 1.25, 1.25, 3.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (169, '腾讯元器', 'https://yuanqi.tencent.com', '腾讯元器是腾讯推出的一站式AI智能体创作与分发平台，基于腾讯混元大模型', 'entityAI/logo_AI 智能体平台_腾讯元器.png', 'entityAI/cover_AI 智能体平台_腾讯元器.png', 11, 'tengxunyuanqi', 3.75, 3.0, 1.5, 3.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (170, 'Agent Q', 'https://www.multion.ai/blog/introducing-agent-q-research-breakthrough-for-the-next-generation-of-ai-agents-with-planning-and-self-healing-capabilities', 'MultiOn的Agent Q为自主网络代理设定了一个新的重要里程碑，结合了先进的搜索技术、AI自我批评和强化学习来克服当前的限制，代表着自主代理能力的重大飞跃。', 'entityAI/logo_AI 智能体平台_Agent Q.png', 'entityAI/cover_AI 智能体平台_Agent Q.png', 11, 'Agent Q', 3.75, 0.0, 3.25, 2.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (171, '天工AI助手', 'https://www.tiangong.cn', '天工AI是一个多功能的智能助手，它通过整合搜索、数据分析和智能预测等技术，为用户提供了一个全面、便捷和个性化的服务体验。', 'entityAI/logo_AI 智能体平台_天工AI助手.png', 'entityAI/cover_AI 智能体平台_天工AI助手.png', 11, 'tiangongAIzhushou', 4.0, 1.5, 2.25, 3.75, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (172, '钉钉AI助理', 'https://page.dingtalk.com/wow/dingtalk/default/dingtalk/I0HfYX4QStBIpLgxnZQe', '钉钉AI助理是一款集成了多种智能办公工具的综合性平台。它通过个性化和场景化的服务，大幅提高了工作效率和办公体验。', 'entityAI/logo_AI 智能体平台_钉钉AI助理.png', 'entityAI/cover_AI 智能体平台_钉钉AI助理.png', 11, 'dingdingAIzhuli', 2.75, 2.5, 2.5, 5.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (173, '文心智能体平台', 'https://agents.baidu.com', '文心智能体平台是由百度推出的基于文心大模型的Agent平台，支持开发者根据自身行业领域、应用场景，选取不同类型的开发方式。', 'entityAI/logo_AI 智能体平台_文心智能体平台.png', 'entityAI/cover_AI 智能体平台_文心智能体平台.png', 11, 'wenxinzhinengtipingtai', 2.25, 1.25, 1.5, 1.25, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (174, 'Lyzr AI', 'https://www.lyzr.ai', 'Lyzr AI提供了一个强大的平台，使用户能够快速构建和部署自主的AI Agents。通过AIMS门户，用户可以轻松管理、监控AI Agents的性能，并确保它们的安全性和合规性。', 'entityAI/logo_AI 智能体平台_Lyzr AI.png', 'entityAI/cover_AI 智能体平台_Lyzr AI.png', 11, 'Lyzr AI', 1.75, 1.25, 2.5, 1.75, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (175, '飞书智能伙伴', 'https://www.feishu.cn/product/ai_companion', '飞书智能伙伴是字节跳动旗下企业办公和协作平台飞书最新推出的AI办公助手，能在多种工作场景中发挥作用，例如帮助用户提炼会议要点、总结未读消息、分析PDF与音视频、自动续写或生成文档、表格、邮件、思维导图、问卷等。飞书智能伙伴帮助企业拥抱AI，提升办公体验，增强业务智能，开启新时代办公。', 'entityAI/logo_AI 智能体平台_飞书智能伙伴.png', 'entityAI/cover_AI 智能体平台_飞书智能伙伴.png', 11, 'feishuzhinenghuoban', 3.5, 1.75, 1.5, 1.5, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (176, '集简云', 'https://www.jijyun.cn', '集简云是一个强大的企业自动化工具，它通过提供无代码的可视化操作界面，简化了软件集成的复杂性，使得业务流程自动化变得简单快捷。', 'entityAI/logo_AI 智能体平台_集简云.png', 'entityAI/cover_AI 智能体平台_集简云.png', 11, 'jijianyun', 3.0, 3.5, 1.25, 3.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (177, '语聚AI', 'https://yuju.jijyun.cn', '语聚AI是一个强大的AI语言模型工具，它通过集成企业知识文档和多种语言模型，提供了一个能够创造性生成内容并提升企业知识管理能力的智能助手。', 'entityAI/logo_AI 智能体平台_语聚AI.png', 'entityAI/cover_AI 智能体平台_语聚AI.png', 11, 'yujuAI', 3.5, 2.75, 3.25, 2.25, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (178, 'Firsthand AI', 'https://www.firsthand.ai', 'Firsthand AI提供了一个强大的平台，使品牌和出版商能够通过AI Agents与消费者进行个性化对话，同时完全控制自己的数据和内容。', 'entityAI/logo_AI 智能体平台_Firsthand AI.png', 'entityAI/cover_AI 智能体平台_Firsthand AI.png', 11, 'Firsthand AI', 3.25, 4.0, 2.75, 3.5, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (179, 'Bitscale', 'https://bitscale.ai', 'Bitscale是一个强大的AI平台，它通过提供易于使用的电子表格界面，帮助增长团队构建可扩展的工作流，从而简化了市场研究、个性化推广和内容生成的过程。', 'entityAI/logo_AI 智能体平台_Bitscale.png', 'entityAI/cover_AI 智能体平台_Bitscale.png', 11, 'Bitscale', 3.0, 1.25, 2.75, 3.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (180, 'Agent.so', 'https://www.agent.so', 'Agent.so是一个创新的AI平台，通过易于训练的个性化AI Agents，为用户提供快速、定制化的服务。无论是个人还是企业，Agent.so都能提供强大的支持，帮助用户提高效率，实现目标。', 'entityAI/logo_AI 智能体平台_Agent.so.png', 'entityAI/cover_AI 智能体平台_Agent.so.png', 11, 'Agent.so', 3.5, 5.0, 0.75, 2.25, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (181, '实在智能', 'https://www.ai-indeed.com', '实在智能，一款基于AI+RPA技术的智能助理，他可以模拟人类操作和决策流程，来提高工作的效率', 'entityAI/logo_AI 智能体平台_实在智能.png', 'entityAI/cover_AI 智能体平台_实在智能.png', 11, 'shizaizhineng', 2.25, 2.5, 1.75, 3.25, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (182, 'Beam AI', 'https://beam.ai', 'Beam AI提供了一个功能强大的平台，使用户能够创建和定制AI Agents来自动化各种任务。通过AI Agent数据库、工具配置、任务模板和个性设置，Beam AI的AI Agents能够以高度自动化和个性化的方式执行复杂的工作流程。', 'entityAI/logo_AI 智能体平台_Beam AI.png', 'entityAI/cover_AI 智能体平台_Beam AI.png', 11, 'Beam AI', 4.5, 3.25, 3.0, 3.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (183, 'LightAI', 'https://www.lightai.com', 'LightAI是一个综合性的AI服务平台，通过提供AI销售和客服功能，帮助企业提升客户接待效率和销售业绩。', 'entityAI/logo_AI 智能体平台_LightAI.png', 'entityAI/cover_AI 智能体平台_LightAI.png', 11, 'LightAI', 3.75, 2.0, 1.25, 3.5, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (184, 'Anakin.ai', 'http://anakin.ai/zh-cn', '生成内容、图片、视频和声音；构建自动化工作流程、定制AI应用和智能代理。您专属的AI应用定制工作站。', 'entityAI/logo_AI 智能体平台_Anakin.ai.png', 'entityAI/cover_AI 智能体平台_Anakin.ai.png', 11, 'Anakin.ai', 3.25, 2.0, 2.5, 1.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (185, '智谱清言ChatGLM', 'https://chatglm.cn/apps?image=https%3A%2F%2Fsfile.chatglm.cn%2Factiveimg%2Fbdms%2F66b97e348217030036f486f1&open_from=ads_web_aigc&fr=ads_web_aigc', '智谱清言是一款基于人工智能技术的对话助手，遵循中国政府的立场和社会主义价值观，提供多领域知识问答、信息检索、文本生成等服务。', 'entityAI/logo_AI 大模型平台_智谱清言ChatGLM.png', 'entityAI/cover_AI 大模型平台_智谱清言ChatGLM.png', 12, 'zhipuqingyanChatGLM', 3.5, 2.0, 1.25, 3.5, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (186, '思必驰 DFM-2 大模型', 'https://www.duiopen.com', '思必驰 DFM-2 大模型作为思必驰的自研对话式语言大模型，展现了其在多模态交互和行业应用中的潜力。它通过结合先进的AI技术，为用户提供了更加智能化和个性化的体验，推动了智能语音交互技术在不同行业中的应用和发展。', 'entityAI/logo_AI 大模型平台_思必驰 DFM-2 大模型.png', 'entityAI/cover_AI 大模型平台_思必驰 DFM-2 大模型.png', 12, 'sibichi DFM-2 damoxing', 0.75, 2.5, 3.0, 0.75, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (187, '左医医疗大语言模型', 'https://open.zuoshouyisheng.com', '左手医生通过开放平台赋能医疗健康行业，为医疗机构、信息化厂商、医药企业、连锁药店、健康管理机构、智能硬件等合作伙伴提供多种类型的高质量智能医生服务。', 'entityAI/logo_AI 大模型平台_左医医疗大语言模型.png', 'entityAI/cover_AI 大模型平台_左医医疗大语言模型.png', 12, 'zuoyiyiliaodayuyanmoxing', 3.5, 4.25, 1.25, 3.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (188, '慧政大模型', 'https://www.huilan.com/web/cp/jsdz/hzdmxpt/index.shtml', '一个综合性的智慧政务工具，它通过智能化的手段，帮助政务工作人员提高工作效率，优化决策过程，并创造高质量的政务内容。', 'entityAI/logo_AI 大模型平台_慧政大模型.png', 'entityAI/cover_AI 大模型平台_慧政大模型.png', 12, 'huizhengdamoxing', 2.0, 3.25, 1.75, 3.75, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (189, '商汤商量SenseChat', 'https://chat.sensetime.com', '商汤商量SenseChat是由商汤科技推出的语言大模型，提供对话和文档理解服务，能够处理百科问答、图片理解、数学解答、代码编写等多种任务。', 'entityAI/logo_AI 大模型平台_商汤商量SenseChat.png', 'entityAI/cover_AI 大模型平台_商汤商量SenseChat.png', 12, 'shangtangshangliangSenseChat', 1.75, 3.5, 3.25, 3.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (190, '八斗智能', 'https://www.chatbot.cn/increase.html', '八斗智能的语义理解模型是一个强大的工具，它通过大规模预训练和行业特定的迁移学习，能够提供高度准确的语义理解服务。', 'entityAI/logo_AI 大模型平台_八斗智能.png', 'entityAI/cover_AI 大模型平台_八斗智能.png', 12, 'badouzhineng', 1.25, 2.25, 1.75, 2.5, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (191, '通义千问', 'https://tongyi.aliyun.com/qianwen', '通义千问是由阿里云推出的一种超大规模语言模型，它可以理解和回答各种领域的问题，包括常见、复杂甚至是少见的问题。它不仅是一个效率助手，也是一个点子生成机，可以帮助用户完成各种任务，如写邮件、写文章、写脚本、写情书、写诗等。此外，它还能提供娱乐功能，比如讲笑话、唱歌等。', 'entityAI/logo_AI 大模型平台_通义千问.png', 'entityAI/cover_AI 大模型平台_通义千问.png', 12, 'tongyiqianwen', 2.0, 1.75, 3.25, 1.75, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (192, '阶跃星辰', 'https://www.stepfun.com', '通过其领先的多模态理解和内容生成技术，为用户提供了一个高效、智能的工具', 'entityAI/logo_AI 大模型平台_阶跃星辰.png', 'entityAI/cover_AI 大模型平台_阶跃星辰.png', 12, 'jieyuexingchen', 2.25, 2.0, 2.5, 0.75, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (193, '原子回声AtomGPT大模型', 'https://grow.atomecho.cn', '原子回声AtomGPT大模型是一个不断学习和进步的中文大模型项目，它通过向用户展示模型的学习过程，提供了一个参与和观察模型成长的平台。', 'entityAI/logo_AI 大模型平台_原子回声AtomGPT大模型.png', 'entityAI/cover_AI 大模型平台_原子回声AtomGPT大模型.png', 12, 'yuanzihuishengAtomGPTdamoxing', 2.25, 3.0, 4.75, 2.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (194, '博看大模型', 'https://llm-pc.bookan.com.cn/?id=65889#/bk_llm_pc', '博看大模型是吉林外国语大学推出的一款多功能图书馆服务AI，它通过智能对话和信息检索功能，为用户提供了一个方便快捷的图书馆信息获取渠道。', 'entityAI/logo_AI 大模型平台_博看大模型.png', 'entityAI/cover_AI 大模型平台_博看大模型.png', 12, 'bokandamoxing', 3.0, 3.25, 1.0, 2.75, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (195, '语鲸大模型', 'https://lingowhale.com', '语鲸大模型是一个多功能的AI语言处理工具，它通过先进的算法和持续的学习，为用户提供高效、准确的语言服务。', 'entityAI/logo_AI 大模型平台_语鲸大模型.png', 'entityAI/cover_AI 大模型平台_语鲸大模型.png', 12, 'yujingdamoxing', 2.25, 3.75, 2.75, 3.75, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (196, '智星AI', 'https://www.wisstars.com', '智星AI作为一个多功能的人工智能对话软件，以其丰富的插件功能和不断扩展的插件库，为用户提供了一个灵活、有用的工具，以增强工作和日常生活的效率和乐趣。', 'entityAI/logo_AI 大模型平台_智星AI.png', 'entityAI/cover_AI 大模型平台_智星AI.png', 12, 'zhixingAI', 3.75, 4.0, 4.25, 1.75, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (197, '腾讯混元', 'https://hunyuan.tencent.com', '腾讯混元大模型是由腾讯研发的大语言模型，具备跨领域知识和自然语言理解能力，实现基于人机自然语言对话的方式，理解用户指令并执行任务，帮助用户实现人获取信息，知识和灵感。', 'entityAI/logo_AI 大模型平台_腾讯混元.png', 'entityAI/cover_AI 大模型平台_腾讯混元.png', 12, 'tengxunhunyuan', 2.0, 2.25, 4.0, 1.25, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (198, 'MiniMax 大语言模型', 'https://www.minimaxi.com', '它基于海量中文数据训练而成，拥有超过1000亿个参数，能够处理上百TB的文本数据。', 'entityAI/logo_AI 大模型平台_MiniMax 大语言模型.png', 'entityAI/cover_AI 大模型平台_MiniMax 大语言模型.png', 12, 'MiniMax dayuyanmoxing', 0.0, 1.75, 3.25, 2.25, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (199, '文心大模型', 'https://wenxin.baidu.com', '文心大模型是一种知识增强的自然语言处理（NLP）模型，由百度开发。它在技术开放日上首次亮相，展示了其在AI领域的最新技术突破和产业应用实践。', 'entityAI/logo_AI 大模型平台_文心大模型.png', 'entityAI/cover_AI 大模型平台_文心大模型.png', 12, 'wenxindamoxing', 4.25, 1.5, 0.0, 3.75, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (200, '蓝心大模型BlueLM', 'https://developers.vivo.com/product/ai/bluelm', '蓝心大模型（BlueLM）是vivo推出的自研通用大模型矩阵，包含十亿、百亿、千亿三个参数量级共5款，主要面向端侧和云端服务，用于复杂逻辑推理等应用场景。', 'entityAI/logo_AI 大模型平台_蓝心大模型BlueLM.png', 'entityAI/cover_AI 大模型平台_蓝心大模型BlueLM.png', 12, 'lanxindamoxingBlueLM', 1.25, 3.75, 3.5, 2.75, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (201, 'DeepSeek', 'https://www.deepseek.com', 'DeepSeek-V2是由杭州深度求索公司发布的第二代开源MoE模型，DeepSeek-V2 在中文综合能力与 GPT-4-Turbo，文心 4.0 等闭源模型在评测中处于同一梯队，英文综合能力英文综合能力（MT-Bench）与最强的开源模型 LLaMA3-70B 处于同一梯队，超过最强 MoE 开源模型 Mixtral8x22B，特别擅长数学、编程和逻辑推理任务。它在多个大型模型排行榜上名列前茅，支持长达128K的上下文长度，并提供开放源代码。', 'entityAI/logo_AI 大模型平台_DeepSeek.png', 'entityAI/cover_AI 大模型平台_DeepSeek.png', 12, 'DeepSeek', 1.25, 3.0, 1.75, 0.75, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (202, '盘古大模型', 'https://www.huaweicloud.com/product/pangu.html', '盘古大模型是华为云推出的全面AI解决方案，覆盖了自然语言处理、计算机视觉、多模态学习、预测分析和科学计算等多个领域。', 'entityAI/logo_AI 大模型平台_盘古大模型.png', 'entityAI/cover_AI 大模型平台_盘古大模型.png', 12, 'pangudamoxing', 3.25, 2.75, 2.75, 0.25, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (203, '讯飞星火认知大模型', 'https://xinghuo.xfyun.cn/desk?ch=xhweb_Squ', '讯飞星火认知大模型是由科大讯飞发布的大模型，具有7大核心能力，包括文本生成、语言理解、知识问答、逻辑推理、数学能力、代码能力、多模交互，对标ChatGPT。', 'entityAI/logo_AI 大模型平台_讯飞星火认知大模型.png', 'entityAI/cover_AI 大模型平台_讯飞星火认知大模型.png', 12, 'xunfeixinghuorenzhidamoxing', 1.0, 4.0, 1.5, 3.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (204, '火山方舟', 'https://www.volcengine.com/product/ark', '火山方舟是火山引擎推出的大模型服务平台，作为一个开放的MaaS（Model as a Service）平台，其愿景是让更多的企业和个人能够轻松地接入和使用大模型技术，实现体验创新、数据驱动和敏捷迭代。', 'entityAI/logo_AI 大模型平台_火山方舟.png', 'entityAI/cover_AI 大模型平台_火山方舟.png', 12, 'huoshanfangzhou', 3.25, 3.25, 3.25, 4.25, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (205, '元象大模型XChat', 'https://chat.xverse.cn', '元象大模型XChat是元象XVERSE推出的高性能AI产品，它通过自研技术，能够满足不同复杂度任务的需求，并在中文领域表现突出。', 'entityAI/logo_AI 大模型平台_元象大模型XChat.png', 'entityAI/cover_AI 大模型平台_元象大模型XChat.png', 12, 'yuanxiangdamoxingXChat', 1.25, 1.5, 2.75, 2.75, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (206, 'MOSS 复旦大模型', 'https://moss.fastnlp.top', '复旦大模型MOSS，正式开源了', 'entityAI/logo_AI 大模型平台_MOSS 复旦大模型.png', 'entityAI/cover_AI 大模型平台_MOSS 复旦大模型.png', 12, 'MOSS fudandamoxing', 1.0, 2.25, 0.25, 2.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (207, '封神榜-IDEA研究院', 'https://fengshenbang-lm.com', '封神榜-IDEA研究院是一套致力于中文认知智能的研究项目，它通过一系列先进的语言模型和多模态模型，推动了中文自然语言处理技术的发展。', 'entityAI/logo_AI 大模型平台_封神榜-IDEA研究院.png', 'entityAI/cover_AI 大模型平台_封神榜-IDEA研究院.png', 12, 'fengshenbang-IDEAyanjiuyuan', 3.25, 2.0, 1.5, 3.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (208, 'KwaiYii快意大模型', 'https://github.com/kwai/KwaiYii', 'KwaiYii快意大模型是快手AI团队研发的大规模语言模型，它在多个权威Benchmark上展现出卓越的性能，尤其在中英文跨学科专业能力、数理逻辑及代码能力方面表现突出。', 'entityAI/logo_AI 大模型平台_KwaiYii快意大模型.png', 'entityAI/cover_AI 大模型平台_KwaiYii快意大模型.png', 12, 'KwaiYiikuaiyidamoxing', 1.25, 2.75, 1.0, 3.25, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (209, '智谱API-免费领取', 'https://www.bigmodel.cn/login?utm_source=3&utm_campaign=xmh0708&_channel_track_key=d9UVXKfk', '新用户免费领1亿tokens，基于领先的千亿级多语言、多模态预训练模型，打造高效率、通用化的“模型即服务”AI开发新范式。', 'entityAI/logo_AIGC基础设施_智谱API-免费领取.png', 'entityAI/cover_AIGC基础设施_智谱API-免费领取.png', 13, 'zhipuAPI-mianfeilingqu', 2.5, 3.75, 3.0, 1.25, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (210, '讯飞星火API', 'https://xinghuo.xfyun.cn/sparkapi?ch=xh_srx_nQ1o', 'API无需认证申请，领取即可用！', 'entityAI/logo_AIGC基础设施_讯飞星火API.png', 'entityAI/cover_AIGC基础设施_讯飞星火API.png', 13, 'xunfeixinghuoAPI', 2.0, 3.5, 3.0, 2.75, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (211, '文心大模型 api', 'https://qianfan.cloud.baidu.com', '文心大模型企业级服务唯一入口，一站式企业级大模型平台，提供先进的生成式AI生产及应用全流程开发工具链', 'entityAI/logo_AIGC基础设施_文心大模型 api.png', 'entityAI/cover_AIGC基础设施_文心大模型 api.png', 13, 'wenxindamoxing api', 2.25, 2.5, 2.75, 2.75, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (212, '通义千问 api', 'https://help.aliyun.com/zh/dashscope/developer-reference/api-details?disableWebsiteRedirect=true', '通义千问模型具有强大的自然语言处理能力，您可以使用DashScope SDK或HTTP接口调用通义千问模型，将通义千问模型集成到您的业务中。', 'entityAI/logo_AIGC基础设施_通义千问 api.png', 'entityAI/cover_AIGC基础设施_通义千问 api.png', 13, 'tongyiqianwen api', 2.75, 2.25, 3.5, 3.75, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (213, '腾讯混元大模型 api', 'https://cloud.tencent.com/document/product/1729/101848', '腾讯混元大模型 api', 'entityAI/logo_AIGC基础设施_腾讯混元大模型 api.png', 'entityAI/cover_AIGC基础设施_腾讯混元大模型 api.png', 13, 'tengxunhunyuandamoxing api', 1.75, 5.0, 1.25, 4.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (214, '硅基流动', 'https://siliconflow.cn/zh-cn/siliconcloud', 'SiliconCloud 是硅基流动推出的一站式大模型云服务平台。', 'entityAI/logo_AIGC基础设施_硅基流动.png', 'entityAI/cover_AIGC基础设施_硅基流动.png', 13, 'guijiliudong', 3.0, 1.5, 2.75, 5.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (215, 'Gemini api', 'https://docs.gemini.com/rest-api', 'Gemini api', 'entityAI/logo_AIGC基础设施_Gemini api.png', 'entityAI/cover_AIGC基础设施_Gemini api.png', 13, 'Gemini api', 3.0, 3.0, 3.75, 2.5, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (216, '云雀语言模型api', 'https://www.volcengine.com/product/yunque', '云雀语言模型api', 'entityAI/logo_AIGC基础设施_云雀语言模型api.png', 'entityAI/cover_AIGC基础设施_云雀语言模型api.png', 13, 'yunqueyuyanmoxingapi', 4.75, 3.0, 3.25, 2.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (217, '天工开放平台 api', 'https://model-platform.tiangong.cn/api-reference', '天工开放平台 api', 'entityAI/logo_AIGC基础设施_天工开放平台 api.png', 'entityAI/cover_AIGC基础设施_天工开放平台 api.png', 13, 'tiangongkaifangpingtai api', 1.75, 4.25, 2.5, 2.25, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (218, 'minimax api', 'https://www.minimaxi.com', '提供安全、灵活、可靠的API服务，助力企业和开发者快速搭建AI应用', 'entityAI/logo_AIGC基础设施_minimax api.png', 'entityAI/cover_AIGC基础设施_minimax api.png', 13, 'minimax api', 3.0, 1.5, 2.25, 0.5, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (219, '商汤日日新 api', 'https://platform.sensenova.cn/home', '商汤日日新 api', 'entityAI/logo_AIGC基础设施_商汤日日新 api.png', 'entityAI/cover_AIGC基础设施_商汤日日新 api.png', 13, 'shangtangririxin api', 1.75, 4.0, 1.75, 0.75, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (220, '百川智能 api', 'https://platform.baichuan-ai.com/docs/api', '百川智能的 API 开放平台文档页面，提供开发者接入百川大模型的服务。在使用 API 前，需要完成实名认证、充值和创建 API Key。', 'entityAI/logo_AIGC基础设施_百川智能 api.png', 'entityAI/cover_AIGC基础设施_百川智能 api.png', 13, 'baichuanzhineng api', 4.25, 2.75, 3.25, 3.25, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (221, 'BlueLm蓝心大模型 api', 'https://developers.vivo.com/product/ai/bluelm', 'BlueLm蓝心大模型 api', 'entityAI/logo_AIGC基础设施_BlueLm蓝心大模型 api.png', 'entityAI/cover_AIGC基础设施_BlueLm蓝心大模型 api.png', 13, 'BlueLmlanxindamoxing api', 3.75, 2.0, 3.75, 3.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (222, '华为盘古大模型api', 'https://support.huawei.com/enterprise/zh/doc/EDOC1100327551', '华为盘古大模型api', 'entityAI/logo_AIGC基础设施_华为盘古大模型api.png', 'entityAI/cover_AIGC基础设施_华为盘古大模型api.png', 13, 'huaweipangudamoxingapi', 2.0, 1.0, 2.75, 3.75, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (223, 'kimi chat(Moonshot api)', 'https://platform.moonshot.cn/docs/api/chat', '该平台与 OpenAI SDK 兼容，支持使用 Python 和 Node.js 语言进行开发。开发者可以通过 API 访问 Moonshot AI 的语言模型，例如 "moonshot-v1-8k"，来进行聊天对话的生成。', 'entityAI/logo_AIGC基础设施_kimi chat(Moonshot api).png', 'entityAI/cover_AIGC基础设施_kimi chat(Moonshot api).png', 13, 'kimi chat(Moonshot api)', 2.0, 1.75, 1.25, 2.5, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (224, '出门问问api', 'https://ai.chumenwenwen.com/pages/document/get-started', '出门问问（Chumen Wenwen）是一家中国的人工智能公司，以其智能语音助手和相关技术而闻名。出门问问提供的OPEN API（开放应用程序编程接口）允许开发者将出门问问的技术集成到自己的应用程序、服务或产品中。', 'entityAI/logo_AIGC基础设施_出门问问api.png', 'entityAI/cover_AIGC基础设施_出门问问api.png', 13, 'chumenwenwenapi', 2.5, 4.25, 1.5, 2.25, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (225, 'Gork api', 'https://developers.x.ai/api', 'xAI API 旨在让开发者能够集成和使用 xAI 的先进人工智能技术，以增强自己的应用程序和服务。', 'entityAI/logo_AIGC基础设施_Gork api.png', 'entityAI/cover_AIGC基础设施_Gork api.png', 13, 'Gork api', 1.25, 1.5, 3.0, 2.75, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (226, 'ollama api', 'https://github.com/ollama/ollama', 'Ollama 是一个轻量级、可扩展的框架，用于在本地机器上构建和运行大型语言模型。', 'entityAI/logo_AIGC基础设施_ollama api.png', 'entityAI/cover_AIGC基础设施_ollama api.png', 13, 'ollama api', 3.5, 2.25, 1.5, 3.25, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (227, 'openai api', 'https://openai.com/api', '它为开发者和研究人员提供了访问 OpenAI 人工智能技术的接口。通过这些 API，用户可以集成和利用 OpenAI 的先进算法和模型，如自然语言处理、图像识别和机器学习等，来增强自己的应用程序和服务。', 'entityAI/logo_AIGC基础设施_openai api.png', 'entityAI/cover_AIGC基础设施_openai api.png', 13, 'openai api', 1.75, 3.5, 1.0, 2.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (228, 'JinaChat', 'https://chat.jina.ai', '多模态、超省钱的大模型服务', 'entityAI/logo_AIGC基础设施_JinaChat.png', 'entityAI/cover_AIGC基础设施_JinaChat.png', 13, 'JinaChat', 0.5, 2.0, 2.5, 2.5, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (229, 'Sonantic.io', 'https://app.sonantic.io', 'Sonantic Limited是一个利用人工智能，通过其API及网络应用程序进行内容创作、分析、编辑及分发的文字转语音工具。', 'entityAI/logo_AIGC基础设施_Sonantic.io.png', 'entityAI/cover_AIGC基础设施_Sonantic.io.png', 13, 'Sonantic.io', 3.5, 3.0, 3.0, 4.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (230, 'Cleanup.picture', 'https://cleanup.pictures', 'Cleanup.picture 是一种基于人工智能的高级编辑工具，比其他克隆图章工具要好得多。像 adobe photoshop fix 这样的克隆工具需要背景参考，而我们的 AI 只需点击几下，就能真正猜出不需要的文本、不需要的人、不需要的对象背后的内容。', 'entityAI/logo_AIGC基础设施_Cleanup.picture.png', 'entityAI/cover_AIGC基础设施_Cleanup.picture.png', 13, 'Cleanup.picture', 1.0, 2.25, 1.5, 1.25, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (231, 'Convai', 'https://convai.com', '对话式 AI API，用于语音识别、语言理解和生成，以及用于设计游戏和支持语音的应用程序的文本转语音。', 'entityAI/logo_AIGC基础设施_Convai.png', 'entityAI/cover_AIGC基础设施_Convai.png', 13, 'Convai', 2.0, 3.75, 4.25, 3.25, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (232, 'Inworld.ai', 'https://www.inworld.ai', 'Inworld 提供了一个平台，用于将高级 NPC 行为和即兴对话添加到游戏和实时媒体中。使用文本到字符的提示来创建角色个性并使用 Inworld SDK 集成到体验中。', 'entityAI/logo_AIGC基础设施_Inworld.ai.png', 'entityAI/cover_AIGC基础设施_Inworld.ai.png', 13, 'Inworld.ai', 2.75, 1.0, 3.5, 3.25, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (233, '豆包MarsCode', 'https://marscode.cn/?utm_source=aigc.cn&utm_medium=xycpa&utm_campaign=', '豆包MarsCode是字节跳动旗下的公司推出的一个免费AI编程工具，既提供一个AI驱动的云端集成开发环境（IDE），也支持作为VS Code和JetBrains的智能编程扩展（Extension）使用。基于豆包大模型，MarsCode通过AI助手提供代码补全、生成、优化等功能，支持云函数开发，具备API测试、存储和部署工具，能够自动生成JSON Schema。此外，MarsCode扩展支持主流编程语言和IDE，提供代码编辑、解释、注释生成、单元测试生成、错误修复等辅助功能，增强了编码的效率和质量，覆盖了包括后端、前端、App开发在内的多种编程语言和框架。', 'entityAI/logo_AIGC开发平台_豆包MarsCode.png', 'entityAI/cover_AIGC开发平台_豆包MarsCode.png', 14, 'doubaoMarsCode', 2.25, 0.0, 1.75, 1.75, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (234, '小浣熊AI助手', 'https://raccoon.sensetime.com/login?utm_source=bljuly02', '代码小浣熊Raccoon是商汤科技最新推出的一个智能AI编程助手和工具，由商汤自研的大模型驱动，支持多种编程语言和多项任务能力，可为开发人员带来全新的编程体验。', 'entityAI/logo_AIGC开发平台_小浣熊AI助手.png', 'entityAI/cover_AIGC开发平台_小浣熊AI助手.png', 14, 'xiaohuanxiongAIzhushou', 4.25, 2.25, 2.0, 3.25, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (235, 'Open Voice OS', 'https://openvoiceos.com', '一个社区驱动的开源语音 AI 平台，用于使用 NLP、可自定义的 UI 以及对隐私和安全的关注跨设备创建自定义语音控制界面。', 'entityAI/logo_AIGC开发平台_Open Voice OS.png', 'entityAI/cover_AIGC开发平台_Open Voice OS.png', 14, 'Open Voice OS', 4.0, 4.75, 2.75, 2.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (236, '腾讯云AI代码助手', 'https://acc.cloud.tencent.com/downloads', '腾讯云AI代码助手是由腾讯云自主研发的AI编程辅助工具，旨在通过人工智能技术提高开发者的编码效率。', 'entityAI/logo_AIGC开发平台_腾讯云AI代码助手.png', 'entityAI/cover_AIGC开发平台_腾讯云AI代码助手.png', 14, 'tengxunyunAIdaimazhushou', 2.75, 2.0, 4.25, 0.25, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (237, 'Bolt.new', 'https://bolt.new', '一个为全栈 Web 开发者设计的高效工具，它通过简化开发流程，使得从创建到部署的整个过程更加快捷和方便。', 'entityAI/logo_AIGC开发平台_Bolt.new.png', 'entityAI/cover_AIGC开发平台_Bolt.new.png', 14, 'Bolt.new', 2.5, 2.0, 3.75, 3.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (238, 'Plandex', 'https://plandex.ai', 'Plandex是一个基于终端的开源 AI 编程引擎，可帮助程序员完成复杂的软件编程开发任务、解决不良输出并最大限度地提高生产力。', 'entityAI/logo_AIGC开发平台_Plandex.png', 'entityAI/cover_AIGC开发平台_Plandex.png', 14, 'Plandex', 2.25, 1.75, 1.25, 2.25, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (239, 'Tabby', 'https://tabby.tabbyml.com', 'Tabby是一个自托管的人工智能编程助手，为开发人员提供了一个开源和本地部署的替代方案，支持通过利用第三方开源代码大模型（如StarCoder、CodeLlama、DeepseekCoder）以实现类似于 GitHub Copilot 的功能。Tabby的设计目标是帮助开发者通过提供代码建议、自动完成和其他编程相关的辅助功能来提高编程效率和体验。', 'entityAI/logo_AIGC开发平台_Tabby.png', 'entityAI/cover_AIGC开发平台_Tabby.png', 14, 'Tabby', 3.0, 2.75, 3.0, 3.5, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (240, 'Fitten Code', 'https://code.fittentech.com', 'Fitten Code是一个由GPT驱动的代码生成和补全工具。它支持80多种编程语言，包括Python、Javascript、Typescript、Java等，旨在提高编码效率和减少手动编写时间，让编码更轻松。Fitten Code AI助手目前对个人用户是完全免费的。', 'entityAI/logo_AIGC开发平台_Fitten Code.png', 'entityAI/cover_AIGC开发平台_Fitten Code.png', 14, 'Fitten Code', 0.75, 2.25, 1.5, 1.5, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (241, 'SoloLearn', 'https://www.sololearn.com/en', 'SoloLearn 是一个在线学习平台，提供编程、设计、数据科学、移动开发等领域的课程和教程。', 'entityAI/logo_AIGC开发平台_SoloLearn.png', 'entityAI/cover_AIGC开发平台_SoloLearn.png', 14, 'SoloLearn', 3.75, 2.5, 3.75, 2.25, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (242, '驭码CodeRider', 'https://coderider.gitlab.cn', '驭码CodeRider是极狐GitLab推出的AI编程与软件智能研发助手，专为提升程序员的编码效率和研发效能而设计。', 'entityAI/logo_AIGC开发平台_驭码CodeRider.png', 'entityAI/cover_AIGC开发平台_驭码CodeRider.png', 14, 'yumaCodeRider', 3.75, 1.75, 4.0, 2.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (243, 'CHTML', 'https://www.chtml.cn', 'chtml即code helper tag mark law 代码辅助标记方法，是一款简洁好用的在线的代码命名工具、变量命名工具、变量命名规则库，使用它可以让您轻松摆脱翻译软件的困扰，快速选择合适的变量名称用于开发工作中。', 'entityAI/logo_AIGC开发平台_CHTML.png', 'entityAI/cover_AIGC开发平台_CHTML.png', 14, 'CHTML', 2.25, 1.5, 4.75, 1.5, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (244, 'iFlyCode', 'https://iflycode.xfyun.cn', 'iFlyCode 是科大讯飞最新推出的智能编程助手，基于讯飞星火认知大模型，可以帮助开发人员编程更轻松，创意更自由。该AI编程工具拥有代码生成、代码补齐、代码纠错、代码解释、生成单元测试等功能。', 'entityAI/logo_AIGC开发平台_iFlyCode.png', 'entityAI/cover_AIGC开发平台_iFlyCode.png', 14, 'iFlyCode', 1.0, 1.0, 1.75, 2.75, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (245, '天壤小白', 'https://www.tianrang.com', '天壤小白大模型应用开发平台，提供一站式的大模型开发服务和全面的赋能，为开发者和零编程基础人员轻松创建个性化的AI应用。', 'entityAI/logo_AIGC开发平台_天壤小白.png', 'entityAI/cover_AIGC开发平台_天壤小白.png', 14, 'tianrangxiaobai', 2.5, 3.0, 0.75, 4.25, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (246, 'JetBrains AI', 'https://www.jetbrains.com', 'JetBrains AI是编程软件开发公司JetBrains最新为其旗下系列IDE推出的类似于GitHub Copilot的AI编程助手，可与IntelliJ IDEA、PyCharm、PhpStorm、ReSharper、Fleet等集成开发环境工具深度整合，提供代码聊天、代码生成、上下文代码分析、代码解释、代码翻译等功能，帮助开发人员提高开发效率和代码质量。', 'entityAI/logo_AIGC开发平台_JetBrains AI.png', 'entityAI/cover_AIGC开发平台_JetBrains AI.png', 14, 'JetBrains AI', 1.0, 4.5, 0.25, 2.75, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (247, 'Sky-code', 'https://sky-code.singularity-ai.com/index.html#', 'Sky-code 是 SingularityAI 研发的一款AI代码生成工具，支持各种主流编程语言，助力开发人员更快更好的编码。Sky-code 可以直接集成到编辑器中，无缝衔接在开发环境，在键入代码的同时，智能高效补全代码，提升工作效率，节省开发时间。', 'entityAI/logo_AIGC开发平台_Sky-code.png', 'entityAI/cover_AIGC开发平台_Sky-code.png', 14, 'Sky-code', 3.75, 2.5, 1.75, 2.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (248, '图像大厨Imgcook', 'https://www.imgcook.com', '图像大厨Imgcook阿里巴巴出品...', 'entityAI/logo_AIGC开发平台_图像大厨Imgcook.png', 'entityAI/cover_AIGC开发平台_图像大厨Imgcook.png', 14, 'tuxiangdachuImgcook', 0.25, 2.5, 1.75, 1.5, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (249, '通义灵码', 'https://tongyi.aliyun.com/lingma', '基于通义大模型的智能编码辅助工具', 'entityAI/logo_AIGC开发平台_通义灵码.png', 'entityAI/cover_AIGC开发平台_通义灵码.png', 14, 'tongyilingma', 4.75, 2.5, 3.0, 2.5, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (250, 'CodeGeeX', 'https://codegeex.cn/zh-CN', '自动代码生成、代码翻译、自动编写注释等功能，支持20多种编程语言', 'entityAI/logo_AIGC开发平台_CodeGeeX.png', 'entityAI/cover_AIGC开发平台_CodeGeeX.png', 14, 'CodeGeeX', 1.5, 3.5, 1.25, 2.75, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (251, 'JamGPT', 'https://jam.dev', 'JamGPT是Bug报告工具Jam最新推出的AI Debug助手，JamGPT可帮助开发人员分析所有的Bug报告细节，在你开始阅读之前就找到相关原因和解决方案。', 'entityAI/logo_AIGC开发平台_JamGPT.png', 'entityAI/cover_AIGC开发平台_JamGPT.png', 14, 'JamGPT', 2.5, 2.5, 2.75, 3.75, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (252, 'CodeFuse', 'https://codefuse.alipay.com', '蚂蚁自研智能研发助手', 'entityAI/logo_AIGC开发平台_CodeFuse.png', 'entityAI/cover_AIGC开发平台_CodeFuse.png', 14, 'CodeFuse', 2.5, 0.75, 3.0, 0.75, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (253, 'HeyCLI', 'https://www.heycli.com', '自然语言转义为CLI命令', 'entityAI/logo_AIGC开发平台_HeyCLI.png', 'entityAI/cover_AIGC开发平台_HeyCLI.png', 14, 'HeyCLI', 0.5, 1.5, 2.25, 3.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (254, 'Retool AI', 'https://retool.com/products/ai', 'Retool AI 是一个低代码平台，它允许用户快速地将人工智能（AI）集成到应用程序和工作流中。该平台提供了预构建的AI组件，如GPT-4查询器、图像分类器、文本摘要器等，使用户能够轻松使用任何AI模型。此外，Retool 还允许用户安全地连接业务数据，如数据库、API、SaaS工具等，为AI模型提供上下文和输入。这样，用户就可以为他们的业务定制AI工具，如内容生成器、数据分析器、客户支持助手等，并且比传统的开发方式更快地交付。', 'entityAI/logo_AIGC开发平台_Retool AI.png', 'entityAI/cover_AIGC开发平台_Retool AI.png', 14, 'Retool AI', 4.5, 2.5, 2.75, 1.75, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (255, 'Visual Studio IntelliCode', 'https://visualstudio.microsoft.com', 'Visual Studio AI辅助开发', 'entityAI/logo_AIGC开发平台_Visual Studio IntelliCode.png', 'entityAI/cover_AIGC开发平台_Visual Studio IntelliCode.png', 14, 'Visual Studio IntelliCode', 3.0, 1.5, 2.25, 3.25, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (256, 'BitoAI', 'https://bito.ai', '将生成代码的速度提高 10 倍', 'entityAI/logo_AIGC开发平台_BitoAI.png', 'entityAI/cover_AIGC开发平台_BitoAI.png', 14, 'BitoAI', 1.5, 3.0, 1.75, 2.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (257, 'AITDK', 'https://aitdk.com/?utm_source=aigc', '为网站生成SEO优化标题、描述和关键词', 'entityAI/logo_AIGC应用场景_AITDK.png', 'entityAI/cover_AIGC应用场景_AITDK.png', 15, 'AITDK', 2.5, 3.0, 1.25, 1.75, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (258, '豹变种草', 'https://www.bbzc-ai.com', '豹变种草是一款AI赋能的SEO内容种草工具，旨在帮助业务快速获取全网搜索流量。通过挖掘高价值关键词，生成有吸引力的种草内容，并一键发布到多个平台，实现低成本精准引流。该工具能够节省时间和人力成本，提高平台曝光量和投入产出比。', 'entityAI/logo_AIGC应用场景_豹变种草.png', 'entityAI/cover_AIGC应用场景_豹变种草.png', 15, 'baobianzhongcao', 2.75, 2.5, 2.25, 3.5, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (259, '谷歌seo AI写作工具', 'https://www.artseo.cn/ai-writing-tool', '该工具会按照谷歌on page seo的标准创建文章，根据输入的关键词或标题进行文章创作，自动布局关键词!高原创度!可自定义LSI关键词、—键添加内部链接。', 'entityAI/logo_AIGC应用场景_谷歌seo AI写作工具.png', 'entityAI/cover_AIGC应用场景_谷歌seo AI写作工具.png', 15, 'gugeseo AIxiezuogongju', 2.5, 1.25, 1.0, 4.25, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (260, 'BloggerGPT', 'https://langface.ai', '让其自主工作，发展你的博客', 'entityAI/logo_AIGC应用场景_BloggerGPT.png', 'entityAI/cover_AIGC应用场景_BloggerGPT.png', 15, 'BloggerGPT', 1.75, 2.25, 1.0, 4.25, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (261, 'BlogSEO AI', 'https://blogseo.ai', '用AI生成带内链和图片的SEO优化的Blog', 'entityAI/logo_AIGC应用场景_BlogSEO AI.png', 'entityAI/cover_AIGC应用场景_BlogSEO AI.png', 15, 'BlogSEO AI', 2.25, 2.25, 4.0, 2.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (262, 'SurferSEO', 'https://surferseo.com', 'SurferSEO优化大纲是一款基于...', 'entityAI/logo_AIGC应用场景_SurferSEO.png', 'entityAI/cover_AIGC应用场景_SurferSEO.png', 15, 'SurferSEO', 3.5, 3.5, 4.25, 1.5, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (263, 'Eilla AI', 'https://eilla.ai', 'Eilla.ai是一个由人工智能驱...', 'entityAI/logo_AIGC应用场景_Eilla AI.png', 'entityAI/cover_AIGC应用场景_Eilla AI.png', 15, 'Eilla AI', 0.75, 2.5, 0.75, 4.75, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (264, 'Closers Copy', 'https://www.closerscopy.com', '它通过提供易于使用的界面、丰富的功能和强大的社区支持，帮助用户提高内容创作的效率和质量。无论是初学者还是经验丰富的营销专家，ClosersCopy都能提供有价值的资源和工具，以提升他们的营销努力。', 'entityAI/logo_AIGC应用场景_Closers Copy.png', 'entityAI/cover_AIGC应用场景_Closers Copy.png', 15, 'Closers Copy', 1.25, 2.5, 2.5, 3.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (265, 'Article Fiesta', 'https://www.futurepedia.io/tool/article-fiesta', '提供关键字即可为您的网站或博客创建文章', 'entityAI/logo_AIGC应用场景_Article Fiesta.png', 'entityAI/cover_AIGC应用场景_Article Fiesta.png', 15, 'Article Fiesta', 2.75, 0.25, 2.5, 1.75, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (266, 'growthbar', 'https://www.growthbarseo.com', '为博客文章、网站页面和文章...', 'entityAI/logo_AIGC应用场景_growthbar.png', 'entityAI/cover_AIGC应用场景_growthbar.png', 15, 'growthbar', 1.75, 2.5, 2.25, 3.5, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (267, 'SEOmatic AI', 'https://seomatic.ai', 'SEOmatic通过程序化搜索引擎...', 'entityAI/logo_AIGC应用场景_SEOmatic AI.png', 'entityAI/cover_AIGC应用场景_SEOmatic AI.png', 15, 'SEOmatic AI', 0.25, 2.25, 0.75, 2.25, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (268, 'Blog Booster', 'https://blogbooster.ai', 'WordPress 网站上编写并自动发布博客文章', 'entityAI/logo_AIGC应用场景_Blog Booster.png', 'entityAI/cover_AIGC应用场景_Blog Booster.png', 15, 'Blog Booster', 1.25, 2.25, 4.25, 4.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (269, 'Seo.ai', 'https://seo.ai', 'SEO.ai让你利用世界领先的生...', 'entityAI/logo_AIGC应用场景_Seo.ai.png', 'entityAI/cover_AIGC应用场景_Seo.ai.png', 15, 'Seo.ai', 3.0, 4.0, 1.5, 4.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (270, 'SEO GPT', 'https://seovendor.co/seo-gpt', 'SEO GPT是一种创建你的SEO页...', 'entityAI/logo_AIGC应用场景_SEO GPT.png', 'entityAI/cover_AIGC应用场景_SEO GPT.png', 15, 'SEO GPT', 2.5, 3.5, 3.25, 3.5, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (271, 'SheetAI.app', 'https://www.sheetai.app', '用通俗易懂的英语描述您想要的内容，然后在您的电子表格中观看魔法发生！', 'entityAI/logo_AIGC应用场景_SheetAI.app.png', 'entityAI/cover_AIGC应用场景_SheetAI.app.png', 15, 'SheetAI.app', 4.0, 3.0, 3.0, 1.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (272, 'Thundercontent', 'https://thundercontent.com', 'Thundercontent使用人工智能...', 'entityAI/logo_AIGC应用场景_Thundercontent.png', 'entityAI/cover_AIGC应用场景_Thundercontent.png', 15, 'Thundercontent', 2.5, 2.5, 2.0, 2.25, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (273, 'Optimo', 'https://askoptimo.com', 'AI驱动的营销程序，可以简化和加速营销过程。', 'entityAI/logo_AIGC应用场景_Optimo.png', 'entityAI/cover_AIGC应用场景_Optimo.png', 15, 'Optimo', 2.5, 1.5, 4.75, 2.5, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (274, 'Mentioned', 'https://www.mentioned.ai', '我们扫描您的内容以识别您提到的人和公司，然后发送电子邮件活动让他们知道。', 'entityAI/logo_AIGC应用场景_Mentioned.png', 'entityAI/cover_AIGC应用场景_Mentioned.png', 15, 'Mentioned', 1.0, 0.5, 2.5, 1.75, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (275, 'Katteb', 'https://katteb.com/en', 'Katteb AI使您能够快速而轻松...', 'entityAI/logo_AIGC应用场景_Katteb.png', 'entityAI/cover_AIGC应用场景_Katteb.png', 15, 'Katteb', 1.0, 0.75, 1.75, 2.75, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (276, 'Jenni', 'https://jenni.ai', '智能写作助手，提升研究和写作效率', 'entityAI/logo_AIGC应用场景_Jenni.png', 'entityAI/cover_AIGC应用场景_Jenni.png', 15, 'Jenni', 3.5, 4.25, 2.5, 2.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (277, 'Neuronwriter', 'https://www.neuronwriter.com', 'NEURONwriter帮助您以用户意...', 'entityAI/logo_AIGC应用场景_Neuronwriter.png', 'entityAI/cover_AIGC应用场景_Neuronwriter.png', 15, 'Neuronwriter', 2.75, 3.25, 2.0, 2.5, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (278, 'LongShot', 'https://longshot.ai', 'LongShot是一个人工智能写作...', 'entityAI/logo_AIGC应用场景_LongShot.png', 'entityAI/cover_AIGC应用场景_LongShot.png', 15, 'LongShot', 2.5, 1.25, 2.5, 1.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (279, 'BlogNLP', 'https://www.blognlp.com', 'BlogNLP是一个免费的人工智能...', 'entityAI/logo_AIGC应用场景_BlogNLP.png', 'entityAI/cover_AIGC应用场景_BlogNLP.png', 15, 'BlogNLP', 1.5, 0.75, 2.75, 3.25, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (280, 'CheckForAI', 'https://checkforai.com', 'AI项目更新订阅服务', 'entityAI/logo_AIGC应用场景_CheckForAI.png', 'entityAI/cover_AIGC应用场景_CheckForAI.png', 15, 'CheckForAI', 2.25, 2.75, 4.0, 0.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (281, '算了么AI', 'https://suanleme.gebagi.com/?source=aigccn', '卦解心声的AI易经占卜师', 'entityAI/logo_AIGC行业应用_算了么AI.png', 'entityAI/cover_AIGC行业应用_算了么AI.png', 16, 'suanlemeAI', 0.25, 3.5, 2.5, 4.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (282, 'Promethean AI', 'https://www.prometheanai.com', 'Promethean AI是一个强大的AI助手，为创意团队提供了一个无需上传资产和更换编辑器即可使用的平台。它通过企业级的数据安全和工作流定制功能，帮助团队提高生产效率，同时保持创意流程的完整性。', 'entityAI/logo_AIGC行业应用_Promethean AI.png', 'entityAI/cover_AIGC行业应用_Promethean AI.png', 16, 'Promethean AI', 4.25, 1.0, 1.75, 2.5, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (283, 'Meshy', 'https://www.meshy.ai/zh', 'Meshy作为一个创新的AI 3D模型生成器，通过其强大的AI技术，为用户提供了一个快速、简单且高效的3D创作解决方案。无论是专业的3D艺术家还是初学者，都能利用Meshy轻松创作出逼真的3D模型，推动3D内容创作的未来。', 'entityAI/logo_AIGC行业应用_Meshy.png', 'entityAI/cover_AIGC行业应用_Meshy.png', 16, 'Meshy', 1.25, 3.5, 1.5, 4.5, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (284, 'Fotor AI游戏资产生成器', 'https://www.fotor.com/features/ai-game-assets-generator', 'Fotor AI游戏资产生成器是一个创新的工具，它通过AI技术降低了游戏资产创作的门槛，使得各类游戏开发者都能够快速获得所需的高质量游戏资产。', 'entityAI/logo_AIGC行业应用_Fotor AI游戏资产生成器.png', 'entityAI/cover_AIGC行业应用_Fotor AI游戏资产生成器.png', 16, 'Fotor AIyouxizichanshengchengqi', 0.75, 4.75, 1.5, 2.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (285, 'Charisma', 'https://charisma.ai', 'Charisma通过其AI驱动的故事引擎，为创造引人入胜的虚拟角色对话提供了强大支持。无论是在教育、娱乐还是其他领域，Charisma都能够通过其可控AI和GenAI即兴创作能力，帮助开发者构建富有吸引力的交互体验。', 'entityAI/logo_AIGC行业应用_Charisma.png', 'entityAI/cover_AIGC行业应用_Charisma.png', 16, 'Charisma', 4.25, 2.75, 0.5, 0.75, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (286, 'Inworld AI', 'https://inworld.ai/zh-cn', 'Inworld AI是一个综合性的AI游戏开发平台，它通过提供先进的NPC逻辑、互动剧情设计工具、实时AI反应和自然语音生成等功能，极大地增强了游戏的沉浸感和互动性。', 'entityAI/logo_AIGC行业应用_Inworld AI.png', 'entityAI/cover_AIGC行业应用_Inworld AI.png', 16, 'Inworld AI', 3.75, 0.0, 2.75, 1.75, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (287, 'VEED AI', 'https://www.veed.io/tools/ai-image-generator/ai-game-generator', 'VEED AI游戏生成器是一个多功能的AI工具，它通过文本到图像的转换技术，帮助游戏开发者快速获取游戏设计和营销的视觉素材。', 'entityAI/logo_AIGC行业应用_VEED AI.png', 'entityAI/cover_AIGC行业应用_VEED AI.png', 16, 'VEED AI', 3.75, 3.75, 2.5, 2.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (288, 'Layer AI', 'https://www.layer.ai', 'Layer AI是一个强大的工具，它通过AI技术帮助游戏工作室在保持艺术风格一致性的同时，提高生产效率和创造力。', 'entityAI/logo_AIGC行业应用_Layer AI.png', 'entityAI/cover_AIGC行业应用_Layer AI.png', 16, 'Layer AI', 4.75, 3.25, 2.0, 1.5, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (289, 'AI RPG Generator Freeplay', 'https://flowgpt.com', 'AI RPG Generator Freeplay 是一个强大且灵活的工具，适用于RPG爱好者或游戏设计师，能够快速生成丰富的游戏内容和故事情节，提供独特的游戏体验。', 'entityAI/logo_AIGC行业应用_AI RPG Generator Freeplay.png', 'entityAI/cover_AIGC行业应用_AI RPG Generator Freeplay.png', 16, 'AI RPG Generator Freeplay', 2.5, 3.5, 4.5, 2.25, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (290, 'Rosebud AI', 'https://www.rosebud.ai', 'Rosebud AI是一个创新的游戏开发工具，它通过AI技术简化了游戏创作的复杂性，使得从初学者到经验丰富的开发者都能够快速地将想法转化为游戏。', 'entityAI/logo_AIGC行业应用_Rosebud AI.png', 'entityAI/cover_AIGC行业应用_Rosebud AI.png', 16, 'Rosebud AI', 4.0, 2.0, 3.75, 3.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (291, 'Hotpot AI游戏生成器', 'https://hotpot.ai/game-asset-generator', 'Hotpot AI游戏生成器是游戏开发者的创意盟友，通过其AI驱动的方法，不仅加速了制作流程，还为游戏设计创新开辟了新的可能性。', 'entityAI/logo_AIGC行业应用_Hotpot AI游戏生成器.png', 'entityAI/cover_AIGC行业应用_Hotpot AI游戏生成器.png', 16, 'Hotpot AIyouxishengchengqi', 3.0, 2.5, 2.5, 2.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (292, 'Scenario', 'https://www.scenario.com', 'Scenario是一个强大的工具，它通过AI技术帮助游戏开发者和设计师创建和定制游戏资产。用户可以根据自己的需求训练AI模型，并通过高级控制功能精确调整生成的资产。', 'entityAI/logo_AIGC行业应用_Scenario.png', 'entityAI/cover_AIGC行业应用_Scenario.png', 16, 'Scenario', 3.25, 1.5, 4.75, 0.5, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (293, 'Ludo.ai', 'https://ludo.ai', 'Ludo.ai是一个强大的AI辅助游戏设计平台，它通过提供一系列AI工具，帮助游戏开发者在游戏设计过程中提高效率和创新能力。', 'entityAI/logo_AIGC行业应用_Ludo.ai.png', 'entityAI/cover_AIGC行业应用_Ludo.ai.png', 16, 'Ludo.ai', 3.25, 1.75, 1.75, 4.5, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (294, 'DefinityLegend', 'https://www.definitylegend.com', 'DefinityLegend是一个创新的游戏平台，它通过提供无代码的游戏构建工具，降低了游戏开发的门槛，使得任何有创意的人都可以成为游戏开发者', 'entityAI/logo_AIGC行业应用_DefinityLegend.png', 'entityAI/cover_AIGC行业应用_DefinityLegend.png', 16, 'DefinityLegend', 4.5, 3.5, 1.5, 2.0, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (295, 'Octokit', 'https://octokit.co', 'Octokit是一个多功能的无代码游戏创作工具，它通过提供丰富的模板和资产，简化了游戏开发和部署流程，使得任何用户都能轻松创建游戏化产品。', 'entityAI/logo_AIGC行业应用_Octokit.png', 'entityAI/cover_AIGC行业应用_Octokit.png', 16, 'Octokit', 2.75, 0.0, 0.5, 4.25, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (296, 'Charmed AI', 'https://charmed.ai', 'Charmed AI是一个强大的3D创作工具，它通过AI技术简化了3D建模和动画制作的流程。无论是生成3D几何体、应用纹理、还是动画绑定，Charmed AI都提供了高效的解决方案，使用户能够快速将创意转化为现实，同时保持对细节的精确控制。', 'entityAI/logo_AIGC行业应用_Charmed AI.png', 'entityAI/cover_AIGC行业应用_Charmed AI.png', 16, 'Charmed AI', 1.75, 4.0, 3.0, 1.5, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (297, 'AI游戏素材生成器', 'https://game-generator.com', 'AI游戏素材生成器是一个创新的游戏开发辅助工具，它通过AI技术简化了游戏美术资源的创作过程。这个平台不仅为独立开发者和小团队节省了成本，也为大型团队提高了工作效率，使得游戏开发变得更加高效和便捷。', 'entityAI/logo_AIGC行业应用_AI游戏素材生成器.png', 'entityAI/cover_AIGC行业应用_AI游戏素材生成器.png', 16, 'AIyouxisucaishengchengqi', 3.5, 2.5, 1.75, 2.75, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (298, 'Biomes', 'https://www.biomes.gg', '一款专为网络打造的开源沙盒 MMORPG', 'entityAI/logo_AIGC行业应用_Biomes.png', 'entityAI/cover_AIGC行业应用_Biomes.png', 16, 'Biomes', 2.75, 3.75, 0.0, 2.25, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (299, 'GGPredict', 'https://ggpredict.io', '提高你的CS:技能的力量AI-gen...', 'entityAI/logo_AIGC行业应用_GGPredict.png', 'entityAI/cover_AIGC行业应用_GGPredict.png', 16, 'GGPredict', 1.5, 0.75, 1.0, 2.25, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (300, 'The Simulation', 'https://fablesimulation.com', '仿真是一个人工intelligence-...', 'entityAI/logo_AIGC行业应用_The Simulation.png', 'entityAI/cover_AIGC行业应用_The Simulation.png', 16, 'The Simulation', 2.25, 3.5, 3.5, 2.75, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (301, 'LitRPG Adventures', 'https://litrpgadventures.com', '先进的桌面RPG发电机内容库D', 'entityAI/logo_AIGC行业应用_LitRPG Adventures.png', 'entityAI/cover_AIGC行业应用_LitRPG Adventures.png', 16, 'LitRPG Adventures', 3.0, 1.25, 3.0, 1.75, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (302, 'Convai Technologies Inc.', 'https://convai.com', 'Convai Technologies Inc.为...', 'entityAI/logo_AIGC行业应用_Convai Technologies Inc..png', 'entityAI/cover_AIGC行业应用_Convai Technologies Inc..png', 16, 'Convai Technologies Inc.', 2.5, 4.0, 2.75, 3.25, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (303, 'Orbofi', 'https://www.orbofi.com', 'Orbofi允许用户为web3、游戏...', 'entityAI/logo_AIGC行业应用_Orbofi.png', 'entityAI/cover_AIGC行业应用_Orbofi.png', 16, 'Orbofi', 1.5, 1.5, 2.5, 4.25, 0, 0, 0, 0, 0, 0, 0);
+INSERT INTO entityai_entityai (id, name, url, description, logo, cover, type_id, pinyin_name, total_score1, total_score2, total_score3, total_score4, like_count, average_score, comment_count, score1_sum, score2_sum, score3_sum, score4_sum) VALUES (304, 'AI Roguelite', 'https://store.steampowered.com/app/1889620/AI_Roguelite', '【付费】AI Roguelite是一款...', 'entityAI/logo_AIGC行业应用_AI Roguelite.png', 'entityAI/cover_AIGC行业应用_AI Roguelite.png', 16, 'AI Roguelite', 3.0, 1.5, 3.0, 4.5, 0, 0, 0, 0, 0, 0, 0);
 INSERT INTO user_like (id, user_id, entityAI_id, created_time) VALUES (1, 4, 1, '2024-12-25 20:20:19.574435');
 INSERT INTO user_like (id, user_id, entityAI_id, created_time) VALUES (2, 7, 1, '2024-12-23 09:39:22.673718');
 INSERT INTO user_like (id, user_id, entityAI_id, created_time) VALUES (3, 8, 1, '2024-12-17 12:05:18.572076');
@@ -0,0 +1,84 @@
+import time
+
+from django.core.cache import cache
+
+CACHE_TIMEOUT = 60 * 60  # 按代数区分的缓存默认保留 1 小时，数据变化后旧代数的缓存自然失效
+LOCK_TIMEOUT = 10  # 单飞锁的最长持有时间（秒），防止计算进程崩溃后锁无法释放
+LOCK_WAIT_INTERVAL = 0.05  # 等待其他进程计算结果时的轮询间隔（秒）
+
+
+def _generation_key(name):
+    return f'generation:{name}'
+
+
+def get_generation(name):
+    """
+    获取缓存代数，数据变化时代数加一，旧代数下的缓存全部作废
+    """
+    key = _generation_key(name)
+    generation = cache.get(key)
+    if generation is None:
+        # 代数丢失（如 Redis 被清空）时以当前毫秒时间初始化，避免与旧缓存的代数重合
+        cache.add(key, int(time.time() * 1000), timeout=None)
+        generation = cache.get(key)
+    return generation
+
+
+def bump_generation(*names):
+    """
+    使指定名称的缓存代数加一
+    """
+    for name in names:
+        key = _generation_key(name)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.add(key, int(time.time() * 1000), timeout=None)
+
+
+def incr_counter(key, delta=1):
+    """
+    计数器加一，键不存在时创建且永不过期
+    """
+    try:
+        return cache.incr(key, delta)
+    except ValueError:
+        if cache.add(key, delta, timeout=None):
+            return delta
+        return cache.incr(key, delta)
+
+
+def get_or_compute(key, compute, timeout=CACHE_TIMEOUT):
+    """
+    读取缓存，未命中时只允许一个进程重新计算（单飞），其他进程等待其结果，避免缓存击穿
+    """
+    value = cache.get(key)
+    if value is not None:
+        return value
+
+    lock_key = f'{key}:lock'
+    if cache.add(lock_key, 1, timeout=LOCK_TIMEOUT):
+        try:
+            value = compute()
+            cache.set(key, value, timeout)
+        finally:
+            cache.delete(lock_key)
+        return value
+
+    # 其他进程正在计算，等待结果写入缓存
+    deadline = time.monotonic() + LOCK_TIMEOUT
+    while time.monotonic() < deadline:
+        time.sleep(LOCK_WAIT_INTERVAL)
+        value = cache.get(key)
+        if value is not None:
+            return value
+
+    # 等待超时（计算进程可能已崩溃），自行计算但不抢占缓存
+    return compute()
+
+
+def get_or_compute_by_generation(key, generation_name, compute, timeout=CACHE_TIMEOUT):
+    """
+    以代数为版本号的缓存，代数变化后自动重新计算
+    """
+    return get_or_compute(f'{key}:{get_generation(generation_name)}', compute, timeout)
@@ -0,0 +1,122 @@
+import codecs
+import csv
+import datetime
+import json
+
+from django.http import StreamingHttpResponse
+
+EXPORT_FORMATS = ('csv', 'jsonl')
+EXPORT_FORMAT_PARAM = 'file_format'  # 不能用 format，它是 DRF 选择渲染器的参数
+EXPORT_CHUNK_SIZE = 2000
+CONTENT_TYPES = {
+    'csv': 'text/csv; charset=utf-8',
+    'jsonl': 'application/x-ndjson; charset=utf-8',
+}
+
+
+class _Line:
+    """csv.writer 的输出目标，保存最近写入的一行"""
+
+    def write(self, value):
+        self.value = value
+
+
+def _format_value(value):
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    return value
+
+
+def iter_lines(rows, fields, file_format):
+    """
+    把字典逐行编码为 CSV（首行为表头）或 JSONL，逐行产出字符串，不在内存中拼接整个文件
+    """
+    if file_format == 'jsonl':
+        for row in rows:
+            yield json.dumps({field: _format_value(row[field]) for field in fields}, ensure_ascii=False) + '\n'
+        return
+
+    line = _Line()
+    writer = csv.writer(line)
+    writer.writerow(fields)
+    yield line.value
+    for row in rows:
+        writer.writerow([_format_value(row[field]) for field in fields])
+        yield line.value
+
+
+def iter_chunks(queryset, fields, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    按主键分块读取 values()，每块是一条 `id > 上一块最后的 id` 的查询，产出字典列表，fields 必须包含 id。
+    MySQL 驱动会把整个结果集读入内存，按主键分块才能保证内存占用与表大小无关，且深处的块与第一块代价相同
+    """
+    queryset = queryset.order_by('pk').values(*fields)
+    last_pk = None
+    while True:
+        chunk = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+        rows = list(chunk[:chunk_size])
+        if rows:
+            yield rows
+        if len(rows) < chunk_size:
+            return
+        last_pk = rows[-1]['id']
+
+
+def iter_values(queryset, fields, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    逐行产出 iter_chunks 读取的字典
+    """
+    for rows in iter_chunks(queryset, fields, chunk_size):
+        yield from rows
+
+
+def get_export_format(request, default='csv'):
+    """
+    从查询参数中读取导出格式，不支持时返回 None
+    """
+    file_format = request.query_params.get(EXPORT_FORMAT_PARAM) or default
+    return file_format if file_format in EXPORT_FORMATS else None
+
+
+def streaming_response(lines, filename, file_format):
+    """
+    把逐行产出的字符串作为附件流式返回，第一行生成后即开始传输
+    """
+    response = StreamingHttpResponse(lines, content_type=CONTENT_TYPES[file_format])
+    response['Content-Disposition'] = f'attachment; filename="{filename}.{file_format}"'
+    return response
+
+
+def read_rows(file, file_format):
+    """
+    逐行读取 CSV 或 JSONL 文件，产出 (行号, 字典)；JSONL 中无法解析的行产出 (行号, None)
+    """
+    if file_format == 'jsonl':
+        for line_no, line in enumerate(file, 1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError:
+                row = None
+            yield line_no, row if isinstance(row, dict) else None
+        return
+
+    # 第 1 行为表头
+    for line_no, row in enumerate(csv.DictReader(file), 2):
+        yield line_no, row
+
+
+def get_file_format(name, default='jsonl'):
+    """
+    根据文件扩展名判断格式
+    """
+    extension = name.rsplit('.', 1)[-1].lower() if name and '.' in name else ''
+    return extension if extension in EXPORT_FORMATS else default
+
+
+def open_text(file):
+    """
+    把上传的二进制文件逐行解码为文本，兼容带 BOM 的 UTF-8（Excel 导出的 CSV）
+    """
+    return codecs.iterdecode(file, 'utf-8-sig')
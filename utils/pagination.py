@@ -0,0 +1,129 @@
+import base64
+import datetime
+import json
+
+from django.core.exceptions import ValidationError
+from django.db.models import F, Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class CustomPageNumberPagination(PageNumberPagination):
+    page_size = 8  # 默认每页数据量
+    page_size_query_param = 'page_size'  # 允许前端传递的参数名
+    max_page_size = 100  # 限制每页的最大数据量
+
+    cursor_query_param = 'cursor'  # 传入该参数即启用游标分页，首页传空值；为 None 时不支持游标分页
+    max_unpaged_size = 1000  # 未传 `page` 时最多返回的数据量
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.mode = 'page'
+
+        # 游标分页：按 (排序字段, id) 定位，深翻页与首页代价相同，也不需要 COUNT(*)
+        if self.cursor_query_param and self.cursor_query_param in request.query_params:
+            self.mode = 'cursor'
+            return self.paginate_cursor(queryset, request)
+
+        # 如果没有传入 `page` 参数，返回列表形式的数据，但最多 `max_unpaged_size` 条
+        if 'page' not in request.query_params or request.query_params['page'] == '':
+            self.mode = 'unpaged'
+            return list(queryset[:self.max_unpaged_size])
+
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.mode == 'unpaged':
+            return Response(data)
+        if self.mode == 'cursor':
+            return Response({
+                'next': self.get_next_cursor_link(),
+                'results': data,
+            })
+        return super().get_paginated_response(data)
+
+    def paginate_cursor(self, queryset, request):
+        field_name, descending = self.get_cursor_ordering(queryset)
+        field = queryset.model._meta.get_field(field_name)
+
+        if field.null:
+            # 可空字段显式约定空值位置，保证游标条件与排序一致
+            key = F(field_name).desc(nulls_last=True) if descending else F(field_name).asc(nulls_first=True)
+        else:
+            key = F(field_name).desc() if descending else F(field_name).asc()
+        queryset = queryset.order_by(key, '-id' if descending else 'id')
+
+        cursor = request.query_params[self.cursor_query_param]
+        if cursor:
+            value, pk = self.decode_cursor(cursor)
+            try:
+                queryset = queryset.filter(self.get_cursor_filter(field_name, descending, field.null, value, pk))
+            except (TypeError, ValueError, ValidationError):
+                # 游标中的值无法转换为排序字段的类型（例如被篡改）
+                raise NotFound('无效的游标')
+
+        page_size = self.get_page_size(request)
+        results = list(queryset[:page_size + 1])
+        self.has_next = len(results) > page_size
+        results = results[:page_size]
+
+        self.next_position = None
+        if self.has_next:
+            last = results[-1]
+            self.next_position = (getattr(last, field_name), last.pk)
+        return results
+
+    def get_cursor_ordering(self, queryset):
+        """
+        取查询集当前的第一个排序字段作为游标字段，没有排序时按 id 升序
+        """
+        ordering = queryset.query.order_by or queryset.model._meta.ordering
+        for item in ordering:
+            if isinstance(item, str) and item.lstrip('-') not in ('?', 'pk'):
+                return item.lstrip('-'), item.startswith('-')
+        return 'id', False
+
+    @staticmethod
+    def get_cursor_filter(field_name, descending, nullable, value, pk):
+        """
+        生成「排在 (value, pk) 之后」的过滤条件，空值在升序时排最前、降序时排最后
+        """
+        lookup = 'lt' if descending else 'gt'
+        after_pk = Q(**{f'id__{lookup}': pk})
+
+        if value is None:
+            condition = Q(**{f'{field_name}__isnull': True}) & after_pk
+            if not descending:
+                condition |= Q(**{f'{field_name}__isnull': False})
+            return condition
+
+        condition = Q(**{f'{field_name}__{lookup}': value}) | (Q(**{field_name: value}) & after_pk)
+        if descending and nullable:
+            condition |= Q(**{f'{field_name}__isnull': True})
+        return condition
+
+    @staticmethod
+    def encode_cursor(value, pk):
+        if isinstance(value, (datetime.datetime, datetime.date)):
+            value = value.isoformat()  # 保留微秒，避免翻页时跳过或重复数据
+        data = json.dumps([value, pk], ensure_ascii=False)
+        return base64.urlsafe_b64encode(data.encode('utf-8')).decode('ascii')
+
+    @staticmethod
+    def decode_cursor(cursor):
+        try:
+            value, pk = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8'))
+        except (TypeError, ValueError, UnicodeError):
+            raise NotFound('无效的游标')
+        # 排序值只能是标量，主键只能是整数
+        if not isinstance(value, (str, int, float, type(None))) or not isinstance(pk, int) or isinstance(pk, bool):
+            raise NotFound('无效的游标')
+        return value, pk
+
+    def get_next_cursor_link(self):
+        if self.next_position is None:
+            return None
+        url = remove_query_param(self.request.build_absolute_uri(), self.page_query_param)
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(*self.next_position))
@@ -0,0 +1,12 @@
+import jieba
+
+
+def tokenize(text):
+    """
+    使用 jieba 的搜索模式分词并转为小写，去掉空白和标点等无意义的词。
+    搜索索引和相似推荐共用，保证同一段文本在两处得到相同的词
+    """
+    return [
+        token for token in jieba.lcut_for_search(str(text).lower())
+        if token.strip() and any(c.isalnum() for c in token)
+    ]